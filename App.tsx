@@ -1,9 +1,12 @@
 
 import React, { useState, useEffect, useRef } from 'react';
 import { TEAMS_DATA } from './constants';
-import { Team, GameResult, SeasonState, PostseasonSeries, Position } from './types';
+import { Team, GameResult, SeasonState, PostseasonSeries, Position, LineupPlan } from './types';
 import { simulateGame, generateSchedule, progressionSystem } from './services/simulator';
 import { parseScheduleCSV } from './services/scheduleData';
+import { isLineupPlanCurrent, planSeriesLineups } from './services/lineupOptimizer';
+import { IncrementalSim, applyResults, summarizeIncrementalSim } from './services/incrementalSim';
+import { createLeagueSnapshot, decodeLeagueSnapshot, encodeLeagueSnapshot, restoreLeagueSnapshot } from './services/leagueSnapshot';
 import { Standings } from './components/Standings';
 import { TeamDetail } from './components/TeamDetail';
 import { Postseason } from './components/Postseason';
@@ -14,6 +17,10 @@ import { generateTeamData } from './services/leagueService';
 
 const START_DATE = new Date('2026-03-25T12:00:00');
 
+// Background work between sim ticks (setTimeout where idle callbacks are unavailable)
+const scheduleIdle = (fn: () => void): number =>
+  typeof window.requestIdleCallback === 'function' ? window.requestIdleCallback(fn) : window.setTimeout(fn, 0);
+
 const App = () => {
   const [season, setSeason] = useState<SeasonState>({
     teams: TEAMS_DATA.map(t => ({ 
@@ -39,10 +46,53 @@ const App = () => {
   const [simSpeed, setSimSpeed] = useState(500); 
   const [autoInit, setAutoInit] = useState(false);
   const [fastSimResults, setFastSimResults] = useState<import('./services/fastSim').FastSimSummary | null>(null);
+  // Cached seasons behind Live Updates; kept here so results fold in while other views are open
+  const fastSimEnsemble = useRef<IncrementalSim | null>(null);
   const [isBetweenRounds, setIsBetweenRounds] = useState(false);
   const [completedRound, setCompletedRound] = useState<string | undefined>(undefined);
   const [travelDaysRemaining, setTravelDaysRemaining] = useState(0);
   const fileInputRef = useRef<HTMLInputElement>(null);
+  // Batting orders planned once per series (per team, keyed by the current opponent). Planning
+  // takes ~100ms per team, so it runs one team at a time in idle time, ahead of each game day;
+  // games whose plan isn't ready yet use getBestLineup.
+  const lineupPlans = useRef(new Map<string, LineupPlan>());
+  const lineupQueue = useRef(new Map<string, [Team, Team]>());
+  const lineupPlanning = useRef(false);
+
+  const planNextLineup = () => {
+    const next = lineupQueue.current.entries().next();
+    if (next.done) {
+      lineupPlanning.current = false;
+      return;
+    }
+    const [teamId, [team, opponent]] = next.value;
+    lineupQueue.current.delete(teamId);
+    try {
+      lineupPlans.current.set(teamId, planSeriesLineups(team, opponent, lineupPlans.current.get(teamId)));
+    } catch (e) {
+      console.error(`Failed to plan lineups for ${team.name}`, e);
+    }
+    scheduleIdle(planNextLineup);
+  };
+
+  const queueLineupPlan = (team: Team, opponent: Team) => {
+    if (isLineupPlanCurrent(lineupPlans.current.get(team.id), team, opponent)) return;
+    lineupQueue.current.set(team.id, [team, opponent]);
+    if (!lineupPlanning.current) {
+      lineupPlanning.current = true;
+      scheduleIdle(planNextLineup);
+    }
+  };
+
+  const getSeriesLineups = (home: Team, away: Team) => {
+    queueLineupPlan(home, away);
+    queueLineupPlan(away, home);
+    const ready = (team: Team, opponent: Team) => {
+      const plan = lineupPlans.current.get(team.id);
+      return isLineupPlanCurrent(plan, team, opponent) ? plan : undefined;
+    };
+    return { home: ready(home, away), away: ready(away, home) };
+  };
 
   useEffect(() => {
     if (season.schedule.length === 0 && season.phase === 'Regular Season') {
@@ -61,6 +111,34 @@ const App = () => {
     }
   }, []);
 
+  // Plan the next game day's series lineups while the current tick's results are on screen
+  useEffect(() => {
+    const nextGame = season.schedule.find(g => !g.played);
+    if (!nextGame) return;
+    const teams = new Map(season.teams.map(t => [t.id, t]));
+    season.schedule.forEach(g => {
+      if (g.played || g.date !== nextGame.date) return;
+      const home = teams.get(g.homeTeamId);
+      const away = teams.get(g.awayTeamId);
+      if (!home?.isRosterGenerated || !away?.isRosterGenerated) return;
+      queueLineupPlan(home, away);
+      queueLineupPlan(away, home);
+    });
+  }, [season.schedule]);
+
+  // Live updates: fold each day's results into the cached fast-sim seasons instead of rerunning
+  useEffect(() => {
+    const ensemble = fastSimEnsemble.current;
+    if (!ensemble) return;
+    const applied = applyResults(ensemble, season.schedule);
+    if (applied === null) {
+      // A cached result was undone (new season, reset): the ensemble no longer applies
+      fastSimEnsemble.current = null;
+    } else if (applied > 0) {
+      setFastSimResults(summarizeIncrementalSim(ensemble));
+    }
+  }, [season.schedule]);
+
   const handleTeamUpdate = (updatedTeam: Team) => {
     setSeason(prev => ({
       ...prev,
@@ -105,14 +183,30 @@ const App = () => {
     downloadAnchorNode.remove();
   };
 
+  // Binary league snapshot: a fraction of the JSON size, restored in milliseconds
+  const handleSaveSnapshot = () => {
+    const url = URL.createObjectURL(new Blob([encodeLeagueSnapshot(createLeagueSnapshot(season))], { type: 'application/octet-stream' }));
+    const downloadAnchorNode = document.createElement('a');
+    downloadAnchorNode.setAttribute("href", url);
+    downloadAnchorNode.setAttribute("download", "grand_slam_data.gsls");
+    document.body.appendChild(downloadAnchorNode);
+    downloadAnchorNode.click();
+    downloadAnchorNode.remove();
+    URL.revokeObjectURL(url);
+  };
+
   const handleLoadData = (event: React.ChangeEvent<HTMLInputElement>) => {
     const fileReader = new FileReader();
     if (event.target.files && event.target.files[0]) {
-        fileReader.readAsText(event.target.files[0], "UTF-8");
+        const isSnapshot = event.target.files[0].name.endsWith('.gsls');
+        if (isSnapshot) fileReader.readAsArrayBuffer(event.target.files[0]);
+        else fileReader.readAsText(event.target.files[0], "UTF-8");
         fileReader.onload = (e) => {
             if (e.target?.result) {
                 try {
-                    const parsedData = JSON.parse(e.target.result as string);
+                    const parsedData = isSnapshot
+                        ? restoreLeagueSnapshot(decodeLeagueSnapshot(new Uint8Array(e.target.result as ArrayBuffer)))
+                        : JSON.parse(e.target.result as string);
                     if (parsedData.teams && parsedData.date) {
                         // Merge loaded team data with original TEAMS_DATA to preserve logoUrl and other static properties
                         const mergedTeams = parsedData.teams.map((loadedTeam: Team) => {
@@ -316,7 +410,7 @@ const App = () => {
           const home = updatedTeams[homeIdx];
           const away = updatedTeams[awayIdx];
 
-          const result = simulateGame(home, away, season.date);
+          const result = simulateGame(home, away, season.date, false, { lineups: getSeriesLineups(home, away) });
           const finalResult = { ...game, ...result, id: game.id, played: true };
           results.push(finalResult);
           
@@ -478,7 +572,7 @@ const App = () => {
             const home = updatedTeams.find(t => t.id === homeTeamId)!;
             const away = updatedTeams.find(t => t.id === awayTeamId)!;
             
-            const result = simulateGame(home, away, season.date, true);
+            const result = simulateGame(home, away, season.date, true, { lineups: getSeriesLineups(home, away) });
             
             // Archive postseason game
             const archivedGame: GameResult = {
@@ -602,9 +696,12 @@ const App = () => {
                              Save JSON
                          </button>
                          <button onClick={() => fileInputRef.current?.click()} className="text-xs bg-cyan-800 hover:bg-cyan-700 text-cyan-100 border border-cyan-600 rounded py-1 transition">
-                             Load JSON
+                             Load Save
+                         </button>
+                         <button onClick={handleSaveSnapshot} className="col-span-2 text-xs bg-emerald-900 hover:bg-emerald-800 text-emerald-100 border border-emerald-700 rounded py-1 transition">
+                             Save Snapshot
                          </button>
-                         <input type="file" ref={fileInputRef} onChange={handleLoadData} accept=".json" className="hidden" />
+                         <input type="file" ref={fileInputRef} onChange={handleLoadData} accept=".json,.gsls" className="hidden" />
                     </div>
 
                     <div className="pt-2">
@@ -649,7 +746,7 @@ const App = () => {
         {view === 'leaderboard' ? (
             <Leaderboard teams={season.teams} />
         ) : view === 'fastsim' ? (
-            <FastSim teams={season.teams} schedule={season.schedule} savedResults={fastSimResults} onResultsChange={setFastSimResults} />
+            <FastSim teams={season.teams} schedule={season.schedule} savedResults={fastSimResults} onResultsChange={setFastSimResults} ensembleRef={fastSimEnsemble} />
         ) : view === 'archive' ? (
             <GameArchive schedule={season.schedule} teams={season.teams} />
         ) : (
@@ -1,16 +1,27 @@
 import React, { useMemo, useState, useEffect } from "react";
 import { Team, GameResult } from "../types";
 import { runFastSim, FastSimSummary, AwardEntry } from "../services/fastSim";
+import { IncrementalSim, createIncrementalSim, summarizeIncrementalSim } from "../services/incrementalSim";
 
 interface FastSimProps {
   teams: Team[];
   schedule: GameResult[];
   savedResults: FastSimSummary | null;
   onResultsChange: (results: FastSimSummary | null) => void;
+  // Cached seasons for live updates, owned by App so real results fold in on every view
+  ensembleRef: React.MutableRefObject<IncrementalSim | null>;
 }
 
 const formatPct = (value: number) => `${value.toFixed(1)}%`;
 
+// Adaptive runs stop once every team's playoff and World Series odds are within +/-1 point (95%).
+// That takes about 4,000 seasons on a typical league, so the adaptive cap defaults well above it.
+const ADAPTIVE_TARGET_WIDTH = 2;
+const ADAPTIVE_SIM_CAP = 10000;
+
+const ErrorBar = ({ value }: { value?: number }) =>
+  value === undefined ? null : <span className="text-[10px] text-slate-500 ml-1">±{value.toFixed(1)}</span>;
+
 const AwardTable = ({ title, entries }: { title: string; entries: AwardEntry[] }) => (
   <div className="bg-slate-900 border border-slate-800 rounded-lg p-4">
     <h3 className="text-sm uppercase font-bold text-slate-400 mb-3">{title}</h3>
@@ -29,12 +40,15 @@ const AwardTable = ({ title, entries }: { title: string; entries: AwardEntry[] }
   </div>
 );
 
-export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults, onResultsChange }) => {
+export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults, onResultsChange, ensembleRef }) => {
   const [simCount, setSimCount] = useState(2000);
   const [running, setRunning] = useState(false);
   const [progress, setProgress] = useState(0);
   const [selectedTeamId, setSelectedTeamId] = useState<string>(teams[0]?.id || "");
   const [freshProjection, setFreshProjection] = useState(false);
+  const [liveUpdates, setLiveUpdates] = useState(false);
+  const [adaptive, setAdaptive] = useState(true);
+  const [simCap, setSimCap] = useState(ADAPTIVE_SIM_CAP);
   
   // Use saved results from parent - persists across view changes
   const results = savedResults;
@@ -42,6 +56,8 @@ export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults,
   // Calculate remaining games to show warning if season is complete
   const remainingGames = schedule.filter(g => !g.played && !g.isPostseason).length;
   const seasonComplete = remainingGames === 0 && schedule.length > 0;
+  // Live updates keep a fixed ensemble, so adaptive stopping only applies to one-off runs
+  const adaptiveRun = adaptive && !(liveUpdates && !freshProjection);
 
   const runSimulation = async () => {
     if (!teams.every(t => t.isRosterGenerated)) {
@@ -53,8 +69,20 @@ export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults,
     setProgress(0);
 
     await new Promise(resolve => setTimeout(resolve, 0));
-    // Pass freshProjection flag to simulate full season from scratch if enabled
-    const summary = runFastSim(teams, schedule, simCount, freshProjection);
+    let summary: FastSimSummary;
+    if (liveUpdates && !freshProjection) {
+      ensembleRef.current = createIncrementalSim(teams, schedule, simCount);
+      summary = summarizeIncrementalSim(ensembleRef.current);
+    } else {
+      ensembleRef.current = null;
+      // Pass freshProjection flag to simulate full season from scratch if enabled.
+      // In adaptive mode the count is only the cap.
+      summary = runFastSim(teams, schedule, adaptiveRun ? simCap : simCount, freshProjection, {
+        antithetic: true,
+        stratified: true,
+        targetWidth: adaptiveRun ? ADAPTIVE_TARGET_WIDTH : undefined
+      });
+    }
     onResultsChange(summary);
     setSelectedTeamId(teams[0]?.id || "");
     setProgress(100);
@@ -69,28 +97,29 @@ export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults,
     const dist = selectedTeamOdds.winsDist;
     const wins = Object.keys(dist).map(Number);
     const binSize = 5;
-    const bins: { label: string; count: number }[] = [];
+    const bins: { label: string; prob: number }[] = [];
 
     if (wins.length === 0) {
       const mean = Math.round(selectedTeamOdds.meanWins);
-      return [{ label: `${mean}-${mean}`, count: results?.simulations || 1 }];
+      return [{ label: `${mean}-${mean}`, prob: 1 }];
     }
 
     const minWin = Math.min(...wins);
     const maxWin = Math.max(...wins);
 
     for (let w = minWin; w <= maxWin; w += binSize) {
-      let count = 0;
+      let prob = 0;
       for (let i = w; i < w + binSize; i++) {
-        count += dist[i] || 0;
+        prob += dist[i] || 0;
       }
-      bins.push({ label: `${w}-${w + binSize - 1}`, count });
+      bins.push({ label: `${w}-${w + binSize - 1}`, prob });
     }
 
     return bins;
-  }, [selectedTeamOdds, results?.simulations]);
+  }, [selectedTeamOdds]);
 
-  const maxCount = Math.max(1, ...histogramData.map(b => b.count));
+  // winsDist holds probabilities, so bars scale against the tallest bin
+  const maxProb = Math.max(0, ...histogramData.map(b => b.prob)) || 1;
 
   return (
     <div className="space-y-6">
@@ -130,14 +159,39 @@ export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults,
               />
               <span className="text-xs text-slate-400">Fresh Projection</span>
             </label>
-            <input
-              type="number"
-              min={100}
-              step={100}
-              value={simCount}
-              onChange={(e) => setSimCount(Number(e.target.value))}
-              className="w-32 bg-slate-950 border border-slate-700 text-slate-200 px-3 py-2 rounded text-sm"
-            />
+            {/* Live Updates Toggle */}
+            <label className="flex items-center gap-2 cursor-pointer">
+              <input
+                type="checkbox"
+                checked={liveUpdates && !freshProjection}
+                disabled={freshProjection}
+                onChange={(e) => setLiveUpdates(e.target.checked)}
+                className="w-4 h-4 accent-emerald-500"
+              />
+              <span className="text-xs text-slate-400">Live Updates</span>
+            </label>
+            {/* Adaptive Stopping Toggle */}
+            <label className="flex items-center gap-2 cursor-pointer" title="Stop once playoff and World Series odds are within ±1%; the count becomes a cap">
+              <input
+                type="checkbox"
+                checked={adaptiveRun}
+                disabled={liveUpdates && !freshProjection}
+                onChange={(e) => setAdaptive(e.target.checked)}
+                className="w-4 h-4 accent-amber-500"
+              />
+              <span className="text-xs text-slate-400">Adaptive</span>
+            </label>
+            <label className="flex items-center gap-2" title={adaptiveRun ? "Maximum seasons; the run stops earlier once the odds are within ±1%" : "Seasons to simulate"}>
+              <span className="text-xs text-slate-400">{adaptiveRun ? "Max sims" : "Sims"}</span>
+              <input
+                type="number"
+                min={100}
+                step={100}
+                value={adaptiveRun ? simCap : simCount}
+                onChange={(e) => (adaptiveRun ? setSimCap : setSimCount)(Number(e.target.value))}
+                className="w-32 bg-slate-950 border border-slate-700 text-slate-200 px-3 py-2 rounded text-sm"
+              />
+            </label>
             <button
               onClick={runSimulation}
               disabled={running}
@@ -155,7 +209,10 @@ export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults,
             <div className="bg-slate-900 border border-slate-800 rounded-xl p-5">
               <div className="flex items-center justify-between mb-4">
                 <h3 className="text-sm uppercase text-slate-400 font-bold">Team Odds</h3>
-                <div className="text-xs text-slate-500">Simulations: {results.simulations}</div>
+                <div className="text-xs text-slate-500">
+                  Simulations: {results.simulations}
+                  {results.effectiveSimulations !== undefined && ` (effective ${Math.round(results.effectiveSimulations)})`}
+                </div>
               </div>
               <div className="overflow-x-auto custom-scrollbar">
                 <table className="w-full text-sm text-left text-slate-300">
@@ -177,11 +234,11 @@ export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults,
                         <tr key={team.teamId} className="border-b border-slate-800/50">
                           <td className="px-2 py-2 font-semibold text-slate-200">{team.teamName}</td>
                           <td className="px-2 py-2 text-right font-mono">{team.meanWins.toFixed(1)}</td>
-                          <td className="px-2 py-2 text-right font-mono text-emerald-400">{formatPct(team.playoffPct)}</td>
+                          <td className="px-2 py-2 text-right font-mono text-emerald-400">{formatPct(team.playoffPct)}<ErrorBar value={team.errors?.playoffPct} /></td>
                           <td className="px-2 py-2 text-right font-mono">{formatPct(team.divisionPct)}</td>
                           <td className="px-2 py-2 text-right font-mono">{formatPct(team.wildCardPct)}</td>
                           <td className="px-2 py-2 text-right font-mono">{formatPct(team.pennantPct)}</td>
-                          <td className="px-2 py-2 text-right font-mono">{formatPct(team.worldSeriesPct)}</td>
+                          <td className="px-2 py-2 text-right font-mono">{formatPct(team.worldSeriesPct)}<ErrorBar value={team.errors?.worldSeriesPct} /></td>
                         </tr>
                       ))}
                   </tbody>
@@ -222,7 +279,7 @@ export const FastSim: React.FC<FastSimProps> = ({ teams, schedule, savedResults,
                           <div
                             className="w-full bg-emerald-500/80 rounded-t transition-all duration-200"
                             style={{ 
-                              height: `${Math.max(4, (bin.count / maxCount) * 170)}px`,
+                              height: `${Math.max(4, (bin.prob / maxProb) * 170)}px`,
                               minHeight: '4px'
                             }}
                           ></div>
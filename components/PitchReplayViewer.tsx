@@ -1,5 +1,6 @@
 import React, { useState, useMemo, useRef, useEffect } from 'react';
 import { GameReplayData, ReplayPitchEvent, ReplayVector3 } from '../types';
+import { withBallPaths } from '../services/pitchTrajectory';
 
 interface PitchReplayViewerProps {
   replay: GameReplayData;
@@ -218,7 +219,7 @@ const StrikeZoneChart: React.FC<{
 // Sub-component: 3D trajectory viewer (side + top views)
 // ======================================================================
 const TrajectoryView: React.FC<{ pitch: ReplayPitchEvent }> = ({ pitch }) => {
-  const { ballPath, releasePoint, platePoint } = pitch;
+  const { ballPath = [], releasePoint, platePoint } = pitch;
   const color = pitchColor(pitch.pitchType);
   const sidePoints = ballPath.map(projectSide);
   const topPoints  = ballPath.map(projectTop);
@@ -588,9 +589,9 @@ export const PitchReplayViewer: React.FC<PitchReplayViewerProps> = ({
   const [activeView, setActiveView] = useState<'spray' | '3d' | 'field'>('spray');
   const [leftView, setLeftView] = useState<'zone' | 'field'>('zone');
 
-  // Extract all pitch events from replay
+  // Extract all pitch events from replay; ball paths are synthesized here, in one batch
   const allPitches = useMemo(
-    () => replay.events.filter((e): e is ReplayPitchEvent => e.kind === 'pitch'),
+    () => withBallPaths(replay.events.filter((e): e is ReplayPitchEvent => e.kind === 'pitch')),
     [replay]
   );
 
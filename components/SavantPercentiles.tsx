@@ -0,0 +1,41 @@
+import React from 'react';
+import { Player, Position } from '../types';
+import { LeaderboardTable, getPlayerMlbId, getSavantLeaderboardYears, getSavantPercentiles } from '../services/savantLeaderboards';
+import { SAVANT_STAT_LABELS } from './leaderboard/utils';
+
+// Savant-style percentile bars (blue = poor, red = elite) for a real player's latest qualified season
+const percentileColor = (pct: number) => {
+  const t = pct / 100;
+  const r = Math.round(50 + t * 164);
+  const g = Math.round(100 - Math.abs(t - 0.5) * 100);
+  const b = Math.round(214 - t * 164);
+  return `rgb(${r}, ${g}, ${b})`;
+};
+
+export const SavantPercentiles: React.FC<{ player: Player }> = ({ player }) => {
+  const mlbId = getPlayerMlbId(player.id);
+  if (mlbId === undefined) return null;
+
+  const table: LeaderboardTable = player.position === Position.P ? 'pitching' : 'batting';
+  const season = getSavantLeaderboardYears(table)
+    .map(year => ({ year, percentiles: getSavantPercentiles(mlbId, table, year) }))
+    .find(s => Object.keys(s.percentiles).length > 0);
+  if (!season) return null;
+
+  return (
+    <div className="mt-4 pt-4 border-t border-slate-700">
+      <h5 className="text-xs font-bold text-emerald-400 uppercase tracking-wider mb-3">Statcast Percentiles ({season.year})</h5>
+      <div className="grid grid-cols-1 sm:grid-cols-2 gap-x-6 gap-y-1.5">
+        {Object.entries(season.percentiles).map(([stat, pct]) => (
+          <div key={stat} className="flex items-center gap-2 text-xs">
+            <span className="w-28 shrink-0 text-slate-400">{SAVANT_STAT_LABELS[stat] ?? stat}</span>
+            <div className="flex-1 h-2 bg-slate-900 rounded-full overflow-hidden">
+              <div className="h-full rounded-full" style={{ width: `${Math.max(2, pct)}%`, backgroundColor: percentileColor(pct) }}></div>
+            </div>
+            <span className="w-7 text-right font-mono text-slate-200">{pct}</span>
+          </div>
+        ))}
+      </div>
+    </div>
+  );
+};
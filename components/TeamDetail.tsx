@@ -3,6 +3,7 @@ import React, { useState, useMemo } from 'react';
 import { Team, Player } from '../types';
 import { generateTeamData } from '../services/leagueService';
 import { getAdvancedScoutingReport } from '../services/scoutingService';
+import { SavantPercentiles } from './SavantPercentiles';
 
 // === ROSTER REGULARS SECTION ===
 type HitterSortKey = 'name' | 'g' | 'avg' | 'hr' | 'rbi' | 'ops' | 'war';
@@ -724,6 +725,8 @@ export const TeamDetail: React.FC<TeamDetailProps> = ({ team, onUpdateTeam, onCl
                   "{scoutingReport.report}"
                </p>
                
+               <SavantPercentiles player={scoutingReport.player} />
+
                {/* Pitch Repertoire for Pitchers */}
                {scoutingReport.player.position === 'P' && scoutingReport.player.pitchRepertoire && scoutingReport.player.pitchRepertoire.length > 0 && (
                   <div className="mt-4 pt-4 border-t border-slate-700">
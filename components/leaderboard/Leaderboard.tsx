@@ -1,17 +1,19 @@
 
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
 import { Player, Team, Position } from '../../types';
 import { LeaderboardControls } from './LeaderboardControls';
 import { LeaderboardTable } from './LeaderboardTable';
 import { StatCategory, SortKey, getValue } from './utils';
 import { TeamLeaderboard } from '../TeamLeaderboard';
+import { SavantLeaders } from './SavantLeaders';
+import { createPlayerSearch } from '../../services/playerSearch';
 
 interface LeaderboardProps {
   teams: Team[];
 }
 
 export const Leaderboard: React.FC<LeaderboardProps> = ({ teams }) => {
-  const [mode, setMode] = useState<'players' | 'teams'>('players');
+  const [mode, setMode] = useState<'players' | 'teams' | 'statcast'>('players');
   const [category, setCategory] = useState<StatCategory>('batting');
   const [sortKey, setSortKey] = useState<SortKey>('war');
   const [sortAscending, setSortAscending] = useState(false);
@@ -20,7 +22,17 @@ export const Leaderboard: React.FC<LeaderboardProps> = ({ teams }) => {
   const [leagueFilter, setLeagueFilter] = useState<'All' | 'AL' | 'NL'>('All');
 
   // Flatten players with team info
-  const allPlayers = teams.flatMap(t => t.roster.map(p => ({ ...p, teamAbbr: t.abbreviation, teamLeague: t.league })));
+  const allPlayers = useMemo(
+    () => teams.flatMap(t => t.roster.map(p => ({ ...p, teamAbbr: t.abbreviation, teamLeague: t.league }))),
+    [teams]
+  );
+
+  // Name index (accent folding, nicknames, typo tolerance) instead of scanning every name per keystroke
+  const searchIndex = useMemo(() => createPlayerSearch(allPlayers.map(p => ({ id: p.id, name: p.name }))), [allPlayers]);
+  const searchMatches = useMemo(
+    () => searchTerm.trim() ? new Set(searchIndex.search(searchTerm, allPlayers.length).map(m => m.id)) : null,
+    [searchIndex, searchTerm, allPlayers.length]
+  );
 
   // Calculate qualification thresholds dynamically based on games played
   const maxGames = Math.max(...teams.map(t => t.wins + t.losses)) || 1;
@@ -33,8 +45,7 @@ export const Leaderboard: React.FC<LeaderboardProps> = ({ teams }) => {
         // League filter
         if (leagueFilter !== 'All' && p.teamLeague !== leagueFilter) return false;
         
-        const matchesSearch = p.name.toLowerCase().includes(searchTerm.toLowerCase());
-        if (!matchesSearch) return false;
+        if (searchMatches && !searchMatches.has(p.id)) return false;
 
         const pa = (p.statsCounters.ab + p.statsCounters.bb + p.statsCounters.hbp + p.statsCounters.sf + p.statsCounters.sac);
         const ip = p.pitching?.ip || 0;
@@ -87,6 +98,12 @@ export const Leaderboard: React.FC<LeaderboardProps> = ({ teams }) => {
             >
               Team Leaders
             </button>
+            <button 
+              onClick={() => setMode('statcast')} 
+              className={`px-4 py-2 rounded-lg font-semibold transition ${mode === 'statcast' ? 'bg-emerald-600 text-white' : 'bg-slate-800 text-slate-400 hover:bg-slate-700'}`}
+            >
+              Statcast (MLB)
+            </button>
           </div>
           {mode === 'players' && (
             <div className="flex gap-2">
@@ -136,8 +153,10 @@ export const Leaderboard: React.FC<LeaderboardProps> = ({ teams }) => {
                 }} 
             />
           </>
-        ) : (
+        ) : mode === 'teams' ? (
           <TeamLeaderboard teams={teams} />
+        ) : (
+          <SavantLeaders />
         )}
     </div>
   );
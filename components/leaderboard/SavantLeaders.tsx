@@ -0,0 +1,61 @@
+import React, { useMemo, useState } from 'react';
+import { LeaderboardTable, getSavantLeaderboardStats, getSavantLeaderboardYears, getSavantLeaders } from '../../services/savantLeaderboards';
+import { SAVANT_STAT_LABELS, formatSavantValue } from './utils';
+
+// Real-MLB Statcast leaders, precomputed by scripts/buildLeaderboards.py (qualified players only)
+export const SavantLeaders: React.FC = () => {
+    const [table, setTable] = useState<LeaderboardTable>('batting');
+    const years = getSavantLeaderboardYears(table);
+    const stats = getSavantLeaderboardStats(table);
+    const [year, setYear] = useState(years[0] ?? '');
+    const [stat, setStat] = useState(stats[0] ?? '');
+
+    const activeYear = years.includes(year) ? year : years[0] ?? '';
+    const activeStat = stats.includes(stat) ? stat : stats[0] ?? '';
+    const leaders = useMemo(() => getSavantLeaders(table, activeYear, activeStat, 25), [table, activeYear, activeStat]);
+
+    const selectClass = "bg-slate-800 border border-slate-700 text-white rounded-lg px-3 py-2 text-sm focus:ring-emerald-500 focus:border-emerald-500 focus:outline-none";
+
+    return (
+        <div>
+            <div className="flex flex-col md:flex-row justify-between items-center mb-6 gap-4">
+                <h2 className="text-2xl font-bold text-white">Statcast Leaders <span className="text-sm font-normal text-slate-500">(MLB)</span></h2>
+                <div className="flex flex-wrap gap-2">
+                    <select value={table} onChange={e => setTable(e.target.value as LeaderboardTable)} className={selectClass}>
+                        <option value="batting">Hitters</option>
+                        <option value="pitching">Pitchers</option>
+                    </select>
+                    <select value={activeYear} onChange={e => setYear(e.target.value)} className={selectClass}>
+                        {years.map(y => <option key={y} value={y}>{y}</option>)}
+                    </select>
+                    <select value={activeStat} onChange={e => setStat(e.target.value)} className={selectClass}>
+                        {stats.map(s => <option key={s} value={s}>{SAVANT_STAT_LABELS[s] ?? s}</option>)}
+                    </select>
+                </div>
+            </div>
+            <div className="overflow-x-auto custom-scrollbar max-h-[650px] rounded-lg border border-slate-700">
+                <table className="w-full text-left text-sm text-slate-300">
+                    <thead className="bg-slate-800 text-slate-400 uppercase font-bold sticky top-0 z-10 shadow-sm">
+                        <tr>
+                            <th className="px-4 py-3 border-b border-slate-700">Rank</th>
+                            <th className="px-4 py-3 border-b border-slate-700">Player</th>
+                            <th className="px-4 py-3 text-right border-b border-slate-700 text-emerald-400">{SAVANT_STAT_LABELS[activeStat] ?? activeStat}</th>
+                        </tr>
+                    </thead>
+                    <tbody className="divide-y divide-slate-800">
+                        {leaders.map(leader => (
+                            <tr key={leader.mlbId} className="hover:bg-slate-800/50 transition">
+                                <td className="px-4 py-2 font-mono text-slate-500">{leader.rank}</td>
+                                <td className="px-4 py-2 font-medium text-white">{leader.name}</td>
+                                <td className="px-4 py-2 text-right font-mono">{formatSavantValue(activeStat, leader.value)}</td>
+                            </tr>
+                        ))}
+                        {leaders.length === 0 && (
+                            <tr><td colSpan={3} className="px-4 py-6 text-center text-slate-500">No Statcast data for this season</td></tr>
+                        )}
+                    </tbody>
+                </table>
+            </div>
+        </div>
+    );
+};
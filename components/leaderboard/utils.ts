@@ -109,3 +109,21 @@ export const getHeaders = (category: StatCategory): { key: SortKey; label: strin
             ];
     }
 };
+
+// Labels for the Statcast leaderboards and percentile bars (services/savantLeaderboards)
+export const SAVANT_STAT_LABELS: Record<string, string> = {
+    xwoba: 'xwOBA', xba: 'xBA', xslg: 'xSLG', woba: 'wOBA', ba: 'BA', slg: 'SLG', xera: 'xERA',
+    k_pct: 'K%', bb_pct: 'BB%', chase_pct: 'Chase%', whiff_pct: 'Whiff%', gb_pct: 'GB%',
+    avg_exit_velo: 'Avg EV', max_exit_velo: 'Max EV', avg_exit_velo_against: 'Avg EV',
+    barrel_pct: 'Barrel%', hard_hit_pct: 'Hard-Hit%', la_sweet_spot_pct: 'Sweet Spot%',
+    sprint_speed: 'Sprint Speed', fastball_velo: 'FB Velo',
+    pitching_run_value: 'Pitching Run Value', fastball_run_value: 'Fastball RV',
+    breaking_run_value: 'Breaking RV', offspeed_run_value: 'Offspeed RV',
+};
+
+export const formatSavantValue = (stat: string, value: number): string => {
+    if (['xwoba', 'xba', 'xslg', 'woba', 'ba', 'slg'].includes(stat)) return value.toFixed(3).replace(/^0/, '');
+    if (stat === 'xera') return value.toFixed(2);
+    if (stat.endsWith('_run_value')) return value.toFixed(0);
+    return value.toFixed(1);
+};
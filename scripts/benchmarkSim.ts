@@ -0,0 +1,68 @@
+// Throughput + calibration benchmark for the season and game engines
+// Plays the fixed league (seeded synthetic league, or a saved season file) on services/schedule.json
+// Run: npm run bench:sim -- [--seed N] [--sims N] [--days N] [--no-replay] [--league grand_slam_data.json] [--out report.json]
+
+import { readFileSync, writeFileSync } from 'node:fs';
+import { resolve } from 'node:path';
+import { Team } from '../types';
+import { runBenchmark, BenchmarkOptions } from '../services/benchmark';
+
+function parseArgs(argv: string[]) {
+  const options: BenchmarkOptions = {};
+  let leaguePath = '';
+  let outPath = '';
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--seed') options.seed = Number(argv[++i]);
+    else if (arg === '--sims') options.fastSimulations = Number(argv[++i]);
+    else if (arg === '--days') options.gameDays = Number(argv[++i]);
+    else if (arg === '--no-replay') options.captureReplay = false;
+    else if (arg === '--league') leaguePath = argv[++i];
+    else if (arg === '--out') outPath = argv[++i];
+  }
+  return { options, leaguePath, outPath };
+}
+
+function loadLeague(path: string): Team[] | undefined {
+  if (!path) return undefined;
+  // Accepts the season file written by "Save Data" in the app (SeasonState JSON)
+  const data = JSON.parse(readFileSync(resolve(path), 'utf8'));
+  return Array.isArray(data) ? data : data.teams;
+}
+
+const fmt = (value: number, digits = 1) => value.toLocaleString('en-US', { maximumFractionDigits: digits, minimumFractionDigits: digits });
+
+function main() {
+  const { options, leaguePath, outPath } = parseArgs(process.argv.slice(2));
+  const teams = loadLeague(leaguePath);
+
+  console.log('='.repeat(60));
+  console.log(`Simulation benchmark (${teams ? leaguePath : 'synthetic league'})`);
+  console.log('='.repeat(60));
+
+  const report = runBenchmark(options, teams);
+  const fs = report.fastSim;
+  const ge = report.gameEngine;
+
+  console.log(`\nSeason engine (runFastSim, ${fs.simulations} sims x ${fs.gamesPerSimulation} games):`);
+  console.log(`  ${fmt(fs.simsPerSec)} sims/sec, ${fmt(fs.gamesPerSec, 0)} games/sec (${fmt(fs.elapsedMs, 0)} ms)`);
+  console.log(`  Mean wins: best ${fmt(fs.bestMeanWins)}, worst ${fmt(fs.worstMeanWins)}, spread ${fmt(fs.winSpread)}`);
+  console.log(`  Win SD: team means ${fmt(fs.meanWinsStdDev, 2)}, all team-seasons ${fmt(fs.seasonWinsStdDev, 2)}`);
+
+  console.log(`\nGame engine (simulateGame, ${ge.games} games):`);
+  console.log(`  ${fmt(ge.gamesPerSec)} games/sec, ${fmt(ge.pitchesPerSec, 0)} pitches/sec (${fmt(ge.elapsedMs, 0)} ms)`);
+  console.log(`  K% ${fmt(ge.kPct * 100)}, BB% ${fmt(ge.bbPct * 100)}, HR/PA ${fmt(ge.hrPerPa * 100, 2)}%, HR/G ${fmt(ge.hrPerGame, 2)}, BABIP ${fmt(ge.babip, 3)}`);
+  console.log(`  R/G ${fmt(ge.runsPerGame, 2)}, P/PA ${fmt(ge.pitchesPerPa, 2)}`);
+
+  console.log('\nCalibration checks:');
+  report.checks.forEach(c => {
+    console.log(`  ${c.ok ? '✔' : '✘'} ${c.metric}: ${fmt(c.value, 3)} (target ${c.min}-${c.max})`);
+  });
+
+  if (outPath) {
+    writeFileSync(resolve(outPath), JSON.stringify(report, null, 2));
+    console.log(`\nWrote report to ${resolve(outPath)}`);
+  }
+}
+
+main();
@@ -0,0 +1,112 @@
+// League snapshot benchmark: daily checkpoints, deltas, full encode and restore versus JSON
+// Simulates the first days of the 2026 schedule with the benchmark league (or a saved season file)
+// Run: npm run bench:snapshot -- [--league grand_slam_data.json] [--seed N] [--days 20]
+
+import { readFileSync } from 'node:fs';
+import { resolve } from 'node:path';
+import { GameResult, SeasonState, Team } from '../types';
+import { buildBenchmarkLeague } from '../services/benchmark';
+import { parseScheduleCSV } from '../services/scheduleData';
+import { simulateGame } from '../services/simulator';
+import {
+  createLeagueSnapshot,
+  decodeLeagueSnapshot,
+  diffLeagueSnapshots,
+  encodeLeagueSnapshot,
+  encodeLeagueSnapshotDelta,
+  restoreLeagueSnapshot
+} from '../services/leagueSnapshot';
+
+function parseArgs(argv: string[]) {
+  let seed = 20260325;
+  let days = 20;
+  let leaguePath = '';
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--seed') seed = Number(argv[++i]);
+    else if (arg === '--days') days = Number(argv[++i]);
+    else if (arg === '--league') leaguePath = argv[++i];
+  }
+  return { seed, days, leaguePath };
+}
+
+function loadSeason(path: string): SeasonState | undefined {
+  if (!path) return undefined;
+  // Accepts the season file written by "Save JSON" in the app (SeasonState JSON)
+  const data = JSON.parse(readFileSync(resolve(path), 'utf8'));
+  return { ...data, date: new Date(data.date), isPlaying: false };
+}
+
+const fmt = (value: number, digits = 0) => value.toLocaleString('en-US', { maximumFractionDigits: digits, minimumFractionDigits: digits });
+const kb = (bytes: number) => `${fmt(bytes / 1024)} KB`;
+
+const timed = <T>(fn: () => T): [T, number] => {
+  const start = performance.now();
+  const result = fn();
+  return [result, performance.now() - start];
+};
+
+// One sim day: play the day's unplayed games and record them in the standings
+function playDay(season: SeasonState, date: string, seed: number): SeasonState {
+  const teams = new Map<string, Team>(season.teams.map(t => [t.id, t]));
+  const schedule = season.schedule.map((game, index): GameResult => {
+    if (game.date !== date || game.played) return game;
+    const home = teams.get(game.homeTeamId);
+    const away = teams.get(game.awayTeamId);
+    if (!home || !away) return game;
+    const result = simulateGame(home, away, new Date(date), false, { seed: seed + index });
+    const winner = result.winnerId === home.id ? home : away;
+    const loser = winner === home ? away : home;
+    winner.wins++;
+    loser.losses++;
+    return { ...result, id: game.id, date: game.date };
+  });
+  return { ...season, schedule, date: new Date(date) };
+}
+
+function main() {
+  const { seed, days, leaguePath } = parseArgs(process.argv.slice(2));
+  const loaded = loadSeason(leaguePath);
+  const schedule = parseScheduleCSV();
+  let season: SeasonState = loaded ?? {
+    teams: buildBenchmarkLeague(seed),
+    schedule,
+    date: new Date(schedule[0].date),
+    phase: 'Regular Season',
+    isPlaying: false,
+    postseason: null
+  };
+
+  console.log('='.repeat(60));
+  console.log(`League snapshots (${loaded ? leaguePath : 'synthetic league'}, ${days} sim days)`);
+  console.log('='.repeat(60));
+
+  let snapshot = createLeagueSnapshot(season);
+  const dates = [...new Set(season.schedule.filter(g => !g.played).map(g => g.date))].slice(0, days);
+  let checkpointMs = 0;
+  let deltaBytes = 0;
+  dates.forEach(date => {
+    season = playDay(season, date, seed);
+    const [next, ms] = timed(() => createLeagueSnapshot(season, snapshot));
+    checkpointMs += ms;
+    deltaBytes += encodeLeagueSnapshotDelta(diffLeagueSnapshots(snapshot, next), next.pool).length;
+    snapshot = next;
+  });
+
+  const [json, jsonMs] = timed(() => JSON.stringify(season));
+  const [, parseMs] = timed(() => JSON.parse(json));
+  const [bytes, encodeMs] = timed(() => encodeLeagueSnapshot(snapshot));
+  const [decoded, decodeMs] = timed(() => decodeLeagueSnapshot(bytes));
+  const [, restoreMs] = timed(() => restoreLeagueSnapshot(decoded));
+  const [, forkMs] = timed(() => restoreLeagueSnapshot(snapshot));
+
+  const dayCount = Math.max(1, dates.length);
+  console.log(`\nDaily checkpoint      ${fmt(checkpointMs / dayCount, 1)}ms, delta ${kb(deltaBytes / dayCount)}`);
+  console.log(`Fork (restore)        ${fmt(forkMs, 1)}ms`);
+  console.log(`\n${'Format'.padEnd(10)}${'Size'.padStart(12)}${'Save'.padStart(10)}${'Load'.padStart(10)}`);
+  console.log(`${'JSON'.padEnd(10)}${kb(json.length).padStart(12)}${`${fmt(jsonMs)}ms`.padStart(10)}${`${fmt(parseMs)}ms`.padStart(10)}`);
+  console.log(`${'Snapshot'.padEnd(10)}${kb(bytes.length).padStart(12)}${`${fmt(encodeMs)}ms`.padStart(10)}${`${fmt(decodeMs + restoreMs)}ms`.padStart(10)}`);
+  console.log(`\nSnapshot is ${fmt(100 * bytes.length / json.length, 1)}% of the JSON size`);
+}
+
+main();
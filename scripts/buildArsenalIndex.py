@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Build the nearest-neighbor arsenal index used for pitchers without a Savant arsenal.
+
+Reads services/savantRegistry.json and writes services/arsenalIndex.json: one
+profile per (pitcher, season) that has both a pitch arsenal and a pitching
+line, mapped to that season's arsenal. Profiles are
+
+  fastball_velo, whiff_pct, gb_pct, k_pct, bb_pct, role
+
+standardized to z-scores. Savant records a 0 for stats it has no number for;
+those are filled with the season-independent league mean (fastball velocity
+from the arsenal's own fastball when possible), so they don't pull a profile
+toward either end. The artifacts carry no starts or innings, so role comes
+from arsenal depth: four or more pitches thrown at least 5% of the time marks
+a starter's repertoire. Role is weighted as a soft constraint (ROLE_WEIGHT
+standard deviations) rather than a hard split.
+
+The profiles are stored as an implicit balanced KD-tree: points are ordered so
+that the median of every [lo, hi) range is a node, and `axes` holds the split
+dimension of each node. services/arsenalIndex.ts queries it for the k most
+similar real pitchers and blends their arsenals, so fallbacks are
+deterministic and take microseconds.
+
+Usage:
+    python scripts/buildArsenalIndex.py build
+    python scripts/buildArsenalIndex.py query --velo 97 --whiff 31 --role reliever [--k 5]
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import sys
+from datetime import datetime
+
+from savantRegistry import REGISTRY_PATH, SERVICES_DIR
+
+
+ARSENAL_INDEX_PATH = os.path.join(SERVICES_DIR, 'arsenalIndex.json')
+ARSENAL_INDEX_VERSION = 1
+
+# Profile dimensions: registry pitching field (None = derived)
+FEATURES = ['fastball_velo', 'whiff_pct', 'gb_pct', 'k_pct', 'bb_pct', 'role']
+STAT_FEATURES = FEATURES[:-1]
+ROLE_WEIGHT = 2.0
+STARTER_PITCHES = 4
+STARTER_MIN_USAGE = 5.0
+
+FASTBALL_TYPES = {'Four-Seam Fastball', 'Sinker'}
+
+
+def _fastball_speed(pitches, pitch_types):
+    """Speed of the most-used fastball in an encoded arsenal, or 0."""
+    best = None
+    for type_idx, speed, usage in pitches:
+        if pitch_types[type_idx] in FASTBALL_TYPES and (best is None or usage > best[1]):
+            best = (speed, usage)
+    return best[0] if best else 0
+
+
+def _is_starter(pitches):
+    return sum(1 for _, _, usage in pitches if usage >= STARTER_MIN_USAGE) >= STARTER_PITCHES
+
+
+def collect_profiles(registry):
+    """Raw (mlbId, year, stats, role, arsenal) for every season with an arsenal and a pitching line."""
+    players = registry['players']['rows']
+    pitching = registry['tables'].get('pitching')
+    arsenal = registry['tables'].get('arsenal')
+    if not pitching or not arsenal:
+        return [], []
+    fields = pitching['fields']
+    pitch_types = arsenal['pitchTypes']
+
+    profiles = []
+    for year, rows in arsenal['years'].items():
+        lines = {row[0]: row for row in pitching['years'].get(year, [])}
+        for idx, pitches in rows:
+            line = lines.get(idx)
+            if not pitches or line is None:
+                continue
+            stats = {f: line[fields.index(f) + 1] for f in STAT_FEATURES}
+            if not stats['fastball_velo']:
+                stats['fastball_velo'] = _fastball_speed(pitches, pitch_types)
+            profiles.append({
+                'mlbId': players[idx][0],
+                'year': int(year),
+                'stats': stats,
+                'starter': _is_starter(pitches),
+                'arsenal': pitches,
+            })
+    profiles.sort(key=lambda p: (p['mlbId'], p['year']))
+    return profiles, pitch_types
+
+
+def standardize(profiles):
+    """Mean and scale per stat feature over the non-missing values."""
+    mean, scale = [], []
+    for f in STAT_FEATURES:
+        values = [p['stats'][f] for p in profiles if p['stats'][f]]
+        m = sum(values) / len(values) if values else 0.0
+        var = sum((v - m) ** 2 for v in values) / len(values) if values else 0.0
+        mean.append(m)
+        scale.append(math.sqrt(var) or 1.0)
+    return mean, scale
+
+
+def to_point(stats, starter, mean, scale):
+    point = [((stats[f] or mean[i]) - mean[i]) / scale[i] for i, f in enumerate(STAT_FEATURES)]
+    point.append(ROLE_WEIGHT if starter else 0.0)
+    return point
+
+
+def build_kdtree(points):
+    """Reorder points into an implicit KD-tree. Returns (order, axes)."""
+    dims = len(points[0]) if points else 0
+    order = list(range(len(points)))
+    axes = [0] * len(points)
+
+    def build(lo, hi):
+        if hi - lo <= 0:
+            return
+        # Split on the widest dimension of this range
+        spans = []
+        for d in range(dims):
+            values = [points[order[i]][d] for i in range(lo, hi)]
+            spans.append(max(values) - min(values))
+        axis = spans.index(max(spans))
+        order[lo:hi] = sorted(order[lo:hi], key=lambda i: points[i][axis])
+        mid = (lo + hi) // 2
+        axes[mid] = axis
+        build(lo, mid)
+        build(mid + 1, hi)
+
+    build(0, len(points))
+    return order, axes
+
+
+def build_index(registry):
+    profiles, pitch_types = collect_profiles(registry)
+    mean, scale = standardize(profiles)
+    raw_points = [to_point(p['stats'], p['starter'], mean, scale) for p in profiles]
+    order, axes = build_kdtree(raw_points)
+    return {
+        'format': 'arsenal-index',
+        'version': ARSENAL_INDEX_VERSION,
+        'lastUpdated': datetime.now().isoformat(),
+        'registryUpdated': registry.get('lastUpdated'),
+        'features': FEATURES,
+        'mean': [round(m, 4) for m in mean],
+        'scale': [round(s, 4) for s in scale],
+        'roleWeight': ROLE_WEIGHT,
+        'pitchTypes': pitch_types,
+        # Aligned arrays, in KD-tree order
+        'points': [[round(v, 4) for v in raw_points[i]] for i in order],
+        'axes': axes,
+        'pitchers': [[profiles[i]['mlbId'], profiles[i]['year']] for i in order],
+        'arsenals': [profiles[i]['arsenal'] for i in order],
+    }
+
+
+def write_arsenal_index(registry_path=REGISTRY_PATH, path=ARSENAL_INDEX_PATH):
+    """Rebuild services/arsenalIndex.json. Returns the number of indexed profiles."""
+    with open(registry_path, 'r') as f:
+        registry = json.load(f)
+    data = build_index(registry)
+    with open(path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    return len(data['points'])
+
+
+def query(index, point, k=5):
+    """k nearest profiles to a standardized point (None = ignore that dimension). [(distance, position)]"""
+    points, axes = index['points'], index['axes']
+    best = []  # max-heap of (-distance^2, position)
+
+    def visit(lo, hi):
+        if hi <= lo:
+            return
+        mid = (lo + hi) // 2
+        node = points[mid]
+        dist = sum((node[d] - v) ** 2 for d, v in enumerate(point) if v is not None)
+        if len(best) < k:
+            heapq.heappush(best, (-dist, mid))
+        elif dist < -best[0][0]:
+            heapq.heapreplace(best, (-dist, mid))
+        axis = axes[mid]
+        if point[axis] is None:
+            visit(lo, mid)
+            visit(mid + 1, hi)
+            return
+        diff = point[axis] - node[axis]
+        near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+        visit(*near)
+        if len(best) < k or diff * diff < -best[0][0]:
+            visit(*far)
+
+    visit(0, len(points))
+    return sorted((math.sqrt(-d), pos) for d, pos in best)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Nearest-neighbor index over real pitcher arsenals')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='Rebuild services/arsenalIndex.json from the registry')
+    q = sub.add_parser('query', help='Print the most similar real pitchers for a profile')
+    q.add_argument('--velo', type=float)
+    q.add_argument('--whiff', type=float)
+    q.add_argument('--gb', type=float)
+    q.add_argument('--k-pct', type=float)
+    q.add_argument('--bb-pct', type=float)
+    q.add_argument('--role', choices=['starter', 'reliever'], default='starter')
+    q.add_argument('--k', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        count = write_arsenal_index()
+        print(f"Indexed {count} pitcher-season profiles")
+        print(f"Saved to: {ARSENAL_INDEX_PATH}")
+        return
+
+    try:
+        with open(ARSENAL_INDEX_PATH, 'r') as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        sys.exit(f"{ARSENAL_INDEX_PATH} not found; run `python scripts/buildArsenalIndex.py build` first")
+
+    values = [args.velo, args.whiff, args.gb, args.k_pct, args.bb_pct]
+    point = [None if v is None else (v - index['mean'][i]) / index['scale'][i] for i, v in enumerate(values)]
+    point.append(index['roleWeight'] if args.role == 'starter' else 0.0)
+
+    with open(REGISTRY_PATH, 'r') as f:
+        names = {row[0]: row[1] for row in json.load(f)['players']['rows']}
+    types = index['pitchTypes']
+    for dist, pos in query(index, point, args.k):
+        mlb_id, year = index['pitchers'][pos]
+        mix = ', '.join(f"{types[t]} {speed:.1f} ({usage:.0f}%)" for t, speed, usage in index['arsenals'][pos])
+        print(f"  {dist:5.2f}  {names.get(mlb_id, mlb_id)} {year}: {mix}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Precompute Savant leaderboards and percentile ranks per stat and season.
+
+Reads services/savantRegistry.json and writes services/savantLeaderboards.json:
+
+  for each table (batting / pitching) and season
+    players   mlbIds of the qualified players, ascending
+    stats     per stat:
+                leaders  top-N [mlbId, value] rows, best first
+                pct      0-100 percentile for each qualified player, aligned
+                         with `players` (-1 where the stat is missing)
+
+Qualification mirrors Savant's percentile pages: batters need a minimum number
+of plate appearances. The pitcher artifact has no volume column, so pitchers
+qualify on having tracked batted-ball data. The registry stores a missing stat
+as 0: for stats that can't really be 0 (velocities, expected stats, K%...) a 0
+is left out of the ranking; for stats that can (run values, barrel%, BB%) a 0
+counts when the player has data from the same source (ZERO_VALID_WITH).
+
+The app reads the file through services/savantLeaderboards.ts, so leaderboard
+views and percentile bars are plain lookups with no client-side sorting.
+
+Usage:
+    python scripts/buildLeaderboards.py build
+    python scripts/buildLeaderboards.py leaders batting 2025 xwoba [--limit 10]
+    python scripts/buildLeaderboards.py player 592450 [--year 2025]
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+from savantRegistry import REGISTRY_PATH, SERVICES_DIR
+
+
+LEADERBOARDS_PATH = os.path.join(SERVICES_DIR, 'savantLeaderboards.json')
+LEADERBOARD_SIZE = 50
+
+# table -> (qualifying field, minimum value)
+QUALIFIERS = {
+    'batting': ('pa', 100),
+    'pitching': ('avg_exit_velo_against', 0.1),
+}
+
+# table -> stat -> True when a higher value is better
+STATS = {
+    'batting': {
+        'xwoba': True,
+        'xba': True,
+        'xslg': True,
+        'woba': True,
+        'ba': True,
+        'slg': True,
+        'k_pct': False,
+        'bb_pct': True,
+        'chase_pct': False,
+        'whiff_pct': False,
+        'avg_exit_velo': True,
+        'max_exit_velo': True,
+        'barrel_pct': True,
+        'hard_hit_pct': True,
+        'la_sweet_spot_pct': True,
+        'sprint_speed': True,
+    },
+    'pitching': {
+        'xera': False,
+        'xba': False,
+        'xwoba': False,
+        'avg_exit_velo_against': False,
+        'barrel_pct': False,
+        'hard_hit_pct': False,
+        'gb_pct': True,
+        'k_pct': True,
+        'bb_pct': False,
+        'whiff_pct': True,
+        'chase_pct': True,
+        'pitching_run_value': True,
+        'fastball_run_value': True,
+        'breaking_run_value': True,
+        'offspeed_run_value': True,
+        'fastball_velo': True,
+    },
+}
+
+_RUN_VALUES = ('pitching_run_value', 'fastball_run_value', 'breaking_run_value', 'offspeed_run_value')
+
+# table -> stat -> fields from the same data source (BB% and K% come from
+# FanGraphs); a 0 in the stat is a real value when any of them is nonzero.
+# Other stats treat 0 as "no data".
+ZERO_VALID_WITH = {
+    'batting': {
+        'bb_pct': ('k_pct',),
+        'barrel_pct': ('avg_exit_velo', 'hard_hit_pct'),
+    },
+    'pitching': {
+        'bb_pct': ('k_pct',),
+        'barrel_pct': ('avg_exit_velo_against', 'hard_hit_pct'),
+        **{stat: tuple(other for other in _RUN_VALUES if other != stat) for stat in _RUN_VALUES},
+    },
+}
+
+
+def has_value(table, stat, row, col):
+    """Whether a registry row has a number for `stat` (0 only counts where it can be real)."""
+    if row[col[stat]]:
+        return True
+    sources = ZERO_VALID_WITH.get(table, {}).get(stat, ())
+    return any(field in col and row[col[field]] for field in sources)
+
+
+def percentiles(values, higher_is_better):
+    """0-100 percentile for each value (ties share the midpoint rank)."""
+    n = len(values)
+    if n == 1:
+        return [100]
+    ordered = sorted(values) if higher_is_better else sorted(values, reverse=True)
+    first = {}
+    last = {}
+    for i, v in enumerate(ordered):
+        first.setdefault(v, i)
+        last[v] = i
+    return [round(100 * (first[v] + last[v]) / 2 / (n - 1)) for v in values]
+
+
+def build_leaderboards(registry, limit=LEADERBOARD_SIZE):
+    """Compute {table: {year: {players, stats}}} from a registry dict."""
+    player_ids = [row[0] for row in registry['players']['rows']]
+    tables = {}
+    for table, stats in STATS.items():
+        table_data = registry['tables'].get(table)
+        if not table_data:
+            continue
+        col = {field: i + 1 for i, field in enumerate(table_data['fields'])}
+        qual_field, qual_min = QUALIFIERS[table]
+        years = {}
+        for year, rows in table_data['years'].items():
+            qualified = sorted(
+                (player_ids[row[0]], row) for row in rows
+                if qual_field in col and row[col[qual_field]] >= qual_min
+            )
+            ids = [mlb_id for mlb_id, _ in qualified]
+            year_stats = {}
+            for stat, higher_is_better in stats.items():
+                if stat not in col:
+                    continue
+                ranked = [(pos, row[col[stat]]) for pos, (_, row) in enumerate(qualified) if has_value(table, stat, row, col)]
+                if not ranked:
+                    continue
+                pct = [-1] * len(ids)
+                for (pos, _), p in zip(ranked, percentiles([v for _, v in ranked], higher_is_better)):
+                    pct[pos] = p
+                best_first = sorted(ranked, key=lambda pv: (-pv[1] if higher_is_better else pv[1], ids[pv[0]]))
+                year_stats[stat] = {
+                    'leaders': [[ids[pos], value] for pos, value in best_first[:limit]],
+                    'pct': pct,
+                }
+            years[year] = {'players': ids, 'stats': year_stats}
+        tables[table] = {
+            'qualifier': {'field': qual_field, 'min': qual_min},
+            'higherIsBetter': {stat: hib for stat, hib in stats.items() if stat in col},
+            'years': years,
+        }
+    return {
+        'format': 'savant-leaderboards',
+        'version': 1,
+        'lastUpdated': datetime.now().isoformat(),
+        'registryUpdated': registry.get('lastUpdated'),
+        'leaderboardSize': limit,
+        'tables': tables,
+    }
+
+
+def write_leaderboards(registry_path=REGISTRY_PATH, path=LEADERBOARDS_PATH):
+    """Rebuild services/savantLeaderboards.json. Returns the number of (table, year, stat) boards."""
+    with open(registry_path, 'r') as f:
+        registry = json.load(f)
+    data = build_leaderboards(registry)
+    with open(path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    return sum(len(y['stats']) for t in data['tables'].values() for y in t['years'].values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precomputed Savant leaderboards and percentiles')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='Build services/savantLeaderboards.json from the registry')
+    leaders_parser = sub.add_parser('leaders', help='Print a leaderboard')
+    leaders_parser.add_argument('table', choices=sorted(STATS))
+    leaders_parser.add_argument('year')
+    leaders_parser.add_argument('stat')
+    leaders_parser.add_argument('--limit', type=int, default=10)
+    player_parser = sub.add_parser('player', help="Print a player's percentiles")
+    player_parser.add_argument('mlb_id', type=int)
+    player_parser.add_argument('--year')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        count = write_leaderboards()
+        print(f"Built {count} leaderboards")
+        print(f"Saved to: {LEADERBOARDS_PATH}")
+        return
+
+    with open(LEADERBOARDS_PATH, 'r') as f:
+        data = json.load(f)
+    with open(REGISTRY_PATH, 'r') as f:
+        names = {row[0]: row[1] for row in json.load(f)['players']['rows']}
+
+    if args.command == 'leaders':
+        board = data['tables'][args.table]['years'].get(args.year, {}).get('stats', {}).get(args.stat)
+        if board is None:
+            print(f"No {args.table} leaderboard for {args.stat} in {args.year}")
+            sys.exit(1)
+        for rank, (mlb_id, value) in enumerate(board['leaders'][:args.limit], 1):
+            print(f"  {rank:>3}. {names.get(mlb_id, mlb_id)}: {value}")
+    elif args.command == 'player':
+        for table, table_data in data['tables'].items():
+            for year, year_data in table_data['years'].items():
+                if args.year and year != args.year:
+                    continue
+                if args.mlb_id not in year_data['players']:
+                    continue
+                pos = year_data['players'].index(args.mlb_id)
+                ranks = {stat: s['pct'][pos] for stat, s in year_data['stats'].items() if s['pct'][pos] >= 0}
+                print(f"  {table} {year}: " + ', '.join(f"{stat} {p}" for stat, p in ranks.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Build a league roster snapshot from the MLB Stats API.
+
+On start the app builds all 30 teams through services/mlbScraper.ts, which
+calls statsapi.mlb.com per team (hydrated roster, active roster, coaches) and
+per pitcher without a Savant arsenal (pitchArsenal + statSplits): hundreds of
+round trips from the browser. This script makes the same requests ahead of
+time and writes them to public/rosterSnapshot.json. The scraper answers from
+the snapshot first and only goes to the network for requests it doesn't have.
+
+  - requests run concurrently on a thread pool, one keep-alive connection per
+    worker, under a shared rate limit
+  - pitcher arsenals are fetched in batches with /people?personIds=...
+    and split back into the per-pitcher responses the app asks for; pitchers
+    the batch doesn't cover fall back to the per-pitcher endpoints
+  - every request is retried with backoff (--retries, --backoff)
+
+Responses are stored under the exact API path the app requests, so the app's
+parsing is unchanged. A 404 is stored as null ("known missing").
+
+Point --base-url at a local stand-in server to build without the real API.
+
+Usage:
+    python scripts/buildRosterSnapshot.py [--workers 8] [--rate 10] [--season 2025]
+    python scripts/buildRosterSnapshot.py --base-url http://localhost:8080/api/v1
+"""
+
+import argparse
+import http.client
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from ingestCheckpoint import DEFAULT_BACKOFF, DEFAULT_RETRIES, call_with_retries
+from savantRegistry import REGISTRY_PATH
+
+
+DEFAULT_BASE_URL = 'https://statsapi.mlb.com/api/v1'
+SNAPSHOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'public', 'rosterSnapshot.json'))
+SNAPSHOT_VERSION = 1
+PEOPLE_BATCH = 50
+
+# Paths as built in services/mlbScraper.ts (must match exactly)
+HYDRATED_ROSTER = '/teams/{team}/roster?rosterType=fullRoster&hydrate=person(stats(type=[yearByYear,career],group=[hitting,pitching,fielding],gameType=R))'
+ACTIVE_ROSTER = '/teams/{team}/roster?rosterType=active'
+COACHES = '/teams/{team}/coaches'
+PITCH_ARSENAL = '/people/{person}/stats?stats=pitchArsenal&group=pitching'
+PITCH_SPLITS = '/people/{person}/stats?stats=statSplits&sitCodes=pitch&group=pitching&season={season}'
+PEOPLE_ARSENALS = '/people?personIds={ids}&hydrate=stats(type=[pitchArsenal,statSplits],sitCodes=pitch,group=pitching,season={season})'
+
+PITCHER_ABBREVIATIONS = {'P', 'SP', 'RP', 'CL', 'RHP', 'LHP'}
+
+
+class RateLimiter:
+    """Token bucket shared by all workers."""
+
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second if per_second > 0 else 0
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class StatsApiClient:
+    """GETs against the Stats API over one pooled keep-alive connection per thread."""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, rate=10.0, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, timeout=30):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.limiter = RateLimiter(rate)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+    def _connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            conn = self.local.conn = cls(self.host, timeout=self.timeout)
+        return conn
+
+    def _get_once(self, path):
+        self.limiter.wait()
+        with self.lock:
+            self.requests += 1
+        conn = self._connection()
+        try:
+            conn.request('GET', self.prefix + path, headers={'Accept': 'application/json', 'Connection': 'keep-alive'})
+            res = conn.getresponse()
+            body = res.read()
+        except (http.client.HTTPException, OSError):
+            # Drop the broken connection; the retry opens a fresh one
+            conn.close()
+            self.local.conn = None
+            raise
+        if res.status == 404:
+            return None
+        if res.status != 200:
+            raise RuntimeError(f"HTTP {res.status} for {path}")
+        return json.loads(body)
+
+    def get(self, path):
+        """Parsed JSON, None for a 404. Raises after the last retry."""
+        result, status, _, error = call_with_retries(
+            lambda: self._get_once(path), path, self.retries, self.backoff, allow_empty=True
+        )
+        if status != 'ok':
+            with self.lock:
+                self.failures += 1
+            raise RuntimeError(error or f"No response for {path}")
+        return result
+
+
+def _is_pitcher(entry):
+    position = entry.get('position') or {}
+    return position.get('type') == 'Pitcher' or position.get('abbreviation') in PITCHER_ABBREVIATIONS
+
+
+def savant_arsenal_ids(registry_path=REGISTRY_PATH):
+    """Pitchers the app already has a Savant arsenal for (no API call needed)."""
+    try:
+        with open(registry_path, 'r') as f:
+            registry = json.load(f)
+    except FileNotFoundError:
+        return set()
+    players = registry['players']['rows']
+    arsenal = registry['tables'].get('arsenal')
+    if not arsenal:
+        return set()
+    return {
+        players[idx][0] for idx, year, row_index in arsenal['current']
+        if arsenal['years'][str(year)][row_index][1]
+    }
+
+
+def _stats_of_type(person, type_name):
+    return [s for s in person.get('stats', []) if (s.get('type') or {}).get('displayName') == type_name]
+
+
+def build_snapshot(client, season=2025, workers=8, registry_path=REGISTRY_PATH):
+    """Fetch everything the app requests on start. Returns the snapshot dict."""
+    responses = {}
+    errors = []
+
+    def fetch_into(path):
+        try:
+            responses[path] = client.get(path)
+        except Exception as e:
+            errors.append(f"{path}: {e}")
+
+    teams_data = client.get('/teams?sportId=1')
+    team_ids = sorted(t['id'] for t in (teams_data or {}).get('teams', []))
+    print(f"  {len(team_ids)} MLB teams")
+
+    # 1. Rosters and staff: three requests per team, all at once
+    team_paths = [p.format(team=t) for t in team_ids for p in (HYDRATED_ROSTER, ACTIVE_ROSTER, COACHES)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(fetch_into, team_paths))
+    print(f"  Rosters and staff: {len(team_paths)} requests")
+
+    # 2. Arsenals for pitchers without Savant data, batched by personIds
+    have_arsenal = savant_arsenal_ids(registry_path)
+    pitchers = set()
+    for team in team_ids:
+        for path in (HYDRATED_ROSTER, ACTIVE_ROSTER):
+            for entry in (responses.get(path.format(team=team)) or {}).get('roster', []):
+                person_id = (entry.get('person') or {}).get('id')
+                if person_id and _is_pitcher(entry) and person_id not in have_arsenal:
+                    pitchers.add(person_id)
+    pitchers = sorted(pitchers)
+    print(f"  Pitchers needing an API arsenal: {len(pitchers)} ({len(have_arsenal)} covered by Savant)")
+
+    batches = [pitchers[i:i + PEOPLE_BATCH] for i in range(0, len(pitchers), PEOPLE_BATCH)]
+    batch_paths = [PEOPLE_ARSENALS.format(ids=','.join(map(str, b)), season=season) for b in batches]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(fetch_into, batch_paths))
+
+    covered = set()
+    for path in batch_paths:
+        for person in (responses.pop(path, None) or {}).get('people', []):
+            arsenal = _stats_of_type(person, 'pitchArsenal')
+            splits = _stats_of_type(person, 'statSplits')
+            if not arsenal and not splits:
+                continue
+            # Same shape as the per-pitcher endpoints return
+            responses[PITCH_ARSENAL.format(person=person['id'])] = {'stats': arsenal}
+            responses[PITCH_SPLITS.format(person=person['id'], season=season)] = {'stats': splits}
+            covered.add(person['id'])
+
+    missing = [p for p in pitchers if p not in covered]
+    single_paths = [path.format(person=p, season=season) for p in missing for path in (PITCH_ARSENAL, PITCH_SPLITS)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(fetch_into, single_paths))
+    print(f"  Arsenals: {len(batches)} batched requests covered {len(covered)} pitchers, "
+          f"{len(single_paths)} single requests for the rest")
+
+    return {
+        'format': 'roster-snapshot',
+        'version': SNAPSHOT_VERSION,
+        'builtAt': datetime.now().isoformat(),
+        'baseUrl': f"{client.scheme}://{client.host}{client.prefix}",
+        'season': season,
+        'teams': team_ids,
+        'responses': dict(sorted(responses.items())),
+    }, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the league roster snapshot the app loads on start')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help='Stats API base URL (or a local stand-in)')
+    parser.add_argument('--season', type=int, default=2025, help='Season for pitch-type splits')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent connections')
+    parser.add_argument('--rate', type=float, default=10.0, help='Maximum requests per second (0 = unlimited)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES)
+    parser.add_argument('--backoff', type=float, default=DEFAULT_BACKOFF)
+    parser.add_argument('--out', default=SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Building league roster snapshot")
+    print("=" * 60)
+    client = StatsApiClient(args.base_url, rate=args.rate, retries=args.retries, backoff=args.backoff)
+    start = time.perf_counter()
+    snapshot, errors = build_snapshot(client, season=args.season, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    tmp = args.out + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(snapshot, f, separators=(',', ':'))
+    os.replace(tmp, args.out)
+
+    print(f"\n  {client.requests} HTTP requests in {elapsed:.1f}s, {len(snapshot['responses'])} responses stored")
+    print(f"  {os.path.getsize(args.out) / 1024:.0f} KB")
+    if errors:
+        print(f"\n  {len(errors)} requests failed (the app fetches these live):")
+        for error in errors[:10]:
+            print(f"    {error}")
+    print(f"\nSaved to: {os.path.abspath(args.out)}")
+
+
+if __name__ == '__main__':
+    main()
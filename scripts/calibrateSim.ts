@@ -0,0 +1,104 @@
+// Refit the simulator constants in services/simParams.json against the benchmark calibration targets
+// Fits the fixed league (seeded synthetic league, or a saved season file) on services/schedule.json
+// Run: npm run calibrate:sim -- [--league grand_slam_data.json] [--standings standings.json] [--seed N] [--days N]
+//                               [--rounds N] [--seasons N] [--write] [--out params.json]
+
+import { readFileSync, writeFileSync } from 'node:fs';
+import { resolve } from 'node:path';
+import { Team } from '../types';
+import { calibrateSimulator, CalibrationOptions } from '../services/calibration';
+import { CALIBRATION_TARGETS, buildBenchmarkLeague } from '../services/benchmark';
+import { parseScheduleCSV } from '../services/scheduleData';
+import { SIM_PARAMS } from '../services/simParams';
+
+const PARAMS_PATH = 'services/simParams.json';
+
+function parseArgs(argv: string[]) {
+  const options: CalibrationOptions = {};
+  let leaguePath = '';
+  let standingsPath = '';
+  let outPath = '';
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--seed') options.seed = Number(argv[++i]);
+    else if (arg === '--days') options.gameDays = Number(argv[++i]);
+    else if (arg === '--rounds') options.rounds = Number(argv[++i]);
+    else if (arg === '--seasons') options.seasons = Number(argv[++i]);
+    else if (arg === '--league') leaguePath = argv[++i];
+    else if (arg === '--standings') standingsPath = argv[++i];
+    else if (arg === '--write') outPath = PARAMS_PATH;
+    else if (arg === '--out') outPath = argv[++i];
+  }
+  return { options, leaguePath, standingsPath, outPath };
+}
+
+function loadLeague(path: string): Team[] | undefined {
+  if (!path) return undefined;
+  // Accepts the season file written by "Save Data" in the app (SeasonState JSON)
+  const data = JSON.parse(readFileSync(resolve(path), 'utf8'));
+  return Array.isArray(data) ? data : data.teams;
+}
+
+// Historical final standings: { "2024": [98, 95, ...], ... } or [[98, 95, ...], ...],
+// with each entry a win total or { wins }
+function loadStandings(path: string): number[][] | undefined {
+  if (!path) return undefined;
+  const data = JSON.parse(readFileSync(resolve(path), 'utf8'));
+  const seasons: unknown[][] = Array.isArray(data) ? data : Object.values(data);
+  return seasons.map(season => season.map(entry => (typeof entry === 'number' ? entry : (entry as { wins: number }).wins)));
+}
+
+const fmt = (value: number, digits = 3) => value.toLocaleString('en-US', { maximumFractionDigits: digits, minimumFractionDigits: digits });
+
+function main() {
+  const { options, leaguePath, standingsPath, outPath } = parseArgs(process.argv.slice(2));
+  const loaded = loadLeague(leaguePath);
+  const standings = loadStandings(standingsPath);
+  // Same default league as the benchmark
+  const teams: Team[] = loaded && loaded.length > 0 ? loaded : buildBenchmarkLeague(options.seed ?? 20260325);
+
+  console.log('='.repeat(60));
+  console.log(`Simulator calibration (${loaded ? leaguePath : 'synthetic league'}${standings ? `, ${standings.length} historical seasons` : ''})`);
+  console.log('='.repeat(60));
+
+  const before = JSON.parse(JSON.stringify(SIM_PARAMS));
+  const result = calibrateSimulator(teams, parseScheduleCSV(), { ...options, standings, league: leaguePath || 'synthetic' });
+  const { params } = result;
+
+  console.log('\nCorrection rounds (analytic model vs game engine):');
+  result.rounds.forEach(r => {
+    const cells = Object.keys(r.analytic).map(m => `${m} ${fmt(r.analytic[m])}/${fmt(r.simulated[m])}`);
+    console.log(`  ${r.round}: ${cells.join(', ')}`);
+  });
+
+  console.log('\nFitted constants:');
+  (['pitch', 'ballInPlay', 'season'] as const).forEach(group => {
+    Object.entries(params[group]).forEach(([key, value]) => {
+      const old = (before[group] as Record<string, number>)[key];
+      if (old !== value) console.log(`  ${group}.${key}: ${fmt(old, 5)} -> ${fmt(value as number, 5)}`);
+    });
+  });
+
+  console.log('\nTargets:');
+  Object.entries(result.targets).forEach(([metric, target]) => {
+    const value = params.fit!.achieved[metric];
+    const range = CALIBRATION_TARGETS[metric];
+    const ok = range ? value >= range.min && value <= range.max : Math.abs(value - target) <= 2;
+    console.log(`  ${ok ? '✔' : '✘'} ${metric}: ${fmt(value)} (target ${fmt(target)})`);
+  });
+  if ('runsPerGame' in params.fit!.achieved) {
+    const { min, max } = CALIBRATION_TARGETS.runsPerGame;
+    const value = params.fit!.achieved.runsPerGame;
+    console.log(`  ${value >= min && value <= max ? '✔' : '✘'} runsPerGame: ${fmt(value)} (not fitted, range ${min}-${max})`);
+  }
+
+  console.log(`\nFit in ${fmt(result.elapsedMs / 1000, 1)}s`);
+  if (outPath) {
+    writeFileSync(resolve(outPath), JSON.stringify(params, null, 2) + '\n');
+    console.log(`Saved revision ${params.revision} to: ${resolve(outPath)}`);
+  } else {
+    console.log('Dry run: pass --write to update services/simParams.json');
+  }
+}
+
+main();
@@ -13,16 +13,36 @@ Fetched stats per player:
   - Baserunning Run Value, Fielding Run Value, Batting Run Value
 
 Usage:
-    python scripts/fetchBatterSavant.py
+    python scripts/fetchBatterSavant.py [--resume] [--retries N] [--backoff S] [--profile] [--trace-memory]
+
+Each (source, year) fetch is retried with backoff and checkpointed under
+services/batterSavant.checkpoints/. After a partial failure, --resume re-fetches
+only the failed or missing units and re-merges; see ingestCheckpoint.py.
+
+A run report (per-stage timings, rows, HTTP calls, errors) is written to
+services/batterSavant.report.json; see ingestReport.py.
 
 Requirements:
     pip install pybaseball pandas
 """
 
+import argparse
 import json
 import os
 from datetime import datetime
 
+from ingestCheckpoint import (
+    DEFAULT_BACKOFF,
+    DEFAULT_RETRIES,
+    CheckpointStore,
+    add_checkpoint_args,
+    call_with_retries,
+)
+from ingestReport import RunReport, add_instrumentation_args, record_error, record_rows_in
+from playerSearch import write_search_index
+from buildLeaderboards import write_leaderboards
+from savantRegistry import REGISTRY_PATH, write_registry
+
 try:
     from pybaseball import (
         statcast_batter_expected_stats,
@@ -69,98 +89,86 @@ def safe_int(val, default=0):
 def fetch_expected_stats(year: int, min_pa: int = MIN_PA) -> dict:
     """Fetch expected batting stats (xwOBA, xBA, xSLG) for a year."""
     print(f"  Fetching expected stats for {year}...")
-    try:
-        df = statcast_batter_expected_stats(year, minPA=min_pa)
-        if df is None or df.empty:
-            print(f"    No expected stats data for {year}")
-            return {}
-
-        result = {}
-        for _, row in df.iterrows():
-            player_id = safe_int(row.get('player_id', row.get('batter', 0)))
-            if player_id == 0:
-                continue
+    df = statcast_batter_expected_stats(year, minPA=min_pa)
+    if df is None or df.empty:
+        print(f"    No expected stats data for {year}")
+        return {}
+    record_rows_in(len(df))
 
-            result[player_id] = {
-                'pa': safe_int(row.get('pa', 0)),
-                'xwoba': safe_float(row.get('est_woba', 0)),
-                'xba': safe_float(row.get('est_ba', 0)),
-                'xslg': safe_float(row.get('est_slg', 0)),
-                'woba': safe_float(row.get('woba', 0)),
-                'ba': safe_float(row.get('ba', 0)),
-                'slg': safe_float(row.get('slg', 0)),
-            }
+    result = {}
+    for _, row in df.iterrows():
+        player_id = safe_int(row.get('player_id', row.get('batter', 0)))
+        if player_id == 0:
+            continue
 
-        print(f"    Got expected stats for {len(result)} batters")
-        return result
+        result[player_id] = {
+            'pa': safe_int(row.get('pa', 0)),
+            'xwoba': safe_float(row.get('est_woba', 0)),
+            'xba': safe_float(row.get('est_ba', 0)),
+            'xslg': safe_float(row.get('est_slg', 0)),
+            'woba': safe_float(row.get('woba', 0)),
+            'ba': safe_float(row.get('ba', 0)),
+            'slg': safe_float(row.get('slg', 0)),
+        }
 
-    except Exception as e:
-        print(f"    Error fetching expected stats for {year}: {e}")
-        return {}
+    print(f"    Got expected stats for {len(result)} batters")
+    return result
 
 
 def fetch_exit_velo_barrels(year: int, min_pa: int = MIN_PA) -> dict:
     """Fetch exit velocity and barrel data for a year."""
     print(f"  Fetching exit velo/barrels for {year}...")
-    try:
-        df = statcast_batter_exitvelo_barrels(year, minBBE=50)
-        if df is None or df.empty:
-            print(f"    No exit velo data for {year}")
-            return {}
-
-        result = {}
-        for _, row in df.iterrows():
-            player_id = safe_int(row.get('player_id', row.get('batter', 0)))
-            if player_id == 0:
-                continue
+    df = statcast_batter_exitvelo_barrels(year, minBBE=50)
+    if df is None or df.empty:
+        print(f"    No exit velo data for {year}")
+        return {}
+    record_rows_in(len(df))
 
-            result[player_id] = {
-                'avg_exit_velo': safe_float(row.get('avg_hit_speed', row.get('exit_velocity_avg', 0))),
-                'max_exit_velo': safe_float(row.get('max_hit_speed', row.get('exit_velocity_max', 0))),
-                'barrel_pct': safe_float(row.get('brl_percent', row.get('barrel_batted_rate', 0))),
-                'hard_hit_pct': safe_float(row.get('ev95percent', row.get('hard_hit_percent', 0))),
-                'la_sweet_spot_pct': safe_float(row.get('anglesweetspotpercent', row.get('sweetspot_percent', 0))),
-                'avg_launch_angle': safe_float(row.get('avg_hit_angle', row.get('launch_angle_avg', 0))),
-                'attempts': safe_int(row.get('attempts', row.get('batted_balls', 0))),
-            }
+    result = {}
+    for _, row in df.iterrows():
+        player_id = safe_int(row.get('player_id', row.get('batter', 0)))
+        if player_id == 0:
+            continue
 
-        print(f"    Got exit velo data for {len(result)} batters")
-        return result
+        result[player_id] = {
+            'avg_exit_velo': safe_float(row.get('avg_hit_speed', row.get('exit_velocity_avg', 0))),
+            'max_exit_velo': safe_float(row.get('max_hit_speed', row.get('exit_velocity_max', 0))),
+            'barrel_pct': safe_float(row.get('brl_percent', row.get('barrel_batted_rate', 0))),
+            'hard_hit_pct': safe_float(row.get('ev95percent', row.get('hard_hit_percent', 0))),
+            'la_sweet_spot_pct': safe_float(row.get('anglesweetspotpercent', row.get('sweetspot_percent', 0))),
+            'avg_launch_angle': safe_float(row.get('avg_hit_angle', row.get('launch_angle_avg', 0))),
+            'attempts': safe_int(row.get('attempts', row.get('batted_balls', 0))),
+        }
 
-    except Exception as e:
-        print(f"    Error fetching exit velo for {year}: {e}")
-        return {}
+    print(f"    Got exit velo data for {len(result)} batters")
+    return result
 
 
 def fetch_sprint_speeds(year: int) -> dict:
     """Fetch sprint speed data for a year."""
     print(f"  Fetching sprint speeds for {year}...")
-    try:
-        df = statcast_sprint_speed(year)
-        if df is None or df.empty:
-            print(f"    No sprint speed data for {year}")
-            return {}
-
-        result = {}
-        for _, row in df.iterrows():
-            player_id = safe_int(row.get('player_id', 0))
-            if player_id == 0:
-                continue
+    df = statcast_sprint_speed(year)
+    if df is None or df.empty:
+        print(f"    No sprint speed data for {year}")
+        return {}
+    record_rows_in(len(df))
 
-            result[player_id] = {
-                'sprint_speed': safe_float(row.get('sprint_speed', 0)),
-            }
+    result = {}
+    for _, row in df.iterrows():
+        player_id = safe_int(row.get('player_id', 0))
+        if player_id == 0:
+            continue
 
-        print(f"    Got sprint speed for {len(result)} batters")
-        return result
+        result[player_id] = {
+            'sprint_speed': safe_float(row.get('sprint_speed', 0)),
+        }
 
-    except Exception as e:
-        print(f"    Error fetching sprint speed for {year}: {e}")
-        return {}
+    print(f"    Got sprint speed for {len(result)} batters")
+    return result
 
 
-def lookup_player_names(player_ids: set) -> dict:
-    """Look up player names from MLB IDs."""
+def lookup_player_names(player_ids: set, retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF) -> dict:
+    """Look up player names from MLB IDs (each batch is retried with backoff)."""
     print(f"\nLooking up names for {len(player_ids)} batters...")
     names = {}
     id_list = list(player_ids)
@@ -171,8 +179,12 @@ def lookup_player_names(player_ids: set) -> dict:
             chunk = id_list[i:i + chunk_size]
             print(f"  Looking up batch {i//chunk_size + 1}/{(len(id_list) + chunk_size - 1)//chunk_size}...")
             try:
-                result_df = playerid_reverse_lookup(chunk, key_type='mlbam')
+                result_df, _, _, _ = call_with_retries(
+                    lambda: playerid_reverse_lookup(chunk, key_type='mlbam'),
+                    f"name batch {i//chunk_size + 1}", retries=retries, backoff=backoff, allow_empty=True,
+                )
                 if result_df is not None and not result_df.empty:
+                    record_rows_in(len(result_df))
                     for _, row in result_df.iterrows():
                         mlb_id = row.get('key_mlbam')
                         if pd.notna(mlb_id):
@@ -182,9 +194,11 @@ def lookup_player_names(player_ids: set) -> dict:
                                 names[int(mlb_id)] = f"{first} {last}"
             except Exception as e:
                 print(f"    Batch lookup error: {e}")
+                record_error(e)
                 continue
     except Exception as e:
         print(f"  Name lookup error: {e}")
+        record_error(e)
 
     print(f"  Resolved {len(names)} names")
     return names
@@ -193,56 +207,62 @@ def lookup_player_names(player_ids: set) -> dict:
 def build_fg_to_mlbam_map():
     """Build a FanGraphs ID -> MLBAM ID mapping using the Chadwick register."""
     print("Building FanGraphs -> MLBAM ID map...")
-    try:
-        reg = chadwick_register()
-        mapped = reg.dropna(subset=['key_mlbam', 'key_fangraphs'])
-        fg_to_mlbam = {}
-        for _, row in mapped.iterrows():
-            fg_id = int(row['key_fangraphs'])
-            mlbam_id = int(row['key_mlbam'])
-            if fg_id > 0 and mlbam_id > 0:
-                fg_to_mlbam[fg_id] = mlbam_id
-        print(f"  Mapped {len(fg_to_mlbam)} FanGraphs IDs to MLBAM IDs")
-        return fg_to_mlbam
-    except Exception as e:
-        print(f"  Error building ID map: {e}")
-        return {}
+    reg = chadwick_register()
+    record_rows_in(len(reg))
+    mapped = reg.dropna(subset=['key_mlbam', 'key_fangraphs'])
+    fg_to_mlbam = {}
+    for _, row in mapped.iterrows():
+        fg_id = int(row['key_fangraphs'])
+        mlbam_id = int(row['key_mlbam'])
+        if fg_id > 0 and mlbam_id > 0:
+            fg_to_mlbam[fg_id] = mlbam_id
+    print(f"  Mapped {len(fg_to_mlbam)} FanGraphs IDs to MLBAM IDs")
+    return fg_to_mlbam
 
 
 def fetch_fangraphs_batting(year, fg_to_mlbam):
     """Fetch K%, BB%, O-Swing% (chase), SwStr% (whiff) from FanGraphs batting stats."""
     print(f"  Fetching FanGraphs batting stats for {year}...")
-    try:
-        df = batting_stats(year, qual=1)
-        if df is None or df.empty:
-            return {}
-        result = {}
-        for _, row in df.iterrows():
-            fg_id = safe_int(row.get('IDfg', 0))
-            mlbam_id = fg_to_mlbam.get(fg_id, 0)
-            if mlbam_id == 0:
-                continue
-            result[mlbam_id] = {
-                'k_pct': round(safe_float(row.get('K%', 0)) * 100, 1),
-                'bb_pct': round(safe_float(row.get('BB%', 0)) * 100, 1),
-                # O-Swing% = chase rate (swings on pitches outside zone)
-                'chase_pct': round(safe_float(row.get('O-Swing%', 0)) * 100, 1),
-                # SwStr% = swinging strike rate (whiff rate)
-                'whiff_pct': round(safe_float(row.get('SwStr%', 0)) * 100, 1),
-            }
-        print(f"    Got {len(result)} batters (mapped from FanGraphs)")
-        return result
-    except Exception as e:
-        print(f"    Error: {e}")
+    df = batting_stats(year, qual=1)
+    if df is None or df.empty:
         return {}
+    record_rows_in(len(df))
+    result = {}
+    for _, row in df.iterrows():
+        fg_id = safe_int(row.get('IDfg', 0))
+        mlbam_id = fg_to_mlbam.get(fg_id, 0)
+        if mlbam_id == 0:
+            continue
+        result[mlbam_id] = {
+            'k_pct': round(safe_float(row.get('K%', 0)) * 100, 1),
+            'bb_pct': round(safe_float(row.get('BB%', 0)) * 100, 1),
+            # O-Swing% = chase rate (swings on pitches outside zone)
+            'chase_pct': round(safe_float(row.get('O-Swing%', 0)) * 100, 1),
+            # SwStr% = swinging strike rate (whiff rate)
+            'whiff_pct': round(safe_float(row.get('SwStr%', 0)) * 100, 1),
+        }
+    print(f"    Got {len(result)} batters (mapped from FanGraphs)")
+    return result
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Fetch batter Savant data')
+    add_checkpoint_args(parser)
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+
+    output_path = os.path.join(os.path.dirname(__file__), '..', 'services', 'batterSavant.json')
+    output_path = os.path.abspath(output_path)
+    report = RunReport('fetchBatterSavant', output_path, profile=args.profile, trace_memory=args.trace_memory)
+    store = CheckpointStore(output_path, resume=args.resume, retries=args.retries, backoff=args.backoff)
+
     print("=" * 60)
     print("Fetching MLB Batter Savant Data (2022-2025)")
     print("=" * 60)
 
-    fg_to_mlbam = build_fg_to_mlbam_map()
+    with report.stage('fg_id_map', source='chadwick') as st:
+        fg_to_mlbam = store.run('fg_id_map', build_fg_to_mlbam_map, source='chadwick')
+        st.rows_out = len(fg_to_mlbam)
 
     all_player_ids = set()
     yearly_data = {}
@@ -250,10 +270,18 @@ def main():
     for year in YEARS:
         print(f"\n--- Processing {year} ---")
 
-        expected = fetch_expected_stats(year, MIN_PA)
-        exit_velo = fetch_exit_velo_barrels(year, MIN_PA)
-        sprint = fetch_sprint_speeds(year)
-        fg_stats = fetch_fangraphs_batting(year, fg_to_mlbam)
+        with report.stage('expected_stats', source='savant', year=year) as st:
+            expected = store.run('expected_stats', lambda: fetch_expected_stats(year, MIN_PA), source='savant', year=year)
+            st.rows_out = len(expected)
+        with report.stage('exit_velo_barrels', source='savant', year=year) as st:
+            exit_velo = store.run('exit_velo_barrels', lambda: fetch_exit_velo_barrels(year, MIN_PA), source='savant', year=year)
+            st.rows_out = len(exit_velo)
+        with report.stage('sprint_speed', source='savant', year=year) as st:
+            sprint = store.run('sprint_speed', lambda: fetch_sprint_speeds(year), source='savant', year=year)
+            st.rows_out = len(sprint)
+        with report.stage('fangraphs_batting', source='fangraphs', year=year) as st:
+            fg_stats = store.run('fangraphs_batting', lambda: fetch_fangraphs_batting(year, fg_to_mlbam), source='fangraphs', year=year)
+            st.rows_out = len(fg_stats)
 
         # Merge all data sources for this year
         merged = {}
@@ -298,7 +326,9 @@ def main():
         print(f"  Combined {len(merged)} batters for {year}")
 
     # Look up player names
-    player_names = lookup_player_names(all_player_ids)
+    with report.stage('name_lookup', source='chadwick') as st:
+        player_names = lookup_player_names(all_player_ids, retries=args.retries, backoff=args.backoff)
+        st.rows_out = len(player_names)
 
     # Build combined output
     batters = {}
@@ -334,9 +364,6 @@ def main():
     print(f"{'=' * 60}")
 
     # Save to JSON
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'services', 'batterSavant.json')
-    output_path = os.path.abspath(output_path)
-
     output_data = {
         'lastUpdated': datetime.now().isoformat(),
         'source': 'Baseball Savant via pybaseball',
@@ -345,8 +372,10 @@ def main():
         'batters': batters,
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    with report.stage('write_json') as st:
+        with open(output_path, 'w') as f:
+            json.dump(output_data, f, indent=2)
+        st.rows_out = len(batters)
 
     print(f"\nSaved to: {output_path}")
 
@@ -363,6 +392,7 @@ def main():
     for field, count in zero_fields.items():
         pct = round(count / total * 100, 1) if total > 0 else 0
         print(f"  {field}: {count}/{total} still zero ({pct}%)")
+    report.set_quality(zero_fields, total)
 
     # Print samples
     print("\nSample entries:")
@@ -375,6 +405,18 @@ def main():
         print(f"    Avg EV: {cs.get('avg_exit_velo', 'N/A')}, Barrel%: {cs.get('barrel_pct', 'N/A')}, HH%: {cs.get('hard_hit_pct', 'N/A')}")
         print(f"    Sprint: {cs.get('sprint_speed', 'N/A')}, K%: {cs.get('k_pct', 'N/A')}, BB%: {cs.get('bb_pct', 'N/A')}")
 
+    # Rebuild the normalized registry the app loads (services/savantRegistry.json)
+    # plus the name search index and precomputed leaderboards over it
+    with report.stage('registry') as st:
+        st.rows_out = write_registry()
+        write_search_index()
+        write_leaderboards()
+    print(f"\nRebuilt registry: {REGISTRY_PATH}")
+
+    store.print_summary()
+    print()
+    report.write()
+
 
 if __name__ == '__main__':
     main()
@@ -5,16 +5,37 @@ This script retrieves real pitch repertoire data for all MLB pitchers
 across multiple seasons (2022-2024) and saves it as JSON for use in the simulation.
 
 Usage:
-    python scripts/fetchPitchArsenals.py
+    python scripts/fetchPitchArsenals.py [--resume] [--retries N] [--backoff S] [--profile] [--trace-memory]
+
+Each year is retried with backoff and checkpointed under
+services/pitchArsenals.checkpoints/. After a partial failure, --resume re-fetches
+only the failed or missing years and re-merges; see ingestCheckpoint.py.
+
+A run report (per-stage timings, rows, HTTP calls, errors) is written to
+services/pitchArsenals.report.json; see ingestReport.py.
 
 Requirements:
     pip install pybaseball pandas
 """
 
+import argparse
 import json
 import os
 from datetime import datetime
 
+from ingestCheckpoint import (
+    DEFAULT_BACKOFF,
+    DEFAULT_RETRIES,
+    CheckpointStore,
+    add_checkpoint_args,
+    call_with_retries,
+)
+from ingestReport import RunReport, add_instrumentation_args, record_error, record_rows_in
+from playerSearch import write_search_index
+from buildArsenalIndex import write_arsenal_index
+from buildLeaderboards import write_leaderboards
+from savantRegistry import REGISTRY_PATH, write_registry
+
 try:
     from pybaseball import statcast_pitcher_pitch_arsenal, playerid_reverse_lookup
     import pandas as pd
@@ -50,83 +71,79 @@ PITCH_CODES = ['ff', 'si', 'fc', 'sl', 'ch', 'cu', 'fs', 'kn', 'st', 'sv', 'kc',
 YEARS = [2025, 2024, 2023, 2022]  # 2025 season is now complete
 
 
-def fetch_year_arsenals(year: int, min_pitches: int = 100) -> tuple[dict, set]:
+def fetch_year_arsenals(year: int, min_pitches: int = 100) -> dict:
     """
     Fetch pitch arsenal data for a single year.
     
     Returns:
-        Tuple of (arsenals dict, set of pitcher IDs)
+        Dict of pitcher ID -> arsenal. Fetch errors propagate so the
+        checkpoint runner can retry the year.
     """
     print(f"  Fetching {year} data...")
     
-    try:
-        speed_df = statcast_pitcher_pitch_arsenal(year, minP=min_pitches, arsenal_type='avg_speed')
-        usage_df = statcast_pitcher_pitch_arsenal(year, minP=min_pitches, arsenal_type='n_')
-        
-        if speed_df is None or speed_df.empty or usage_df is None or usage_df.empty:
-            print(f"    Warning: No data for {year}")
-            return {}, set()
+    speed_df = statcast_pitcher_pitch_arsenal(year, minP=min_pitches, arsenal_type='avg_speed')
+    usage_df = statcast_pitcher_pitch_arsenal(year, minP=min_pitches, arsenal_type='n_')
+    
+    if speed_df is None or speed_df.empty or usage_df is None or usage_df.empty:
+        print(f"    Warning: No data for {year}")
+        return {}
+    
+    print(f"    Retrieved {len(speed_df)} pitchers for {year}")
+    record_rows_in(len(speed_df) + len(usage_df))
+    
+    arsenals = {}
+    
+    for idx, speed_row in speed_df.iterrows():
+        pitcher_id = int(speed_row['pitcher'])
         
-        print(f"    Retrieved {len(speed_df)} pitchers for {year}")
+        usage_row = usage_df[usage_df['pitcher'] == pitcher_id]
+        if usage_row.empty:
+            continue
+        usage_row = usage_row.iloc[0]
         
-        arsenals = {}
-        pitcher_ids = set()
+        pitcher_arsenal = []
         
-        for idx, speed_row in speed_df.iterrows():
-            pitcher_id = int(speed_row['pitcher'])
-            pitcher_ids.add(pitcher_id)
-            
-            usage_row = usage_df[usage_df['pitcher'] == pitcher_id]
-            if usage_row.empty:
-                continue
-            usage_row = usage_row.iloc[0]
-            
-            pitcher_arsenal = []
-            
-            for code in PITCH_CODES:
-                speed_col = f'{code}_avg_speed'
-                usage_col = f'n_{code}'
-                
-                speed = speed_row.get(speed_col, float('nan')) if speed_col in speed_row.index else float('nan')
-                usage = usage_row.get(usage_col, float('nan')) if usage_col in usage_row.index else float('nan')
-                
-                if pd.isna(speed) or pd.isna(usage) or usage < 3.0:
-                    continue
-                
-                pitch_name = PITCH_NAMES.get(code, code.upper())
-                pitcher_arsenal.append({
-                    'type': pitch_name,
-                    'speed': round(float(speed), 1),
-                    'usage': round(float(usage), 1)
-                })
+        for code in PITCH_CODES:
+            speed_col = f'{code}_avg_speed'
+            usage_col = f'n_{code}'
             
-            # Sort by usage and limit to top 6
-            pitcher_arsenal.sort(key=lambda x: x['usage'], reverse=True)
-            pitcher_arsenal = pitcher_arsenal[:6]
+            speed = speed_row.get(speed_col, float('nan')) if speed_col in speed_row.index else float('nan')
+            usage = usage_row.get(usage_col, float('nan')) if usage_col in usage_row.index else float('nan')
             
-            # Normalize to 100%
-            total_usage = sum(p['usage'] for p in pitcher_arsenal)
-            if total_usage > 0 and len(pitcher_arsenal) > 0:
-                for p in pitcher_arsenal:
-                    p['usage'] = round((p['usage'] / total_usage) * 100, 1)
-                
-                diff = 100 - sum(p['usage'] for p in pitcher_arsenal)
-                if abs(diff) > 0.1:
-                    pitcher_arsenal[0]['usage'] = round(pitcher_arsenal[0]['usage'] + diff, 1)
+            if pd.isna(speed) or pd.isna(usage) or usage < 3.0:
+                continue
             
-            if len(pitcher_arsenal) > 0:
-                arsenals[pitcher_id] = pitcher_arsenal
+            pitch_name = PITCH_NAMES.get(code, code.upper())
+            pitcher_arsenal.append({
+                'type': pitch_name,
+                'speed': round(float(speed), 1),
+                'usage': round(float(usage), 1)
+            })
         
-        return arsenals, pitcher_ids
+        # Sort by usage and limit to top 6
+        pitcher_arsenal.sort(key=lambda x: x['usage'], reverse=True)
+        pitcher_arsenal = pitcher_arsenal[:6]
         
-    except Exception as e:
-        print(f"    Error fetching {year}: {e}")
-        return {}, set()
+        # Normalize to 100%
+        total_usage = sum(p['usage'] for p in pitcher_arsenal)
+        if total_usage > 0 and len(pitcher_arsenal) > 0:
+            for p in pitcher_arsenal:
+                p['usage'] = round((p['usage'] / total_usage) * 100, 1)
+            
+            diff = 100 - sum(p['usage'] for p in pitcher_arsenal)
+            if abs(diff) > 0.1:
+                pitcher_arsenal[0]['usage'] = round(pitcher_arsenal[0]['usage'] + diff, 1)
+        
+        if len(pitcher_arsenal) > 0:
+            arsenals[pitcher_id] = pitcher_arsenal
+    
+    return arsenals
 
 
-def lookup_player_names(pitcher_ids: set) -> dict:
+def lookup_player_names(pitcher_ids: set, retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF) -> dict:
     """
     Look up player names from MLB IDs using pybaseball's reverse lookup.
+    Each batch is retried with exponential backoff.
     """
     print(f"\nLooking up names for {len(pitcher_ids)} pitchers...")
     names = {}
@@ -144,9 +161,13 @@ def lookup_player_names(pitcher_ids: set) -> dict:
             print(f"  Looking up batch {i//chunk_size + 1}/{(len(id_list) + chunk_size - 1)//chunk_size}...")
             
             try:
-                result = playerid_reverse_lookup(chunk, key_type='mlbam')
+                result, _, _, _ = call_with_retries(
+                    lambda: playerid_reverse_lookup(chunk, key_type='mlbam'),
+                    f"name batch {i//chunk_size + 1}", retries=retries, backoff=backoff, allow_empty=True,
+                )
                 
                 if result is not None and not result.empty:
+                    record_rows_in(len(result))
                     for _, row in result.iterrows():
                         mlb_id = row.get('key_mlbam')
                         if pd.notna(mlb_id):
@@ -156,16 +177,28 @@ def lookup_player_names(pitcher_ids: set) -> dict:
                                 names[int(mlb_id)] = f"{first} {last}"
             except Exception as e:
                 print(f"    Batch lookup error: {e}")
+                record_error(e)
                 continue
                 
     except Exception as e:
         print(f"  Name lookup error: {e}")
+        record_error(e)
     
     print(f"  Resolved {len(names)} names")
     return names
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Fetch pitch arsenal data')
+    add_checkpoint_args(parser)
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+
+    output_path = os.path.join(os.path.dirname(__file__), '..', 'services', 'pitchArsenals.json')
+    output_path = os.path.abspath(output_path)
+    report = RunReport('fetchPitchArsenals', output_path, profile=args.profile, trace_memory=args.trace_memory)
+    store = CheckpointStore(output_path, resume=args.resume, retries=args.retries, backoff=args.backoff)
+
     print("=" * 60)
     print("Fetching MLB Pitch Arsenal Data (2022-2024)")
     print("=" * 60)
@@ -175,13 +208,17 @@ def main():
     yearly_arsenals = {}
     
     for year in YEARS:
-        arsenals, pitcher_ids = fetch_year_arsenals(year, min_pitches=100)
+        with report.stage('pitch_arsenal', source='savant', year=year) as st:
+            arsenals = store.run('pitch_arsenal', lambda: fetch_year_arsenals(year, min_pitches=100), source='savant', year=year)
+            st.rows_out = len(arsenals)
         yearly_arsenals[year] = arsenals
-        all_pitcher_ids.update(pitcher_ids)
+        all_pitcher_ids.update(arsenals.keys())
         print(f"    Processed {len(arsenals)} pitchers for {year}")
     
     # Look up player names
-    player_names = lookup_player_names(all_pitcher_ids)
+    with report.stage('name_lookup', source='chadwick') as st:
+        player_names = lookup_player_names(all_pitcher_ids, retries=args.retries, backoff=args.backoff)
+        st.rows_out = len(player_names)
     
     # Build combined output with historical data per pitcher
     pitchers = {}
@@ -222,9 +259,6 @@ def main():
     print(f"{'=' * 60}")
     
     # Save to JSON
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'services', 'pitchArsenals.json')
-    output_path = os.path.abspath(output_path)
-    
     output_data = {
         'lastUpdated': datetime.now().isoformat(),
         'source': 'Baseball Savant via pybaseball',
@@ -233,8 +267,10 @@ def main():
         'pitchers': pitchers
     }
     
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    with report.stage('write_json') as st:
+        with open(output_path, 'w') as f:
+            json.dump(output_data, f, indent=2)
+        st.rows_out = len(pitchers)
     
     print(f"\nSaved to: {output_path}")
     
@@ -248,6 +284,19 @@ def main():
         print(f"    Years: {years_with_data}")
         print(f"    Current ({years_with_data[0] if years_with_data else 'N/A'}): {p['currentArsenal'][:2] if p['currentArsenal'] else 'N/A'}...")
 
+    # Rebuild the normalized registry the app loads (services/savantRegistry.json)
+    # plus the name search index, precomputed leaderboards and arsenal index over it
+    with report.stage('registry') as st:
+        st.rows_out = write_registry()
+        write_search_index()
+        write_leaderboards()
+        write_arsenal_index()
+    print(f"\nRebuilt registry: {REGISTRY_PATH}")
+
+    store.print_summary()
+    print()
+    report.write()
+
 
 if __name__ == '__main__':
     main()
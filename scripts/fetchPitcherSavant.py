@@ -8,16 +8,38 @@ Data sources:
   - statcast_pitcher_exitvelo_barrels: avg EV against, barrel%, hard-hit%
   - statcast_pitcher_arsenal_stats: per-pitch run values, whiff%, K%
   - pitching_stats (FanGraphs): K%, BB%, GB% (raw values)
-  - pitchArsenals.json: fastball velo, extension
+  - pitch arsenals (via SavantStore): fastball velo, extension
 
 Usage:
-    python scripts/fetchPitcherSavant.py
+    python scripts/fetchPitcherSavant.py [--resume] [--retries N] [--backoff S] [--profile] [--trace-memory]
+
+Each (source, year) fetch is retried with backoff and checkpointed under
+services/pitcherSavant.checkpoints/. After a partial failure, --resume re-fetches
+only the failed or missing units and re-merges; see ingestCheckpoint.py.
+
+A run report (per-stage timings, rows, HTTP calls, errors) is written to
+services/pitcherSavant.report.json; see ingestReport.py.
 """
 
+import argparse
 import json
 import os
 from datetime import datetime
 
+from ingestCheckpoint import (
+    DEFAULT_BACKOFF,
+    DEFAULT_RETRIES,
+    CheckpointStore,
+    add_checkpoint_args,
+    call_with_retries,
+)
+from ingestReport import RunReport, add_instrumentation_args, record_error, record_rows_in
+from playerSearch import write_search_index
+from buildArsenalIndex import write_arsenal_index
+from buildLeaderboards import write_leaderboards
+from savantRegistry import REGISTRY_PATH, write_registry
+from savantStore import SavantStore
+
 try:
     from pybaseball import (
         statcast_pitcher_expected_stats,
@@ -33,6 +55,11 @@ except ImportError:
     print("Please run: pip install pybaseball pandas")
     exit(1)
 
+try:
+    from pybaseball import statcast_pitcher_percentile_ranks
+except ImportError:
+    statcast_pitcher_percentile_ranks = None
+
 
 YEARS = [2025, 2024, 2023, 2022]
 MIN_PA = 50
@@ -59,157 +86,159 @@ def safe_int(val, default=0):
 def build_fg_to_mlbam_map():
     """Build a FanGraphs ID -> MLBAM ID mapping using the Chadwick register."""
     print("Building FanGraphs -> MLBAM ID map...")
-    try:
-        reg = chadwick_register()
-        mapped = reg.dropna(subset=['key_mlbam', 'key_fangraphs'])
-        fg_to_mlbam = {}
-        for _, row in mapped.iterrows():
-            fg_id = int(row['key_fangraphs'])
-            mlbam_id = int(row['key_mlbam'])
-            if fg_id > 0 and mlbam_id > 0:
-                fg_to_mlbam[fg_id] = mlbam_id
-        print(f"  Mapped {len(fg_to_mlbam)} FanGraphs IDs to MLBAM IDs")
-        return fg_to_mlbam
-    except Exception as e:
-        print(f"  Error building ID map: {e}")
-        return {}
+    reg = chadwick_register()
+    record_rows_in(len(reg))
+    mapped = reg.dropna(subset=['key_mlbam', 'key_fangraphs'])
+    fg_to_mlbam = {}
+    for _, row in mapped.iterrows():
+        fg_id = int(row['key_fangraphs'])
+        mlbam_id = int(row['key_mlbam'])
+        if fg_id > 0 and mlbam_id > 0:
+            fg_to_mlbam[fg_id] = mlbam_id
+    print(f"  Mapped {len(fg_to_mlbam)} FanGraphs IDs to MLBAM IDs")
+    return fg_to_mlbam
 
 
 def fetch_expected_stats(year):
     """Fetch xERA, xBA, xwOBA from Savant expected stats."""
     print(f"  Fetching Savant expected stats for {year}...")
-    try:
-        df = statcast_pitcher_expected_stats(year, minPA=MIN_PA)
-        if df is None or df.empty:
-            return {}
-        result = {}
-        for _, row in df.iterrows():
-            pid = safe_int(row.get('player_id', 0))
-            if pid == 0:
-                continue
-            result[pid] = {
-                'xera': safe_float(row.get('xera', 0)),
-                'xba': safe_float(row.get('est_ba', 0)),
-                'xwoba': safe_float(row.get('est_woba', 0)),
-            }
-        print(f"    Got {len(result)} pitchers")
-        return result
-    except Exception as e:
-        print(f"    Error: {e}")
+    df = statcast_pitcher_expected_stats(year, minPA=MIN_PA)
+    if df is None or df.empty:
         return {}
+    record_rows_in(len(df))
+    result = {}
+    for _, row in df.iterrows():
+        pid = safe_int(row.get('player_id', 0))
+        if pid == 0:
+            continue
+        result[pid] = {
+            'xera': safe_float(row.get('xera', 0)),
+            'xba': safe_float(row.get('est_ba', 0)),
+            'xwoba': safe_float(row.get('est_woba', 0)),
+        }
+    print(f"    Got {len(result)} pitchers")
+    return result
 
 
 def fetch_exit_velo(year):
     """Fetch exit velo against, barrel%, hard-hit% from Savant."""
     print(f"  Fetching Savant exit velo/barrels for {year}...")
-    try:
-        df = statcast_pitcher_exitvelo_barrels(year, minBBE=30)
-        if df is None or df.empty:
-            return {}
-        result = {}
-        for _, row in df.iterrows():
-            pid = safe_int(row.get('player_id', 0))
-            if pid == 0:
-                continue
-            result[pid] = {
-                'avg_exit_velo_against': safe_float(row.get('avg_hit_speed', 0)),
-                'barrel_pct': safe_float(row.get('brl_percent', 0)),
-                'hard_hit_pct': safe_float(row.get('ev95percent', 0)),
-            }
-        print(f"    Got {len(result)} pitchers")
-        return result
-    except Exception as e:
-        print(f"    Error: {e}")
+    df = statcast_pitcher_exitvelo_barrels(year, minBBE=30)
+    if df is None or df.empty:
         return {}
+    record_rows_in(len(df))
+    result = {}
+    for _, row in df.iterrows():
+        pid = safe_int(row.get('player_id', 0))
+        if pid == 0:
+            continue
+        result[pid] = {
+            'avg_exit_velo_against': safe_float(row.get('avg_hit_speed', 0)),
+            'barrel_pct': safe_float(row.get('brl_percent', 0)),
+            'hard_hit_pct': safe_float(row.get('ev95percent', 0)),
+        }
+    print(f"    Got {len(result)} pitchers")
+    return result
 
 
 def fetch_arsenal_stats(year):
     """Fetch per-pitch-type run values, whiff%, K% from Savant arsenal stats."""
     print(f"  Fetching Savant arsenal stats for {year}...")
-    try:
-        df = statcast_pitcher_arsenal_stats(year, minPA=20)
-        if df is None or df.empty:
-            return {}
-
-        # Group by player_id, aggregate across pitch types
-        result = {}
-        for pid, group in df.groupby('player_id'):
-            pid = safe_int(pid)
-            if pid == 0:
-                continue
-
-            total_pitches = group['pitches'].sum()
-            if total_pitches == 0:
-                continue
-
-            # Weighted averages by pitch usage
-            w_whiff = 0
-            total_run_value = 0
-            fb_rv = 0
-            breaking_rv = 0
-            offspeed_rv = 0
-
-            for _, row in group.iterrows():
-                pitches = safe_int(row.get('pitches', 0))
-                weight = pitches / total_pitches if total_pitches > 0 else 0
-                w_whiff += safe_float(row.get('whiff_percent', 0)) * weight
-                rv = safe_float(row.get('run_value', 0))
-                total_run_value += rv
-
-                # Classify pitch type for category run values
-                ptype = str(row.get('pitch_type', '')).upper()
-                if ptype in ('FF', 'SI', 'FA', 'FC'):
-                    fb_rv += rv
-                elif ptype in ('SL', 'CU', 'KC', 'ST', 'SV', 'CS'):
-                    breaking_rv += rv
-                elif ptype in ('CH', 'FS', 'FO', 'SC', 'KN', 'EP'):
-                    offspeed_rv += rv
-
-            result[pid] = {
-                'whiff_pct': round(w_whiff, 1),
-                'pitching_run_value': round(total_run_value, 1),
-                'fastball_run_value': round(fb_rv, 1),
-                'breaking_run_value': round(breaking_rv, 1),
-                'offspeed_run_value': round(offspeed_rv, 1),
-            }
-
-        print(f"    Got {len(result)} pitchers")
-        return result
-    except Exception as e:
-        print(f"    Error: {e}")
+    df = statcast_pitcher_arsenal_stats(year, minPA=20)
+    if df is None or df.empty:
         return {}
+    record_rows_in(len(df))
+
+    # Group by player_id, aggregate across pitch types
+    result = {}
+    for pid, group in df.groupby('player_id'):
+        pid = safe_int(pid)
+        if pid == 0:
+            continue
+
+        total_pitches = group['pitches'].sum()
+        if total_pitches == 0:
+            continue
+
+        # Weighted averages by pitch usage
+        w_whiff = 0
+        total_run_value = 0
+        fb_rv = 0
+        breaking_rv = 0
+        offspeed_rv = 0
+
+        for _, row in group.iterrows():
+            pitches = safe_int(row.get('pitches', 0))
+            weight = pitches / total_pitches if total_pitches > 0 else 0
+            w_whiff += safe_float(row.get('whiff_percent', 0)) * weight
+            rv = safe_float(row.get('run_value', 0))
+            total_run_value += rv
+
+            # Classify pitch type for category run values
+            ptype = str(row.get('pitch_type', '')).upper()
+            if ptype in ('FF', 'SI', 'FA', 'FC'):
+                fb_rv += rv
+            elif ptype in ('SL', 'CU', 'KC', 'ST', 'SV', 'CS'):
+                breaking_rv += rv
+            elif ptype in ('CH', 'FS', 'FO', 'SC', 'KN', 'EP'):
+                offspeed_rv += rv
+
+        result[pid] = {
+            'whiff_pct': round(w_whiff, 1),
+            'pitching_run_value': round(total_run_value, 1),
+            'fastball_run_value': round(fb_rv, 1),
+            'breaking_run_value': round(breaking_rv, 1),
+            'offspeed_run_value': round(offspeed_rv, 1),
+        }
+
+    print(f"    Got {len(result)} pitchers")
+    return result
 
 
 def fetch_fangraphs_stats(year, fg_to_mlbam):
     """Fetch K%, BB%, GB%, O-Swing% (chase), SwStr% from FanGraphs pitching stats."""
     print(f"  Fetching FanGraphs stats for {year}...")
-    try:
-        df = pitching_stats(year, qual=1)
-        if df is None or df.empty:
-            return {}
-        result = {}
-        for _, row in df.iterrows():
-            fg_id = safe_int(row.get('IDfg', 0))
-            mlbam_id = fg_to_mlbam.get(fg_id, 0)
-            if mlbam_id == 0:
-                continue
-            result[mlbam_id] = {
-                'k_pct': round(safe_float(row.get('K%', 0)) * 100, 1),
-                'bb_pct': round(safe_float(row.get('BB%', 0)) * 100, 1),
-                'gb_pct': round(safe_float(row.get('GB%', 0)) * 100, 1),
-                # O-Swing% = chase rate (swings on pitches outside zone)
-                'chase_pct': round(safe_float(row.get('O-Swing%', 0)) * 100, 1),
-                # SwStr% = swinging strike rate (similar to whiff%)
-                'swstr_pct': round(safe_float(row.get('SwStr%', 0)) * 100, 1),
-            }
-        print(f"    Got {len(result)} pitchers (mapped from FanGraphs)")
-        return result
-    except Exception as e:
-        print(f"    Error: {e}")
+    df = pitching_stats(year, qual=1)
+    if df is None or df.empty:
         return {}
+    record_rows_in(len(df))
+    result = {}
+    for _, row in df.iterrows():
+        fg_id = safe_int(row.get('IDfg', 0))
+        mlbam_id = fg_to_mlbam.get(fg_id, 0)
+        if mlbam_id == 0:
+            continue
+        result[mlbam_id] = {
+            'k_pct': round(safe_float(row.get('K%', 0)) * 100, 1),
+            'bb_pct': round(safe_float(row.get('BB%', 0)) * 100, 1),
+            'gb_pct': round(safe_float(row.get('GB%', 0)) * 100, 1),
+            # O-Swing% = chase rate (swings on pitches outside zone)
+            'chase_pct': round(safe_float(row.get('O-Swing%', 0)) * 100, 1),
+            # SwStr% = swinging strike rate (similar to whiff%)
+            'swstr_pct': round(safe_float(row.get('SwStr%', 0)) * 100, 1),
+        }
+    print(f"    Got {len(result)} pitchers (mapped from FanGraphs)")
+    return result
 
 
-def lookup_player_names(player_ids):
+def fetch_chase_percentiles(year):
+    """Fetch chase% percentile ranks from Savant (fills gaps in FanGraphs O-Swing%)."""
+    print(f"  Fetching chase% percentile ranks for {year}...")
+    df = statcast_pitcher_percentile_ranks(year)
+    if df is None or df.empty:
+        return {}
+    record_rows_in(len(df))
+    result = {}
+    for _, row in df.iterrows():
+        pid = safe_int(row.get('player_id', 0))
+        pctile = safe_float(row.get('chase_percent', 0))
+        if pid != 0 and pctile > 0:
+            result[pid] = pctile
+    print(f"    Got {len(result)} pitchers")
+    return result
+
+
+def lookup_player_names(player_ids, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
     print(f"\nLooking up names for {len(player_ids)} pitchers...")
     names = {}
     id_list = list(player_ids)
@@ -217,8 +246,12 @@ def lookup_player_names(player_ids):
         for i in range(0, len(id_list), 200):
             chunk = id_list[i:i + 200]
             try:
-                result_df = playerid_reverse_lookup(chunk, key_type='mlbam')
+                result_df, _, _, _ = call_with_retries(
+                    lambda: playerid_reverse_lookup(chunk, key_type='mlbam'),
+                    f"name batch {i//200 + 1}", retries=retries, backoff=backoff, allow_empty=True,
+                )
                 if result_df is not None and not result_df.empty:
+                    record_rows_in(len(result_df))
                     for _, row in result_df.iterrows():
                         mlb_id = row.get('key_mlbam')
                         if pd.notna(mlb_id):
@@ -228,6 +261,7 @@ def lookup_player_names(player_ids):
                                 names[int(mlb_id)] = f"{first} {last}"
             except Exception as e:
                 print(f"    Batch error: {e}")
+                record_error(e)
     except Exception as e:
         print(f"  Error: {e}")
     print(f"  Resolved {len(names)} names")
@@ -235,11 +269,23 @@ def lookup_player_names(player_ids):
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Fetch pitcher Savant data')
+    add_checkpoint_args(parser)
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+
+    output_path = os.path.join(os.path.dirname(__file__), '..', 'services', 'pitcherSavant.json')
+    output_path = os.path.abspath(output_path)
+    report = RunReport('fetchPitcherSavant', output_path, profile=args.profile, trace_memory=args.trace_memory)
+    store = CheckpointStore(output_path, resume=args.resume, retries=args.retries, backoff=args.backoff)
+
     print("=" * 60)
     print("Fetching MLB Pitcher Savant Data (2022-2025)")
     print("=" * 60)
 
-    fg_to_mlbam = build_fg_to_mlbam_map()
+    with report.stage('fg_id_map', source='chadwick') as st:
+        fg_to_mlbam = store.run('fg_id_map', build_fg_to_mlbam_map, source='chadwick')
+        st.rows_out = len(fg_to_mlbam)
 
     all_player_ids = set()
     yearly_data = {}
@@ -247,10 +293,18 @@ def main():
     for year in YEARS:
         print(f"\n--- Processing {year} ---")
 
-        expected = fetch_expected_stats(year)
-        exit_velo = fetch_exit_velo(year)
-        arsenal = fetch_arsenal_stats(year)
-        fg_stats = fetch_fangraphs_stats(year, fg_to_mlbam)
+        with report.stage('expected_stats', source='savant', year=year) as st:
+            expected = store.run('expected_stats', lambda: fetch_expected_stats(year), source='savant', year=year)
+            st.rows_out = len(expected)
+        with report.stage('exit_velo_barrels', source='savant', year=year) as st:
+            exit_velo = store.run('exit_velo_barrels', lambda: fetch_exit_velo(year), source='savant', year=year)
+            st.rows_out = len(exit_velo)
+        with report.stage('arsenal_stats', source='savant', year=year) as st:
+            arsenal = store.run('arsenal_stats', lambda: fetch_arsenal_stats(year), source='savant', year=year)
+            st.rows_out = len(arsenal)
+        with report.stage('fangraphs_pitching', source='fangraphs', year=year) as st:
+            fg_stats = store.run('fangraphs_pitching', lambda: fetch_fangraphs_stats(year, fg_to_mlbam), source='fangraphs', year=year)
+            st.rows_out = len(fg_stats)
 
         all_ids = set(expected.keys()) | set(exit_velo.keys()) | set(arsenal.keys()) | set(fg_stats.keys())
 
@@ -287,90 +341,85 @@ def main():
         all_player_ids.update(all_ids)
         print(f"  Combined {len(merged)} pitchers for {year}")
 
-    # Enrich with fastball velo & extension from pitchArsenals.json
-    arsenals_path = os.path.join(os.path.dirname(__file__), '..', 'services', 'pitchArsenals.json')
-    arsenals_path = os.path.abspath(arsenals_path)
-    try:
-        with open(arsenals_path, 'r') as f:
-            arsenals_data = json.load(f)
-        pitchers_arsenal = arsenals_data.get('pitchers', {})
-        print(f"\nEnriching with pitchArsenals.json ({len(pitchers_arsenal)} pitchers)...")
-
-        for pid_str, pitcher_data in pitchers_arsenal.items():
-            pid = int(pid_str) if pid_str.isdigit() else None
-            if pid is None:
-                continue
-
-            current_arsenal = pitcher_data.get('currentArsenal', [])
-            fastball_velo = 0
-            extension = 0
-            for pitch in current_arsenal:
-                ptype = (pitch.get('type', '') or '').lower()
-                if ptype in ('four-seam fastball', 'sinker', 'fastball'):
-                    velo = pitch.get('speed', 0)
-                    if velo > fastball_velo:
-                        fastball_velo = velo
-                    ext = pitch.get('extension', 0)
-                    if ext > extension:
-                        extension = ext
-
-            for year in YEARS:
-                if pid in yearly_data.get(year, {}):
-                    if fastball_velo > 0:
-                        yearly_data[year][pid]['fastball_velo'] = round(fastball_velo, 1)
-                    if extension > 0:
-                        yearly_data[year][pid]['extension'] = round(extension, 1)
-
-            arsenal_history = pitcher_data.get('arsenalHistory', {})
-            for year_str, pitches in arsenal_history.items():
-                year_int = int(year_str) if year_str.isdigit() else None
-                if year_int and year_int in YEARS and pid in yearly_data.get(year_int, {}):
-                    pid_yearly = yearly_data[year_int][pid]
-                    for pitch in pitches:
-                        ptype = (pitch.get('type', '') or '').lower()
-                        if ptype in ('four-seam fastball', 'sinker', 'fastball'):
-                            velo = pitch.get('speed', 0)
-                            if velo > pid_yearly['fastball_velo']:
-                                pid_yearly['fastball_velo'] = round(velo, 1)
-                            ext = pitch.get('extension', 0)
-                            if ext > pid_yearly['extension']:
-                                pid_yearly['extension'] = round(ext, 1)
-
-            all_player_ids.add(pid)
-    except FileNotFoundError:
-        print("  pitchArsenals.json not found, skipping")
-    except Exception as e:
-        print(f"  Error: {e}")
+    # Enrich with fastball velo & extension from the pitch arsenals (indexed lookups
+    # in the Savant store instead of loading all of pitchArsenals.json)
+    with report.stage('arsenal_enrichment', source='savantStore') as st:
+        try:
+            arsenal_store = SavantStore()
+            print(f"\nEnriching with pitch arsenals from {os.path.basename(arsenal_store.store_path)}...")
+
+            for pid in sorted(all_player_ids):
+                pitcher_data = arsenal_store.entry('arsenal', pid)
+                if pitcher_data is None:
+                    continue
+                record_rows_in(1)
+
+                current_arsenal = pitcher_data.get('currentArsenal', [])
+                fastball_velo = 0
+                extension = 0
+                for pitch in current_arsenal:
+                    ptype = (pitch.get('type', '') or '').lower()
+                    if ptype in ('four-seam fastball', 'sinker', 'fastball'):
+                        velo = pitch.get('speed', 0)
+                        if velo > fastball_velo:
+                            fastball_velo = velo
+                        ext = pitch.get('extension', 0)
+                        if ext > extension:
+                            extension = ext
+
+                for year in YEARS:
+                    if pid in yearly_data.get(year, {}):
+                        if fastball_velo > 0:
+                            yearly_data[year][pid]['fastball_velo'] = round(fastball_velo, 1)
+                        if extension > 0:
+                            yearly_data[year][pid]['extension'] = round(extension, 1)
+
+                arsenal_history = pitcher_data.get('arsenalHistory', {})
+                for year_str, pitches in arsenal_history.items():
+                    year_int = int(year_str) if year_str.isdigit() else None
+                    if year_int and year_int in YEARS and pid in yearly_data.get(year_int, {}):
+                        pid_yearly = yearly_data[year_int][pid]
+                        for pitch in pitches:
+                            ptype = (pitch.get('type', '') or '').lower()
+                            if ptype in ('four-seam fastball', 'sinker', 'fastball'):
+                                velo = pitch.get('speed', 0)
+                                if velo > pid_yearly['fastball_velo']:
+                                    pid_yearly['fastball_velo'] = round(velo, 1)
+                                ext = pitch.get('extension', 0)
+                                if ext > pid_yearly['extension']:
+                                    pid_yearly['extension'] = round(ext, 1)
+
+                st.rows_out += 1
+            arsenal_store.close()
+        except FileNotFoundError:
+            print("  Savant store not found (run fetchPitchArsenals.py first), skipping")
+        except Exception as e:
+            print(f"  Error: {e}")
+            record_error(e)
 
     # Enrich chase% from percentile ranks for players missing FanGraphs data
     print("\nEnriching missing chase% from percentile ranks...")
-    try:
-        from pybaseball import statcast_pitcher_percentile_ranks
+    if statcast_pitcher_percentile_ranks is None:
+        print("  statcast_pitcher_percentile_ranks not available")
+    else:
         enriched_count = 0
         for year in YEARS:
-            try:
-                df = statcast_pitcher_percentile_ranks(year)
-                if df is None or df.empty:
+            with report.stage('chase_percentiles', source='savant', year=year) as st:
+                percentiles = store.run('chase_percentiles', lambda: fetch_chase_percentiles(year), source='savant', year=year)
+                st.rows_out = len(percentiles)
+            for pid, pctile in percentiles.items():
+                if pid not in yearly_data.get(year, {}):
                     continue
-                for _, row in df.iterrows():
-                    pid = safe_int(row.get('player_id', 0))
-                    if pid == 0 or pid not in yearly_data.get(year, {}):
-                        continue
-                    # Only fill in if FanGraphs didn't provide chase%
-                    if yearly_data[year][pid].get('chase_pct', 0) == 0:
-                        pctile = safe_float(row.get('chase_percent', 0))
-                        if pctile > 0:
-                            raw_chase = 20 + (pctile / 100) * 18
-                            yearly_data[year][pid]['chase_pct'] = round(raw_chase, 1)
-                            enriched_count += 1
-                print(f"  Checked percentile ranks for {year}")
-            except Exception as e:
-                print(f"  Error enriching chase% for {year}: {e}")
+                # Only fill in if FanGraphs didn't provide chase%
+                if yearly_data[year][pid].get('chase_pct', 0) == 0:
+                    raw_chase = 20 + (pctile / 100) * 18
+                    yearly_data[year][pid]['chase_pct'] = round(raw_chase, 1)
+                    enriched_count += 1
         print(f"  Enriched {enriched_count} additional chase% entries from percentile ranks")
-    except ImportError:
-        print("  statcast_pitcher_percentile_ranks not available")
 
-    player_names = lookup_player_names(all_player_ids)
+    with report.stage('name_lookup', source='chadwick') as st:
+        player_names = lookup_player_names(all_player_ids, retries=args.retries, backoff=args.backoff)
+        st.rows_out = len(player_names)
 
     # Build output
     pitchers = {}
@@ -400,8 +449,6 @@ def main():
     print(f"\n{'=' * 60}")
     print(f"Total unique pitchers: {len(pitchers)}")
 
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'services', 'pitcherSavant.json')
-    output_path = os.path.abspath(output_path)
     output_data = {
         'lastUpdated': datetime.now().isoformat(),
         'source': 'Baseball Savant + FanGraphs via pybaseball',
@@ -409,8 +456,10 @@ def main():
         'pitcherCount': len(pitchers),
         'pitchers': pitchers,
     }
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    with report.stage('write_json') as st:
+        with open(output_path, 'w') as f:
+            json.dump(output_data, f, indent=2)
+        st.rows_out = len(pitchers)
     print(f"Saved to: {output_path}")
 
     # Verify data quality
@@ -426,6 +475,7 @@ def main():
     for field, count in zero_fields.items():
         pct = round(count / total * 100, 1) if total > 0 else 0
         print(f"  {field}: {count}/{total} still zero ({pct}%)")
+    report.set_quality(zero_fields, total)
 
     print("\nSample entries:")
     for pid in list(pitchers.keys())[:5]:
@@ -437,6 +487,19 @@ def main():
         print(f"    FB Velo: {cs.get('fastball_velo')}, EV Against: {cs.get('avg_exit_velo_against')}")
         print(f"    Run Values: total={cs.get('pitching_run_value')}, FB={cs.get('fastball_run_value')}, BRK={cs.get('breaking_run_value')}, OS={cs.get('offspeed_run_value')}")
 
+    # Rebuild the normalized registry the app loads (services/savantRegistry.json)
+    # plus the name search index, precomputed leaderboards and arsenal index over it
+    with report.stage('registry') as st:
+        st.rows_out = write_registry()
+        write_search_index()
+        write_leaderboards()
+        write_arsenal_index()
+    print(f"\nRebuilt registry: {REGISTRY_PATH}")
+
+    store.print_summary()
+    print()
+    report.write()
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Checkpointed, resumable fetch units for the Savant ingest scripts.
+
+Every (source, year) fetch is a unit. Each unit is retried with exponential
+backoff and its result is checkpointed to disk as soon as it completes:
+
+  services/batterSavant.checkpoints/expected_stats_2025.json
+  services/batterSavant.checkpoints/sprint_speed_2024.json
+  ...
+
+A normal run re-fetches every unit and overwrites its checkpoint. With
+--resume, units whose checkpoint is 'ok' are loaded from disk and only failed,
+empty or missing units are fetched again, after which the script re-merges
+everything into the artifact. A flaky source costs a retry, not a full
+four-year re-download.
+
+Usage (inside an ingest script):
+    store = CheckpointStore(output_path, resume=args.resume, retries=args.retries)
+    expected = store.run('expected_stats', lambda: fetch_expected_stats(2025), source='savant', year=2025)
+    ...
+    store.print_summary()
+"""
+
+import json
+import os
+import random
+import time
+from datetime import datetime
+
+from ingestReport import record_cache_hit, record_error, record_retry
+
+
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 2.0
+MAX_BACKOFF = 60.0
+
+
+def _int_keys(data):
+    """JSON turns int player IDs into strings; restore them on load."""
+    if not isinstance(data, dict):
+        return data
+    return {int(k) if isinstance(k, str) and k.isdigit() else k: v for k, v in data.items()}
+
+
+def backoff_delay(attempt, base=DEFAULT_BACKOFF):
+    """Exponential backoff (base, 2*base, 4*base, ...) with a little jitter, capped."""
+    delay = min(base * (2 ** (attempt - 1)), MAX_BACKOFF)
+    return delay + random.uniform(0, delay * 0.25)
+
+
+def call_with_retries(fn, label, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, allow_empty=False):
+    """
+    Call fn() up to retries + 1 times.
+
+    An exception, or an empty result when allow_empty is False, counts as a
+    failed attempt. Returns (result, status, attempts, error) where status is
+    'ok', 'empty' or 'failed' and result is None unless status is 'ok'; never
+    raises. Pass allow_empty=True when fn returns a DataFrame.
+    """
+    last_error = None
+    attempts = 0
+    for attempt in range(1, retries + 2):
+        attempts = attempt
+        try:
+            result = fn()
+            if allow_empty or result:
+                return result, 'ok', attempts, None
+            last_error = None
+        except Exception as e:
+            last_error = e
+            print(f"    {label} failed (attempt {attempt}/{retries + 1}): {e}")
+
+        if attempt <= retries:
+            delay = backoff_delay(attempt, backoff)
+            reason = 'empty result' if last_error is None else 'error'
+            print(f"    Retrying {label} in {delay:.1f}s ({reason})...")
+            record_retry()
+            time.sleep(delay)
+
+    if last_error is not None:
+        record_error(last_error)
+        return None, 'failed', attempts, f"{type(last_error).__name__}: {last_error}"
+    return None, 'empty', attempts, None
+
+
+class CheckpointStore:
+    """Per-unit checkpoint files for one ingest artifact."""
+
+    def __init__(self, artifact_path, resume=False, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+        base = os.path.splitext(os.path.abspath(artifact_path))[0]
+        self.directory = f"{base}.checkpoints"
+        self.resume = resume
+        self.retries = retries
+        self.backoff = backoff
+        self.results = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def unit_key(name, year=None):
+        return name if year is None else f"{name}_{year}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key):
+        """Return the checkpoint entry for a unit, or None if missing/unreadable."""
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save(self, key, entry):
+        # Write then rename so an interrupted run never leaves a half-written checkpoint
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def run(self, name, fetch_fn, source=None, year=None, allow_empty=False):
+        """Fetch one unit (or load it from its checkpoint when resuming) and return its data."""
+        key = self.unit_key(name, year)
+
+        if self.resume:
+            entry = self.load(key)
+            if entry and entry.get('status') == 'ok':
+                print(f"  Using checkpoint for {key} (fetched {entry.get('fetchedAt')})")
+                record_cache_hit()
+                self.results[key] = 'cached'
+                return _int_keys(entry.get('data', {}))
+
+        data, status, attempts, error = call_with_retries(
+            fetch_fn, key, retries=self.retries, backoff=self.backoff, allow_empty=allow_empty,
+        )
+        if data is None:
+            data = {}
+        self.save(key, {
+            'unit': key,
+            'source': source,
+            'year': year,
+            'status': status,
+            'attempts': attempts,
+            'error': error,
+            'fetchedAt': datetime.now().isoformat(),
+            'data': data,
+        })
+        self.results[key] = status
+        return data
+
+    def incomplete_units(self):
+        return sorted(key for key, status in self.results.items() if status not in ('ok', 'cached'))
+
+    def print_summary(self):
+        fetched = sum(1 for s in self.results.values() if s == 'ok')
+        cached = sum(1 for s in self.results.values() if s == 'cached')
+        incomplete = self.incomplete_units()
+        print(f"\nFetch units: {fetched} fetched, {cached} from checkpoint, {len(incomplete)} incomplete")
+        if incomplete:
+            print(f"  Incomplete: {', '.join(incomplete)}")
+            print("  Re-run with --resume to retry only these units and re-merge.")
+
+
+def add_checkpoint_args(parser):
+    """Shared CLI flags for checkpointed ingest scripts."""
+    parser.add_argument('--resume', action='store_true', help='Reuse successful unit checkpoints; re-fetch only failed or missing units')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help=f'Retries per fetch unit (default {DEFAULT_RETRIES})')
+    parser.add_argument('--backoff', type=float, default=DEFAULT_BACKOFF, help=f'Initial backoff in seconds, doubled per retry (default {DEFAULT_BACKOFF})')
+    return parser
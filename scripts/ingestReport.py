@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Structured run-report instrumentation for the Savant ingest scripts.
+
+Each fetch step runs inside a report stage that records timing, rows in/out,
+HTTP calls, cache hits, retries, errors and memory high-water marks. Stages can
+optionally be profiled with cProfile and traced with tracemalloc. At the end of
+a run the report is written next to the artifact:
+
+  services/batterSavant.json              (artifact)
+  services/batterSavant.report.json       (latest run report)
+  services/batterSavant.runs.jsonl        (one summary line per run, for graphing)
+
+Usage (inside an ingest script):
+    report = RunReport('fetchBatterSavant', output_path, profile=args.profile)
+    with report.stage('expected_stats', source='savant', year=2025) as st:
+        data = fetch_expected_stats(2025)
+        st.rows_out = len(data)
+    report.write()
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+
+# The stage currently executing, so fetch helpers can record rows/errors
+# without having the report threaded through every call.
+_ACTIVE_STAGE = None
+_HTTP_HOOK_INSTALLED = False
+
+
+def _max_rss_kb():
+    """Process memory high-water mark in KB (ru_maxrss is bytes on macOS)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def _install_http_hook():
+    """Count HTTP requests made through `requests` (used by pybaseball) per stage."""
+    global _HTTP_HOOK_INSTALLED
+    if _HTTP_HOOK_INSTALLED:
+        return
+    try:
+        import requests
+    except ImportError:
+        return
+
+    original_request = requests.Session.request
+
+    def counted_request(self, method, url, *args, **kwargs):
+        if _ACTIVE_STAGE is not None:
+            _ACTIVE_STAGE.http_calls += 1
+        return original_request(self, method, url, *args, **kwargs)
+
+    requests.Session.request = counted_request
+    _HTTP_HOOK_INSTALLED = True
+
+
+def record_rows_in(count):
+    """Record raw rows received by the active stage (e.g. len(df))."""
+    if _ACTIVE_STAGE is not None:
+        _ACTIVE_STAGE.rows_in += int(count)
+
+
+def record_error(error):
+    """Record a swallowed exception against the active stage."""
+    if _ACTIVE_STAGE is not None:
+        _ACTIVE_STAGE.errors.append(f"{type(error).__name__}: {error}")
+
+
+def record_cache_hit(count=1):
+    if _ACTIVE_STAGE is not None:
+        _ACTIVE_STAGE.cache_hits += count
+
+
+def record_retry(count=1):
+    if _ACTIVE_STAGE is not None:
+        _ACTIVE_STAGE.retries += count
+
+
+class StageRecord:
+    """Metrics for one instrumented stage."""
+
+    def __init__(self, name, source=None, year=None):
+        self.name = name
+        self.source = source
+        self.year = year
+        self.started_at = None
+        self.duration_s = 0.0
+        self.rows_in = 0
+        self.rows_out = 0
+        self.http_calls = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.errors = []
+        self.max_rss_kb = 0
+        self.traced_peak_kb = None
+        self.profile_top = None
+
+    @property
+    def status(self):
+        if self.errors:
+            return 'error'
+        if self.rows_out == 0:
+            return 'empty'
+        return 'ok'
+
+    def to_dict(self):
+        data = {
+            'name': self.name,
+            'source': self.source,
+            'year': self.year,
+            'status': self.status,
+            'startedAt': self.started_at,
+            'durationSec': round(self.duration_s, 3),
+            'rowsIn': self.rows_in,
+            'rowsOut': self.rows_out,
+            'httpCalls': self.http_calls,
+            'cacheHits': self.cache_hits,
+            'retries': self.retries,
+            'errors': self.errors,
+            'maxRssKb': self.max_rss_kb,
+        }
+        if self.traced_peak_kb is not None:
+            data['tracedPeakKb'] = self.traced_peak_kb
+        if self.profile_top is not None:
+            data['profileTop'] = self.profile_top
+        return data
+
+
+class RunReport:
+    """Collects stage records for one ingest run and writes them next to the artifact."""
+
+    def __init__(self, script, artifact_path, profile=False, trace_memory=False, profile_limit=15):
+        self.script = script
+        self.artifact_path = os.path.abspath(artifact_path)
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.profile_limit = profile_limit
+        self.stages = []
+        self.quality = {}
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+        _install_http_hook()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name, source=None, year=None):
+        global _ACTIVE_STAGE
+        record = StageRecord(name, source=source, year=year)
+        record.started_at = datetime.now().isoformat()
+        previous = _ACTIVE_STAGE
+        _ACTIVE_STAGE = record
+
+        profiler = cProfile.Profile() if self.profile else None
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        if profiler:
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record.errors.append(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            record.duration_s = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+                record.profile_top = self._summarize_profile(profiler, record)
+            if self.trace_memory:
+                record.traced_peak_kb = tracemalloc.get_traced_memory()[1] // 1024
+            record.max_rss_kb = _max_rss_kb()
+            _ACTIVE_STAGE = previous
+            self.stages.append(record)
+
+    def _summarize_profile(self, profiler, record):
+        """Dump the full profile next to the report and keep the top entries inline."""
+        label = record.name if record.year is None else f"{record.name}_{record.year}"
+        prof_path = f"{self._base_path()}.{label}.prof"
+        profiler.dump_stats(prof_path)
+
+        stats = pstats.Stats(profiler)
+        top = []
+        for func, (cc, nc, tt, ct, callers) in sorted(stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)[:self.profile_limit]:
+            filename, line, fn_name = func
+            top.append({
+                'function': f"{os.path.basename(filename)}:{line}({fn_name})",
+                'calls': nc,
+                'totalSec': round(tt, 4),
+                'cumulativeSec': round(ct, 4),
+            })
+        return top
+
+    def _base_path(self):
+        return os.path.splitext(self.artifact_path)[0]
+
+    def set_quality(self, field_counts, total):
+        """Record the end-of-run data quality check (zero-valued field counts)."""
+        self.quality = {
+            'total': total,
+            'zeroFields': {
+                field: {'count': count, 'pct': round(count / total * 100, 1) if total > 0 else 0}
+                for field, count in field_counts.items()
+            },
+        }
+
+    def to_dict(self):
+        stages = [s.to_dict() for s in self.stages]
+        return {
+            'script': self.script,
+            'artifact': os.path.basename(self.artifact_path),
+            'startedAt': self.started_at,
+            'finishedAt': datetime.now().isoformat(),
+            'durationSec': round(time.perf_counter() - self._start, 3),
+            'maxRssKb': _max_rss_kb(),
+            'totals': {
+                'httpCalls': sum(s.http_calls for s in self.stages),
+                'cacheHits': sum(s.cache_hits for s in self.stages),
+                'retries': sum(s.retries for s in self.stages),
+                'errors': sum(len(s.errors) for s in self.stages),
+                'emptyStages': [s.name if s.year is None else f"{s.name}:{s.year}" for s in self.stages if s.status != 'ok'],
+            },
+            'quality': self.quality,
+            'stages': stages,
+        }
+
+    def write(self):
+        """Write <artifact>.report.json and append a summary line to <artifact>.runs.jsonl."""
+        data = self.to_dict()
+        report_path = f"{self._base_path()}.report.json"
+        with open(report_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+        summary = {
+            'startedAt': data['startedAt'],
+            'durationSec': data['durationSec'],
+            'maxRssKb': data['maxRssKb'],
+            **data['totals'],
+            'stages': {
+                (s['name'] if s['year'] is None else f"{s['name']}:{s['year']}"): {
+                    'durationSec': s['durationSec'],
+                    'rowsOut': s['rowsOut'],
+                    'status': s['status'],
+                }
+                for s in data['stages']
+            },
+        }
+        with open(f"{self._base_path()}.runs.jsonl", 'a') as f:
+            f.write(json.dumps(summary) + '\n')
+
+        print(f"Run report: {report_path}")
+        problems = data['totals']['emptyStages']
+        if problems:
+            print(f"  Warning: {len(problems)} stage(s) returned no data or errored: {', '.join(problems)}")
+        return report_path
+
+
+def add_instrumentation_args(parser):
+    """Shared CLI flags for the ingest scripts."""
+    parser.add_argument('--profile', action='store_true', help='cProfile each stage (writes .prof files next to the report)')
+    parser.add_argument('--trace-memory', action='store_true', help='Track per-stage Python heap peaks with tracemalloc')
+    return parser
@@ -0,0 +1,72 @@
+// Run-optimal batting orders for every team against power and finesse starters
+// Uses the fixed benchmark league (or a saved season file) and the current services/simParams.json
+// Run: npm run optimize:lineups -- [--league grand_slam_data.json] [--seed N] [--team NYY]
+
+import { readFileSync } from 'node:fs';
+import { resolve } from 'node:path';
+import { Team } from '../types';
+import { buildBenchmarkLeague } from '../services/benchmark';
+import { optimizeLeagueLineups, OptimizedLineup } from '../services/lineupOptimizer';
+
+function parseArgs(argv: string[]) {
+  let seed = 20260325;
+  let leaguePath = '';
+  let team = '';
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--seed') seed = Number(argv[++i]);
+    else if (arg === '--league') leaguePath = argv[++i];
+    else if (arg === '--team') team = argv[++i].toUpperCase();
+  }
+  return { seed, leaguePath, team };
+}
+
+function loadLeague(path: string): Team[] | undefined {
+  if (!path) return undefined;
+  // Accepts the season file written by "Save Data" in the app (SeasonState JSON)
+  const data = JSON.parse(readFileSync(resolve(path), 'utf8'));
+  return Array.isArray(data) ? data : data.teams;
+}
+
+const fmt = (value: number, digits = 3) => value.toLocaleString('en-US', { maximumFractionDigits: digits, minimumFractionDigits: digits });
+
+const printOrder = (lineup: OptimizedLineup) => {
+  lineup.order.forEach((p, i) => console.log(`    ${i + 1}. ${p.name} (${p.position})`));
+};
+
+function main() {
+  const { seed, leaguePath, team } = parseArgs(process.argv.slice(2));
+  const loaded = loadLeague(leaguePath);
+  const teams: Team[] = loaded && loaded.length > 0 ? loaded : buildBenchmarkLeague(seed);
+
+  console.log('='.repeat(60));
+  console.log(`Lineup optimization (${loaded ? leaguePath : 'synthetic league'}, ${teams.length} teams)`);
+  console.log('='.repeat(60));
+
+  const start = performance.now();
+  const lineups = optimizeLeagueLineups(teams);
+  const elapsedMs = performance.now() - start;
+
+  console.log(`\n${'Team'.padEnd(6)}${'vs power'.padStart(18)}${'vs finesse'.padStart(18)}`);
+  let gain = 0;
+  teams.forEach(t => {
+    const { power, finesse } = lineups.get(t.id)!;
+    gain += power.runsPerGame - power.heuristicRuns + finesse.runsPerGame - finesse.heuristicRuns;
+    const cell = (l: OptimizedLineup) => `${fmt(l.runsPerGame)} (+${fmt(l.runsPerGame - l.heuristicRuns)})`.padStart(18);
+    console.log(`${t.abbreviation.padEnd(6)}${cell(power)}${cell(finesse)}`);
+  });
+  console.log(`\nRuns per game vs getBestLineup under the same model: +${fmt(gain / (teams.length * 2))} on average`);
+
+  const detail = teams.find(t => t.abbreviation === team);
+  if (detail) {
+    const { power, finesse } = lineups.get(detail.id)!;
+    console.log(`\n${detail.abbreviation} vs power starters:`);
+    printOrder(power);
+    console.log(`${detail.abbreviation} vs finesse starters:`);
+    printOrder(finesse);
+  }
+
+  console.log(`\nOptimized ${teams.length * 2} lineups in ${fmt(elapsedMs / 1000, 1)}s`);
+}
+
+main();
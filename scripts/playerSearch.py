@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Fuzzy player-name search over the Savant registry.
+
+Builds a persisted index (services/playerSearch.json) of every player in
+savantRegistry.json:
+
+  - names are folded: accents stripped, lowercased, punctuation removed
+    ("José Ramírez" -> "jose ramirez", "J.T. Realmuto" -> "jt realmuto")
+  - a sorted prefix table over the full name and every trailing part of it,
+    so "ohta", "shohei o" and "ramirez" all hit by binary search
+  - trigram postings for typo tolerance ("mookie bets", "vladimir guerero")
+  - nickname expansion on first names ("mike trout" -> "michael", "vladdy")
+
+Queries return ranked (mlbId, name, score) matches. The index is rebuilt
+automatically when the registry is newer, and by the ingest scripts after each
+run.
+
+Usage:
+    python scripts/playerSearch.py build
+    python scripts/playerSearch.py query "mookie bets" [--limit 5]
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import unicodedata
+from bisect import bisect_left
+
+from savantRegistry import REGISTRY_PATH, SERVICES_DIR
+
+
+SEARCH_INDEX_PATH = os.path.join(SERVICES_DIR, 'playerSearch.json')
+INDEX_VERSION = 1
+
+# Minimum trigram (Dice) similarity for a fuzzy match
+MIN_SIMILARITY = 0.35
+
+# Common first-name variants; each group is expanded both ways at query time
+NICKNAME_GROUPS = [
+    ['michael', 'mike', 'mikey'],
+    ['matthew', 'matt'],
+    ['alexander', 'alex', 'alejandro'],
+    ['nicholas', 'nick', 'nico'],
+    ['christopher', 'chris'],
+    ['joshua', 'josh'],
+    ['jacob', 'jake'],
+    ['zachary', 'zach', 'zack'],
+    ['william', 'will', 'bill', 'billy', 'willie'],
+    ['robert', 'rob', 'bob', 'bobby', 'robbie'],
+    ['daniel', 'dan', 'danny'],
+    ['anthony', 'tony'],
+    ['joseph', 'joe', 'joey'],
+    ['jonathan', 'jon', 'jonny'],
+    ['benjamin', 'ben'],
+    ['samuel', 'sam', 'sammy'],
+    ['thomas', 'tom', 'tommy'],
+    ['andrew', 'andy', 'drew'],
+    ['peter', 'pete'],
+    ['cameron', 'cam'],
+    ['nathaniel', 'nathan', 'nate'],
+    ['edward', 'ed', 'eddie'],
+    ['james', 'jim', 'jimmy', 'jamie'],
+    ['gregory', 'greg'],
+    ['jeffrey', 'jeff'],
+    ['kenneth', 'ken', 'kenny'],
+    ['steven', 'stephen', 'steve'],
+    ['frederick', 'fred', 'freddie', 'freddy'],
+    ['manuel', 'manny'],
+    ['javier', 'javy'],
+    ['vladimir', 'vlad', 'vladdy'],
+    ['richard', 'rich', 'rick', 'ricky'],
+    ['timothy', 'tim', 'timmy'],
+    ['charles', 'charlie', 'chuck'],
+    ['theodore', 'ted', 'teddy', 'theo'],
+    ['mitchell', 'mitch'],
+    ['francisco', 'frankie', 'frank', 'pancho'],
+    ['enrique', 'kike'],
+    ['jose', 'pepe'],
+    ['jackson', 'jack'],
+    ['maxwell', 'max'],
+]
+
+NICKNAMES = {}
+for _group in NICKNAME_GROUPS:
+    for _name in _group:
+        NICKNAMES.setdefault(_name, set()).update(n for n in _group if n != _name)
+
+
+def fold(name):
+    """Accent-strip, lowercase and drop punctuation so spellings compare equal."""
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    stripped = re.sub(r"[.'`]", '', stripped)
+    tokens = re.sub(r'[^a-z0-9 ]', ' ', stripped).split()
+    # Run initials together: "j t realmuto" -> "jt realmuto"
+    merged = []
+    in_initials = False
+    for token in tokens:
+        is_initial = len(token) == 1 and token.isalpha()
+        if is_initial and in_initials:
+            merged[-1] += token
+        else:
+            merged.append(token)
+        in_initials = is_initial
+    return ' '.join(merged)
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_index(registry):
+    """Build the persisted search index from a registry dict."""
+    players = [[row[0], row[1]] for row in registry['players']['rows']]
+    keys = []
+    postings = {}
+    for idx, (_, name) in enumerate(players):
+        folded = fold(name)
+        tokens = folded.split()
+        for i in range(len(tokens)):
+            keys.append([' '.join(tokens[i:]), idx])
+        for tri in trigrams(folded):
+            postings.setdefault(tri, []).append(idx)
+    keys.sort()
+    return {
+        'version': INDEX_VERSION,
+        'lastUpdated': registry.get('lastUpdated'),
+        'players': players,
+        'keys': keys,
+        'trigrams': postings,
+    }
+
+
+def write_search_index(registry_path=REGISTRY_PATH, index_path=SEARCH_INDEX_PATH):
+    """Rebuild services/playerSearch.json from the registry. Returns the player count."""
+    with open(registry_path, 'r') as f:
+        registry = json.load(f)
+    index = build_index(registry)
+    with open(index_path, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+    return len(index['players'])
+
+
+class PlayerSearch:
+    """Ranked name lookups over the persisted index."""
+
+    def __init__(self, index_path=SEARCH_INDEX_PATH, registry_path=REGISTRY_PATH, auto_build=True):
+        if auto_build and os.path.exists(registry_path):
+            stale = (not os.path.exists(index_path)
+                     or os.path.getmtime(index_path) < os.path.getmtime(registry_path))
+            if stale:
+                write_search_index(registry_path, index_path)
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+        if index.get('version') != INDEX_VERSION:
+            raise ValueError(f"{index_path} is an old search index; rebuild it")
+        self.players = index['players']
+        self.key_text = [k for k, _ in index['keys']]
+        self.key_player = [i for _, i in index['keys']]
+        self.postings = index['trigrams']
+        self.folded = [fold(name) for _, name in self.players]
+        self.trigram_counts = [len(trigrams(f)) for f in self.folded]
+
+    def _variants(self, folded):
+        """The query plus nickname expansions of its first token."""
+        tokens = folded.split()
+        variants = [folded]
+        if tokens:
+            for alt in sorted(NICKNAMES.get(tokens[0], ())):
+                variants.append(' '.join([alt] + tokens[1:]))
+        return variants
+
+    def _prefix(self, prefix):
+        """Player indexes whose full name or any trailing part starts with prefix."""
+        pos = bisect_left(self.key_text, prefix)
+        while pos < len(self.key_text) and self.key_text[pos].startswith(prefix):
+            yield self.key_player[pos]
+            pos += 1
+
+    def query(self, text, limit=10):
+        """Return up to `limit` ranked matches: [{'mlbId', 'name', 'score'}]."""
+        folded = fold(text)
+        if not folded:
+            return []
+        scores = {}
+
+        def offer(idx, score):
+            if score > scores.get(idx, 0):
+                scores[idx] = score
+
+        for rank, variant in enumerate(self._variants(folded)):
+            # Nickname expansions rank just below the literal query
+            penalty = 0 if rank == 0 else 0.05
+            for idx in self._prefix(variant):
+                full = self.folded[idx]
+                if full == variant:
+                    offer(idx, 3.0 - penalty)
+                elif full.startswith(variant):
+                    offer(idx, 2.5 - penalty)
+                else:
+                    offer(idx, 2.0 - penalty)
+            # Multi-word queries: every query token must prefix some name token ("sho oht")
+            tokens = variant.split()
+            if len(tokens) > 1:
+                candidates = set(self._prefix(tokens[-1]))
+                for idx in candidates:
+                    name_tokens = self.folded[idx].split()
+                    if all(any(nt.startswith(qt) for nt in name_tokens) for qt in tokens):
+                        offer(idx, 1.8 - penalty)
+
+        # Typo tolerance: trigram Dice similarity when prefix matching comes up short
+        if len(scores) < limit:
+            query_tris = trigrams(folded)
+            shared = {}
+            for tri in query_tris:
+                for idx in self.postings.get(tri, ()):
+                    shared[idx] = shared.get(idx, 0) + 1
+            for idx, count in shared.items():
+                similarity = 2 * count / (len(query_tris) + self.trigram_counts[idx])
+                if similarity >= MIN_SIMILARITY:
+                    offer(idx, similarity)
+
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], self.folded[kv[0]]))[:limit]
+        return [
+            {'mlbId': self.players[idx][0], 'name': self.players[idx][1], 'score': round(score, 3)}
+            for idx, score in ranked
+        ]
+
+    def best_id(self, text, min_score=0.6):
+        """MLBAM ID of the single best match, or None."""
+        matches = self.query(text, limit=1)
+        if matches and matches[0]['score'] >= min_score:
+            return matches[0]['mlbId']
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fuzzy player-name search index')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='Build services/playerSearch.json from the registry')
+    query_parser = sub.add_parser('query', help='Run a search')
+    query_parser.add_argument('text')
+    query_parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        count = write_search_index()
+        print(f"Indexed {count} players")
+        print(f"Saved to: {SEARCH_INDEX_PATH}")
+    elif args.command == 'query':
+        search = PlayerSearch()
+        start = time.perf_counter()
+        matches = search.query(args.text, limit=args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        for m in matches:
+            print(f"  {m['score']:.3f}  {m['name']} ({m['mlbId']})")
+        print(f"{len(matches)} matches in {elapsed:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
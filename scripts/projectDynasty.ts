@@ -0,0 +1,68 @@
+// Multi-season franchise projections: seasons chained with offseason progression across many
+// parallel universes
+// Uses the fixed benchmark league (or a saved season file) and the 2026 schedule
+// Run: npm run project:dynasty -- [--league grand_slam_data.json] [--seed N] [--seasons 10] [--universes 100] [--team NYY]
+
+import { readFileSync } from 'node:fs';
+import { resolve } from 'node:path';
+import { Team } from '../types';
+import { buildBenchmarkLeague } from '../services/benchmark';
+import { parseScheduleCSV } from '../services/scheduleData';
+import { projectDynasty } from '../services/dynasty';
+
+function parseArgs(argv: string[]) {
+  let seed = 20260325;
+  let seasons = 10;
+  let universes = 100;
+  let leaguePath = '';
+  let team = '';
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--seed') seed = Number(argv[++i]);
+    else if (arg === '--seasons') seasons = Number(argv[++i]);
+    else if (arg === '--universes') universes = Number(argv[++i]);
+    else if (arg === '--league') leaguePath = argv[++i];
+    else if (arg === '--team') team = argv[++i].toUpperCase();
+  }
+  return { seed, seasons, universes, leaguePath, team };
+}
+
+function loadLeague(path: string): Team[] | undefined {
+  if (!path) return undefined;
+  // Accepts the season file written by "Save Data" in the app (SeasonState JSON)
+  const data = JSON.parse(readFileSync(resolve(path), 'utf8'));
+  return Array.isArray(data) ? data : data.teams;
+}
+
+const fmt = (value: number, digits = 0) => value.toLocaleString('en-US', { maximumFractionDigits: digits, minimumFractionDigits: digits });
+
+function main() {
+  const { seed, seasons, universes, leaguePath, team } = parseArgs(process.argv.slice(2));
+  const loaded = loadLeague(leaguePath);
+  const teams: Team[] = loaded && loaded.length > 0 ? loaded : buildBenchmarkLeague(seed);
+
+  console.log('='.repeat(60));
+  console.log(`Dynasty projection (${loaded ? leaguePath : 'synthetic league'}, ${seasons} seasons x ${universes} universes)`);
+  console.log('='.repeat(60));
+
+  const start = performance.now();
+  const projection = projectDynasty(teams, parseScheduleCSV(), { seasons, universes, seed });
+  const elapsedMs = performance.now() - start;
+
+  const shown = team ? teams.filter(t => t.abbreviation === team) : teams;
+  const header = projection.years.map(y => `${y}`.padStart(6)).join('');
+  const table = (title: string, values: (index: number) => number[]) => {
+    console.log(`\n${title}\n${'Team'.padEnd(6)}${header}`);
+    shown.forEach(t => {
+      const row = values(teams.indexOf(t)).map(v => fmt(v).padStart(6)).join('');
+      console.log(`${t.abbreviation.padEnd(6)}${row}`);
+    });
+  };
+  table('Mean wins', i => projection.teams[i].meanWins);
+  table('Playoff %', i => projection.teams[i].playoffPct);
+  if (team) table('Title %', i => projection.teams[i].titlePct);
+
+  console.log(`\n${fmt(seasons * universes)} seasons in ${fmt(elapsedMs / 1000, 1)}s`);
+}
+
+main();
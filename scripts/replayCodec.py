@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Compact binary codec and archive for game replays (GameReplayData).
+
+A saved season (the "Save Data" JSON from the app) carries a replay for every
+game. Each pitch repeats its release point, plate point and an 11-point
+ballPath as float objects, so one game is ~300 KB of JSON. This packs them
+into a seekable archive:
+
+  - vectors are quantized to 1/1000 ft, speeds and hit locations to 0.1
+  - ballPath is not stored when it matches buildPitchPaths() in
+    services/pitchTrajectory.ts; it is regenerated from the pitch type and the
+    release/plate points on decode (otherwise it is delta-encoded). Pitches
+    without one (replays from the current simulator) decode without one too
+  - player IDs, pitch types, results, counts and descriptions go through a
+    per-game string table
+  - integers are zigzag varints; each game is zlib-compressed separately
+
+Archive layout (little endian):
+
+  header   magic b'GSRP', u16 version, u16 reserved, u32 game count, u64 index offset
+  records  one compressed blob per game
+  index    per game, sorted by ID: u16 ID length, ID bytes, u64 offset, u32 length
+
+Any single game can be decoded without touching the others.
+
+Usage:
+    python scripts/replayCodec.py pack season.json [--out season.replays]
+    python scripts/replayCodec.py list season.replays
+    python scripts/replayCodec.py get season.replays <gameId> [--out replay.json]
+    python scripts/replayCodec.py verify season.json season.replays
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from bisect import bisect_left
+
+
+MAGIC = b'GSRP'
+ARCHIVE_VERSION = 1
+HEADER = struct.Struct('<4sHHIQ')
+INDEX_ENTRY = struct.Struct('<QI')
+
+COORD_SCALE = 1000   # vectors: 1/1000 ft
+SPEED_SCALE = 10     # mph
+HIT_SCALE = 10       # hit location (field coordinates)
+# A stored path may differ from the regenerated one by this much before it is kept explicitly
+PATH_TOLERANCE = 2.0 / COORD_SCALE
+
+PATH_POINTS = 10
+
+# Event flag bits
+KIND_ACTION = 0x01
+IS_TOP = 0x02
+HAS_HIT_LOCATION = 0x04     # pitch
+EXPLICIT_PATH = 0x08        # pitch
+NO_PATH = 0x10              # pitch: the source had no ballPath
+HAS_BATTER = 0x04           # action
+HAS_PITCHER = 0x08          # action
+HAS_RUNS = 0x10             # action
+
+
+# ---------------------------------------------------------------------------
+# Varints
+# ---------------------------------------------------------------------------
+
+def _write_uvarint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_svarint(out, value):
+    _write_uvarint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def byte(self):
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def uvarint(self):
+        result = 0
+        shift = 0
+        while True:
+            b = self.data[self.pos]
+            self.pos += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    def svarint(self):
+        raw = self.uvarint()
+        return (raw >> 1) ^ -(raw & 1)
+
+
+def _q(value, scale):
+    return int(round(value * scale))
+
+
+# ---------------------------------------------------------------------------
+# Pitch paths (mirror of buildPitchPaths in services/pitchTrajectory.ts)
+# ---------------------------------------------------------------------------
+
+def _pitch_break(pitch_type):
+    t = pitch_type.lower()
+    if 'slider' in t:
+        return -0.35, -0.5
+    if 'curve' in t:
+        return -0.30, -0.9
+    if 'cutter' in t:
+        return -0.20, -0.25
+    if 'change' in t:
+        return 0.12, -0.5
+    if 'sinker' in t:
+        return 0.10, -0.4
+    return -0.08, -0.25
+
+
+def pitch_path(pitch_type, release, plate, points=PATH_POINTS):
+    """Regenerate a ballPath from the pitch type and its release/plate points."""
+    break_x, drop = _pitch_break(pitch_type)
+    path = []
+    for i in range(points + 1):
+        t = i / points
+        progress = t * t
+        lateral = break_x * progress * 0.3
+        vertical = drop * progress * 0.15
+        path.append({
+            'x': release['x'] + (plate['x'] - release['x'] - lateral) * t + lateral * progress,
+            'y': release['y'] + (plate['y'] - release['y'] - vertical) * t + vertical * progress,
+            'z': release['z'] + (plate['z'] - release['z']) * t,
+        })
+    return path
+
+
+def _path_matches(path, regenerated):
+    if len(path) != len(regenerated):
+        return False
+    return all(
+        abs(p[axis] - r[axis]) <= PATH_TOLERANCE
+        for p, r in zip(path, regenerated) for axis in ('x', 'y', 'z')
+    )
+
+
+# ---------------------------------------------------------------------------
+# Game codec
+# ---------------------------------------------------------------------------
+
+class _Strings:
+    def __init__(self):
+        self.values = []
+        self.index = {}
+
+    def __call__(self, value):
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+def _write_vector(out, vector):
+    for axis in ('x', 'y', 'z'):
+        _write_svarint(out, _q(vector[axis], COORD_SCALE))
+
+
+def _read_vector(reader):
+    return {axis: reader.svarint() / COORD_SCALE for axis in ('x', 'y', 'z')}
+
+
+def encode_replay(replay):
+    """GameReplayData dict -> compressed bytes."""
+    strings = _Strings()
+    body = bytearray()
+    events = replay.get('events', [])
+    _write_uvarint(body, len(events))
+
+    for event in events:
+        flags = IS_TOP if event.get('isTop') else 0
+        if event['kind'] == 'pitch':
+            release = {axis: _q(event['releasePoint'][axis], COORD_SCALE) / COORD_SCALE for axis in 'xyz'}
+            plate = {axis: _q(event['platePoint'][axis], COORD_SCALE) / COORD_SCALE for axis in 'xyz'}
+            # Replays from the simulator carry no path (it is synthesized on view)
+            path = event.get('ballPath')
+            explicit = path is not None and not _path_matches(path, pitch_path(event['pitchType'], release, plate))
+            hit = event.get('hitLocation')
+            flags |= (HAS_HIT_LOCATION if hit else 0) | (EXPLICIT_PATH if explicit else 0)
+            flags |= NO_PATH if path is None else 0
+            body.append(flags)
+            _write_uvarint(body, event['inning'])
+            for key in ('batterId', 'pitcherId'):
+                _write_uvarint(body, strings(event[key]))
+            _write_uvarint(body, event['pitchNumberInPA'])
+            for key in ('countBefore', 'countAfter', 'result', 'pitchType'):
+                _write_uvarint(body, strings(event[key]))
+            _write_svarint(body, _q(event['speed'], SPEED_SCALE))
+            _write_vector(body, event['releasePoint'])
+            _write_vector(body, event['platePoint'])
+            if explicit:
+                _write_uvarint(body, len(path))
+                previous = (0, 0, 0)
+                for point in path:
+                    current = tuple(_q(point[axis], COORD_SCALE) for axis in 'xyz')
+                    for c, p in zip(current, previous):
+                        _write_svarint(body, c - p)
+                    previous = current
+            runners = event.get('runners', [])
+            _write_uvarint(body, len(runners))
+            for runner in runners:
+                _write_uvarint(body, strings(runner['playerId']))
+                body.append(runner['base'])
+            if hit:
+                _write_svarint(body, _q(hit['x'], HIT_SCALE))
+                _write_svarint(body, _q(hit['y'], HIT_SCALE))
+                _write_uvarint(body, strings(hit['type']))
+        elif event['kind'] == 'action':
+            flags |= KIND_ACTION
+            flags |= HAS_BATTER if 'batterId' in event else 0
+            flags |= HAS_PITCHER if 'pitcherId' in event else 0
+            flags |= HAS_RUNS if 'runsScored' in event else 0
+            body.append(flags)
+            _write_uvarint(body, event['inning'])
+            _write_uvarint(body, strings(event['type']))
+            _write_uvarint(body, strings(event['description']))
+            if 'batterId' in event:
+                _write_uvarint(body, strings(event['batterId']))
+            if 'pitcherId' in event:
+                _write_uvarint(body, strings(event['pitcherId']))
+            if 'runsScored' in event:
+                _write_uvarint(body, event['runsScored'])
+        else:
+            raise ValueError(f"Unknown replay event kind: {event['kind']!r}")
+
+    head = bytearray()
+    _write_uvarint(head, int(replay.get('seed', 0)))
+    schema = replay.get('schemaVersion', 'v1').encode('utf-8')
+    _write_uvarint(head, len(schema))
+    head += schema
+    _write_uvarint(head, len(strings.values))
+    for value in strings.values:
+        raw = value.encode('utf-8')
+        _write_uvarint(head, len(raw))
+        head += raw
+    return zlib.compress(bytes(head + body), 9)
+
+
+def decode_replay(blob):
+    """Compressed bytes -> GameReplayData dict (same key order as simulateGame)."""
+    reader = _Reader(zlib.decompress(blob))
+    seed = reader.uvarint()
+    schema_len = reader.uvarint()
+    schema = reader.data[reader.pos:reader.pos + schema_len].decode('utf-8')
+    reader.pos += schema_len
+    strings = []
+    for _ in range(reader.uvarint()):
+        length = reader.uvarint()
+        strings.append(reader.data[reader.pos:reader.pos + length].decode('utf-8'))
+        reader.pos += length
+
+    events = []
+    for _ in range(reader.uvarint()):
+        flags = reader.byte()
+        is_top = bool(flags & IS_TOP)
+        if flags & KIND_ACTION:
+            event = {
+                'kind': 'action',
+                'inning': reader.uvarint(),
+                'isTop': is_top,
+                'type': strings[reader.uvarint()],
+                'description': strings[reader.uvarint()],
+            }
+            if flags & HAS_BATTER:
+                event['batterId'] = strings[reader.uvarint()]
+            if flags & HAS_PITCHER:
+                event['pitcherId'] = strings[reader.uvarint()]
+            if flags & HAS_RUNS:
+                event['runsScored'] = reader.uvarint()
+            events.append(event)
+            continue
+
+        event = {'kind': 'pitch', 'inning': reader.uvarint(), 'isTop': is_top}
+        event['batterId'] = strings[reader.uvarint()]
+        event['pitcherId'] = strings[reader.uvarint()]
+        event['pitchNumberInPA'] = reader.uvarint()
+        for key in ('countBefore', 'countAfter', 'result', 'pitchType'):
+            event[key] = strings[reader.uvarint()]
+        event['speed'] = reader.svarint() / SPEED_SCALE
+        event['releasePoint'] = _read_vector(reader)
+        event['platePoint'] = _read_vector(reader)
+        if flags & EXPLICIT_PATH:
+            path = []
+            current = [0, 0, 0]
+            for _ in range(reader.uvarint()):
+                current = [c + reader.svarint() for c in current]
+                path.append({axis: v / COORD_SCALE for axis, v in zip('xyz', current)})
+            event['ballPath'] = path
+        elif not flags & NO_PATH:
+            event['ballPath'] = pitch_path(event['pitchType'], event['releasePoint'], event['platePoint'])
+        event['runners'] = [
+            {'playerId': strings[reader.uvarint()], 'base': reader.byte()}
+            for _ in range(reader.uvarint())
+        ]
+        if flags & HAS_HIT_LOCATION:
+            event['hitLocation'] = {
+                'x': reader.svarint() / HIT_SCALE,
+                'y': reader.svarint() / HIT_SCALE,
+                'type': strings[reader.uvarint()],
+            }
+        events.append(event)
+
+    return {'schemaVersion': schema, 'seed': seed, 'events': events}
+
+
+# ---------------------------------------------------------------------------
+# Archive
+# ---------------------------------------------------------------------------
+
+def write_archive(games, path):
+    """Write {gameId: GameReplayData} to a seekable archive. Returns bytes written."""
+    entries = []
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, ARCHIVE_VERSION, 0, 0, 0))
+        for game_id in sorted(games):
+            blob = encode_replay(games[game_id])
+            entries.append((game_id, f.tell(), len(blob)))
+            f.write(blob)
+        index_offset = f.tell()
+        for game_id, offset, length in entries:
+            raw = game_id.encode('utf-8')
+            f.write(struct.pack('<H', len(raw)) + raw + INDEX_ENTRY.pack(offset, length))
+        size = f.tell()
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, ARCHIVE_VERSION, 0, len(entries), index_offset))
+    return size
+
+
+class ReplayArchive:
+    """Random-access reader: only the index is loaded; games are decoded on demand."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        magic, version, _, count, index_offset = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay archive")
+        if version != ARCHIVE_VERSION:
+            raise ValueError(f"{path} has archive version {version}, expected {ARCHIVE_VERSION}")
+        self._file.seek(index_offset)
+        index = self._file.read()
+        self._ids = []
+        self._spans = []
+        pos = 0
+        for _ in range(count):
+            (length,) = struct.unpack_from('<H', index, pos)
+            pos += 2
+            self._ids.append(index[pos:pos + length].decode('utf-8'))
+            pos += length
+            self._spans.append(INDEX_ENTRY.unpack_from(index, pos))
+            pos += INDEX_ENTRY.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, game_id):
+        pos = bisect_left(self._ids, game_id)
+        return pos < len(self._ids) and self._ids[pos] == game_id
+
+    def ids(self):
+        return list(self._ids)
+
+    def raw(self, game_id):
+        pos = bisect_left(self._ids, game_id)
+        if pos == len(self._ids) or self._ids[pos] != game_id:
+            raise KeyError(game_id)
+        offset, length = self._spans[pos]
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def get(self, game_id):
+        """Decode one game's replay."""
+        return decode_replay(self.raw(game_id))
+
+
+def load_season_replays(season_path):
+    """{gameId: replay} for every game in a saved season that has one."""
+    with open(season_path, 'r') as f:
+        season = json.load(f)
+    schedule = season['schedule'] if isinstance(season, dict) else season
+    return {g['id']: g['replay'] for g in schedule if g.get('replay')}
+
+
+def _same(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+        return abs(a - b) <= PATH_TOLERANCE + 0.5 / min(SPEED_SCALE, HIT_SCALE, COORD_SCALE)
+    return a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compact replay archive')
+    sub = parser.add_subparsers(dest='command', required=True)
+    pack_parser = sub.add_parser('pack', help='Pack every replay in a saved season into an archive')
+    pack_parser.add_argument('season')
+    pack_parser.add_argument('--out', help='Archive path (default: <season>.replays)')
+    list_parser = sub.add_parser('list', help='List the games in an archive')
+    list_parser.add_argument('archive')
+    get_parser = sub.add_parser('get', help='Decode one game')
+    get_parser.add_argument('archive')
+    get_parser.add_argument('game_id')
+    get_parser.add_argument('--out', help='Output path (default: stdout)')
+    verify_parser = sub.add_parser('verify', help='Check every game round-trips within quantization')
+    verify_parser.add_argument('season')
+    verify_parser.add_argument('archive')
+    args = parser.parse_args()
+
+    if args.command == 'pack':
+        out = args.out or os.path.splitext(args.season)[0] + '.replays'
+        print("=" * 60)
+        print("Packing game replays")
+        print("=" * 60)
+        replays = load_season_replays(args.season)
+        json_bytes = sum(len(json.dumps(r, separators=(',', ':'))) for r in replays.values())
+        start = time.perf_counter()
+        size = write_archive(replays, out)
+        elapsed = time.perf_counter() - start
+        print(f"  {len(replays)} games in {elapsed:.1f}s")
+        if replays:
+            print(f"  {json_bytes / 1024:.0f} KB of replay JSON -> {size / 1024:.0f} KB archive "
+                  f"({100 * size / json_bytes:.1f}%)")
+        print(f"\nSaved to: {os.path.abspath(out)}")
+    elif args.command == 'list':
+        with ReplayArchive(args.archive) as archive:
+            for game_id in archive.ids():
+                print(f"  {game_id}  {len(archive.raw(game_id)):>8} bytes")
+            print(f"{len(archive)} games")
+    elif args.command == 'get':
+        with ReplayArchive(args.archive) as archive:
+            start = time.perf_counter()
+            try:
+                replay = archive.get(args.game_id)
+            except KeyError:
+                print(f"Error: {args.game_id} is not in {args.archive}")
+                sys.exit(1)
+            elapsed = (time.perf_counter() - start) * 1000
+        if args.out:
+            with open(args.out, 'w') as f:
+                json.dump(replay, f)
+            print(f"Decoded {len(replay['events'])} events in {elapsed:.1f} ms")
+            print(f"Saved to: {os.path.abspath(args.out)}")
+        else:
+            json.dump(replay, sys.stdout)
+    elif args.command == 'verify':
+        replays = load_season_replays(args.season)
+        bad = 0
+        with ReplayArchive(args.archive) as archive:
+            for game_id, replay in replays.items():
+                if game_id not in archive or not _same(archive.get(game_id), replay):
+                    bad += 1
+                    print(f"  {game_id}: DIFFERS")
+        print(f"{len(replays) - bad}/{len(replays)} games match")
+        if bad:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+Append-only columnar store for simulated game results.
+
+A saved season keeps every result inside the schedule array, with box scores
+and play logs nested per game, so answering "how do the Dodgers hit at home?"
+means loading the whole document. This store splits results into typed tables
+with one file per column:
+
+  games   one row per game: ID, date, teams, score, hits/errors, and the first
+          row of the game in each child table (the per-game index)
+  lines   line score, one row per inning
+  box     box-score rows (lineups and pitchers) with every StatsCounters field
+  events  play-by-play, one row per log entry
+
+Numeric columns are raw `array` files; short strings (IDs, names, positions)
+are dictionary-encoded through strings.jsonl; play descriptions are a text
+column (offsets + UTF-8 blob). store.json records the committed row counts, so
+an interrupted append is simply ignored and truncated on the next write.
+
+Appends stream in game by game (from a saved season, or JSON lines on stdin
+while a season is simulated). Queries read only the columns they need.
+
+Usage:
+    python scripts/resultsStore.py ingest season.json [--store DIR]
+    some-producer | python scripts/resultsStore.py append [--store DIR] [--batch 50]
+    python scripts/resultsStore.py info [--store DIR]
+    python scripts/resultsStore.py splits LAD [--store DIR]
+    python scripts/resultsStore.py player lad_bench_2 [--limit 20] [--store DIR]
+    python scripts/resultsStore.py game <gameId> [--store DIR]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+SERVICES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'services'))
+DEFAULT_STORE = os.path.join(SERVICES_DIR, 'results.store')
+STORE_VERSION = 1
+
+# Column kinds: array typecodes, 'str' (dictionary id) and 'text' (offsets + blob)
+STRING = 'str'
+TEXT = 'text'
+
+BOX_ROLES = ['awayLineup', 'homeLineup', 'awayPitchers', 'homePitchers']
+FLOAT_STATS = {'totalExitVelo'}
+
+BASE_SCHEMA = {
+    'games': [
+        ('gameId', STRING), ('date', 'i'), ('home', STRING), ('away', STRING),
+        ('homeScore', 'h'), ('awayScore', 'h'), ('innings', 'B'), ('winner', STRING),
+        ('postseason', 'B'), ('stadium', STRING),
+        ('homeHits', 'h'), ('awayHits', 'h'), ('homeErrors', 'h'), ('awayErrors', 'h'),
+        ('lineStart', 'I'), ('boxStart', 'I'), ('eventStart', 'I'),
+    ],
+    # Runs per half-inning; -1 marks a bottom half that wasn't played
+    'lines': [('game', 'I'), ('inning', 'B'), ('away', 'b'), ('home', 'b')],
+    # StatsCounters columns are added as they are first seen
+    'box': [('game', 'I'), ('role', 'B'), ('team', STRING), ('player', STRING), ('name', STRING), ('pos', STRING)],
+    'events': [('game', 'I'), ('inning', 'B'), ('isTop', 'B'), ('type', STRING), ('pitches', 'H'), ('description', TEXT)],
+}
+
+# Child table -> games column holding the game's first row
+CHILD_START = {'lines': 'lineStart', 'box': 'boxStart', 'events': 'eventStart'}
+
+
+def _date_key(iso):
+    """'2026-03-25T12:00:00.000Z' -> 20260325."""
+    return int(iso[:10].replace('-', '')) if iso else 0
+
+
+def _date_str(key):
+    text = str(key)
+    return f"{text[:4]}-{text[4:6]}-{text[6:]}"
+
+
+class ResultsStore:
+    """Columnar results store rooted at a directory."""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = path
+        self._manifest_path = os.path.join(path, 'store.json')
+        if os.path.exists(self._manifest_path):
+            with open(self._manifest_path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != STORE_VERSION:
+                raise ValueError(f"{path} has store version {manifest.get('version')}, expected {STORE_VERSION}")
+            self.schema = {table: [tuple(c) for c in cols] for table, cols in manifest['schema'].items()}
+            self.rows = manifest['rows']
+            self._string_count = manifest['strings']
+            self._text_bytes = manifest.get('textBytes', {})
+        else:
+            self.schema = {table: list(cols) for table, cols in BASE_SCHEMA.items()}
+            self.rows = {table: 0 for table in BASE_SCHEMA}
+            self._string_count = 0
+            self._text_bytes = {}
+        self._strings = None
+        self._string_ids = None
+        self._columns = {}
+        self._pending = {table: [] for table in self.schema}
+        self._pending_strings = []
+        self._game_index = None
+        self._team_index = None
+        self._date_order = None
+
+    # -- storage -------------------------------------------------------------
+
+    def _file(self, table, column, suffix='bin'):
+        return os.path.join(self.path, table, f"{column}.{suffix}")
+
+    def _load_strings(self):
+        if self._strings is None:
+            self._strings = []
+            path = os.path.join(self.path, 'strings.jsonl')
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    for line in f:
+                        if len(self._strings) == self._string_count:
+                            break
+                        self._strings.append(json.loads(line))
+            self._string_ids = {s: i for i, s in enumerate(self._strings)}
+        return self._strings
+
+    def _intern(self, value):
+        self._load_strings()
+        value = '' if value is None else str(value)
+        idx = self._string_ids.get(value)
+        if idx is None:
+            idx = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+            self._pending_strings.append(value)
+        return idx
+
+    def column(self, table, name):
+        """Committed values of one column (strings decoded). Only this column is read."""
+        key = (table, name)
+        if key in self._columns:
+            return self._columns[key]
+        kind = dict(self.schema[table])[name]
+        count = self.rows[table]
+        if kind == TEXT:
+            values = []
+            if count:
+                offsets = array('Q')
+                with open(self._file(table, name, 'off'), 'rb') as f:
+                    offsets.fromfile(f, count)
+                with open(self._file(table, name, 'txt'), 'rb') as f:
+                    blob = f.read(offsets[-1])
+                values = [blob[(offsets[i - 1] if i else 0):offsets[i]].decode('utf-8') for i in range(count)]
+        else:
+            raw = array('I' if kind == STRING else kind)
+            path = self._file(table, name)
+            if count and os.path.exists(path):
+                with open(path, 'rb') as f:
+                    raw.fromfile(f, count)
+            if kind == STRING:
+                strings = self._load_strings()
+                values = [strings[i] for i in raw]
+            else:
+                values = raw
+        self._columns[key] = values
+        return values
+
+    def _raw_ids(self, table, name):
+        """Dictionary ids of a string column, without decoding."""
+        raw = array('I')
+        path = self._file(table, name)
+        if self.rows[table] and os.path.exists(path):
+            with open(path, 'rb') as f:
+                raw.fromfile(f, self.rows[table])
+        return raw
+
+    # -- appends -------------------------------------------------------------
+
+    def _ensure_column(self, table, name, kind):
+        if name in dict(self.schema[table]):
+            return
+        self.schema[table].append((name, kind))
+        # New column: backfill committed rows with zeros (buffered rows default to 0 on flush)
+        backfill = self.rows[table]
+        os.makedirs(os.path.join(self.path, table), exist_ok=True)
+        with open(self._file(table, name), 'wb') as f:
+            array(kind, [0] * backfill).tofile(f)
+
+    def has_game(self, game_id):
+        return game_id in self._games_by_id()
+
+    def append_game(self, game):
+        """Buffer one played GameResult. Returns False if it is unplayed or already stored."""
+        if not game.get('played') or self.has_game(game['id']):
+            return False
+        game_row = self.rows['games'] + len(self._pending['games'])
+        starts = {t: self.rows[t] + len(self._pending[t]) for t in CHILD_START}
+
+        box = game.get('boxScore') or {}
+        line_score = box.get('lineScore') or {}
+        innings = line_score.get('innings') or []
+        if not innings and game.get('lineScore'):
+            innings = [{'inning': i + 1, 'away': a, 'home': h}
+                       for i, (a, h) in enumerate(zip(game['lineScore']['away'], game['lineScore']['home']))]
+        for inning in innings:
+            self._pending['lines'].append({'game': game_row, 'inning': inning['inning'],
+                                           'away': inning.get('away', 0), 'home': inning.get('home', 0)})
+
+        for role, key in enumerate(BOX_ROLES):
+            team = game['homeTeamId'] if key.startswith('home') else game['awayTeamId']
+            for player in box.get(key, []):
+                row = {'game': game_row, 'role': role, 'team': team, 'player': player['id'],
+                       'name': player.get('name', ''), 'pos': player.get('pos', '')}
+                for stat, value in (player.get('stats') or {}).items():
+                    if not isinstance(value, (int, float)):
+                        continue
+                    self._ensure_column('box', stat, 'd' if stat in FLOAT_STATS else 'i')
+                    row[stat] = value
+                self._pending['box'].append(row)
+
+        for event in game.get('log', []):
+            self._pending['events'].append({
+                'game': game_row, 'inning': event.get('inning', 0), 'isTop': 1 if event.get('isTop') else 0,
+                'type': event.get('type', ''), 'pitches': len(event.get('pitches') or []),
+                'description': event.get('description', ''),
+            })
+
+        self._pending['games'].append({
+            'gameId': game['id'], 'date': _date_key(game.get('date')),
+            'home': game['homeTeamId'], 'away': game['awayTeamId'],
+            'homeScore': game.get('homeScore', 0), 'awayScore': game.get('awayScore', 0),
+            'innings': game.get('innings', len(innings)), 'winner': game.get('winnerId', ''),
+            'postseason': 1 if game.get('isPostseason') else 0, 'stadium': game.get('stadium', ''),
+            'homeHits': line_score.get('homeHits', 0), 'awayHits': line_score.get('awayHits', 0),
+            'homeErrors': line_score.get('homeErrors', 0), 'awayErrors': line_score.get('awayErrors', 0),
+            'lineStart': starts['lines'], 'boxStart': starts['box'], 'eventStart': starts['events'],
+        })
+        self._games_by_id()[game['id']] = game_row
+        return True
+
+    def flush(self):
+        """Write buffered rows to the column files and commit them in store.json."""
+        if not any(self._pending.values()):
+            return 0
+        os.makedirs(self.path, exist_ok=True)
+        appended = len(self._pending['games'])
+
+        # Encode strings first so new dictionary entries are known
+        encoded = {}
+        for table, rows in self._pending.items():
+            for name, kind in self.schema[table]:
+                if kind == STRING:
+                    encoded[(table, name)] = [self._intern(r.get(name, '')) for r in rows]
+        if self._pending_strings:
+            with open(os.path.join(self.path, 'strings.jsonl'), 'a') as f:
+                self._truncate_strings(f)
+                for value in self._pending_strings:
+                    f.write(json.dumps(value) + '\n')
+
+        for table, rows in self._pending.items():
+            if not rows:
+                continue
+            os.makedirs(os.path.join(self.path, table), exist_ok=True)
+            for name, kind in self.schema[table]:
+                if kind == TEXT:
+                    blob_path = self._file(table, name, 'txt')
+                    committed = self._text_bytes.get(f"{table}.{name}", 0)
+                    offsets = array('Q')
+                    end = committed
+                    with open(blob_path, 'ab') as f:
+                        f.truncate(committed)
+                        for r in rows:
+                            raw = str(r.get(name, '')).encode('utf-8')
+                            f.write(raw)
+                            end += len(raw)
+                            offsets.append(end)
+                    self._text_bytes[f"{table}.{name}"] = end
+                    self._append_array(self._file(table, name, 'off'), offsets, self.rows[table])
+                elif kind == STRING:
+                    self._append_array(self._file(table, name), array('I', encoded[(table, name)]), self.rows[table])
+                else:
+                    values = [r.get(name, 0) for r in rows]
+                    if kind != 'd':
+                        values = [int(round(v)) for v in values]
+                    self._append_array(self._file(table, name), array(kind, values), self.rows[table])
+            self.rows[table] += len(rows)
+
+        self._string_count = len(self._strings)
+        self._pending = {table: [] for table in self.schema}
+        self._pending_strings = []
+        self._columns.clear()
+        self._team_index = None
+        self._date_order = None
+
+        manifest = {
+            'version': STORE_VERSION,
+            'updated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'schema': self.schema,
+            'rows': self.rows,
+            'strings': self._string_count,
+            'textBytes': self._text_bytes,
+        }
+        tmp = self._manifest_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, self._manifest_path)
+        return appended
+
+    @staticmethod
+    def _append_array(path, values, committed_rows):
+        with open(path, 'ab') as f:
+            # Drop anything past the last commit (an interrupted append)
+            f.truncate(committed_rows * values.itemsize)
+            values.tofile(f)
+
+    def _truncate_strings(self, f):
+        """Trim strings.jsonl to its committed entries."""
+        with open(f.name, 'rb') as r:
+            keep = 0
+            for _ in range(self._string_count):
+                line = r.readline()
+                if not line:
+                    break
+                keep += len(line)
+        f.truncate(keep)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.flush()
+
+    # -- indexes -------------------------------------------------------------
+
+    def _games_by_id(self):
+        if self._game_index is None:
+            self._game_index = {gid: row for row, gid in enumerate(self.column('games', 'gameId'))}
+        return self._game_index
+
+    def _games_by_team(self):
+        if self._team_index is None:
+            self._team_index = {}
+            for row, (home, away) in enumerate(zip(self.column('games', 'home'), self.column('games', 'away'))):
+                self._team_index.setdefault(home, []).append(row)
+                self._team_index.setdefault(away, []).append(row)
+        return self._team_index
+
+    def game_rows(self, team=None, start=None, end=None):
+        """Game row numbers, optionally for one team and an inclusive date range ('YYYY-MM-DD')."""
+        if self._date_order is None:
+            dates = self.column('games', 'date')
+            self._date_order = sorted(range(len(dates)), key=lambda r: dates[r])
+            self._sorted_dates = [dates[r] for r in self._date_order]
+        lo = bisect_left(self._sorted_dates, _date_key(start)) if start else 0
+        hi = bisect_right(self._sorted_dates, _date_key(end)) if end else len(self._sorted_dates)
+        rows = self._date_order[lo:hi]
+        if team is not None:
+            team_rows = set(self._games_by_team().get(team, ()))
+            rows = [r for r in rows if r in team_rows]
+        return rows
+
+    def child_range(self, table, game_row):
+        """[start, end) rows of a child table belonging to one game."""
+        starts = self.column('games', CHILD_START[table])
+        end = starts[game_row + 1] if game_row + 1 < len(starts) else self.rows[table]
+        return starts[game_row], end
+
+    # -- queries -------------------------------------------------------------
+
+    def team_splits(self, team, start=None, end=None):
+        """W-L and runs for/against: overall, home, away, by month, one-run and extra-inning games."""
+        home_col = self.column('games', 'home')
+        home_score = self.column('games', 'homeScore')
+        away_score = self.column('games', 'awayScore')
+        innings = self.column('games', 'innings')
+        dates = self.column('games', 'date')
+        splits = {}
+
+        def add(name, won, rs, ra):
+            s = splits.setdefault(name, {'w': 0, 'l': 0, 'rs': 0, 'ra': 0})
+            s['w' if won else 'l'] += 1
+            s['rs'] += rs
+            s['ra'] += ra
+
+        for row in self.game_rows(team, start, end):
+            at_home = home_col[row] == team
+            rs, ra = (home_score[row], away_score[row]) if at_home else (away_score[row], home_score[row])
+            won = rs > ra
+            add('overall', won, rs, ra)
+            add('home' if at_home else 'away', won, rs, ra)
+            add(f"month {_date_str(dates[row])[:7]}", won, rs, ra)
+            if abs(rs - ra) == 1:
+                add('one-run', won, rs, ra)
+            if innings[row] > 9:
+                add('extra innings', won, rs, ra)
+        return splits
+
+    def player_log(self, player_id, stats=('ab', 'h', 'hr', 'rbi', 'bb', 'so', 'outsPitched', 'er', 'p_so')):
+        """One row per game the player appeared in, oldest first."""
+        self._load_strings()
+        target = self._string_ids.get(player_id)
+        if target is None:
+            return []
+        rows = [i for i, pid in enumerate(self._raw_ids('box', 'player')) if pid == target]
+        game_col = self.column('box', 'game')
+        team_col = self.column('box', 'team')
+        dates = self.column('games', 'date')
+        home = self.column('games', 'home')
+        away = self.column('games', 'away')
+        available = [s for s in stats if s in dict(self.schema['box'])]
+        stat_cols = {s: self.column('box', s) for s in available}
+        log = []
+        for i in rows:
+            g = game_col[i]
+            opponent = away[g] if team_col[i] == home[g] else home[g]
+            entry = {'date': _date_str(dates[g]), 'gameId': self.column('games', 'gameId')[g],
+                     'team': team_col[i], 'opponent': opponent}
+            entry.update({s: stat_cols[s][i] for s in available})
+            log.append(entry)
+        log.sort(key=lambda e: e['date'])
+        return log
+
+    def game(self, game_id):
+        """Reassemble one game's score, line score, box score rows and log."""
+        row = self._games_by_id().get(game_id)
+        if row is None:
+            return None
+        result = {name: self.column('games', name)[row] for name, _ in self.schema['games']
+                  if name not in CHILD_START.values()}
+        result['date'] = _date_str(result['date'])
+        lo, hi = self.child_range('lines', row)
+        result['lineScore'] = [{'inning': self.column('lines', 'inning')[i], 'away': self.column('lines', 'away')[i],
+                                'home': self.column('lines', 'home')[i]} for i in range(lo, hi)]
+        lo, hi = self.child_range('box', row)
+        names = [name for name, _ in self.schema['box'] if name != 'game']
+        result['box'] = [{name: self.column('box', name)[i] for name in names} for i in range(lo, hi)]
+        for entry in result['box']:
+            entry['role'] = BOX_ROLES[entry['role']]
+        lo, hi = self.child_range('events', row)
+        result['log'] = [{'inning': self.column('events', 'inning')[i], 'isTop': bool(self.column('events', 'isTop')[i]),
+                          'type': self.column('events', 'type')[i],
+                          'description': self.column('events', 'description')[i]} for i in range(lo, hi)]
+        return result
+
+
+def ingest_season(season_path, store, batch=100):
+    """Append every played game from a saved season that the store doesn't have yet."""
+    with open(season_path, 'r') as f:
+        season = json.load(f)
+    schedule = season['schedule'] if isinstance(season, dict) else season
+    added = 0
+    for game in sorted(schedule, key=lambda g: g.get('date', '')):
+        if store.append_game(game):
+            added += 1
+            if added % batch == 0:
+                store.flush()
+    store.flush()
+    return added
+
+
+def _print_table(rows):
+    if not rows:
+        return
+    keys = list(rows[0].keys())
+    widths = {k: max(len(k), *(len(str(r[k])) for r in rows)) for k in keys}
+    print('  ' + '  '.join(k.rjust(widths[k]) for k in keys))
+    for r in rows:
+        print('  ' + '  '.join(str(r[k]).rjust(widths[k]) for k in keys))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar store for simulated game results')
+    parser.add_argument('--store', default=DEFAULT_STORE, help='Store directory')
+    # --store is also accepted after the command (the subparser only sets it when given)
+    store_option = argparse.ArgumentParser(add_help=False)
+    store_option.add_argument('--store', default=argparse.SUPPRESS, help='Store directory')
+    sub = parser.add_subparsers(dest='command', required=True)
+    ingest_parser = sub.add_parser('ingest', parents=[store_option], help='Append the played games from a saved season')
+    ingest_parser.add_argument('season')
+    append_parser = sub.add_parser('append', parents=[store_option], help='Append GameResult JSON lines from stdin as they arrive')
+    append_parser.add_argument('--batch', type=int, default=50, help='Commit every N games')
+    sub.add_parser('info', parents=[store_option], help='Table sizes')
+    splits_parser = sub.add_parser('splits', parents=[store_option], help='Team splits')
+    splits_parser.add_argument('team')
+    splits_parser.add_argument('--start')
+    splits_parser.add_argument('--end')
+    player_parser = sub.add_parser('player', parents=[store_option], help='Player game log')
+    player_parser.add_argument('player_id')
+    player_parser.add_argument('--limit', type=int, default=0)
+    game_parser = sub.add_parser('game', parents=[store_option], help='Reassemble one game')
+    game_parser.add_argument('game_id')
+    args = parser.parse_args()
+
+    store = ResultsStore(args.store)
+    start = time.perf_counter()
+
+    if args.command == 'ingest':
+        added = ingest_season(args.season, store)
+        print(f"Appended {added} games in {time.perf_counter() - start:.1f}s ({store.rows['games']} stored)")
+        print(f"Store: {os.path.abspath(args.store)}")
+    elif args.command == 'append':
+        added = 0
+        for line in sys.stdin:
+            line = line.strip()
+            if line and store.append_game(json.loads(line)):
+                added += 1
+                if added % args.batch == 0:
+                    store.flush()
+                    print(f"  {store.rows['games']} games committed", flush=True)
+        store.flush()
+        print(f"Appended {added} games ({store.rows['games']} stored)")
+    elif args.command == 'info':
+        for table, count in store.rows.items():
+            size = sum(os.path.getsize(os.path.join(store.path, table, f))
+                       for f in os.listdir(os.path.join(store.path, table))) if count else 0
+            print(f"  {table:<7} {count:>9} rows  {len(store.schema[table]):>3} columns  {size / 1024:>9.0f} KB")
+    elif args.command == 'splits':
+        splits = store.team_splits(args.team, args.start, args.end)
+        _print_table([{'split': name, **s, 'pct': f"{s['w'] / max(1, s['w'] + s['l']):.3f}"} for name, s in splits.items()])
+    elif args.command == 'player':
+        log = store.player_log(args.player_id)
+        _print_table(log[-args.limit:] if args.limit else log)
+    elif args.command == 'game':
+        game = store.game(args.game_id)
+        if game is None:
+            print(f"Error: {args.game_id} is not in the store")
+            sys.exit(1)
+        json.dump(game, sys.stdout, indent=2)
+        print()
+
+    if args.command in ('splits', 'player'):
+        print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+// Scores one-for-one roster moves for every team: each player on another roster as a
+// replacement for the team's lowest-ranked player at the same position
+// Uses the fixed benchmark league (or a saved season file) and the 2026 schedule
+// Run: npm run whatif:roster -- [--league grand_slam_data.json] [--seed N] [--sims 400] [--team NYY]
+
+import { readFileSync } from 'node:fs';
+import { resolve } from 'node:path';
+import { GameResult, Team } from '../types';
+import { buildBenchmarkLeague } from '../services/benchmark';
+import { parseScheduleCSV } from '../services/scheduleData';
+import { createRosterWhatIf, evaluateRosterMoves, MoveEvaluation, RosterMove } from '../services/rosterWhatIf';
+
+function parseArgs(argv: string[]) {
+  let seed = 20260325;
+  let simulations = 400;
+  let leaguePath = '';
+  let team = '';
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--seed') seed = Number(argv[++i]);
+    else if (arg === '--sims') simulations = Number(argv[++i]);
+    else if (arg === '--league') leaguePath = argv[++i];
+    else if (arg === '--team') team = argv[++i].toUpperCase();
+  }
+  return { seed, simulations, leaguePath, team };
+}
+
+function loadLeague(path: string): { teams: Team[]; schedule?: GameResult[] } | undefined {
+  if (!path) return undefined;
+  // Accepts the season file written by "Save Data" in the app (SeasonState JSON)
+  const data = JSON.parse(readFileSync(resolve(path), 'utf8'));
+  return Array.isArray(data) ? { teams: data } : { teams: data.teams, schedule: data.schedule };
+}
+
+const fmt = (value: number, digits = 1) => value.toLocaleString('en-US', { maximumFractionDigits: digits, minimumFractionDigits: digits });
+
+function main() {
+  const { seed, simulations, leaguePath, team } = parseArgs(process.argv.slice(2));
+  const loaded = loadLeague(leaguePath);
+  const teams: Team[] = loaded && loaded.teams.length > 0 ? loaded.teams : buildBenchmarkLeague(seed);
+  const schedule = loaded?.schedule && loaded.schedule.length > 0 ? loaded.schedule : parseScheduleCSV();
+  const byId = new Map(teams.map(t => [t.id, t]));
+
+  console.log('='.repeat(60));
+  console.log(`Roster what-if (${loaded ? leaguePath : 'synthetic league'}, ${teams.length} teams, ${simulations} seasons)`);
+  console.log('='.repeat(60));
+
+  let start = performance.now();
+  const engine = createRosterWhatIf(teams, schedule, { simulations, seed });
+  const setupMs = performance.now() - start;
+
+  const targets = team ? teams.filter(t => t.abbreviation === team) : teams;
+  const moves: RosterMove[] = [];
+  targets.forEach(t => {
+    teams.forEach(other => {
+      if (other === t) return;
+      other.roster.forEach(p => {
+        const out = t.roster.filter(q => q.position === p.position).sort((a, b) => a.rating - b.rating)[0];
+        if (out) moves.push({ teamId: t.id, add: p, removeId: out.id });
+      });
+    });
+  });
+
+  start = performance.now();
+  const evaluations = evaluateRosterMoves(engine, moves);
+  const firstMs = performance.now() - start;
+  start = performance.now();
+  evaluateRosterMoves(engine, moves);
+  const repeatMs = performance.now() - start;
+
+  const describe = (e: MoveEvaluation) => {
+    const t = byId.get(e.move.teamId)!;
+    const out = t.roster.find(p => p.id === e.move.removeId);
+    return `${t.abbreviation.padEnd(5)}${`${e.move.add!.name} for ${out?.name ?? '-'}`.padEnd(34)}` +
+      `${fmt(e.overallDelta, 2).padStart(7)}${fmt(e.winsDelta).padStart(8)}${fmt(e.playoffPct).padStart(9)}${fmt(e.playoffDelta).padStart(8)}`;
+  };
+  console.log(`\n${'Team'.padEnd(5)}${'Move'.padEnd(34)}${'ovr'.padStart(7)}${'wins'.padStart(8)}${'playoff%'.padStart(9)}${'delta'.padStart(8)}`);
+  [...evaluations].sort((a, b) => b.playoffDelta - a.playoffDelta || b.winsDelta - a.winsDelta).slice(0, 15).forEach(e => console.log(describe(e)));
+
+  console.log(`\nEnsemble: ${fmt(setupMs, 0)}ms`);
+  console.log(`${moves.length.toLocaleString('en-US')} moves: ${fmt(firstMs, 0)}ms with response curves, ${fmt(repeatMs, 0)}ms repeated` +
+    ` (${Math.round(moves.length / (repeatMs / 1000)).toLocaleString('en-US')} moves/s)`);
+}
+
+main();
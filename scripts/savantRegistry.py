@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Build the normalized Savant player registry from the three ingest artifacts.
+
+batterSavant.json, pitcherSavant.json and pitchArsenals.json each repeat the
+player's name and mlbId, and store `currentStats`/`currentArsenal` as a full
+copy of the latest history year. The registry stores every player once and
+every stat line once:
+
+  players   one row per player: [mlbId, name, roles, yearsActive]
+  tables    batting / pitching / arsenal, each with a field list and per-year
+            rows of [playerIndex, value, value, ...]
+  current   per table, [playerIndex, year, rowIndex] pointers to the latest row
+            instead of copies
+
+The app reads services/savantRegistry.json through services/savantRegistry.ts.
+The original per-source layouts can be regenerated on demand as compatibility
+views.
+
+Usage:
+    python scripts/savantRegistry.py build
+    python scripts/savantRegistry.py view batters [--out path.json]
+    python scripts/savantRegistry.py verify
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+
+SERVICES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'services'))
+REGISTRY_PATH = os.path.join(SERVICES_DIR, 'savantRegistry.json')
+
+# table name -> (artifact file, players key, current key, history key, count key, role)
+SOURCES = {
+    'batting': ('batterSavant.json', 'batters', 'currentStats', 'statsHistory', 'batterCount', 'batter'),
+    'pitching': ('pitcherSavant.json', 'pitchers', 'currentStats', 'statsHistory', 'pitcherCount', 'pitcher'),
+    'arsenal': ('pitchArsenals.json', 'pitchers', 'currentArsenal', 'arsenalHistory', 'pitcherCount', 'pitcher'),
+}
+
+# Compatibility view name -> table
+VIEWS = {
+    'batters': 'batting',
+    'pitchers': 'pitching',
+    'arsenals': 'arsenal',
+}
+
+ARSENAL_FIELDS = ['type', 'speed', 'usage']
+
+
+def load_artifact(table):
+    path = os.path.join(SERVICES_DIR, SOURCES[table][0])
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"  {SOURCES[table][0]} not found, skipping {table}")
+        return None
+
+
+def _stat_fields(players, history_key):
+    """Field order from the first stat line (every line in an artifact shares one schema)."""
+    for entry in players.values():
+        for line in entry.get(history_key, {}).values():
+            return list(line.keys())
+    return []
+
+
+def build_registry(artifacts):
+    """Normalize {table: artifact dict} into the registry layout."""
+    # Player registry: one row per mlbId across all sources
+    people = {}
+    for table, data in artifacts.items():
+        if data is None:
+            continue
+        _, players_key, _, history_key, _, role = SOURCES[table]
+        for entry in data.get(players_key, {}).values():
+            mlb_id = int(entry['mlbId'])
+            person = people.setdefault(mlb_id, {'name': entry['name'], 'roles': set(), 'years': set()})
+            if person['name'].startswith('Unknown (') and not entry['name'].startswith('Unknown ('):
+                person['name'] = entry['name']
+            person['roles'].add(role)
+            person['years'].update(int(y) for y in entry.get(history_key, {}))
+
+    player_ids = sorted(people)
+    index_of = {mlb_id: idx for idx, mlb_id in enumerate(player_ids)}
+    player_rows = [
+        [mlb_id, people[mlb_id]['name'], sorted(people[mlb_id]['roles']), sorted(people[mlb_id]['years'], reverse=True)]
+        for mlb_id in player_ids
+    ]
+
+    tables = {}
+    sources = {}
+    for table, data in artifacts.items():
+        if data is None:
+            continue
+        _, players_key, current_key, history_key, _, _ = SOURCES[table]
+        players = data.get(players_key, {})
+        sources[table] = {'lastUpdated': data.get('lastUpdated'), 'source': data.get('source'), 'years': data.get('years', [])}
+
+        if table == 'arsenal':
+            fields = ARSENAL_FIELDS
+            pitch_types = sorted({p['type'] for e in players.values() for line in e.get(history_key, {}).values() for p in line})
+            type_index = {name: i for i, name in enumerate(pitch_types)}
+        else:
+            fields = _stat_fields(players, history_key)
+            pitch_types = None
+
+        years = {}
+        current = []
+        for mlb_id in player_ids:
+            entry = players.get(str(mlb_id))
+            if entry is None:
+                continue
+            idx = index_of[mlb_id]
+            history = entry.get(history_key, {})
+            latest = entry.get(current_key)
+            current_year = next((y for y in sorted(history, reverse=True) if history[y] == latest), None) if latest else None
+            for year, line in history.items():
+                if table == 'arsenal':
+                    values = [[type_index[p['type']], p['speed'], p['usage']] for p in line]
+                    years.setdefault(year, []).append([idx, values])
+                else:
+                    years.setdefault(year, []).append([idx] + [line.get(field, 0) for field in fields])
+                if year == current_year:
+                    current.append([idx, int(year), len(years[year]) - 1])
+
+        tables[table] = {
+            'fields': fields,
+            'years': dict(sorted(years.items(), reverse=True)),
+            'current': current,
+        }
+        if pitch_types is not None:
+            tables[table]['pitchTypes'] = pitch_types
+
+    all_years = sorted({y for row in player_rows for y in row[3]}, reverse=True)
+    return {
+        'format': 'savant-registry',
+        'version': 1,
+        'lastUpdated': datetime.now().isoformat(),
+        'years': all_years,
+        'sources': sources,
+        'players': {'fields': ['mlbId', 'name', 'roles', 'years'], 'rows': player_rows},
+        'tables': tables,
+    }
+
+
+def _decode_line(table_data, row):
+    if 'pitchTypes' in table_data:
+        types = table_data['pitchTypes']
+        return [{'type': types[t], 'speed': speed, 'usage': usage} for t, speed, usage in row[1]]
+    return dict(zip(table_data['fields'], row[1:]))
+
+
+def expand_view(registry, view):
+    """Regenerate a per-source artifact (batters / pitchers / arsenals) from the registry."""
+    table = VIEWS[view]
+    _, players_key, current_key, history_key, count_key, _ = SOURCES[table]
+    table_data = registry['tables'].get(table)
+    meta = registry['sources'].get(table, {})
+    players = registry['players']['rows']
+
+    entries = {}
+    if table_data:
+        for year, rows in table_data['years'].items():
+            for row in rows:
+                mlb_id, name = players[row[0]][0], players[row[0]][1]
+                entry = entries.setdefault(str(mlb_id), {
+                    'name': name,
+                    'mlbId': mlb_id,
+                    current_key: None,
+                    history_key: {},
+                })
+                entry[history_key][year] = _decode_line(table_data, row)
+        for idx, year, row_index in table_data['current']:
+            entry = entries[str(players[idx][0])]
+            # Pointer -> the same object as the history line, so the view costs no extra memory
+            entry[current_key] = entry[history_key][str(year)]
+
+    return {
+        'lastUpdated': meta.get('lastUpdated'),
+        'source': meta.get('source'),
+        'years': meta.get('years', []),
+        count_key: len(entries),
+        players_key: entries,
+    }
+
+
+def write_registry(path=REGISTRY_PATH):
+    """Rebuild the registry from whatever artifacts exist. Returns the player count."""
+    artifacts = {table: load_artifact(table) for table in SOURCES}
+    registry = build_registry(artifacts)
+    with open(path, 'w') as f:
+        json.dump(registry, f, separators=(',', ':'))
+    return len(registry['players']['rows'])
+
+
+def verify(registry):
+    """Check that every compatibility view round-trips to its source artifact."""
+    ok = True
+    for view, table in VIEWS.items():
+        original = load_artifact(table)
+        if original is None:
+            continue
+        expanded = expand_view(registry, view)
+        players_key = SOURCES[table][1]
+        same = expanded[players_key] == original[players_key]
+        print(f"  {view}: {len(expanded[players_key])} players, {'matches' if same else 'DIFFERS FROM'} {SOURCES[table][0]}")
+        ok = ok and same
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Normalized Savant player registry')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='Build services/savantRegistry.json from the ingest artifacts')
+    view_parser = sub.add_parser('view', help='Write a compatibility view (original per-source layout)')
+    view_parser.add_argument('view', choices=sorted(VIEWS))
+    view_parser.add_argument('--out', help='Output path (default: stdout)')
+    sub.add_parser('verify', help='Check every view round-trips to its source artifact')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        print("=" * 60)
+        print("Building Savant player registry")
+        print("=" * 60)
+        count = write_registry()
+        source_bytes = sum(
+            os.path.getsize(os.path.join(SERVICES_DIR, SOURCES[t][0]))
+            for t in SOURCES if os.path.exists(os.path.join(SERVICES_DIR, SOURCES[t][0]))
+        )
+        registry_bytes = os.path.getsize(REGISTRY_PATH)
+        print(f"  {count} players")
+        print(f"  {source_bytes / 1024:.0f} KB of artifacts -> {registry_bytes / 1024:.0f} KB registry")
+        print(f"\nSaved to: {REGISTRY_PATH}")
+        return
+
+    with open(REGISTRY_PATH, 'r') as f:
+        registry = json.load(f)
+
+    if args.command == 'view':
+        data = expand_view(registry, args.view)
+        if args.out:
+            with open(args.out, 'w') as f:
+                json.dump(data, f, indent=2)
+            print(f"Saved to: {os.path.abspath(args.out)}")
+        else:
+            json.dump(data, sys.stdout, indent=2)
+    elif args.command == 'verify':
+        if not verify(registry):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
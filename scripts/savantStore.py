@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+Indexed, memory-mapped query library over the Savant player registry.
+
+SavantStore compiles services/savantRegistry.json into a binary file
+(services/savantStore.bin) of fixed-width records and sorted indexes, then
+memory-maps it. Lookups binary-search the mapped pages, so opening the store
+costs a small table of contents and per-process memory does not grow with the
+dataset. The OS page cache is shared between processes.
+
+  store = SavantStore()
+  store.player(660271)                         -> {'mlbId', 'name', 'roles', 'years'}
+  store.stats('batting', 660271)               -> current-season line
+  store.stats('pitching', 660271, 2024)        -> that season's line
+  store.entry('arsenal', 660271)               -> {'name', 'mlbId', 'currentArsenal', 'arsenalHistory'}
+  store.search('ohta')                         -> name/prefix matches
+  store.stat_range('batting', 2025, 'xwoba', 0.380, None)
+
+The binary file is rebuilt automatically when the registry is newer.
+
+A small local HTTP service exposes the same queries, so the app can fetch only
+the players on a roster:
+
+    python scripts/savantStore.py serve [--port 8765]
+    GET /players?ids=660271,592450     GET /search?q=judge   (fuzzy, see playerSearch.py)
+    GET /player/660271                 GET /range?table=batting&year=2025&field=xwoba&min=0.38
+
+Usage:
+    python scripts/savantStore.py build
+    python scripts/savantStore.py serve [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+import unicodedata
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from playerSearch import PlayerSearch
+from savantRegistry import REGISTRY_PATH, SERVICES_DIR, SOURCES
+
+
+STORE_PATH = os.path.join(SERVICES_DIR, 'savantStore.bin')
+
+MAGIC = b'SVST'
+VERSION = 2
+HEADER = struct.Struct('<4sII')           # magic, version, toc length
+
+PLAYER = struct.Struct('<iIHBI')           # mlbId, name offset, name length, roles mask, years mask (bit per season, up to 32)
+NAME_KEY = struct.Struct('<IHI')           # key offset, key length, player index
+ARSENAL_ROW = struct.Struct('<III')        # player index, pitch offset, pitch count
+PITCH = struct.Struct('<Bdd')              # pitch type index, speed, usage
+RANGE_ROW = struct.Struct('<dI')           # value, player index
+PLAYER_INDEX = struct.Struct('<I')
+
+ROLES = ['batter', 'pitcher']
+NO_CURRENT = 255
+
+# Entry keys per table, matching the original per-source artifacts
+ENTRY_KEYS = {table: (spec[2], spec[3]) for table, spec in SOURCES.items()}
+
+
+def normalize_name(name):
+    """Lowercase and strip accents so 'José Ramírez' matches 'jose ramirez'."""
+    decomposed = unicodedata.normalize('NFKD', name)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower().strip()
+
+
+def _number(value):
+    return int(value) if float(value).is_integer() else value
+
+
+# --- Build ---
+
+class _SectionWriter:
+    def __init__(self):
+        self.chunks = []
+        self.offset = 0
+        self.toc = {}
+
+    def add(self, name, data, **meta):
+        pad = (-self.offset) % 8
+        if pad:
+            self.chunks.append(b'\0' * pad)
+            self.offset += pad
+        self.toc[name] = {'offset': self.offset, 'length': len(data), **meta}
+        self.chunks.append(data)
+        self.offset += len(data)
+
+
+def _store_version(store_path):
+    """Format version in a store file's header (None if it isn't a Savant store)."""
+    with open(store_path, 'rb') as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    magic, version, _ = HEADER.unpack(header)
+    return version if magic == MAGIC else None
+
+
+def build_store(registry_path=REGISTRY_PATH, store_path=STORE_PATH):
+    """Compile the registry JSON into the memory-mappable binary store."""
+    with open(registry_path, 'r') as f:
+        registry = json.load(f)
+
+    years = sorted(registry['years'], reverse=True)
+    if len(years) > 32:
+        raise ValueError(f"{len(years)} seasons in the registry; the store's years mask holds 32")
+    year_bit = {year: 1 << i for i, year in enumerate(years)}
+    rows = registry['players']['rows']
+    writer = _SectionWriter()
+
+    # Players + name strings
+    names = bytearray()
+    players = bytearray()
+    for mlb_id, name, roles, active in rows:
+        encoded = name.encode('utf-8')
+        role_mask = sum(1 << ROLES.index(r) for r in roles if r in ROLES)
+        years_mask = sum(year_bit.get(y, 0) for y in active)
+        players += PLAYER.pack(mlb_id, len(names), len(encoded), role_mask, years_mask)
+        names += encoded
+    writer.add('players', bytes(players), count=len(rows))
+    writer.add('names', bytes(names))
+
+    # Name index: full normalized name plus each later token ("ohtani" finds "shohei ohtani")
+    keys = []
+    for idx, row in enumerate(rows):
+        normalized = normalize_name(row[1])
+        tokens = normalized.split()
+        for i in range(len(tokens)):
+            keys.append((' '.join(tokens[i:]), idx))
+    keys.sort()
+    key_blob = bytearray()
+    key_index = bytearray()
+    for key, idx in keys:
+        encoded = key.encode('utf-8')
+        key_index += NAME_KEY.pack(len(key_blob), len(encoded), idx)
+        key_blob += encoded
+    writer.add('nameIndex', bytes(key_index), count=len(keys))
+    writer.add('nameKeys', bytes(key_blob))
+
+    tables = {}
+    for table, data in registry['tables'].items():
+        fields = data['fields']
+        table_years = sorted((int(y) for y in data['years']), reverse=True)
+        tables[table] = {'fields': fields, 'years': table_years}
+        if 'pitchTypes' in data:
+            tables[table]['pitchTypes'] = data['pitchTypes']
+
+        for year in table_years:
+            year_rows = sorted(data['years'][str(year)], key=lambda r: r[0])
+            if table == 'arsenal':
+                index = bytearray()
+                pitches = bytearray()
+                pitch_count = 0
+                for row in year_rows:
+                    index += ARSENAL_ROW.pack(row[0], pitch_count, len(row[1]))
+                    for type_idx, speed, usage in row[1]:
+                        pitches += PITCH.pack(type_idx, speed, usage)
+                        pitch_count += 1
+                writer.add(f'{table}:{year}', bytes(index), count=len(year_rows))
+                writer.add(f'{table}:{year}:pitches', bytes(pitches), count=pitch_count)
+                continue
+
+            row_struct = struct.Struct('<I' + 'd' * len(fields))
+            packed = bytearray()
+            for row in year_rows:
+                packed += row_struct.pack(row[0], *(float(v or 0) for v in row[1:]))
+            writer.add(f'{table}:{year}', bytes(packed), count=len(year_rows))
+
+            # Sorted (value, player) index per field for stat-range queries
+            for f_idx, field in enumerate(fields):
+                ranked = sorted((float(row[f_idx + 1] or 0), row[0]) for row in year_rows)
+                writer.add(f'range:{table}:{year}:{field}', b''.join(RANGE_ROW.pack(v, i) for v, i in ranked), count=len(ranked))
+
+        # Current pointers: one byte per player, the index into `years` of the current line
+        current = bytearray([NO_CURRENT]) * len(rows)
+        for idx, year, _ in data['current']:
+            current[idx] = years.index(year)
+        writer.add(f'current:{table}', bytes(current), count=len(rows))
+
+    toc = json.dumps({
+        'lastUpdated': registry.get('lastUpdated'),
+        'sources': registry.get('sources', {}),
+        'years': years,
+        'tables': tables,
+        'sections': writer.toc,
+    }, separators=(',', ':')).encode('utf-8')
+
+    body_start = HEADER.size + len(toc)
+    body_start += (-body_start) % 8
+    tmp_path = f"{store_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(toc)))
+        f.write(toc)
+        f.write(b'\0' * (body_start - HEADER.size - len(toc)))
+        for chunk in writer.chunks:
+            f.write(chunk)
+    os.replace(tmp_path, store_path)
+    return store_path
+
+
+# --- Query ---
+
+class SavantStore:
+    """Lazily memory-mapped, indexed view of the Savant registry."""
+
+    def __init__(self, store_path=STORE_PATH, registry_path=REGISTRY_PATH, auto_build=True):
+        self.store_path = store_path
+        self.registry_path = registry_path
+        self.auto_build = auto_build
+        self._file = None
+        self._mm = None
+        self._toc = None
+        self._body = 0
+        self._row_structs = {}
+
+    # Opening is deferred until the first query
+    def _open(self):
+        if self._mm is not None:
+            return
+        if self.auto_build and os.path.exists(self.registry_path):
+            stale = (not os.path.exists(self.store_path)
+                     or os.path.getmtime(self.store_path) < os.path.getmtime(self.registry_path)
+                     or _store_version(self.store_path) != VERSION)
+            if stale:
+                build_store(self.registry_path, self.store_path)
+        self._file = open(self.store_path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, toc_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.store_path} is not a v{VERSION} Savant store; rebuild it")
+        self._toc = json.loads(self._mm[HEADER.size:HEADER.size + toc_len])
+        self._body = HEADER.size + toc_len + ((-(HEADER.size + toc_len)) % 8)
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def toc(self):
+        self._open()
+        return self._toc
+
+    def _section(self, name):
+        info = self.toc['sections'].get(name)
+        if info is None:
+            return None, 0
+        return self._body + info['offset'], info.get('count', 0)
+
+    def _row_struct(self, table):
+        s = self._row_structs.get(table)
+        if s is None:
+            s = struct.Struct('<I' + 'd' * len(self.toc['tables'][table]['fields']))
+            self._row_structs[table] = s
+        return s
+
+    def _bisect_player(self, start, count, size, player_idx):
+        """Binary search a section of records that begin with a uint32 player index."""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = PLAYER_INDEX.unpack_from(self._mm, start + mid * size)[0]
+            if value < player_idx:
+                lo = mid + 1
+            elif value > player_idx:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def player_index(self, mlb_id):
+        start, count = self._section('players')
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = struct.unpack_from('<i', self._mm, start + mid * PLAYER.size)[0]
+            if value < mlb_id:
+                lo = mid + 1
+            elif value > mlb_id:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _player_at(self, idx):
+        start, _ = self._section('players')
+        names_start, _ = self._section('names')
+        mlb_id, name_off, name_len, roles, years_mask = PLAYER.unpack_from(self._mm, start + idx * PLAYER.size)
+        name = self._mm[names_start + name_off:names_start + name_off + name_len].decode('utf-8')
+        years = [y for i, y in enumerate(self.toc['years']) if years_mask & (1 << i)]
+        return {
+            'mlbId': mlb_id,
+            'name': name,
+            'roles': [r for i, r in enumerate(ROLES) if roles & (1 << i)],
+            'years': years,
+        }
+
+    def player(self, mlb_id):
+        """Registry row for a player, or None."""
+        self._open()
+        idx = self.player_index(int(mlb_id))
+        return None if idx is None else self._player_at(idx)
+
+    def _line(self, table, year, player_idx):
+        start, count = self._section(f'{table}:{year}')
+        if start is None:
+            return None
+        meta = self.toc['tables'][table]
+        if table == 'arsenal':
+            pos = self._bisect_player(start, count, ARSENAL_ROW.size, player_idx)
+            if pos is None:
+                return None
+            _, pitch_off, pitch_count = ARSENAL_ROW.unpack_from(self._mm, start + pos * ARSENAL_ROW.size)
+            pitches_start, _ = self._section(f'{table}:{year}:pitches')
+            types = meta['pitchTypes']
+            arsenal = []
+            for i in range(pitch_count):
+                type_idx, speed, usage = PITCH.unpack_from(self._mm, pitches_start + (pitch_off + i) * PITCH.size)
+                arsenal.append({'type': types[type_idx], 'speed': _number(speed), 'usage': _number(usage)})
+            return arsenal
+
+        row_struct = self._row_struct(table)
+        pos = self._bisect_player(start, count, row_struct.size, player_idx)
+        if pos is None:
+            return None
+        values = row_struct.unpack_from(self._mm, start + pos * row_struct.size)[1:]
+        return {field: _number(v) for field, v in zip(meta['fields'], values)}
+
+    def _current_year(self, table, player_idx):
+        start, _ = self._section(f'current:{table}')
+        if start is None:
+            return None
+        pointer = self._mm[start + player_idx]
+        return None if pointer == NO_CURRENT else self.toc['years'][pointer]
+
+    def stats(self, table, mlb_id, year=None):
+        """One season's line for a player (current season when year is None)."""
+        self._open()
+        idx = self.player_index(int(mlb_id))
+        if idx is None or table not in self.toc['tables']:
+            return None
+        if year is None:
+            year = self._current_year(table, idx)
+            if year is None:
+                return None
+        return self._line(table, int(year), idx)
+
+    def history(self, table, mlb_id):
+        """{year: line} for every season a player has in a table, most recent first."""
+        self._open()
+        idx = self.player_index(int(mlb_id))
+        if idx is None or table not in self.toc['tables']:
+            return {}
+        history = {}
+        for year in self.toc['tables'][table]['years']:
+            line = self._line(table, year, idx)
+            if line is not None:
+                history[str(year)] = line
+        return history
+
+    def entry(self, table, mlb_id):
+        """Player entry in the original per-source layout (name, mlbId, current, history)."""
+        self._open()
+        idx = self.player_index(int(mlb_id))
+        if idx is None:
+            return None
+        history = self.history(table, mlb_id)
+        if not history:
+            return None
+        current_key, history_key = ENTRY_KEYS[table]
+        current_year = self._current_year(table, idx)
+        player = self._player_at(idx)
+        return {
+            'name': player['name'],
+            'mlbId': player['mlbId'],
+            current_key: history.get(str(current_year)) if current_year is not None else None,
+            history_key: history,
+        }
+
+    def search(self, query, limit=10):
+        """Players whose full name, or any trailing part of it, starts with query."""
+        self._open()
+        key = normalize_name(query).encode('utf-8')
+        if not key:
+            return []
+        start, count = self._section('nameIndex')
+        keys_start, _ = self._section('nameKeys')
+
+        def key_at(pos):
+            off, length, idx = NAME_KEY.unpack_from(self._mm, start + pos * NAME_KEY.size)
+            return self._mm[keys_start + off:keys_start + off + length], idx
+
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_at(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        results, seen = [], set()
+        pos = lo
+        while pos < count and len(results) < limit:
+            candidate, idx = key_at(pos)
+            if not candidate.startswith(key):
+                break
+            if idx not in seen:
+                seen.add(idx)
+                results.append(self._player_at(idx))
+            pos += 1
+        return results
+
+    def players_in_year(self, table, year):
+        """mlbIds with a line in the given table and season."""
+        self._open()
+        start, count = self._section(f'{table}:{int(year)}')
+        if start is None:
+            return []
+        size = ARSENAL_ROW.size if table == 'arsenal' else self._row_struct(table).size
+        players_start, _ = self._section('players')
+        ids = []
+        for pos in range(count):
+            idx = PLAYER_INDEX.unpack_from(self._mm, start + pos * size)[0]
+            ids.append(struct.unpack_from('<i', self._mm, players_start + idx * PLAYER.size)[0])
+        return ids
+
+    def stat_range(self, table, year, field, low=None, high=None, limit=100):
+        """[(mlbId, value)] with low <= value <= high, ascending by value."""
+        self._open()
+        start, count = self._section(f'range:{table}:{int(year)}:{field}')
+        if start is None:
+            return []
+        lo, hi = 0, count
+        if low is not None:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if RANGE_ROW.unpack_from(self._mm, start + mid * RANGE_ROW.size)[0] < low:
+                    lo = mid + 1
+                else:
+                    hi = mid
+        players_start, _ = self._section('players')
+        results = []
+        pos = lo
+        while pos < count and len(results) < limit:
+            value, idx = RANGE_ROW.unpack_from(self._mm, start + pos * RANGE_ROW.size)
+            if high is not None and value > high:
+                break
+            mlb_id = struct.unpack_from('<i', self._mm, players_start + idx * PLAYER.size)[0]
+            results.append((mlb_id, _number(value)))
+            pos += 1
+        return results
+
+    def roster(self, mlb_ids):
+        """Everything the app needs for a list of players, keyed by mlbId."""
+        result = {}
+        for mlb_id in mlb_ids:
+            player = self.player(mlb_id)
+            if player is None:
+                continue
+            result[str(player['mlbId'])] = {
+                **player,
+                'batting': self.entry('batting', mlb_id),
+                'pitching': self.entry('pitching', mlb_id),
+                'arsenal': self.entry('arsenal', mlb_id),
+            }
+        return result
+
+
+# --- HTTP service ---
+
+def make_handler(store, search):
+    class SavantHandler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            # The Vite dev server runs on another port
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            parts = [p for p in url.path.split('/') if p]
+            start = time.perf_counter()
+            try:
+                if parts == ['health']:
+                    payload = {'ok': True, 'lastUpdated': store.toc.get('lastUpdated')}
+                elif parts == ['players']:
+                    ids = [int(i) for i in params.get('ids', '').split(',') if i.strip()]
+                    payload = store.roster(ids)
+                elif len(parts) == 2 and parts[0] == 'player':
+                    payload = store.roster([int(parts[1])]).get(str(int(parts[1])))
+                    if payload is None:
+                        return self._send(404, {'error': f"player {parts[1]} not found"})
+                elif parts == ['search']:
+                    payload = search.query(params.get('q', ''), limit=int(params.get('limit', 10)))
+                elif parts == ['range']:
+                    low = float(params['min']) if 'min' in params else None
+                    high = float(params['max']) if 'max' in params else None
+                    payload = [
+                        {'mlbId': mlb_id, 'value': value}
+                        for mlb_id, value in store.stat_range(
+                            params['table'], int(params['year']), params['field'], low, high,
+                            limit=int(params.get('limit', 100)),
+                        )
+                    ]
+                else:
+                    return self._send(404, {'error': f"unknown endpoint {url.path}"})
+            except (KeyError, ValueError) as e:
+                return self._send(400, {'error': f"bad request: {e}"})
+            self._send(200, payload)
+            self.log_message('%s %.3f ms', url.path, (time.perf_counter() - start) * 1000)
+
+        def log_message(self, fmt, *args):
+            if self.server.verbose:
+                super().log_message(fmt, *args)
+
+    return SavantHandler
+
+
+def serve(host='127.0.0.1', port=8765, verbose=False):
+    store = SavantStore()
+    store.toc  # open (and rebuild if stale) before the first request
+    server = ThreadingHTTPServer((host, port), make_handler(store, PlayerSearch()))
+    server.verbose = verbose
+    print(f"Savant store service on http://{host}:{port} ({store.store_path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Memory-mapped Savant store')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='Compile services/savantRegistry.json into services/savantStore.bin')
+    serve_parser = sub.add_parser('serve', help='Run the local HTTP query service')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--verbose', action='store_true', help='Log each request with its latency')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        path = build_store()
+        print(f"Saved to: {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+    elif args.command == 'serve':
+        serve(args.host, args.port, args.verbose)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import { PitchRepertoireEntry } from "../types";
+
+// Nearest-neighbor index over real pitcher-season profiles, built by scripts/buildArsenalIndex.py
+// from the Savant registry. Pitchers without an arsenal of their own get a blend of the
+// arsenals of the k most similar real pitchers: deterministic, and a few microseconds per query.
+import indexData from './arsenalIndex.json';
+
+interface ArsenalIndexFile {
+    format: string;
+    version: number;
+    lastUpdated: string;
+    features: string[];                          // fastball_velo, whiff_pct, gb_pct, k_pct, bb_pct, role
+    mean: number[];
+    scale: number[];
+    roleWeight: number;
+    pitchTypes: string[];
+    points: number[][];                          // standardized profiles, in implicit KD-tree order
+    axes: number[];                              // split dimension of the node at each position
+    pitchers: [number, number][];                // [mlbId, year]
+    arsenals: [number, number, number][][];      // [pitchTypeIndex, speed, usage]
+}
+
+export interface ArsenalProfile {
+    fastballVelo?: number;   // mph
+    whiffPct?: number;
+    gbPct?: number;
+    kPct?: number;
+    bbPct?: number;
+    role: 'starter' | 'reliever';
+}
+
+export interface ArsenalNeighbor {
+    mlbId: number;
+    year: number;
+    distance: number;
+    arsenal: PitchRepertoireEntry[];
+}
+
+const index = indexData as unknown as ArsenalIndexFile;
+const DIMS = index.features.length;
+const FASTBALLS = new Set(['Four-Seam Fastball', 'Sinker']);
+
+// Points flattened once for the search loop
+let flatPoints: Float64Array | null = null;
+const getPoints = (): Float64Array => {
+    if (!flatPoints) {
+        flatPoints = new Float64Array(index.points.length * DIMS);
+        index.points.forEach((p, i) => flatPoints!.set(p, i * DIMS));
+    }
+    return flatPoints;
+};
+
+// Standardized query point; NaN marks a dimension the profile doesn't have
+const toPoint = (profile: ArsenalProfile): Float64Array => {
+    const values = [profile.fastballVelo, profile.whiffPct, profile.gbPct, profile.kPct, profile.bbPct];
+    const point = new Float64Array(DIMS);
+    values.forEach((v, d) => { point[d] = v && v > 0 ? (v - index.mean[d]) / index.scale[d] : NaN; });
+    point[DIMS - 1] = profile.role === 'starter' ? index.roleWeight : 0;
+    return point;
+};
+
+/** The k real pitcher-seasons closest to a profile (missing stats are left out of the distance). */
+export const findSimilarArsenals = (profile: ArsenalProfile, k = 5): ArsenalNeighbor[] => {
+    const points = getPoints();
+    const query = toPoint(profile);
+    // Current best k, sorted by squared distance ascending
+    const bestDist: number[] = [];
+    const bestPos: number[] = [];
+
+    const consider = (pos: number, dist: number) => {
+        if (bestDist.length === k && dist >= bestDist[k - 1]) return;
+        let i = bestDist.length < k ? bestDist.length : k - 1;
+        while (i > 0 && bestDist[i - 1] > dist) {
+            bestDist[i] = bestDist[i - 1];
+            bestPos[i] = bestPos[i - 1];
+            i--;
+        }
+        bestDist[i] = dist;
+        bestPos[i] = pos;
+    };
+
+    const visit = (lo: number, hi: number) => {
+        if (hi <= lo) return;
+        const mid = (lo + hi) >> 1;
+        const base = mid * DIMS;
+        let dist = 0;
+        for (let d = 0; d < DIMS; d++) {
+            if (!Number.isNaN(query[d])) dist += (points[base + d] - query[d]) ** 2;
+        }
+        consider(mid, dist);
+
+        const axis = index.axes[mid];
+        if (Number.isNaN(query[axis])) {
+            visit(lo, mid);
+            visit(mid + 1, hi);
+            return;
+        }
+        const diff = query[axis] - points[base + axis];
+        const [nearLo, nearHi, farLo, farHi] = diff < 0 ? [lo, mid, mid + 1, hi] : [mid + 1, hi, lo, mid];
+        visit(nearLo, nearHi);
+        if (bestDist.length < k || diff * diff < bestDist[bestDist.length - 1]) visit(farLo, farHi);
+    };
+
+    visit(0, index.points.length);
+    return bestPos.map((pos, i) => ({
+        mlbId: index.pitchers[pos][0],
+        year: index.pitchers[pos][1],
+        distance: Math.sqrt(bestDist[i]),
+        arsenal: index.arsenals[pos].map(([t, speed, usage]) => ({ type: index.pitchTypes[t], speed, usage }))
+    }));
+};
+
+/**
+ * Arsenal for a pitcher with no data of their own: the neighbors' pitch types weighted by
+ * similarity, as many pitches as the neighbors typically throw, speeds shifted so the
+ * primary fastball matches the profile's velocity.
+ */
+export const buildNearestArsenal = (profile: ArsenalProfile, k = 5): PitchRepertoireEntry[] => {
+    const neighbors = findSimilarArsenals(profile, k);
+    if (neighbors.length === 0) return [];
+
+    const usageByType = new Map<string, number>();
+    const speedByType = new Map<string, { sum: number; weight: number }>();
+    let pitchCount = 0;
+    let weightSum = 0;
+    neighbors.forEach(n => {
+        const w = 1 / (n.distance + 0.25);
+        weightSum += w;
+        pitchCount += w * n.arsenal.length;
+        n.arsenal.forEach(p => {
+            usageByType.set(p.type, (usageByType.get(p.type) || 0) + w * p.usage);
+            const speed = speedByType.get(p.type) || { sum: 0, weight: 0 };
+            speed.sum += w * p.speed;
+            speed.weight += w;
+            speedByType.set(p.type, speed);
+        });
+    });
+
+    const count = Math.max(2, Math.round(pitchCount / weightSum));
+    const picked = [...usageByType.entries()]
+        .sort((a, b) => b[1] - a[1] || a[0].localeCompare(b[0]))
+        .slice(0, count);
+
+    // Normalize usage to 100%, putting any rounding remainder on the primary pitch
+    const total = picked.reduce((sum, [, usage]) => sum + usage, 0);
+    const arsenal = picked.map(([type, usage]) => {
+        const speed = speedByType.get(type)!;
+        return { type, speed: speed.sum / speed.weight, usage: Math.round((usage / total) * 100) };
+    });
+    arsenal[0].usage += 100 - arsenal.reduce((sum, p) => sum + p.usage, 0);
+
+    const fastball = arsenal.find(p => FASTBALLS.has(p.type));
+    const shift = fastball && profile.fastballVelo ? profile.fastballVelo - fastball.speed : 0;
+    return arsenal
+        .map(p => ({ ...p, speed: Math.round((p.speed + shift) * 10) / 10 }))
+        .sort((a, b) => b.usage - a.usage);
+};
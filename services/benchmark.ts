@@ -0,0 +1,366 @@
+import { Team, GameResult, Player, Position, PlayerRatings, StatsCounters } from "../types";
+import { TEAMS_DATA } from "../constants";
+import { runFastSim } from "./fastSim";
+import { simulateGame, createSeededRandom } from "./simulator";
+import { parseScheduleCSV } from "./scheduleData";
+
+/**
+ * Benchmark harness for the season (fastSim) and game (simulator) engines.
+ *
+ * Runs both engines on a fixed league and the real schedule.json with a seeded RNG,
+ * and reports throughput alongside calibration metrics so that performance work
+ * can't silently break realism and realism tuning can't silently slow things down.
+ */
+
+export interface BenchmarkOptions {
+  seed?: number;
+  fastSimulations?: number;   // Full-season simulations for runFastSim
+  gameDays?: number;          // Schedule days played through simulateGame
+  captureReplay?: boolean;    // Include replay/trajectory cost in the game engine timing
+}
+
+export interface FastSimBenchmark {
+  simulations: number;
+  gamesPerSimulation: number;
+  elapsedMs: number;
+  simsPerSec: number;
+  gamesPerSec: number;
+  bestMeanWins: number;
+  worstMeanWins: number;
+  winSpread: number;          // Best mean wins - worst mean wins
+  meanWinsStdDev: number;     // Spread of team means (talent separation)
+  seasonWinsStdDev: number;   // Spread of every team-season win total (talent + luck)
+}
+
+export interface GameEngineBenchmark {
+  games: number;
+  pitches: number;
+  plateAppearances: number;
+  elapsedMs: number;
+  gamesPerSec: number;
+  pitchesPerSec: number;
+  kPct: number;
+  bbPct: number;
+  hrPerPa: number;
+  babip: number;              // Batting average on balls in play
+  hrPerGame: number;          // Per team-game
+  runsPerGame: number;        // Per team-game
+  pitchesPerPa: number;
+}
+
+export interface CalibrationCheck {
+  metric: string;
+  value: number;
+  min: number;
+  max: number;
+  ok: boolean;
+}
+
+export interface BenchmarkReport {
+  seed: number;
+  teams: number;
+  fastSim: FastSimBenchmark;
+  gameEngine: GameEngineBenchmark;
+  checks: CalibrationCheck[];
+}
+
+// Realistic MLB ranges the tuning comments in fastSim.ts / simulator.ts aim for
+export const CALIBRATION_TARGETS: Record<string, { min: number; max: number }> = {
+  bestMeanWins: { min: 90, max: 108 },
+  worstMeanWins: { min: 45, max: 68 },
+  kPct: { min: 0.19, max: 0.25 },
+  bbPct: { min: 0.07, max: 0.10 },
+  hrPerPa: { min: 0.025, max: 0.036 },
+  babip: { min: 0.285, max: 0.305 },
+  runsPerGame: { min: 3.9, max: 5.0 },
+  pitchesPerPa: { min: 3.6, max: 4.1 }
+};
+
+const clamp = (val: number, min: number, max: number) => Math.max(min, Math.min(max, val));
+
+const mean = (values: number[]) => values.reduce((a, b) => a + b, 0) / Math.max(1, values.length);
+
+const stdDev = (values: number[]) => {
+  const m = mean(values);
+  return Math.sqrt(mean(values.map(v => (v - m) * (v - m))));
+};
+
+/** Run fn with Math.random swapped for a seeded generator (same approach as simulateGame). */
+export const withSeededRandom = <T>(seed: number, fn: () => T): T => {
+  const originalMathRandom = Math.random;
+  Math.random = createSeededRandom(seed);
+  try {
+    return fn();
+  } finally {
+    Math.random = originalMathRandom;
+  }
+};
+
+export const createEmptyStatsCounters = (): StatsCounters => ({
+  ab:0, h:0, d:0, t:0, hr:0, gsh:0, bb:0, ibb:0, hbp:0, so:0, rbi:0, sb:0, cs:0, gidp:0, sf:0, sac:0, r:0, lob:0, xbh:0, tb:0, roe:0, wo:0, pa:0,
+  totalExitVelo: 0, battedBallEvents: 0, hardHits: 0, barrels: 0, swings: 0, whiffs: 0, groundouts:0, flyouts:0,
+  outsPitched:0, er:0, p_r:0, p_h:0, p_bb:0, p_ibb:0, p_hbp: 0, p_hr: 0, p_so:0, wp:0, bk:0, pk:0, bf:0,
+  wins:0, losses:0, saves:0, holds:0, blownSaves: 0, pitchesThrown: 0, strikes: 0, qs:0, cg:0, sho:0, gf:0, svo:0, ir:0, irs:0, rw:0,
+  gs: 0, gp: 0, g: 0,
+  po: 0, a: 0, e: 0, dp: 0, tp:0, pb:0, ofa:0, chances: 0, inn: 0
+});
+
+const HITTER_POSITIONS = [
+  Position.C, Position.TB, Position.SB, Position.TB_3, Position.SS, Position.LF, Position.CF, Position.RF, Position.DH,
+  Position.C, Position.SS, Position.CF, Position.TB
+];
+
+// Rotation slots follow simulator.ts conventions: 1-5 starters, 9 closer, 10-11 setup, 12+ middle/long
+const PITCHER_SLOTS = [1, 2, 3, 4, 5, 9, 10, 11, 12, 13, 14, 15, 16];
+
+/**
+ * Build a deterministic synthetic league from TEAMS_DATA.
+ * Used when no saved season file is supplied, so runs are comparable across machines
+ * without hitting statsapi.mlb.com.
+ */
+export const buildBenchmarkLeague = (seed: number): Team[] => {
+  const random = createSeededRandom(seed);
+  const gauss = () => {
+    const u1 = random() || 0.001;
+    const u2 = random();
+    return Math.sqrt(-2 * Math.log(u1)) * Math.cos(2 * Math.PI * u2);
+  };
+  const attr = (base: number, spread: number) => Math.round(clamp(base + gauss() * spread, 20, 99));
+
+  return TEAMS_DATA.map(info => {
+    const teamQuality = gauss() * 5;
+    const roster: Player[] = [];
+
+    const makePlayer = (idx: number, position: Position, rotationSlot: number): Player => {
+      const isPitcher = position === Position.P;
+      const attributes: PlayerRatings = {
+        contact: attr(isPitcher ? 25 : 50 + teamQuality, 12),
+        power: attr(isPitcher ? 20 : 50 + teamQuality, 14),
+        eye: attr(isPitcher ? 25 : 45 + teamQuality, 12),
+        speed: attr(50, 14),
+        defense: attr(55, 12),
+        reaction: attr(55, 12),
+        arm: attr(55, 12),
+        stuff: attr(isPitcher ? 52 + teamQuality : 20, 12),
+        control: attr(isPitcher ? 50 + teamQuality : 20, 12),
+        stamina: attr(isPitcher ? (rotationSlot <= 5 ? 65 : 40) : 30, 8),
+        velocity: attr(isPitcher ? 55 : 30, 14),
+        spin: attr(isPitcher ? 50 : 20, 12)
+      };
+      const rating = isPitcher
+        ? Math.round((attributes.stuff + attributes.control + attributes.stamina) / 3)
+        : Math.round((attributes.contact + attributes.power + attributes.eye) / 3);
+
+      return {
+        id: `${info.id}_bench_${idx}`,
+        name: `${info.abbreviation} ${isPitcher ? 'Pitcher' : 'Hitter'} ${idx}`,
+        position,
+        isTwoWay: false,
+        number: idx,
+        age: 22 + Math.floor(random() * 15),
+        daysRest: 5,
+        rotationSlot,
+        rating,
+        potential: rating,
+        attributes,
+        statsCounters: createEmptyStatsCounters(),
+        injury: { isInjured: false, type: '', daysRemaining: 0, severity: 'Day-to-Day' },
+        history: [],
+        seasonStats: { games: 0, hr: 0, avg: 0, wins: 0, losses: 0, era: 0 }
+      };
+    };
+
+    HITTER_POSITIONS.forEach(pos => roster.push(makePlayer(roster.length + 1, pos, 0)));
+    PITCHER_SLOTS.forEach(slot => roster.push(makePlayer(roster.length + 1, Position.P, slot)));
+
+    return {
+      ...info,
+      roster,
+      staff: [],
+      frontOffice: { gmName: 'Benchmark', strategy: 'Analytics', budget: 150 },
+      wins: 0,
+      losses: 0,
+      runsScored: 0,
+      runsAllowed: 0,
+      isRosterGenerated: true
+    };
+  });
+};
+
+/** Reset season counters so a saved season file can be replayed from opening day. */
+const resetLeague = (teams: Team[]): Team[] => {
+  return teams.map(t => ({
+    ...t,
+    wins: 0,
+    losses: 0,
+    runsScored: 0,
+    runsAllowed: 0,
+    roster: t.roster.map(p => ({
+      ...p,
+      daysRest: p.position === Position.P || p.isTwoWay ? 5 : p.daysRest,
+      statsCounters: createEmptyStatsCounters(),
+      injury: { isInjured: false, type: '', daysRemaining: 0, severity: 'Day-to-Day' },
+      seasonStats: { games: 0, hr: 0, avg: 0, wins: 0, losses: 0, era: 0 },
+      batting: undefined,
+      pitching: undefined
+    }))
+  }));
+};
+
+const dayKey = (date: string) => new Date(date).toISOString().slice(0, 10);
+
+export const benchmarkFastSim = (teams: Team[], schedule: GameResult[], simulations: number, seed: number): FastSimBenchmark => {
+  const gamesPerSimulation = schedule.filter(g => !g.isPostseason).length;
+
+  const start = performance.now();
+  const summary = withSeededRandom(seed, () => runFastSim(teams, schedule, simulations, true));
+  const elapsedMs = performance.now() - start;
+
+  const odds = Object.values(summary.teamOdds);
+  const meanWins = odds.map(o => o.meanWins);
+  // winsDist is a probability distribution per team; pool the teams with equal weight
+  let poolMean = 0;
+  let poolSquare = 0;
+  odds.forEach(o => {
+    Object.entries(o.winsDist).forEach(([wins, p]) => {
+      poolMean += (Number(wins) * p) / odds.length;
+      poolSquare += (Number(wins) * Number(wins) * p) / odds.length;
+    });
+  });
+
+  const seconds = Math.max(elapsedMs, 1e-6) / 1000;
+  // runFastSim works in whole batches, so it may run slightly more than requested
+  return {
+    simulations: summary.simulations,
+    gamesPerSimulation,
+    elapsedMs,
+    simsPerSec: summary.simulations / seconds,
+    gamesPerSec: (summary.simulations * gamesPerSimulation) / seconds,
+    bestMeanWins: Math.max(...meanWins),
+    worstMeanWins: Math.min(...meanWins),
+    winSpread: Math.max(...meanWins) - Math.min(...meanWins),
+    meanWinsStdDev: stdDev(meanWins),
+    seasonWinsStdDev: Math.sqrt(Math.max(0, poolSquare - poolMean * poolMean))
+  };
+};
+
+/**
+ * Play the first `gameDays` schedule days through simulateGame, mirroring the
+ * rest/injury bookkeeping App.tsx performs between days.
+ */
+export const benchmarkGameEngine = (teams: Team[], schedule: GameResult[], gameDays: number, seed: number, captureReplay: boolean): GameEngineBenchmark => {
+  const league = resetLeague(teams);
+  const teamById = new Map(league.map(t => [t.id, t]));
+  const random = createSeededRandom(seed);
+
+  const days = new Map<string, GameResult[]>();
+  schedule.filter(g => !g.isPostseason).forEach(g => {
+    const key = dayKey(g.date);
+    if (!days.has(key)) days.set(key, []);
+    days.get(key)!.push(g);
+  });
+  const orderedDays = [...days.keys()].sort().slice(0, gameDays);
+
+  let games = 0;
+  let pitches = 0;
+  let runs = 0;
+  let elapsedMs = 0;
+
+  for (const day of orderedDays) {
+    league.forEach(t => t.roster.forEach(p => {
+      if (p.position === Position.P) p.daysRest = Math.min(5, p.daysRest + 1);
+    }));
+
+    for (const game of days.get(day)!) {
+      const home = teamById.get(game.homeTeamId);
+      const away = teamById.get(game.awayTeamId);
+      if (!home || !away) continue;
+
+      const gameSeed = Math.floor(random() * 4294967296) >>> 0;
+      const start = performance.now();
+      const result = simulateGame(home, away, new Date(game.date), false, { seed: gameSeed, captureReplay });
+      elapsedMs += performance.now() - start;
+
+      games++;
+      runs += result.homeScore + result.awayScore;
+      if (result.boxScore) {
+        const pitchers = [...result.boxScore.homePitchers, ...result.boxScore.awayPitchers];
+        pitches += pitchers.reduce((sum, p) => sum + (p.stats.pitchesThrown || 0), 0);
+        const pitcherIds = new Set(pitchers.map(p => p.id));
+        [home, away].forEach(t => t.roster.forEach(p => { if (pitcherIds.has(p.id)) p.daysRest = 0; }));
+      }
+    }
+
+    league.forEach(t => t.roster.forEach(p => {
+      if (p.injury.isInjured) {
+        p.injury.daysRemaining--;
+        if (p.injury.daysRemaining <= 0) {
+          p.injury.isInjured = false;
+          p.injury.severity = "Day-to-Day";
+        }
+      }
+    }));
+  }
+
+  // League totals from the season counters the game engine accumulated.
+  // K/BB/HR come from the pitching side, which simulateGame records for every PA.
+  let pa = 0, so = 0, bb = 0, hr = 0, h = 0, ab = 0, sf = 0;
+  league.forEach(t => t.roster.forEach(p => {
+    const s = p.statsCounters;
+    pa += s.ab + s.bb + s.hbp + s.sf + s.sac;
+    ab += s.ab;
+    sf += s.sf;
+    so += s.p_so;
+    bb += s.p_bb;
+    hr += s.p_hr;
+    h += s.p_h;
+  }));
+  const ballsInPlay = ab - so - hr + sf;
+
+  const seconds = Math.max(elapsedMs, 1e-6) / 1000;
+  const teamGames = Math.max(1, games * 2);
+  return {
+    games,
+    pitches,
+    plateAppearances: pa,
+    elapsedMs,
+    gamesPerSec: games / seconds,
+    pitchesPerSec: pitches / seconds,
+    kPct: pa > 0 ? so / pa : 0,
+    bbPct: pa > 0 ? bb / pa : 0,
+    hrPerPa: pa > 0 ? hr / pa : 0,
+    babip: ballsInPlay > 0 ? (h - hr) / ballsInPlay : 0,
+    hrPerGame: hr / teamGames,
+    runsPerGame: runs / teamGames,
+    pitchesPerPa: pa > 0 ? pitches / pa : 0
+  };
+};
+
+export const runBenchmark = (options: BenchmarkOptions = {}, teams?: Team[], schedule?: GameResult[]): BenchmarkReport => {
+  const seed = options.seed ?? 20260325;
+  const league = teams && teams.length > 0 ? teams : buildBenchmarkLeague(seed);
+  const games = schedule && schedule.length > 0 ? schedule : parseScheduleCSV();
+
+  const fastSim = benchmarkFastSim(league, games, options.fastSimulations ?? 1000, seed);
+  const gameEngine = benchmarkGameEngine(league, games, options.gameDays ?? 30, seed, options.captureReplay ?? true);
+
+  const values: Record<string, number> = {
+    bestMeanWins: fastSim.bestMeanWins,
+    worstMeanWins: fastSim.worstMeanWins,
+    kPct: gameEngine.kPct,
+    bbPct: gameEngine.bbPct,
+    hrPerPa: gameEngine.hrPerPa,
+    babip: gameEngine.babip,
+    runsPerGame: gameEngine.runsPerGame,
+    pitchesPerPa: gameEngine.pitchesPerPa
+  };
+  const checks = Object.entries(CALIBRATION_TARGETS).map(([metric, range]) => ({
+    metric,
+    value: values[metric],
+    min: range.min,
+    max: range.max,
+    ok: values[metric] >= range.min && values[metric] <= range.max
+  }));
+
+  return { seed, teams: league.length, fastSim, gameEngine, checks };
+};
@@ -0,0 +1,584 @@
+import { Team, GameResult, Position } from "../types";
+import { SIM_PARAMS, SimParams, PitchParams, BallInPlayParams, SeasonParams, setSimParams } from "./simParams";
+import { getHistoricalPerformance, createSeededRandom } from "./simulator";
+import { getTeamStrength, expectedWinProbability, MIN_OVERALL, MAX_OVERALL } from "./fastSim";
+import { CALIBRATION_TARGETS, benchmarkGameEngine } from "./benchmark";
+
+/**
+ * Calibration engine for the constants in simParams.json.
+ *
+ * Plate appearances are evaluated analytically: simulatePitch draws its form noise
+ * independently on every pitch, so the per-pitch outcome probabilities (averaged over
+ * the noise by quadrature) drive an exact Markov chain over the 12 ball-strike counts.
+ * That gives K%, BB%, HR/PA, BABIP and P/PA for every batter-pitcher matchup in the
+ * league at once, cheaply enough for a Levenberg-Marquardt fit.
+ *
+ * What the analytic model leaves out (fatigue, park factors, errors, bunts, intentional
+ * walks) is measured with a short seeded run of the real game engine: the fit is repeated
+ * against targets shifted by the gap between the simulated and analytic rates.
+ *
+ * Season constants (the win probability logistic and strength variance) are fit on
+ * batched seasons of the fastSim model: expected wins per game from
+ * expectedWinProbability, with fixed strength and luck draws so the objective is smooth.
+ */
+
+export interface CalibrationOptions {
+  seed?: number;
+  gameDays?: number;            // schedule days played through simulateGame per correction round
+  rounds?: number;              // simulation correction rounds after the analytic fit
+  seasons?: number;             // batched seasons for the season fit
+  standings?: number[][];       // historical final win totals (one array per season)
+  league?: string;              // label recorded in the fit
+}
+
+export interface CalibrationRound {
+  round: number;
+  analytic: Record<string, number>;
+  simulated: Record<string, number>;
+}
+
+export interface CalibrationResult {
+  params: SimParams;
+  targets: Record<string, number>;
+  rounds: CalibrationRound[];
+  season: Record<string, number>;
+  elapsedMs: number;
+}
+
+// Constants the fit moves; everything else in simParams.json is held fixed
+const PITCH_FIT: (keyof PitchParams)[] = ['zoneBase', 'chaseBase', 'zoneSwing', 'contactBase', 'foul'];
+const BALL_IN_PLAY_FIT: (keyof BallInPlayParams)[] = ['hitBase', 'hrBase'];
+const SEASON_FIT: (keyof SeasonParams)[] = ['logisticScale', 'strengthSd'];
+
+const PA_METRICS = ['kPct', 'bbPct', 'hrPerPa', 'babip', 'pitchesPerPa'];
+
+// Relative change in a constant that costs as much as missing a target by its half-range
+const PRIOR_SCALE = 1.0;
+
+const clamp = (val: number, min: number, max: number) => Math.max(min, Math.min(max, val));
+
+// 3-point Gauss-Legendre nodes for the uniform ±5 form noise in getEffectiveAttr
+const FORM_NODES = [-5 * Math.sqrt(0.6), 0, 5 * Math.sqrt(0.6)];
+const FORM_WEIGHTS = [5 / 18, 8 / 18, 5 / 18];
+// The same rule for the difference of two independent draws (contact - stuff)
+const DIFF_NODES = [-2, -1, 0, 1, 2].map(k => k * 5 * Math.sqrt(0.6));
+const DIFF_WEIGHTS = [25, 80, 114, 80, 25].map(w => w / 324);
+
+interface MatchupTable {
+  batters: number;
+  pitchers: number;
+  batterWeight: Float64Array;
+  contact: Float64Array;
+  power: Float64Array;
+  eye: Float64Array;
+  hitAdjust: Float64Array;       // [batter * 3 + power node]: power bins + contact history
+  powerFactor: Float64Array;
+  pitcherWeight: Float64Array;
+  control: Float64Array;
+  stuff: Float64Array;
+  pitcherHitAdjust: Float64Array;
+  // Ball-in-play results per matchup ([batter * pitchers + pitcher]), cached for one set of
+  // ballInPlay constants: the Jacobian mostly varies pitch constants, which leave them unchanged
+  ballInPlayKey: string;
+  hitProb: Float64Array;
+  homeRunProb: Float64Array;      // P(hit and home run)
+}
+
+// Mirrors the power bins in resolveBallInPlay
+const powerHitAdjust = (power: number) =>
+  power >= 70 ? 0.012 : power >= 60 ? 0.007 : power >= 50 ? 0.003 : power < 35 ? -0.005 : 0;
+
+/**
+ * Every batter and pitcher in the league, weighted by how often they play:
+ * the top nine hitters per team by rating, and starters ahead of relievers.
+ */
+const buildMatchupTable = (teams: Team[]): MatchupTable => {
+  const batterRows: { weight: number; contact: number; power: number; eye: number; contactFactor: number; powerFactor: number }[] = [];
+  const pitcherRows: { weight: number; control: number; stuff: number; pitchingFactor: number }[] = [];
+
+  teams.forEach(team => {
+    const hitters = team.roster
+      .filter(p => p.position !== Position.P || p.isTwoWay)
+      .sort((a, b) => b.rating - a.rating);
+    hitters.forEach((p, idx) => {
+      const hist = getHistoricalPerformance(p);
+      batterRows.push({
+        weight: idx < 9 ? 1 : 0.1,
+        contact: p.attributes.contact || 50,
+        power: p.attributes.power || 50,
+        eye: p.attributes.eye || 50,
+        contactFactor: Math.min(hist.contactFactor, 1.20),
+        powerFactor: clamp(hist.powerFactor, 0.70, 1.50)
+      });
+    });
+
+    const pitchers = team.roster.filter(p => p.position === Position.P || p.isTwoWay);
+    const starters = pitchers.filter(p => (p.rotationSlot || 0) >= 1 && (p.rotationSlot || 0) <= 5);
+    const relievers = pitchers.length - starters.length;
+    pitchers.forEach(p => {
+      const isStarter = starters.includes(p);
+      pitcherRows.push({
+        // Starters cover about 60% of innings
+        weight: isStarter ? 0.6 / Math.max(1, starters.length) : 0.4 / Math.max(1, relievers),
+        control: p.attributes.control || 50,
+        stuff: p.attributes.stuff || 50,
+        pitchingFactor: getHistoricalPerformance(p).pitchingFactor
+      });
+    });
+  });
+
+  const nb = batterRows.length;
+  const np = pitcherRows.length;
+  const table: MatchupTable = {
+    batters: nb,
+    pitchers: np,
+    batterWeight: new Float64Array(nb),
+    contact: new Float64Array(nb),
+    power: new Float64Array(nb),
+    eye: new Float64Array(nb),
+    hitAdjust: new Float64Array(nb * 3),
+    powerFactor: new Float64Array(nb),
+    pitcherWeight: new Float64Array(np),
+    control: new Float64Array(np),
+    stuff: new Float64Array(np),
+    pitcherHitAdjust: new Float64Array(np),
+    ballInPlayKey: '',
+    hitProb: new Float64Array(nb * np),
+    homeRunProb: new Float64Array(nb * np)
+  };
+
+  batterRows.forEach((b, i) => {
+    table.batterWeight[i] = b.weight;
+    table.contact[i] = b.contact;
+    table.power[i] = b.power;
+    table.eye[i] = b.eye;
+    table.powerFactor[i] = b.powerFactor;
+    const historyAdjust = b.contactFactor > 1.15 ? 0.006 : b.contactFactor > 1.08 ? 0.003 : b.contactFactor > 1.03 ? 0.001 : 0;
+    for (let k = 0; k < 3; k++) {
+      table.hitAdjust[i * 3 + k] = powerHitAdjust(clamp(b.power + FORM_NODES[k], 5, 99)) + historyAdjust;
+    }
+  });
+  pitcherRows.forEach((p, j) => {
+    table.pitcherWeight[j] = p.weight;
+    table.control[j] = p.control;
+    table.stuff[j] = p.stuff;
+    table.pitcherHitAdjust[j] = p.pitchingFactor > 1.06 ? -0.005 : p.pitchingFactor > 1.03 ? -0.003 : p.pitchingFactor > 1.01 ? -0.001 : 0;
+  });
+  return table;
+};
+
+/** Hit and home run probability on a ball in play, averaged over the form noise on power, contact and stuff. */
+const evaluateBallsInPlay = (table: MatchupTable, ballInPlay: BallInPlayParams) => {
+  const key = JSON.stringify(ballInPlay);
+  if (table.ballInPlayKey === key) return;
+  table.ballInPlayKey = key;
+
+  for (let i = 0; i < table.batters; i++) {
+    const contact = table.contact[i];
+    const power = table.power[i];
+    const powerFactor = table.powerFactor[i];
+
+    for (let j = 0; j < table.pitchers; j++) {
+      let hitProb = 0, homeRunProb = 0;
+      for (let c = 0; c < 3; c++) {
+        const effectiveStuff = table.stuff[j] + FORM_NODES[c];
+        for (let a = 0; a < 3; a++) {
+          const hitAdjust = table.hitAdjust[i * 3 + a] + table.pitcherHitAdjust[j];
+          const hr = clamp((ballInPlay.hrBase + (power + FORM_NODES[a] - effectiveStuff) * ballInPlay.hrSpread) * powerFactor, ballInPlay.hrMin, ballInPlay.hrMax);
+          let hit = 0;
+          for (let b = 0; b < 3; b++) {
+            hit += FORM_WEIGHTS[b] * clamp(ballInPlay.hitBase + (contact + FORM_NODES[b] - effectiveStuff) * ballInPlay.hitSpread + hitAdjust, ballInPlay.hitMin, ballInPlay.hitMax);
+          }
+          const w = FORM_WEIGHTS[a] * FORM_WEIGHTS[c];
+          hitProb += w * hit;
+          homeRunProb += w * hit * hr;
+        }
+      }
+      table.hitProb[i * table.pitchers + j] = hitProb;
+      table.homeRunProb[i * table.pitchers + j] = homeRunProb;
+    }
+  }
+};
+
+// Reach probability of each count, indexed balls * 3 + strikes
+const countReach = new Float64Array(12);
+
+/**
+ * League plate-appearance rates for a set of constants, over every matchup.
+ * Fresh (unfatigued) pitchers in a neutral park.
+ */
+const evaluatePlateAppearances = (table: MatchupTable, pitch: PitchParams, ballInPlay: BallInPlayParams): Record<string, number> => {
+  evaluateBallsInPlay(table, ballInPlay);
+  let totalWeight = 0, strikeouts = 0, walks = 0, inPlay = 0, pitches = 0, hits = 0, homeRuns = 0;
+
+  for (let i = 0; i < table.batters; i++) {
+    const effectiveEye = pitch.eyeCenter + (table.eye[i] - pitch.eyeCenter) * pitch.eyeCompression;
+    const chase = clamp(pitch.chaseBase - effectiveEye * pitch.chaseEye, 0, 1);
+    const contact = table.contact[i];
+
+    for (let j = 0; j < table.pitchers; j++) {
+      const weight = table.batterWeight[i] * table.pitcherWeight[j];
+      const zone = clamp(pitch.zoneBase + table.control[j] * pitch.zoneControl, 0, 1);
+      const stuff = table.stuff[j];
+
+      // Contact probability, averaged over the form noise on contact and stuff
+      let contactProb = 0;
+      for (let k = 0; k < 5; k++) {
+        const p = pitch.contactBase + (contact - stuff + DIFF_NODES[k]) * pitch.contactSpread;
+        contactProb += DIFF_WEIGHTS[k] * clamp(p, pitch.contactMin, pitch.contactMax);
+      }
+
+      // Per-pitch outcomes (simulatePitch order: HBP, wild pitch, then zone/swing/contact)
+      const live = (1 - pitch.hbp) * (1 - pitch.wildPitch);
+      const swingContact = live * zone * pitch.zoneSwing * contactProb;
+      const pHbp = pitch.hbp;
+      const pBall = (1 - pitch.hbp) * pitch.wildPitch + live * (1 - zone) * (1 - chase);
+      const pFoul = swingContact * pitch.foul;
+      const pInPlay = swingContact * (1 - pitch.foul);
+      const pStrike = 1 - pHbp - pBall - pFoul - pInPlay;
+
+      // Markov chain over counts; a two-strike foul repeats the count
+      countReach.fill(0);
+      countReach[0] = 1;
+      let k = 0, bb = 0, bip = 0, n = 0;
+      for (let balls = 0; balls < 4; balls++) {
+        for (let strikes = 0; strikes < 3; strikes++) {
+          const reach = countReach[balls * 3 + strikes];
+          if (reach === 0) continue;
+          const visits = strikes === 2 ? reach / (1 - pFoul) : reach;
+          const exitFoul = strikes === 2 ? 0 : pFoul;
+          n += visits;
+          bip += visits * pInPlay;
+          if (balls === 3) bb += visits * pBall;
+          else countReach[(balls + 1) * 3 + strikes] += visits * pBall;
+          if (strikes === 2) k += visits * pStrike;
+          else countReach[balls * 3 + strikes + 1] += visits * (pStrike + exitFoul);
+        }
+      }
+
+      totalWeight += weight;
+      strikeouts += weight * k;
+      walks += weight * bb;
+      inPlay += weight * bip;
+      pitches += weight * n;
+      hits += weight * bip * table.hitProb[i * table.pitchers + j];
+      homeRuns += weight * bip * table.homeRunProb[i * table.pitchers + j];
+    }
+  }
+
+  return {
+    kPct: strikeouts / totalWeight,
+    bbPct: walks / totalWeight,
+    hrPerPa: homeRuns / totalWeight,
+    babip: (hits - homeRuns) / Math.max(1e-9, inPlay - homeRuns),
+    pitchesPerPa: pitches / totalWeight
+  };
+};
+
+/** Solve the small dense system A x = b (Gaussian elimination with partial pivoting). */
+const solveLinear = (A: number[][], b: number[]): number[] => {
+  const n = b.length;
+  const m = A.map((row, i) => [...row, b[i]]);
+  for (let col = 0; col < n; col++) {
+    let pivot = col;
+    for (let r = col + 1; r < n; r++) if (Math.abs(m[r][col]) > Math.abs(m[pivot][col])) pivot = r;
+    [m[col], m[pivot]] = [m[pivot], m[col]];
+    const diag = m[col][col] || 1e-12;
+    for (let r = col + 1; r < n; r++) {
+      const f = m[r][col] / diag;
+      for (let c = col; c <= n; c++) m[r][c] -= f * m[col][c];
+    }
+  }
+  const x = new Array(n).fill(0);
+  for (let r = n - 1; r >= 0; r--) {
+    let sum = m[r][n];
+    for (let c = r + 1; c < n; c++) sum -= m[r][c] * x[c];
+    x[r] = sum / (m[r][r] || 1e-12);
+  }
+  return x;
+};
+
+const sumSquares = (r: number[]) => r.reduce((s, v) => s + v * v, 0);
+
+/**
+ * Levenberg-Marquardt on a residual vector, with a forward-difference Jacobian.
+ * Steps are clamped to [lower, upper].
+ */
+const levenbergMarquardt = (
+  residuals: (x: number[]) => number[],
+  x0: number[],
+  lower: number[],
+  upper: number[],
+  maxIterations = 40
+): number[] => {
+  let x = [...x0];
+  let r = residuals(x);
+  let cost = sumSquares(r);
+  let lambda = 1e-3;
+
+  for (let iter = 0; iter < maxIterations; iter++) {
+    const J = x.map((xi, k) => {
+      const h = 1e-6 * Math.max(1, Math.abs(xi));
+      const step = [...x];
+      step[k] = xi + h;
+      return residuals(step).map((v, i) => (v - r[i]) / h);
+    });
+    const n = x.length;
+    const JtJ = Array.from({ length: n }, (_, a) => Array.from({ length: n }, (_, b) => J[a].reduce((s, v, i) => s + v * J[b][i], 0)));
+    const Jtr = J.map(col => col.reduce((s, v, i) => s + v * r[i], 0));
+
+    let improved = false;
+    while (lambda < 1e8) {
+      const A = JtJ.map((row, a) => row.map((v, b) => (a === b ? v * (1 + lambda) + 1e-12 : v)));
+      const delta = solveLinear(A, Jtr.map(v => -v));
+      const candidate = x.map((xi, k) => clamp(xi + delta[k], lower[k], upper[k]));
+      const candidateR = residuals(candidate);
+      const candidateCost = sumSquares(candidateR);
+      if (candidateCost < cost) {
+        const gain = cost - candidateCost;
+        x = candidate;
+        r = candidateR;
+        cost = candidateCost;
+        lambda = Math.max(1e-9, lambda / 10);
+        improved = gain > 1e-4 * cost;
+        break;
+      }
+      lambda *= 10;
+    }
+    if (!improved) break;
+  }
+  return x;
+};
+
+const fitPlateAppearances = (
+  table: MatchupTable,
+  start: { pitch: PitchParams; ballInPlay: BallInPlayParams },
+  prior: { pitch: PitchParams; ballInPlay: BallInPlayParams },
+  targets: Record<string, number>,
+  tolerances: Record<string, number>
+): { pitch: PitchParams; ballInPlay: BallInPlayParams } => {
+  const unpack = (x: number[]) => {
+    const pitch = { ...start.pitch };
+    const ballInPlay = { ...start.ballInPlay };
+    PITCH_FIT.forEach((key, k) => { pitch[key] = x[k]; });
+    BALL_IN_PLAY_FIT.forEach((key, k) => { ballInPlay[key] = x[PITCH_FIT.length + k]; });
+    return { pitch, ballInPlay };
+  };
+  const x0 = [...PITCH_FIT.map(key => start.pitch[key]), ...BALL_IN_PLAY_FIT.map(key => start.ballInPlay[key])];
+  const anchor = [...PITCH_FIT.map(key => prior.pitch[key]), ...BALL_IN_PLAY_FIT.map(key => prior.ballInPlay[key])];
+
+  const residuals = (x: number[]) => {
+    const { pitch, ballInPlay } = unpack(x);
+    const rates = evaluatePlateAppearances(table, pitch, ballInPlay);
+    return [
+      ...PA_METRICS.map(metric => (rates[metric] - targets[metric]) / tolerances[metric]),
+      ...x.map((v, k) => (v - anchor[k]) / (PRIOR_SCALE * Math.abs(anchor[k])))
+    ];
+  };
+
+  const x = levenbergMarquardt(residuals, x0, x0.map(() => 0.01), x0.map(() => 0.99));
+  return unpack(x);
+};
+
+interface SeasonBatch {
+  seasons: number;
+  teams: number;
+  base: Float64Array;            // team overall from getTeamStrength
+  home: Int32Array;
+  away: Int32Array;
+  strengthDraws: Float64Array;   // [season * teams + team]: standard normal strength draws
+  luckDraws: Float64Array;       // [season * teams + team]: standard normal game-to-game luck
+}
+
+const buildSeasonBatch = (teams: Team[], schedule: GameResult[], seasons: number, seed: number): SeasonBatch => {
+  const index = new Map(teams.map((t, i) => [t.id, i]));
+  const games = schedule.filter(g => !g.isPostseason && index.has(g.homeTeamId) && index.has(g.awayTeamId));
+  const random = createSeededRandom(seed);
+  const gauss = () => Math.sqrt(-2 * Math.log(random() || 1e-12)) * Math.cos(2 * Math.PI * random());
+
+  const batch: SeasonBatch = {
+    seasons,
+    teams: teams.length,
+    base: Float64Array.from(teams, t => getTeamStrength(t).overall),
+    home: Int32Array.from(games, g => index.get(g.homeTeamId)!),
+    away: Int32Array.from(games, g => index.get(g.awayTeamId)!),
+    strengthDraws: new Float64Array(seasons * teams.length),
+    luckDraws: new Float64Array(seasons * teams.length)
+  };
+  for (let i = 0; i < batch.strengthDraws.length; i++) {
+    batch.strengthDraws[i] = gauss();
+    batch.luckDraws[i] = gauss();
+  }
+  return batch;
+};
+
+/**
+ * Standings under a set of season constants. Expected wins per game come from
+ * expectedWinProbability; game-to-game luck is the normal approximation to the
+ * sum of the per-game Bernoulli draws.
+ */
+const evaluateSeasons = (batch: SeasonBatch, season: SeasonParams): Record<string, number> => {
+  setSimParams({ season });
+  const nt = batch.teams;
+  const overall = new Float64Array(nt);
+  const expected = new Float64Array(nt);
+  const variance = new Float64Array(nt);
+  const meanWins = new Float64Array(nt);
+  let best = 0, worst = 0, sd = 0;
+
+  for (let s = 0; s < batch.seasons; s++) {
+    for (let t = 0; t < nt; t++) {
+      overall[t] = clamp(batch.base[t] + batch.strengthDraws[s * nt + t] * season.strengthSd, MIN_OVERALL, MAX_OVERALL);
+    }
+    expected.fill(0);
+    variance.fill(0);
+    for (let g = 0; g < batch.home.length; g++) {
+      const h = batch.home[g];
+      const a = batch.away[g];
+      const p = expectedWinProbability(overall[h], overall[a]);
+      expected[h] += p;
+      expected[a] += 1 - p;
+      variance[h] += p * (1 - p);
+      variance[a] += p * (1 - p);
+    }
+
+    let max = -Infinity, min = Infinity, sum = 0, sumSq = 0;
+    for (let t = 0; t < nt; t++) {
+      meanWins[t] += expected[t] / batch.seasons;
+      const wins = expected[t] + batch.luckDraws[s * nt + t] * Math.sqrt(variance[t]);
+      max = Math.max(max, wins);
+      min = Math.min(min, wins);
+      sum += wins;
+      sumSq += wins * wins;
+    }
+    best += max / batch.seasons;
+    worst += min / batch.seasons;
+    sd += Math.sqrt(Math.max(0, sumSq / nt - (sum / nt) ** 2)) / batch.seasons;
+  }
+
+  let bestMean = -Infinity, worstMean = Infinity;
+  meanWins.forEach(w => { bestMean = Math.max(bestMean, w); worstMean = Math.min(worstMean, w); });
+  return { bestMeanWins: bestMean, worstMeanWins: worstMean, bestWins: best, worstWins: worst, winStdDev: sd };
+};
+
+/**
+ * Season targets from historical final standings: the average best and worst record
+ * and the average spread of a season, each season rescaled to 162 games.
+ */
+export const standingsTargets = (standings: number[][]): { targets: Record<string, number>; tolerances: Record<string, number> } => {
+  const best: number[] = [];
+  const worst: number[] = [];
+  const spread: number[] = [];
+  standings.filter(s => s.length > 1).forEach(season => {
+    const mean = season.reduce((a, b) => a + b, 0) / season.length;
+    const wins = season.map(w => w * 81 / mean);
+    best.push(Math.max(...wins));
+    worst.push(Math.min(...wins));
+    spread.push(Math.sqrt(wins.reduce((s, w) => s + (w - 81) ** 2, 0) / wins.length));
+  });
+  const avg = (v: number[]) => v.reduce((a, b) => a + b, 0) / v.length;
+  // Season-to-season variation sets how closely each one has to match
+  const sd = (v: number[]) => Math.sqrt(v.reduce((s, x) => s + (x - avg(v)) ** 2, 0) / Math.max(1, v.length - 1));
+  return {
+    targets: { bestWins: avg(best), worstWins: avg(worst), winStdDev: avg(spread) },
+    tolerances: { bestWins: Math.max(2, sd(best)), worstWins: Math.max(2, sd(worst)), winStdDev: Math.max(0.5, sd(spread)) }
+  };
+};
+
+const fitSeason = (batch: SeasonBatch, prior: SeasonParams, targets: Record<string, number>, tolerances: Record<string, number>): SeasonParams => {
+  const metrics = Object.keys(targets);
+  const unpack = (x: number[]) => {
+    const season = { ...prior };
+    SEASON_FIT.forEach((key, k) => { season[key] = x[k]; });
+    return season;
+  };
+  const x0 = SEASON_FIT.map(key => prior[key]);
+  const residuals = (x: number[]) => {
+    const standings = evaluateSeasons(batch, unpack(x));
+    return [
+      ...metrics.map(metric => (standings[metric] - targets[metric]) / tolerances[metric]),
+      ...x.map((v, k) => (v - x0[k]) / (PRIOR_SCALE * Math.abs(x0[k])))
+    ];
+  };
+  return unpack(levenbergMarquardt(residuals, x0, x0.map(v => v * 0.25), x0.map(v => v * 4)));
+};
+
+const midpoints = (metrics: string[]) => Object.fromEntries(metrics.map(m => [m, (CALIBRATION_TARGETS[m].min + CALIBRATION_TARGETS[m].max) / 2]));
+const halfRanges = (metrics: string[]) => Object.fromEntries(metrics.map(m => [m, (CALIBRATION_TARGETS[m].max - CALIBRATION_TARGETS[m].min) / 2]));
+
+const round5 = (value: number) => Math.round(value * 1e5) / 1e5;
+
+const roundParams = <T extends Record<K, number>, K extends keyof T>(params: T, keys: K[]): T => {
+  const rounded = { ...params };
+  keys.forEach(key => { rounded[key] = round5(params[key]) as T[K]; });
+  return rounded;
+};
+
+const roundMetrics = (metrics: Record<string, number>) =>
+  Object.fromEntries(Object.entries(metrics).map(([k, v]) => [k, round5(v)]));
+
+/**
+ * Fit the simulator and season constants to the benchmark calibration targets
+ * (CALIBRATION_TARGETS midpoints, or historical standings for the season model).
+ * Returns a new simParams.json revision; the live SIM_PARAMS are left as they were.
+ */
+export const calibrateSimulator = (teams: Team[], schedule: GameResult[], options: CalibrationOptions = {}): CalibrationResult => {
+  const start = performance.now();
+  const seed = options.seed ?? 20260325;
+  const gameDays = options.gameDays ?? 20;
+  const rounds = options.rounds ?? 2;
+  const original = {
+    pitch: { ...SIM_PARAMS.pitch },
+    ballInPlay: { ...SIM_PARAMS.ballInPlay },
+    season: { ...SIM_PARAMS.season }
+  };
+
+  try {
+    // Plate appearances: analytic fit, then correct for what the model leaves out
+    const table = buildMatchupTable(teams);
+    const paTargets = midpoints(PA_METRICS);
+    const paTolerances = halfRanges(PA_METRICS);
+    let shifted = { ...paTargets };
+    let fitted = { pitch: original.pitch, ballInPlay: original.ballInPlay };
+    const history: CalibrationRound[] = [];
+
+    for (let round = 0; round <= rounds; round++) {
+      fitted = fitPlateAppearances(table, fitted, original, shifted, paTolerances);
+      fitted = { pitch: roundParams(fitted.pitch, PITCH_FIT), ballInPlay: roundParams(fitted.ballInPlay, BALL_IN_PLAY_FIT) };
+      const analytic = evaluatePlateAppearances(table, fitted.pitch, fitted.ballInPlay);
+
+      setSimParams(fitted);
+      const engine = benchmarkGameEngine(teams, schedule, gameDays, seed, false);
+      const simulated: Record<string, number> = { runsPerGame: engine.runsPerGame };
+      PA_METRICS.forEach(metric => { simulated[metric] = engine[metric as keyof typeof engine] as number; });
+      history.push({ round, analytic, simulated });
+
+      shifted = Object.fromEntries(PA_METRICS.map(m => [m, paTargets[m] - (simulated[m] - analytic[m])]));
+    }
+
+    // Season model: benchmark win spread, or historical standings when given
+    const batch = buildSeasonBatch(teams, schedule, options.seasons ?? 200, seed);
+    const seasonGoal = options.standings && options.standings.length > 0
+      ? standingsTargets(options.standings)
+      : { targets: midpoints(['bestMeanWins', 'worstMeanWins']), tolerances: halfRanges(['bestMeanWins', 'worstMeanWins']) };
+    const season = roundParams(fitSeason(batch, original.season, seasonGoal.targets, seasonGoal.tolerances), SEASON_FIT);
+    const standings = evaluateSeasons(batch, season);
+
+    const elapsedMs = performance.now() - start;
+    const achieved = { ...history[history.length - 1].simulated, ...standings };
+    const targets = { ...paTargets, ...seasonGoal.targets };
+    const params: SimParams = {
+      ...SIM_PARAMS,
+      revision: SIM_PARAMS.revision + 1,
+      fittedAt: new Date().toISOString(),
+      source: 'scripts/calibrateSim.ts',
+      pitch: fitted.pitch,
+      ballInPlay: fitted.ballInPlay,
+      season,
+      fit: { league: options.league ?? 'synthetic', targets: roundMetrics(targets), achieved: roundMetrics(achieved), elapsedMs: Math.round(elapsedMs) }
+    };
+    return { params, targets, rounds: history, season: standings, elapsedMs };
+  } finally {
+    setSimParams(original);
+  }
+};
@@ -0,0 +1,291 @@
+import { Team, GameResult, Player, PlayerRatings } from "../types";
+import {
+  LINEUP_SLOTS,
+  MAX_OVERALL,
+  MIN_OVERALL,
+  OFFENSE_WEIGHT,
+  PITCHING_WEIGHT,
+  ROTATION_SLOTS,
+  STRENGTH_SD,
+  expectedWinProbability,
+  getPlayerWeight,
+  getPlayoffField,
+  getPostseasonOdds,
+  inverseNormalCdf,
+  isStrengthHitter,
+  isStrengthPitcher,
+  keyedUniform,
+} from "./fastSim";
+import {
+  ATTRIBUTE_MAX,
+  ATTRIBUTE_MIN,
+  DEFAULT_PROGRESSION_SEED,
+  RATING_MAX,
+  RATING_MIN,
+  getProgressionChange,
+  progressionUniform,
+} from "./progression";
+
+// Dynasty mode: many seasons ahead, across many parallel universes.
+//
+// Players live in columns (age, rating and the twelve attributes as typed arrays, one row per
+// universe and player) instead of object graphs, so aging a whole league is one pass over flat
+// arrays. Each season is simulated with the same strength-draw and per-game model as runFastSim,
+// then every universe ages a year. All draws are counter-based (keyedUniform): a projection is
+// reproducible from its seed, and universe 0's rating changes are progressionSystem's for the
+// same seed (both default to DEFAULT_PROGRESSION_SEED, services/progression.ts).
+//
+// Rosters don't turn over except through retirement: a retiring player's spot goes to a rookie
+// near replacement level who inherits the spot's playing-time weight.
+
+export interface DynastyLeague {
+  teams: Team[];
+  playerIds: string[];
+  team: Int16Array;          // [player] team index
+  hitter: Uint8Array;        // [player] 1 = counts toward offense (getTeamStrength's rules)
+  pitcher: Uint8Array;       // [player] 1 = counts toward pitching
+  weight: Float32Array;      // [player] playing-time weight (getPlayerWeight)
+  universes: number;
+  age: Uint8Array;           // [universe * players + player]
+  rating: Uint8Array;
+  attributes: Uint8Array;    // [(universe * players + player) * ATTRIBUTE_KEYS.length + attribute]
+  retirements: number;
+}
+
+export interface DynastyOptions {
+  seasons?: number;
+  universes?: number;
+  seed?: number;
+  startYear?: number;     // defaults to the year of the schedule's first game
+}
+
+export interface DynastyTeamProjection {
+  teamId: string;
+  meanOverall: number[];  // [season]
+  meanWins: number[];
+  playoffPct: number[];
+  titlePct: number[];
+}
+
+export interface DynastyProjection {
+  years: number[];
+  universes: number;
+  teams: DynastyTeamProjection[];
+}
+
+export const ATTRIBUTE_KEYS: (keyof PlayerRatings)[] = [
+  'contact', 'power', 'eye', 'speed', 'defense', 'reaction', 'arm',
+  'stuff', 'control', 'stamina', 'velocity', 'spin'
+];
+const ATTRIBUTES = ATTRIBUTE_KEYS.length;
+const CONTACT = ATTRIBUTE_KEYS.indexOf('contact');
+const POWER = ATTRIBUTE_KEYS.indexOf('power');
+const EYE = ATTRIBUTE_KEYS.indexOf('eye');
+const STUFF = ATTRIBUTE_KEYS.indexOf('stuff');
+const CONTROL = ATTRIBUTE_KEYS.indexOf('control');
+const STAMINA = ATTRIBUTE_KEYS.indexOf('stamina');
+
+// Retirement, and the rookies who replace retiring players
+const RETIREMENT_AGE = 39;
+const DECLINED_RETIREMENT_AGE = 35;   // retire earlier once the rating has bottomed out
+const ROOKIE_AGE = 23;
+const ROOKIE_RATING = 50;
+const ROOKIE_RATING_SD = 5;
+
+const DEFAULT_SEASONS = 10;
+const DEFAULT_UNIVERSES = 100;
+
+// Salts keep the different kinds of draws independent
+const RETIREMENT_SALT = 0x27d4eb2f;
+const STRENGTH_SALT = 0x165667b1;
+
+const clamp = (val: number, min: number, max: number) => Math.max(min, Math.min(max, val));
+
+export const createDynasty = (teams: Team[], universes: number = DEFAULT_UNIVERSES): DynastyLeague => {
+  const players: { player: Player; team: number }[] = [];
+  teams.forEach((t, i) => t.roster.forEach(player => players.push({ player, team: i })));
+  const count = players.length;
+  const age = new Uint8Array(universes * count);
+  const rating = new Uint8Array(universes * count);
+  const attributes = new Uint8Array(universes * count * ATTRIBUTES);
+
+  // Universe 0 from the rosters, then copied to the others
+  players.forEach(({ player }, p) => {
+    age[p] = player.age;
+    rating[p] = player.rating;
+    ATTRIBUTE_KEYS.forEach((k, a) => { attributes[p * ATTRIBUTES + a] = player.attributes[k]; });
+  });
+  for (let u = 1; u < universes; u++) {
+    age.copyWithin(u * count, 0, count);
+    rating.copyWithin(u * count, 0, count);
+    attributes.copyWithin(u * count * ATTRIBUTES, 0, count * ATTRIBUTES);
+  }
+
+  return {
+    teams,
+    playerIds: players.map(({ player }) => player.id),
+    team: Int16Array.from(players, ({ team }) => team),
+    hitter: Uint8Array.from(players, ({ player }) => (isStrengthHitter(player) ? 1 : 0)),
+    pitcher: Uint8Array.from(players, ({ player }) => (isStrengthPitcher(player) ? 1 : 0)),
+    weight: Float32Array.from(players, ({ player }) => getPlayerWeight(player)),
+    universes,
+    age,
+    rating,
+    attributes,
+    retirements: 0
+  };
+};
+
+/** Age every player of every universe by one year (the offseason after `year`). */
+export const progressDynasty = (league: DynastyLeague, year: number, seed: number) => {
+  const { age, rating, attributes, universes } = league;
+  const count = league.playerIds.length;
+  for (let u = 0; u < universes; u++) {
+    for (let p = 0; p < count; p++) {
+      const row = u * count + p;
+      const newAge = age[row] + 1;
+      const change = getProgressionChange(newAge, progressionUniform(seed, year, u, p));
+      const newRating = clamp(rating[row] + change, RATING_MIN, RATING_MAX);
+
+      if (newAge >= RETIREMENT_AGE || (newAge >= DECLINED_RETIREMENT_AGE && newRating === RATING_MIN)) {
+        // Replacement rookie, with the retiring player's attribute profile moved to the rookie's level
+        const z = inverseNormalCdf(keyedUniform(seed ^ RETIREMENT_SALT, year * universes + u, p));
+        const rookie = clamp(Math.round(ROOKIE_RATING + z * ROOKIE_RATING_SD), RATING_MIN, RATING_MAX);
+        const shift = rookie - rating[row];
+        for (let a = row * ATTRIBUTES; a < (row + 1) * ATTRIBUTES; a++) {
+          attributes[a] = clamp(attributes[a] + shift, ATTRIBUTE_MIN, ATTRIBUTE_MAX);
+        }
+        age[row] = ROOKIE_AGE;
+        rating[row] = rookie;
+        league.retirements++;
+        continue;
+      }
+
+      age[row] = newAge;
+      rating[row] = newRating;
+      if (change !== 0) {
+        for (let a = row * ATTRIBUTES; a < (row + 1) * ATTRIBUTES; a++) {
+          attributes[a] = clamp(attributes[a] + change, ATTRIBUTE_MIN, ATTRIBUTE_MAX);
+        }
+      }
+    }
+  }
+};
+
+/** Overall strength of every team in every universe ([universe * teams + team]), as getTeamStrength. */
+export const getDynastyStrengths = (league: DynastyLeague): Float64Array => {
+  const { teams, team, hitter, pitcher, weight, rating, attributes, universes } = league;
+  const count = league.playerIds.length;
+  const overall = new Float64Array(universes * teams.length);
+  const members = teams.map((_, t) => {
+    const rows: number[] = [];
+    team.forEach((owner, p) => { if (owner === t) rows.push(p); });
+    return rows;
+  });
+  // Top-k by score; ties keep roster order, like the stable sort in getTeamStrength
+  const topScores = new Float64Array(LINEUP_SLOTS);
+  const topValues = new Float64Array(LINEUP_SLOTS);
+  const topMean = (rows: number[], u: number, slots: number, include: Uint8Array, score: (row: number, p: number) => number, value: (row: number) => number): number => {
+    let size = 0;
+    rows.forEach(p => {
+      if (!include[p]) return;
+      const row = u * count + p;
+      const s = score(row, p);
+      if (size === slots && s <= topScores[slots - 1]) return;
+      let i = size < slots ? size++ : slots - 1;
+      while (i > 0 && topScores[i - 1] < s) {
+        topScores[i] = topScores[i - 1];
+        topValues[i] = topValues[i - 1];
+        i--;
+      }
+      topScores[i] = s;
+      topValues[i] = value(row);
+    });
+    let sum = 0;
+    for (let i = 0; i < size; i++) sum += topValues[i];
+    return sum / Math.max(1, size);
+  };
+  const battingValue = (row: number) =>
+    (attributes[row * ATTRIBUTES + CONTACT] + attributes[row * ATTRIBUTES + POWER] + attributes[row * ATTRIBUTES + EYE]) / 3;
+  const pitchingValue = (row: number) =>
+    (attributes[row * ATTRIBUTES + STUFF] + attributes[row * ATTRIBUTES + CONTROL] + attributes[row * ATTRIBUTES + STAMINA]) / 3;
+
+  for (let u = 0; u < universes; u++) {
+    members.forEach((rows, t) => {
+      const offense = topMean(rows, u, LINEUP_SLOTS, hitter, (row, p) => rating[row] * weight[p], battingValue);
+      const pitching = topMean(rows, u, ROTATION_SLOTS, pitcher, row => rating[row], pitchingValue);
+      overall[u * teams.length + t] = (offense * OFFENSE_WEIGHT) + (pitching * PITCHING_WEIGHT);
+    });
+  }
+  return overall;
+};
+
+/**
+ * Chain season simulation and progression: simulate a full regular season (and the exact
+ * postseason odds) in every universe, age everyone, repeat.
+ */
+export const projectDynasty = (teams: Team[], schedule: GameResult[], options: DynastyOptions = {}): DynastyProjection => {
+  const seasons = Math.max(1, options.seasons ?? DEFAULT_SEASONS);
+  const universes = Math.max(1, options.universes ?? DEFAULT_UNIVERSES);
+  const seed = options.seed ?? DEFAULT_PROGRESSION_SEED;
+  const regularSeason = schedule.filter(g => !g.isPostseason);
+  const startYear = options.startYear ?? (regularSeason.length > 0 ? new Date(regularSeason[0].date).getFullYear() : 2026);
+
+  const teamIndex = new Map(teams.map((t, i) => [t.id, i]));
+  const games = regularSeason.filter(g => teamIndex.has(g.homeTeamId) && teamIndex.has(g.awayTeamId));
+  const home = Int16Array.from(games, g => teamIndex.get(g.homeTeamId)!);
+  const away = Int16Array.from(games, g => teamIndex.get(g.awayTeamId)!);
+
+  const league = createDynasty(teams, universes);
+  const teamCount = teams.length;
+  const years = Array.from({ length: seasons }, (_, s) => startYear + s);
+  const projections: DynastyTeamProjection[] = teams.map(t => ({
+    teamId: t.id,
+    meanOverall: new Array(seasons).fill(0),
+    meanWins: new Array(seasons).fill(0),
+    playoffPct: new Array(seasons).fill(0),
+    titlePct: new Array(seasons).fill(0)
+  }));
+
+  const wins = new Int16Array(teamCount);
+  const overall = new Float64Array(teamCount);
+  years.forEach((year, s) => {
+    const strengths = getDynastyStrengths(league);
+    for (let u = 0; u < universes; u++) {
+      const draw = s * universes + u;
+      for (let t = 0; t < teamCount; t++) {
+        const base = strengths[u * teamCount + t];
+        projections[t].meanOverall[s] += base;
+        overall[t] = clamp(base + inverseNormalCdf(keyedUniform(seed ^ STRENGTH_SALT, draw, t)) * STRENGTH_SD, MIN_OVERALL, MAX_OVERALL);
+      }
+      wins.fill(0);
+      for (let g = 0; g < home.length; g++) {
+        const homeWin = keyedUniform(seed, draw, g) < expectedWinProbability(overall[home[g]], overall[away[g]]);
+        wins[homeWin ? home[g] : away[g]]++;
+      }
+
+      const winsById: Record<string, number> = {};
+      const overallById: Record<string, number> = {};
+      teams.forEach((t, i) => {
+        winsById[t.id] = wins[i];
+        overallById[t.id] = overall[i];
+        projections[i].meanWins[s] += wins[i];
+      });
+      const field = getPlayoffField(teams, winsById);
+      [...field.divisionWinners, ...field.wildCards].forEach(id => { projections[teamIndex.get(id)!].playoffPct[s]++; });
+      const postseason = getPostseasonOdds(field, winsById, overallById);
+      Object.entries(postseason.worldSeries).forEach(([id, p]) => { projections[teamIndex.get(id)!].titlePct[s] += p; });
+    }
+    progressDynasty(league, year, seed);
+  });
+
+  projections.forEach(p => {
+    for (let s = 0; s < seasons; s++) {
+      p.meanOverall[s] /= universes;
+      p.meanWins[s] /= universes;
+      p.playoffPct[s] = (p.playoffPct[s] / universes) * 100;
+      p.titlePct[s] = (p.titlePct[s] / universes) * 100;
+    }
+  });
+  return { years, universes, teams: projections };
+};
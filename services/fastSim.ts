@@ -1,4 +1,7 @@
 import { Team, GameResult, Player, Position } from "../types";
+import { GameProbability, leagueBracketOdds, worldSeriesOdds } from "./seriesOdds";
+import { computeWinDistributions } from "./winDistribution";
+import { SIM_PARAMS } from "./simParams";
 
 export interface TeamOdds {
   teamId: string;
@@ -10,7 +13,18 @@ export interface TeamOdds {
   wildCardPct: number;
   pennantPct: number;
   worldSeriesPct: number;
-  winsDist: Record<number, number>;
+  winsDist: Record<number, number>;  // wins -> probability (exact, not sampled)
+  errors?: Record<OddsField, number>; // 95% confidence half-widths, in percentage points
+}
+
+export type OddsField = 'playoffPct' | 'divisionPct' | 'wildCardPct' | 'pennantPct' | 'worldSeriesPct';
+
+export interface FastSimOptions {
+  antithetic?: boolean;   // pair each simulation with its mirror image (1 - u for every draw)
+  stratified?: boolean;   // Latin hypercube over the team strength draws within each batch
+  seed?: number;          // fixes every draw: runs with the same seed use common random numbers
+  targetWidth?: number;   // adaptive: stop once every team's playoff and World Series 95% CI is
+                          // narrower than this (percentage points); `simulations` becomes the cap
 }
 
 export interface AwardEntry {
@@ -33,9 +47,10 @@ export interface FastSimSummary {
   teamOdds: Record<string, TeamOdds>;
   awardOdds: AwardOdds;
   simulations: number;
+  effectiveSimulations?: number;  // Importance-weighted projections (incrementalSim): effective sample size
 }
 
-interface TeamStrength {
+export interface TeamStrength {
   offense: number;
   pitching: number;
   overall: number;
@@ -50,38 +65,54 @@ const clamp = (val: number, min: number, max: number) => Math.max(min, Math.min(
 
 const mean = (values: number[]) => values.reduce((a, b) => a + b, 0) / Math.max(1, values.length);
 
-const getTeamStrength = (team: Team): TeamStrength => {
-  const hitters = team.roster.filter(p => p.position !== Position.P || p.isTwoWay);
-  const pitchers = team.roster.filter(p => p.position === Position.P || p.isTwoWay);
-
-  // Use historical games to weight player importance (regular starters matter more)
-  const getPlayerWeight = (p: Player): number => {
-    if (!p.history || p.history.length === 0) return 0.5;
-    const recent = p.history.slice(0, 2);
-    const avgGames = recent.reduce((sum, h) => sum + (h.stats.games || 0), 0) / recent.length;
-    // Players with 100+ games get full weight, others get proportional weight
-    return Math.min(1.0, avgGames / 100);
-  };
+// Strength is the mean of the top 9 hitters' batting and the top 5 pitchers' pitching
+export const LINEUP_SLOTS = 9;
+export const ROTATION_SLOTS = 5;
+export const OFFENSE_WEIGHT = 0.52;
+export const PITCHING_WEIGHT = 0.48;
+
+export const isStrengthHitter = (p: Player): boolean => p.position !== Position.P || !!p.isTwoWay;
+export const isStrengthPitcher = (p: Player): boolean => p.position === Position.P || !!p.isTwoWay;
+
+// Use historical games to weight player importance (regular starters matter more)
+export const getPlayerWeight = (p: Player): number => {
+  if (!p.history || p.history.length === 0) return 0.5;
+  const recent = p.history.slice(0, 2);
+  const avgGames = recent.reduce((sum, h) => sum + (h.stats.games || 0), 0) / recent.length;
+  // Players with 100+ games get full weight, others get proportional weight
+  return Math.min(1.0, avgGames / 100);
+};
+
+export const getBattingValue = (p: Player): number => (p.attributes.contact + p.attributes.power + p.attributes.eye) / 3;
+export const getPitchingValue = (p: Player): number => (p.attributes.stuff + p.attributes.control + p.attributes.stamina) / 3;
+
+export const getTeamStrength = (team: Team): TeamStrength => {
+  const hitters = team.roster.filter(isStrengthHitter);
+  const pitchers = team.roster.filter(isStrengthPitcher);
 
   // Get top hitters weighted by historical usage
   const scoredHitters = hitters.map(p => ({
     player: p,
-    score: p.rating * getPlayerWeight(p),
-    weight: getPlayerWeight(p)
+    score: p.rating * getPlayerWeight(p)
   })).sort((a, b) => b.score - a.score);
   
-  const topHitters = scoredHitters.slice(0, 9).map(h => h.player);
-  const topPitchers = [...pitchers].sort((a, b) => b.rating - a.rating).slice(0, 5);
+  const topHitters = scoredHitters.slice(0, LINEUP_SLOTS).map(h => h.player);
+  const topPitchers = [...pitchers].sort((a, b) => b.rating - a.rating).slice(0, ROTATION_SLOTS);
 
-  const offense = mean(topHitters.map(p => (p.attributes.contact + p.attributes.power + p.attributes.eye) / 3));
-  const pitching = mean(topPitchers.map(p => (p.attributes.stuff + p.attributes.control + p.attributes.stamina) / 3));
-  const overall = (offense * 0.52) + (pitching * 0.48);
+  const offense = mean(topHitters.map(getBattingValue));
+  const pitching = mean(topPitchers.map(getPitchingValue));
+  const overall = (offense * OFFENSE_WEIGHT) + (pitching * PITCHING_WEIGHT);
 
   return { offense, pitching, overall };
 };
 
+// Season-long variance on overall strength, and the range it is clamped to
+export const STRENGTH_SD = SIM_PARAMS.season.strengthSd;
+export const MIN_OVERALL = 25;
+export const MAX_OVERALL = 90;
+
 // Add per-simulation team strength variance to model injury luck, breakouts, etc.
-const getSimulationStrengths = (baseStrengths: Record<string, TeamStrength>): Record<string, TeamStrength> => {
+export const getSimulationStrengths = (baseStrengths: Record<string, TeamStrength>): Record<string, TeamStrength> => {
   const simStrengths: Record<string, TeamStrength> = {};
   
   for (const [teamId, base] of Object.entries(baseStrengths)) {
@@ -93,63 +124,65 @@ const getSimulationStrengths = (baseStrengths: Record<string, TeamStrength>): Re
     const normalRandom = Math.sqrt(-2 * Math.log(u1)) * Math.cos(2 * Math.PI * u2);
     
     // Reduced standard deviation of ~4 points - preserves team quality differences
-    const variance = normalRandom * 4;
+    const variance = normalRandom * STRENGTH_SD;
     
     simStrengths[teamId] = {
       offense: clamp(base.offense + variance * 0.5, 20, 95),
       pitching: clamp(base.pitching + variance * 0.5, 20, 95),
       // Wide range to preserve elite/bad team separation
-      overall: clamp(base.overall + variance, 25, 90)
+      overall: clamp(base.overall + variance, MIN_OVERALL, MAX_OVERALL)
     };
   }
   
   return simStrengths;
 };
 
-const winProbability = (home: TeamStrength, away: TeamStrength): number => {
+// Home win probability before clamping, for a given per-game variance draw.
+// Constants come from simParams.json (season), refit by scripts/calibrateSim.ts.
+const rawWinProbability = (homeOverall: number, awayOverall: number, gameVariance: number): number => {
   // Calibrated for realistic MLB outcomes
   // 2025 Reference: Brewers 95 wins, Rockies 43 wins (52 game spread)
   // Target: Best teams ~95-105 wins, Worst teams ~45-60 wins
-  const diff = home.overall - away.overall;
+  const params = SIM_PARAMS.season;
+  const diff = homeOverall - awayOverall;
   
   // Logistic function - higher sensitivity to team difference
   // Lower divisor = more impact from team quality
-  const base = 1 / (1 + Math.pow(10, -diff / 14));
-  
-  // Home field advantage (~54% historical = +4%)
-  const homeAdv = 0.04;
+  const base = 1 / (1 + Math.pow(10, -diff / params.logisticScale));
   
+  // Home field advantage (~54% historical = +4%), then a small regression toward .500
+  const rawProb = base + params.homeAdvantage + gameVariance;
+  return 0.50 + (rawProb - 0.50) * params.regression;
+};
+
+export const winProbability = (homeOverall: number, awayOverall: number): number => {
   // Per-game variance (any team can beat any team - baseball is chaotic)
-  const gameVariance = (Math.random() * 0.10) - 0.05;
-  
-  // Minimal regression - let team quality shine through
-  const rawProb = base + homeAdv + gameVariance;
-  const regressed = 0.50 + (rawProb - 0.50) * 0.94; // Only 6% regression
-  
+  const { gameVariance, minWinProb, maxWinProb } = SIM_PARAMS.season;
+  const variance = (Math.random() * 2 * gameVariance) - gameVariance;
   // Wide clamp: allows realistic spread
   // Best team vs worst can win ~70% of games
   // This produces ~100+ wins for elite teams, ~50-60 for bad teams
-  return clamp(regressed, 0.28, 0.72);
+  return clamp(rawWinProbability(homeOverall, awayOverall, variance), minWinProb, maxWinProb);
 };
 
-const simulateSeries = (teamA: Team, teamB: Team, strengths: Record<string, TeamStrength>, bestOf: number): string => {
-  const winsNeeded = Math.floor(bestOf / 2) + 1;
-  let winsA = 0;
-  let winsB = 0;
-
-  while (winsA < winsNeeded && winsB < winsNeeded) {
-    // For playoff series, add extra variance (anything can happen in October)
-    const pA = winProbability(strengths[teamA.id], strengths[teamB.id]);
-    // Add playoff variance - pull closer to 50%
-    const playoffAdjusted = 0.50 + (pA - 0.50) * 0.75;
-    if (Math.random() < playoffAdjusted) winsA++;
-    else winsB++;
-  }
-
-  return winsA > winsB ? teamA.id : teamB.id;
+// Mean of winProbability over the per-game variance draw (uniform, then clamped), in closed form.
+// A game whose win probability is itself random is won with its mean probability.
+export const expectedWinProbability = (homeOverall: number, awayOverall: number): number => {
+  const { gameVariance, regression, minWinProb, maxWinProb } = SIM_PARAMS.season;
+  const center = rawWinProbability(homeOverall, awayOverall, 0);
+  const halfWidth = gameVariance * regression;
+  const lo = center - halfWidth;
+  const hi = center + halfWidth;
+  const inLo = Math.max(lo, minWinProb);
+  const inHi = Math.min(hi, maxWinProb);
+  let integral = minWinProb * clamp(minWinProb - lo, 0, hi - lo) + maxWinProb * clamp(hi - maxWinProb, 0, hi - lo);
+  if (inHi > inLo) integral += (inHi * inHi - inLo * inLo) / 2;
+  return integral / (hi - lo);
 };
 
-const getLeagueTeams = (teams: Team[], league: "AL" | "NL") => teams.filter(t => t.league === league);
+// Per-game playoff win probability for the home team: extra variance pulls it closer to 50%
+const playoffGameProbability = (overall: Record<string, number>): GameProbability =>
+  (homeId, awayId) => 0.50 + (expectedWinProbability(overall[homeId], overall[awayId]) - 0.50) * 0.75;
 
 const getDivisionWinners = (teams: Team[], wins: Record<string, number>, league: "AL" | "NL") => {
   const divisions = ["East", "Central", "West"] as const;
@@ -167,6 +200,45 @@ const getWildcardTeams = (teams: Team[], wins: Record<string, number>, league: "
     .slice(0, 3);
 };
 
+export interface PlayoffField {
+  divisionWinners: string[];
+  wildCards: string[];
+  seeds: Record<'AL' | 'NL', string[]>;   // top seed first
+}
+
+export interface PostseasonOdds {
+  pennant: Record<string, number>;       // teamId -> P(win the pennant)
+  worldSeries: Record<string, number>;   // teamId -> P(win the World Series)
+}
+
+// Division winners, wild cards and seeding from one simulated season's final wins
+export const getPlayoffField = (teams: Team[], wins: Record<string, number>): PlayoffField => {
+  const field: PlayoffField = { divisionWinners: [], wildCards: [], seeds: { AL: [], NL: [] } };
+  (['AL', 'NL'] as const).forEach(league => {
+    const divisionWinners = getDivisionWinners(teams, wins, league);
+    const wildcards = getWildcardTeams(teams, wins, league, divisionWinners);
+    field.divisionWinners.push(...divisionWinners.map(t => t.id));
+    field.wildCards.push(...wildcards.map(t => t.id));
+    field.seeds[league] = [...divisionWinners, ...wildcards].sort((a, b) => wins[b.id] - wins[a.id]).map(t => t.id);
+  });
+  return field;
+};
+
+// Exact bracket odds for a playoff field, given the season's strengths (overall, by teamId)
+export const getPostseasonOdds = (
+  field: PlayoffField,
+  wins: Record<string, number>,
+  overall: Record<string, number>
+): PostseasonOdds => {
+  const gameProbability = playoffGameProbability(overall);
+  const al = leagueBracketOdds(field.seeds.AL, gameProbability);
+  const nl = leagueBracketOdds(field.seeds.NL, gameProbability);
+  return {
+    pennant: { ...al?.pennant, ...nl?.pennant },
+    worldSeries: al && nl ? worldSeriesOdds(al.pennant, nl.pennant, gameProbability, wins) : {},
+  };
+};
+
 const getHitterProjection = (player: Player): number => {
   const batting = (player.attributes.contact + player.attributes.power + player.attributes.eye) / 3;
   const speedBonus = player.attributes.speed * 0.08;
@@ -188,46 +260,116 @@ const getRookieCandidates = (players: Player[]) => {
   return rookies.length > 0 ? rookies : players.filter(p => p.age <= 26);
 };
 
-const computeAwardWinners = (
+// Award noise keys sit above every team and game draw key: AWARD_KEY + player * 3 + award
+const AWARD_KEY = 1 << 20;
+
+/**
+ * Award winners for one simulated season. `noise(key)` gives the uniform for each candidate's
+ * score (key = AWARD_KEY + the player's league-wide index * 3 + award), so keyed draws make
+ * the winners reproducible.
+ */
+export const computeAwardWinners = (
   teams: Team[],
   wins: Record<string, number>,
-  league: "AL" | "NL"
+  league: "AL" | "NL",
+  noise: (key: number) => number = () => Math.random()
 ) => {
-  const leagueTeams = teams.filter(t => t.league === league);
-  const leaguePlayers = leagueTeams.flatMap(t => t.roster.map(p => ({ player: p, teamId: t.id })));
+  let firstIndex = 0;
+  const leaguePlayers = teams.flatMap(t => {
+    const offset = firstIndex;
+    firstIndex += t.roster.length;
+    return t.league === league ? t.roster.map((p, i) => ({ player: p, teamId: t.id, index: offset + i })) : [];
+  });
 
   const hitters = leaguePlayers.filter(p => p.player.position !== Position.P || p.player.isTwoWay);
   const pitchers = leaguePlayers.filter(p => p.player.position === Position.P || p.player.isTwoWay);
+  const draw = (index: number, award: number) => noise(AWARD_KEY + index * 3 + award);
 
-  const hitterScores: PlayerProjection[] = hitters.map(({ player, teamId }) => ({
+  const hitterScores: PlayerProjection[] = hitters.map(({ player, teamId, index }) => ({
     player,
-    score: getHitterProjection(player) + wins[teamId] * 0.08 + (Math.random() * 8)
+    score: getHitterProjection(player) + wins[teamId] * 0.08 + (draw(index, 0) * 8)
   }));
 
-  const pitcherScores: PlayerProjection[] = pitchers.map(({ player, teamId }) => ({
+  const pitcherScores: PlayerProjection[] = pitchers.map(({ player, teamId, index }) => ({
     player,
     // Pass true for forCyYoung to apply two-way player penalty
-    score: getPitcherProjection(player, true) + wins[teamId] * 0.06 + (Math.random() * 8)
+    score: getPitcherProjection(player, true) + wins[teamId] * 0.06 + (draw(index, 1) * 8)
   }));
 
-  const rookies = getRookieCandidates(hitters.map(h => h.player));
-  const rookieScores: PlayerProjection[] = rookies.map(player => ({
+  const rookieIds = new Set(getRookieCandidates(hitters.map(h => h.player)).map(p => p.id));
+  const rookieScores: PlayerProjection[] = hitters.filter(h => rookieIds.has(h.player.id)).map(({ player, index }) => ({
     player,
-    score: getHitterProjection(player) + (Math.random() * 10)
+    score: getHitterProjection(player) + (draw(index, 2) * 10)
   }));
 
-  const mvp = hitterScores.sort((a, b) => b.score - a.score)[0]?.player;
-  const cy = pitcherScores.sort((a, b) => b.score - a.score)[0]?.player;
-  const roy = rookieScores.sort((a, b) => b.score - a.score)[0]?.player;
+  // Only the top score matters: a scan keeps the first of any ties, like the stable sort did
+  const top = (scores: PlayerProjection[]) =>
+    scores.reduce<PlayerProjection | undefined>((best, s) => (!best || s.score > best.score ? s : best), undefined)?.player;
+  const mvp = top(hitterScores);
+  const cy = top(pitcherScores);
+  const roy = top(rookieScores);
 
   return { mvp, cy, roy };
 };
 
+// Simulations run in batches; the spread of the batch means gives the confidence intervals
+// (valid for every sampling mode, since batches are independent of each other)
+const BATCH_SIZE = 50;
+const MIN_BATCHES = 8;
+const Z_95 = 1.96;
+const ODDS_FIELDS: OddsField[] = ['playoffPct', 'divisionPct', 'wildCardPct', 'pennantPct', 'worldSeriesPct'];
+const STRATA_SALT = 0x5bd1e995;
+
+const mix32 = (h: number): number => {
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x7feb352d);
+  h ^= h >>> 15;
+  h = Math.imul(h, 0x846ca68b);
+  h ^= h >>> 16;
+  return h >>> 0;
+};
+
+// Counter-based uniform in (0, 1): the same (seed, draw, key) always gives the same number,
+// so a draw can be replayed (antithetic partner) or shared between runs (common random numbers)
+export const keyedUniform = (seed: number, draw: number, key: number): number =>
+  (mix32(mix32(seed ^ mix32(draw + 0x9e3779b9)) ^ (key + 0x632be5ab)) + 0.5) / 4294967296;
+
+// Acklam's rational approximation of the standard normal quantile (relative error < 1.2e-9)
+const QUANTILE_A = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02, 1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00];
+const QUANTILE_B = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02, 6.680131188771972e+01, -1.328068155288572e+01];
+const QUANTILE_C = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00, -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00];
+const QUANTILE_D = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00];
+
+export const inverseNormalCdf = (p: number): number => {
+  const [a, b, c, d] = [QUANTILE_A, QUANTILE_B, QUANTILE_C, QUANTILE_D];
+  if (p < 0.02425 || p > 0.97575) {
+    const q = Math.sqrt(-2 * Math.log(Math.min(p, 1 - p)));
+    const x = (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) /
+      ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1);
+    return p < 0.5 ? x : -x;
+  }
+  const q = p - 0.5;
+  const r = q * q;
+  return (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q /
+    (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1);
+};
+
+// Random permutation of 0..n-1 (one Latin hypercube column)
+const stratumPermutation = (seed: number, batch: number, column: number, n: number): number[] => {
+  const perm = Array.from({ length: n }, (_, i) => i);
+  for (let i = n - 1; i > 0; i--) {
+    const j = Math.floor(keyedUniform(seed ^ STRATA_SALT, batch, column * n + i) * (i + 1));
+    [perm[i], perm[j]] = [perm[j], perm[i]];
+  }
+  return perm;
+};
+
 export const runFastSim = (
   teams: Team[],
   schedule: GameResult[],
   simulations: number,
-  freshProjection: boolean = false  // If true, ignore current standings and simulate full season
+  freshProjection: boolean = false,  // If true, ignore current standings and simulate full season
+  options: FastSimOptions = {}
 ): FastSimSummary => {
   // Calculate BASE team strengths (will be varied per simulation)
   const baseStrengths: Record<string, TeamStrength> = {};
@@ -246,23 +388,24 @@ export const runFastSim = (
   const remainingGames = freshProjection 
     ? schedule.filter(g => !g.isPostseason)
     : schedule.filter(g => !g.played && !g.isPostseason);
+  // Draw keys: teams by position, games by position in the schedule (stable across runs)
+  const scheduleIndex = new Map(schedule.map((g, i) => [g, i]));
+  const simGames = remainingGames
+    .filter(g => baseStrengths[g.homeTeamId] && baseStrengths[g.awayTeamId])
+    .map(g => ({ game: g, key: teams.length + scheduleIndex.get(g)! }));
 
-  const winsTotals: Record<string, number[]> = {};
   const playoffCounts: Record<string, number> = {};
   const divisionCounts: Record<string, number> = {};
   const wildCardCounts: Record<string, number> = {};
   const pennantCounts: Record<string, number> = {};
   const wsCounts: Record<string, number> = {};
-  const winsDist: Record<string, Record<number, number>> = {};
 
   teams.forEach(t => {
-    winsTotals[t.id] = [];
     playoffCounts[t.id] = 0;
     divisionCounts[t.id] = 0;
     wildCardCounts[t.id] = 0;
     pennantCounts[t.id] = 0;
     wsCounts[t.id] = 0;
-    winsDist[t.id] = {};
   });
 
   const mvpAL: Record<string, number> = {};
@@ -272,102 +415,135 @@ export const runFastSim = (
   const royAL: Record<string, number> = {};
   const royNL: Record<string, number> = {};
 
-  for (let sim = 0; sim < simulations; sim++) {
-    const wins: Record<string, number> = { ...baseWins };
-    const losses: Record<string, number> = { ...baseLosses };
-    
-    // CRITICAL: Generate per-simulation variance in team strengths
-    // This models season-to-season variance: injuries, breakouts, regression, luck
-    const simStrengths = getSimulationStrengths(baseStrengths);
-
-    for (const game of remainingGames) {
-      const homeStrength = simStrengths[game.homeTeamId];
-      const awayStrength = simStrengths[game.awayTeamId];
-      if (!homeStrength || !awayStrength) continue;
-
-      const pHome = winProbability(homeStrength, awayStrength);
-      if (Math.random() < pHome) {
-        wins[game.homeTeamId]++;
-        losses[game.awayTeamId]++;
-      } else {
-        wins[game.awayTeamId]++;
-        losses[game.homeTeamId]++;
-      }
-    }
+  const seed = options.seed ?? Math.floor(Math.random() * 4294967296);
+  // Antithetic runs share one set of draws per pair; stratification spreads the strength
+  // draws of a batch's pairs (or single simulations) over equal-probability strata
+  const units = options.antithetic ? BATCH_SIZE / 2 : BATCH_SIZE;
+  const maxBatches = Math.max(1, Math.ceil(simulations / BATCH_SIZE));
+  const countMaps = [playoffCounts, divisionCounts, wildCardCounts, pennantCounts, wsCounts];
+  const batchMeanSums = ODDS_FIELDS.map(() => new Float64Array(teams.length));
+  const batchMeanSquares = ODDS_FIELDS.map(() => new Float64Array(teams.length));
+  let batches = 0;
+
+  // 95% CI half-width of one field for team t, in percentage points
+  const halfWidth = (field: number, t: number): number => {
+    if (batches < 2) return 100;
+    const m = batchMeanSums[field][t] / batches;
+    const variance = Math.max(0, (batchMeanSquares[field][t] - batches * m * m) / (batches - 1));
+    return Z_95 * Math.sqrt(variance / batches) * 100;
+  };
 
-    teams.forEach(t => {
-      winsTotals[t.id].push(wins[t.id]);
-      const dist = winsDist[t.id];
-      dist[wins[t.id]] = (dist[wins[t.id]] || 0) + 1;
-    });
+  while (batches < maxBatches) {
+    const strata = options.stratified ? teams.map((_, t) => stratumPermutation(seed, batches, t, units)) : null;
+    const before = countMaps.map(counts => teams.map(t => counts[t.id]));
+
+    for (let j = 0; j < BATCH_SIZE; j++) {
+      const unit = options.antithetic ? j >> 1 : j;
+      const draw = batches * units + unit;
+      const mirrored = options.antithetic && (j & 1) === 1;
+      const uniform = (u: number) => (mirrored ? 1 - u : u);
+
+      const wins: Record<string, number> = { ...baseWins };
+      const losses: Record<string, number> = { ...baseLosses };
+
+      // CRITICAL: Generate per-simulation variance in team strengths
+      // This models season-to-season variance: injuries, breakouts, regression, luck
+      const overall: Record<string, number> = {};
+      teams.forEach((t, i) => {
+        let u = keyedUniform(seed, draw, i);
+        if (strata) u = (strata[i][unit] + u) / units;
+        const z = inverseNormalCdf(uniform(u));
+        overall[t.id] = clamp(baseStrengths[t.id].overall + z * STRENGTH_SD, MIN_OVERALL, MAX_OVERALL);
+      });
 
-    const leagueChampions: Record<'AL' | 'NL', string> = { AL: '', NL: '' };
+      // The per-game variance draw only matters through its mean, so each game is a single
+      // draw against expectedWinProbability (same outcome distribution as winProbability)
+      for (const { game, key } of simGames) {
+        const pHome = expectedWinProbability(overall[game.homeTeamId], overall[game.awayTeamId]);
+        if (uniform(keyedUniform(seed, draw, key)) < pHome) {
+          wins[game.homeTeamId]++;
+          losses[game.awayTeamId]++;
+        } else {
+          wins[game.awayTeamId]++;
+          losses[game.homeTeamId]++;
+        }
+      }
 
-    (['AL', 'NL'] as const).forEach(league => {
-      const leagueTeams = getLeagueTeams(teams, league);
-      const divisionWinners = getDivisionWinners(teams, wins, league);
-      const wildcards = getWildcardTeams(teams, wins, league, divisionWinners);
+      // Postseason: exact bracket odds for this simulation's seeding and strengths
+      const field = getPlayoffField(teams, wins);
+      const postseason = getPostseasonOdds(field, wins, overall);
 
-      divisionWinners.forEach(team => {
-        divisionCounts[team.id]++;
-        playoffCounts[team.id]++;
+      field.divisionWinners.forEach(teamId => {
+        divisionCounts[teamId]++;
+        playoffCounts[teamId]++;
       });
-      wildcards.forEach(team => {
-        wildCardCounts[team.id]++;
-        playoffCounts[team.id]++;
+      field.wildCards.forEach(teamId => {
+        wildCardCounts[teamId]++;
+        playoffCounts[teamId]++;
       });
+      Object.entries(postseason.pennant).forEach(([teamId, p]) => { pennantCounts[teamId] += p; });
+      Object.entries(postseason.worldSeries).forEach(([teamId, p]) => { wsCounts[teamId] += p; });
+
+      const awardNoise = (key: number) => keyedUniform(seed, draw, key);
+      const awardsAL = computeAwardWinners(teams, wins, 'AL', awardNoise);
+      const awardsNL = computeAwardWinners(teams, wins, 'NL', awardNoise);
+
+      if (awardsAL.mvp) mvpAL[awardsAL.mvp.id] = (mvpAL[awardsAL.mvp.id] || 0) + 1;
+      if (awardsNL.mvp) mvpNL[awardsNL.mvp.id] = (mvpNL[awardsNL.mvp.id] || 0) + 1;
+      if (awardsAL.cy) cyAL[awardsAL.cy.id] = (cyAL[awardsAL.cy.id] || 0) + 1;
+      if (awardsNL.cy) cyNL[awardsNL.cy.id] = (cyNL[awardsNL.cy.id] || 0) + 1;
+      if (awardsAL.roy) royAL[awardsAL.roy.id] = (royAL[awardsAL.roy.id] || 0) + 1;
+      if (awardsNL.roy) royNL[awardsNL.roy.id] = (royNL[awardsNL.roy.id] || 0) + 1;
+    }
 
-      const seeds = [...divisionWinners, ...wildcards].sort((a, b) => wins[b.id] - wins[a.id]);
-      if (seeds.length < 6) return;
-
-      const wc1 = simulateSeries(seeds[2], seeds[5], simStrengths, 3);
-      const wc2 = simulateSeries(seeds[3], seeds[4], simStrengths, 3);
-
-      const ds1 = simulateSeries(seeds[0], teams.find(t => t.id === wc2)!, simStrengths, 5);
-      const ds2 = simulateSeries(seeds[1], teams.find(t => t.id === wc1)!, simStrengths, 5);
-
-      const csWinner = simulateSeries(teams.find(t => t.id === ds1)!, teams.find(t => t.id === ds2)!, simStrengths, 7);
-
-      pennantCounts[csWinner]++;
-      leagueChampions[league] = csWinner;
+    countMaps.forEach((counts, f) => {
+      teams.forEach((t, i) => {
+        const batchMean = (counts[t.id] - before[f][i]) / BATCH_SIZE;
+        batchMeanSums[f][i] += batchMean;
+        batchMeanSquares[f][i] += batchMean * batchMean;
+      });
     });
+    batches++;
 
-    if (leagueChampions.AL && leagueChampions.NL) {
-      const wsWinner = simulateSeries(
-        teams.find(t => t.id === leagueChampions.AL)!,
-        teams.find(t => t.id === leagueChampions.NL)!,
-        simStrengths,
-        7
-      );
-      wsCounts[wsWinner]++;
+    if (options.targetWidth !== undefined && batches >= MIN_BATCHES) {
+      const playoff = ODDS_FIELDS.indexOf('playoffPct');
+      const worldSeries = ODDS_FIELDS.indexOf('worldSeriesPct');
+      const widest = Math.max(...teams.flatMap((_, i) => [halfWidth(playoff, i), halfWidth(worldSeries, i)])) * 2;
+      if (widest <= options.targetWidth) break;
     }
-
-    const awardsAL = computeAwardWinners(teams, wins, 'AL');
-    const awardsNL = computeAwardWinners(teams, wins, 'NL');
-
-    if (awardsAL.mvp) mvpAL[awardsAL.mvp.id] = (mvpAL[awardsAL.mvp.id] || 0) + 1;
-    if (awardsNL.mvp) mvpNL[awardsNL.mvp.id] = (mvpNL[awardsNL.mvp.id] || 0) + 1;
-    if (awardsAL.cy) cyAL[awardsAL.cy.id] = (cyAL[awardsAL.cy.id] || 0) + 1;
-    if (awardsNL.cy) cyNL[awardsNL.cy.id] = (cyNL[awardsNL.cy.id] || 0) + 1;
-    if (awardsAL.roy) royAL[awardsAL.roy.id] = (royAL[awardsAL.roy.id] || 0) + 1;
-    if (awardsNL.roy) royNL[awardsNL.roy.id] = (royNL[awardsNL.roy.id] || 0) + 1;
   }
+  const completed = batches * BATCH_SIZE;
+
+  // Win totals don't need the sampled seasons: each team's distribution is computed exactly
+  // over the same strength-variance model
+  const overall: Record<string, number> = {};
+  teams.forEach(t => { overall[t.id] = baseStrengths[t.id].overall; });
+  const winDistributions = computeWinDistributions(remainingGames, baseWins, {
+    base: overall,
+    sd: STRENGTH_SD,
+    min: MIN_OVERALL,
+    max: MAX_OVERALL,
+    gameProbability: expectedWinProbability
+  });
 
   const teamOdds: Record<string, TeamOdds> = {};
-  teams.forEach(t => {
-    const winList = winsTotals[t.id];
-    const total = Math.max(1, simulations);
+  teams.forEach((t, i) => {
+    const winDistribution = winDistributions[t.id];
+    const total = Math.max(1, completed);
+    const errors = {} as Record<OddsField, number>;
+    ODDS_FIELDS.forEach((field, f) => { errors[field] = halfWidth(f, i); });
     teamOdds[t.id] = {
       teamId: t.id,
       teamName: `${t.city} ${t.name}`,
-      meanWins: mean(winList),
-      meanLosses: 162 - mean(winList),
+      meanWins: winDistribution.mean,
+      meanLosses: 162 - winDistribution.mean,
       playoffPct: (playoffCounts[t.id] / total) * 100,
       divisionPct: (divisionCounts[t.id] / total) * 100,
       wildCardPct: (wildCardCounts[t.id] / total) * 100,
       pennantPct: (pennantCounts[t.id] / total) * 100,
       worldSeriesPct: (wsCounts[t.id] / total) * 100,
-      winsDist: winsDist[t.id]
+      winsDist: winDistribution.dist,
+      errors
     };
   });
 
@@ -377,7 +553,7 @@ export const runFastSim = (
         const team = teams.find(t => t.roster.some(p => p.id === id));
         const player = team?.roster.find(p => p.id === id);
         return player
-          ? { playerId: player.id, name: player.name, teamId: team!.id, probability: (count / simulations) * 100 }
+          ? { playerId: player.id, name: player.name, teamId: team!.id, probability: (count / completed) * 100 }
           : null;
       })
       .filter((entry): entry is AwardEntry => entry !== null)
@@ -395,6 +571,6 @@ export const runFastSim = (
       royAL: toAwardEntries(royAL),
       royNL: toAwardEntries(royNL)
     },
-    simulations
+    simulations: completed
   };
 };
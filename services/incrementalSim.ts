@@ -0,0 +1,388 @@
+import { Team, GameResult } from "../types";
+import {
+  AwardOdds,
+  FastSimSummary,
+  MAX_OVERALL,
+  MIN_OVERALL,
+  STRENGTH_SD,
+  TeamOdds,
+  TeamStrength,
+  computeAwardWinners,
+  expectedWinProbability,
+  getPlayoffField,
+  getPostseasonOdds,
+  getSimulationStrengths,
+  getTeamStrength,
+  winProbability,
+} from "./fastSim";
+
+// Live projection mode: instead of rerunning runFastSim after every game, keep the simulated
+// seasons (strength draws and per-game outcomes) and fold each real result into them.
+//
+// A real result replaces that game's simulated outcome in every season, and each season is
+// reweighted by the probability of the real result under its own strength draw (importance
+// weights, kept in log space). Seasons whose draws explain the results badly fade out, so
+// strengths are conditioned on what has actually happened. When the effective sample size
+// drops below a threshold the seasons are resampled in proportion to their weights; duplicated
+// seasons get a Metropolis step on their strength draws (so copies don't stay identical) and
+// fresh outcomes for the games still to be played.
+//
+// A season's bracket odds are only recomputed when a result changes its playoff field, seeding
+// or World Series home field, so an update takes tens of milliseconds instead of the seconds a
+// rerun takes; a resample costs a fraction of a rerun and happens every few dozen games. Award
+// winners are drawn once per season (one win moves a candidate's score by under 0.1 against +/-8
+// of noise) and redrawn for resampled copies.
+
+export interface IncrementalSim {
+  teams: Team[];
+  teamIds: string[];
+  baseOverall: Float64Array;       // [team] overall before the per-season draw
+  baseWins: Int16Array;            // [team] wins already banked when the ensemble was built
+  games: GameResult[];             // games unplayed when the ensemble was built (columns)
+  gameIndex: Map<string, number>;  // game id -> column
+  home: Int16Array;                // [game] team index
+  away: Int16Array;
+  applied: Uint8Array;             // [game] 1 = replaced by its real result
+  teamResults: number[][];         // [team] applied columns involving the team
+  simulations: number;
+  overall: Float64Array;           // [sim * teams + team] strength draw
+  outcomes: Uint8Array;            // [sim * games + game] 1 = home win
+  wins: Int16Array;                // [sim * teams + team] final wins
+  logWeights: Float64Array;        // [sim]
+  // Per-season postseason cache, checked only for seasons marked dirty
+  playoff: Uint8Array;             // [sim * teams + team] 1 = division winner, 2 = wild card
+  pennant: Float64Array;           // [sim * teams + team] P(pennant) in that season
+  worldSeries: Float64Array;
+  fieldKeys: string[];             // [sim] seeding + World Series home field the odds were computed for
+  awards: string[][];              // [sim] award winner ids, in AWARD_KEYS order
+  dirty: Uint8Array;               // [sim] wins changed since the postseason was computed
+  resampleThreshold: number;       // resample when ESS < threshold * simulations
+  resamples: number;
+}
+
+const AWARD_KEYS = ['mvpAL', 'mvpNL', 'cyAL', 'cyNL', 'royAL', 'royNL'] as const;
+
+const DEFAULT_RESAMPLE_THRESHOLD = 0.5;
+
+// Random-walk step for the strength moves after a resample
+const MOVE_SD = 1.5;
+
+const standardNormal = () => Math.sqrt(-2 * Math.log(1 - Math.random())) * Math.cos(2 * Math.PI * Math.random());
+
+const simRecord = (sim: IncrementalSim, values: ArrayLike<number>, s: number): Record<string, number> => {
+  const record: Record<string, number> = {};
+  const offset = s * sim.teamIds.length;
+  sim.teamIds.forEach((id, t) => { record[id] = values[offset + t]; });
+  return record;
+};
+
+// Draw fresh outcomes for every column not yet replaced by a real result, then recount wins
+const simulateSeason = (sim: IncrementalSim, s: number) => {
+  const nTeams = sim.teamIds.length;
+  const nGames = sim.games.length;
+  const row = s * nTeams;
+  const wins = sim.wins.subarray(row, row + nTeams);
+  wins.set(sim.baseWins);
+
+  for (let g = 0; g < nGames; g++) {
+    const cell = s * nGames + g;
+    if (!sim.applied[g]) {
+      const pHome = winProbability(sim.overall[row + sim.home[g]], sim.overall[row + sim.away[g]]);
+      sim.outcomes[cell] = Math.random() < pHome ? 1 : 0;
+    }
+    wins[sim.outcomes[cell] ? sim.home[g] : sim.away[g]]++;
+  }
+  sim.dirty[s] = 1;
+};
+
+const drawAwards = (sim: IncrementalSim, s: number) => {
+  const wins = simRecord(sim, sim.wins, s);
+  const al = computeAwardWinners(sim.teams, wins, 'AL');
+  const nl = computeAwardWinners(sim.teams, wins, 'NL');
+  sim.awards[s] = [al.mvp, nl.mvp, al.cy, nl.cy, al.roy, nl.roy].map(player => player?.id ?? '');
+};
+
+// Log-likelihood of team t's applied results in season s, with its strength set to `strength`
+const teamLogLikelihood = (sim: IncrementalSim, s: number, t: number, strength: number): number => {
+  const row = s * sim.teamIds.length;
+  let logLikelihood = 0;
+  for (const g of sim.teamResults[t]) {
+    const pHome = sim.home[g] === t
+      ? expectedWinProbability(strength, sim.overall[row + sim.away[g]])
+      : expectedWinProbability(sim.overall[row + sim.home[g]], strength);
+    logLikelihood += Math.log(sim.outcomes[s * sim.games.length + g] ? pHome : 1 - pHome);
+  }
+  return logLikelihood;
+};
+
+// One Metropolis sweep over season s's strength draws, targeting the strength prior times the
+// likelihood of the results applied so far (leaves the weighted ensemble's distribution unchanged)
+const moveStrengths = (sim: IncrementalSim, s: number) => {
+  const row = s * sim.teamIds.length;
+  for (let t = 0; t < sim.teamIds.length; t++) {
+    const current = sim.overall[row + t];
+    const proposal = current + MOVE_SD * standardNormal();
+    if (proposal < MIN_OVERALL || proposal > MAX_OVERALL) continue;
+    const base = sim.baseOverall[t];
+    const logPrior = ((current - base) ** 2 - (proposal - base) ** 2) / (2 * STRENGTH_SD * STRENGTH_SD);
+    const logRatio = logPrior + teamLogLikelihood(sim, s, t, proposal) - teamLogLikelihood(sim, s, t, current);
+    if (Math.log(Math.random()) < logRatio) sim.overall[row + t] = proposal;
+  }
+};
+
+export const createIncrementalSim = (
+  teams: Team[],
+  schedule: GameResult[],
+  simulations: number,
+  resampleThreshold: number = DEFAULT_RESAMPLE_THRESHOLD
+): IncrementalSim => {
+  const teamIds = teams.map(t => t.id);
+  const teamIndex: Record<string, number> = {};
+  teamIds.forEach((id, t) => { teamIndex[id] = t; });
+  const games = schedule.filter(g =>
+    !g.played && !g.isPostseason && teamIndex[g.homeTeamId] !== undefined && teamIndex[g.awayTeamId] !== undefined
+  );
+  const nTeams = teamIds.length;
+
+  const baseStrengths: Record<string, TeamStrength> = {};
+  teams.forEach(t => { baseStrengths[t.id] = getTeamStrength(t); });
+
+  const sim: IncrementalSim = {
+    teams,
+    teamIds,
+    baseOverall: Float64Array.from(teamIds, id => baseStrengths[id].overall),
+    baseWins: Int16Array.from(teams, t => t.wins),
+    games,
+    gameIndex: new Map(games.map((g, i) => [g.id, i])),
+    home: Int16Array.from(games, g => teamIndex[g.homeTeamId]),
+    away: Int16Array.from(games, g => teamIndex[g.awayTeamId]),
+    applied: new Uint8Array(games.length),
+    teamResults: teamIds.map(() => []),
+    simulations,
+    overall: new Float64Array(simulations * nTeams),
+    outcomes: new Uint8Array(simulations * games.length),
+    wins: new Int16Array(simulations * nTeams),
+    logWeights: new Float64Array(simulations),
+    playoff: new Uint8Array(simulations * nTeams),
+    pennant: new Float64Array(simulations * nTeams),
+    worldSeries: new Float64Array(simulations * nTeams),
+    fieldKeys: new Array(simulations).fill(''),
+    awards: new Array(simulations),
+    dirty: new Uint8Array(simulations),
+    resampleThreshold,
+    resamples: 0,
+  };
+
+  for (let s = 0; s < simulations; s++) {
+    const strengths = getSimulationStrengths(baseStrengths);
+    teamIds.forEach((id, t) => { sim.overall[s * nTeams + t] = strengths[id].overall; });
+    simulateSeason(sim, s);
+    drawAwards(sim, s);
+  }
+  return sim;
+};
+
+export const effectiveSampleSize = (sim: IncrementalSim): number => {
+  let sum = 0;
+  let sumSquares = 0;
+  sim.logWeights.forEach(lw => {
+    const w = Math.exp(lw);
+    sum += w;
+    sumSquares += w * w;
+  });
+  return sumSquares > 0 ? (sum * sum) / sumSquares : 0;
+};
+
+// Systematic resampling by weight. The first copy of a season is kept as is; further copies
+// get a strength move, fresh outcomes for the unplayed games and fresh award winners.
+const resample = (sim: IncrementalSim) => {
+  const n = sim.simulations;
+  const nTeams = sim.teamIds.length;
+  const nGames = sim.games.length;
+  const weights = Array.from(sim.logWeights, Math.exp);
+  const total = weights.reduce((a, b) => a + b, 0);
+
+  const parents = new Int32Array(n);
+  const step = total / n;
+  let u = Math.random() * step;
+  let cumulative = weights[0];
+  let source = 0;
+  for (let s = 0; s < n; s++) {
+    while (u > cumulative && source < n - 1) cumulative += weights[++source];
+    parents[s] = source;
+    u += step;
+  }
+
+  const overall = sim.overall.slice();
+  const outcomes = sim.outcomes.slice();
+  const wins = sim.wins.slice();
+  const playoff = sim.playoff.slice();
+  const pennant = sim.pennant.slice();
+  const worldSeries = sim.worldSeries.slice();
+  const fieldKeys = sim.fieldKeys.slice();
+  const awards = sim.awards.slice();
+  const dirty = sim.dirty.slice();
+  const seen = new Uint8Array(n);
+
+  parents.forEach((parent, s) => {
+    const from = parent * nTeams;
+    const to = s * nTeams;
+    sim.overall.set(overall.subarray(from, from + nTeams), to);
+    sim.outcomes.set(outcomes.subarray(parent * nGames, (parent + 1) * nGames), s * nGames);
+    if (!seen[parent]) {
+      seen[parent] = 1;
+      sim.wins.set(wins.subarray(from, from + nTeams), to);
+      sim.playoff.set(playoff.subarray(from, from + nTeams), to);
+      sim.pennant.set(pennant.subarray(from, from + nTeams), to);
+      sim.worldSeries.set(worldSeries.subarray(from, from + nTeams), to);
+      sim.fieldKeys[s] = fieldKeys[parent];
+      sim.awards[s] = awards[parent];
+      sim.dirty[s] = dirty[parent];
+    } else {
+      moveStrengths(sim, s);
+      simulateSeason(sim, s);
+      drawAwards(sim, s);
+      sim.fieldKeys[s] = '';
+    }
+  });
+  sim.logWeights.fill(0);
+  sim.resamples++;
+};
+
+// Fold newly played games into the ensemble. Returns how many were applied, or null when the
+// schedule no longer matches it (a cached result was undone) and the caller should rebuild.
+export const applyResults = (sim: IncrementalSim, schedule: GameResult[]): number | null => {
+  const nTeams = sim.teamIds.length;
+  const nGames = sim.games.length;
+  let applied = 0;
+
+  for (const game of schedule) {
+    const g = sim.gameIndex.get(game.id);
+    if (g === undefined) continue;
+    if (!game.played) {
+      if (sim.applied[g]) return null;
+      continue;
+    }
+    if (sim.applied[g]) continue;
+    sim.applied[g] = 1;
+    applied++;
+
+    const outcome = game.winnerId === game.homeTeamId ? 1 : 0;
+    const home = sim.home[g];
+    const away = sim.away[g];
+    sim.teamResults[home].push(g);
+    sim.teamResults[away].push(g);
+    for (let s = 0; s < sim.simulations; s++) {
+      const pHome = expectedWinProbability(sim.overall[s * nTeams + home], sim.overall[s * nTeams + away]);
+      sim.logWeights[s] += Math.log(outcome ? pHome : 1 - pHome);
+
+      const cell = s * nGames + g;
+      if (sim.outcomes[cell] !== outcome) {
+        // This season had the game going the other way: move the win
+        sim.outcomes[cell] = outcome;
+        sim.wins[s * nTeams + (outcome ? home : away)]++;
+        sim.wins[s * nTeams + (outcome ? away : home)]--;
+        sim.dirty[s] = 1;
+      }
+    }
+  }
+
+  if (applied === 0) return 0;
+
+  // Renormalize so the largest weight is 1 (keeps exp() in range)
+  const maxLogWeight = sim.logWeights.reduce((a, b) => Math.max(a, b), -Infinity);
+  for (let s = 0; s < sim.simulations; s++) sim.logWeights[s] -= maxLogWeight;
+
+  if (effectiveSampleSize(sim) < sim.resampleThreshold * sim.simulations) resample(sim);
+  return applied;
+};
+
+const refreshPostseason = (sim: IncrementalSim) => {
+  const nTeams = sim.teamIds.length;
+  for (let s = 0; s < sim.simulations; s++) {
+    if (!sim.dirty[s]) continue;
+    sim.dirty[s] = 0;
+    const wins = simRecord(sim, sim.wins, s);
+    const field = getPlayoffField(sim.teams, wins);
+    // The bracket odds depend on the wins only through the seeding and World Series home field
+    const homeField = field.seeds.AL.map(al => field.seeds.NL.map(nl => (wins[al] >= wins[nl] ? 1 : 0)).join('')).join('');
+    const key = `${field.seeds.AL.join()}|${field.seeds.NL.join()}|${homeField}`;
+    if (key === sim.fieldKeys[s]) continue;
+    sim.fieldKeys[s] = key;
+
+    const odds = getPostseasonOdds(field, wins, simRecord(sim, sim.overall, s));
+    const row = s * nTeams;
+    sim.teamIds.forEach((id, t) => {
+      sim.playoff[row + t] = 0;
+      sim.pennant[row + t] = odds.pennant[id] || 0;
+      sim.worldSeries[row + t] = odds.worldSeries[id] || 0;
+    });
+    field.divisionWinners.forEach(id => { sim.playoff[row + sim.teamIds.indexOf(id)] = 1; });
+    field.wildCards.forEach(id => { sim.playoff[row + sim.teamIds.indexOf(id)] = 2; });
+  }
+};
+
+// Weighted odds over the ensemble, in the same shape runFastSim returns
+export const summarizeIncrementalSim = (sim: IncrementalSim): FastSimSummary => {
+  refreshPostseason(sim);
+  const nTeams = sim.teamIds.length;
+  const weights = Array.from(sim.logWeights, Math.exp);
+  const total = weights.reduce((a, b) => a + b, 0) || 1;
+
+  const teamOdds: Record<string, TeamOdds> = {};
+  sim.teams.forEach((team, t) => {
+    let meanWins = 0;
+    let division = 0;
+    let wildCard = 0;
+    let pennant = 0;
+    let worldSeries = 0;
+    const winsDist: Record<number, number> = {};
+    weights.forEach((w, s) => {
+      const cell = s * nTeams + t;
+      const p = w / total;
+      meanWins += p * sim.wins[cell];
+      winsDist[sim.wins[cell]] = (winsDist[sim.wins[cell]] || 0) + p;
+      if (sim.playoff[cell] === 1) division += p;
+      if (sim.playoff[cell] === 2) wildCard += p;
+      pennant += p * sim.pennant[cell];
+      worldSeries += p * sim.worldSeries[cell];
+    });
+    teamOdds[team.id] = {
+      teamId: team.id,
+      teamName: `${team.city} ${team.name}`,
+      meanWins,
+      meanLosses: 162 - meanWins,
+      playoffPct: (division + wildCard) * 100,
+      divisionPct: division * 100,
+      wildCardPct: wildCard * 100,
+      pennantPct: pennant * 100,
+      worldSeriesPct: worldSeries * 100,
+      winsDist,
+    };
+  });
+
+  const players = new Map(sim.teams.flatMap(t => t.roster.map(p => [p.id, { player: p, teamId: t.id }] as const)));
+  const awardOdds = {} as AwardOdds;
+  AWARD_KEYS.forEach((key, k) => {
+    const shares: Record<string, number> = {};
+    weights.forEach((w, s) => {
+      const id = sim.awards[s][k];
+      if (id) shares[id] = (shares[id] || 0) + w / total;
+    });
+    awardOdds[key] = Object.entries(shares)
+      .filter(([id]) => players.has(id))
+      .map(([id, share]) => {
+        const { player, teamId } = players.get(id)!;
+        return { playerId: id, name: player.name, teamId, probability: share * 100 };
+      })
+      .sort((a, b) => b.probability - a.probability)
+      .slice(0, 10);
+  });
+
+  return {
+    teamOdds,
+    awardOdds,
+    simulations: sim.simulations,
+    effectiveSimulations: effectiveSampleSize(sim),
+  };
+};
@@ -0,0 +1,895 @@
+import { GameResult, Player, SeasonState, Team } from "../types";
+
+// Compact league-state snapshots: checkpoint a season, branch it and restore it in milliseconds.
+//
+// A snapshot holds the league as typed tables instead of object graphs. Scalar fields become
+// columns (one Float64Array cell per row and key, strings as indices into an interned pool),
+// numeric records (statsCounters, seasonStats, batting/pitching/defense) become tables keyed by
+// their fields, and everything else (history, Savant data, staff, game logs, box scores and
+// replays) is packed once into a tagged binary form whose object shapes and strings are interned
+// too. The static section (identities, ratings, rosters, history) changes only with roster moves
+// and offseasons; the state section (records, counters, injuries, schedule) changes every day.
+//
+// Snapshots are immutable. A snapshot taken with the previous one reuses its static section and
+// every packed value whose source object hasn't changed (a played game is packed once), so a
+// daily checkpoint only touches what changed. diffLeagueSnapshots gives the cells that changed
+// between two snapshots; the binary format is that delta against an empty league. Restoring
+// builds fresh objects, so a restore doubles as a fork: a what-if branch is a restore, simulated
+// on, with snapshots that keep sharing the trunk's static section and string pool.
+
+export interface InternPool {
+  strings: string[];
+  stringIndex: Map<string, number>;
+  shapes: number[][];               // object key lists, as string indices
+  shapeIndex: Map<string, number>;
+}
+
+// Columns of scalar fields: number, string (pool index) or boolean (0/1) per key
+export interface FieldTable {
+  rows: number;
+  keys: string[];
+  kinds: Uint8Array;       // [key] FIELD_NUMBER | FIELD_STRING | FIELD_BOOLEAN
+  present: Uint8Array;     // [row] 0 = the record itself is absent (e.g. no batting stats yet)
+  defined: Uint8Array;     // [row * keys + key] 0 = field absent
+  values: Float64Array;    // [row * keys + key]
+}
+
+export interface StaticSection {
+  teams: FieldTable;
+  teamExtras: Uint8Array[];      // [team] packed remaining fields (staff, front office, ...)
+  rosterStart: Int32Array;       // [team] first player row; players are stored team by team
+  players: FieldTable;
+  attributes: FieldTable;
+  playerExtras: Uint8Array[];    // [player] packed remaining fields (history, Savant data, ...)
+  sources?: unknown[][];         // in memory only: the values behind each extras entry
+}
+
+export interface StateSection {
+  date: string;
+  phase: SeasonState['phase'];
+  isPlaying: boolean;
+  postseason: Uint8Array;
+  tables: Record<StateTable, FieldTable>;
+  gameDetails: Uint8Array[];     // [game] packed log, box score, replay, ...
+  gameSources?: unknown[][];     // in memory only
+}
+
+export interface LeagueSnapshot {
+  format: 'league-snapshot';
+  version: number;
+  pool: InternPool;              // shared and append-only across a snapshot's descendants
+  stringCount: number;
+  shapeCount: number;
+  static: StaticSection;
+  state: StateSection;
+}
+
+// Changed cells of one table; cells not listed keep the base value, or (1, 0) for new rows
+export interface TableDelta {
+  rows: number;
+  keys: string[];
+  kinds: Uint8Array;
+  rebased: boolean;              // keys changed: nothing is kept from the base table
+  present: Uint8Array;
+  cells: Uint32Array;
+  defined: Uint8Array;           // [changed cell]
+  values: Float64Array;
+}
+
+export interface PackedDelta {
+  count: number;
+  indices: Uint32Array;
+  values: Uint8Array[];
+}
+
+export interface LeagueSnapshotDelta {
+  format: 'league-snapshot-delta';
+  version: number;
+  baseStringCount: number;
+  baseShapeCount: number;
+  strings: string[];             // pool entries added since the base
+  shapes: number[][];
+  static?: {
+    tables: Record<StaticTable, TableDelta>;
+    rosterStart: Int32Array;
+    teamExtras: PackedDelta;
+    playerExtras: PackedDelta;
+  };
+  state: {
+    date: string;
+    phase: SeasonState['phase'];
+    isPlaying: boolean;
+    postseason: Uint8Array;
+    tables: Partial<Record<StateTable, TableDelta>>;
+    gameDetails: PackedDelta;
+  };
+}
+
+type StaticTable = 'teams' | 'players' | 'attributes';
+type StateTable = 'teams' | 'players' | 'injuries' | 'counters' | 'seasonStats' | 'batting' | 'pitching' | 'defense' | 'games';
+
+const SNAPSHOT_VERSION = 1;
+
+const FIELD_NUMBER = 0;
+const FIELD_STRING = 1;
+const FIELD_BOOLEAN = 2;
+
+// Columns of the fixed tables; everything else on a team, player or game goes to its extras
+const TEAM_STATIC_KEYS = ['id', 'mlbId', 'city', 'name', 'abbreviation', 'logoUrl', 'stadium', 'league', 'division', 'primaryColor', 'secondaryColor', 'isRosterGenerated'];
+const TEAM_STATE_KEYS = ['wins', 'losses', 'runsScored', 'runsAllowed'];
+const PLAYER_STATIC_KEYS = ['id', 'name', 'position', 'isTwoWay', 'number', 'age', 'rating', 'potential', 'trait'];
+const PLAYER_STATE_KEYS = ['daysRest', 'rotationSlot'];
+const PLAYER_RECORDS: [StateTable, keyof Player][] = [
+  ['injuries', 'injury'], ['counters', 'statsCounters'], ['seasonStats', 'seasonStats'],
+  ['batting', 'batting'], ['pitching', 'pitching'], ['defense', 'defense']
+];
+const GAME_KEYS = ['id', 'date', 'homeTeamId', 'awayTeamId', 'homeScore', 'awayScore', 'innings', 'winnerId', 'played', 'isPostseason', 'seriesId', 'replaySeed', 'stadium'];
+
+const TEAM_COLUMNS = new Set([...TEAM_STATIC_KEYS, ...TEAM_STATE_KEYS, 'roster']);
+const PLAYER_COLUMNS = new Set([...PLAYER_STATIC_KEYS, ...PLAYER_STATE_KEYS, 'attributes', ...PLAYER_RECORDS.map(([, key]) => key as string)]);
+const GAME_COLUMNS = new Set(GAME_KEYS);
+
+const STATIC_TABLES: StaticTable[] = ['teams', 'players', 'attributes'];
+const STATE_TABLES: StateTable[] = ['teams', 'players', 'injuries', 'counters', 'seasonStats', 'batting', 'pitching', 'defense', 'games'];
+
+// ---------------------------------------------------------------------------
+// Interning and byte streams
+// ---------------------------------------------------------------------------
+
+const createPool = (): InternPool => ({ strings: [], stringIndex: new Map(), shapes: [], shapeIndex: new Map() });
+
+const intern = (pool: InternPool, value: string): number => {
+  let index = pool.stringIndex.get(value);
+  if (index === undefined) {
+    index = pool.strings.length;
+    pool.strings.push(value);
+    pool.stringIndex.set(value, index);
+  }
+  return index;
+};
+
+const internShape = (pool: InternPool, keys: string[]): number => {
+  const key = keys.join('\u0000');
+  let index = pool.shapeIndex.get(key);
+  if (index === undefined) {
+    index = pool.shapes.length;
+    pool.shapes.push(keys.map(k => intern(pool, k)));
+    pool.shapeIndex.set(key, index);
+  }
+  return index;
+};
+
+interface ByteWriter {
+  bytes: Uint8Array;
+  view: DataView;
+  length: number;
+}
+
+interface ByteReader {
+  bytes: Uint8Array;
+  view: DataView;
+  offset: number;
+}
+
+const createWriter = (capacity = 256): ByteWriter => {
+  const bytes = new Uint8Array(capacity);
+  return { bytes, view: new DataView(bytes.buffer), length: 0 };
+};
+
+const reserve = (w: ByteWriter, n: number) => {
+  if (w.length + n <= w.bytes.length) return;
+  const bytes = new Uint8Array(Math.max(w.bytes.length * 2, w.length + n));
+  bytes.set(w.bytes.subarray(0, w.length));
+  w.bytes = bytes;
+  w.view = new DataView(bytes.buffer);
+};
+
+const writeByte = (w: ByteWriter, value: number) => {
+  reserve(w, 1);
+  w.bytes[w.length++] = value;
+};
+
+// Unsigned LEB128 over the safe-integer range
+const writeUvarint = (w: ByteWriter, value: number) => {
+  reserve(w, 8);
+  while (value >= 0x80) {
+    w.bytes[w.length++] = (value % 0x80) | 0x80;
+    value = Math.floor(value / 0x80);
+  }
+  w.bytes[w.length++] = value;
+};
+
+const writeSvarint = (w: ByteWriter, value: number) => writeUvarint(w, value >= 0 ? value * 2 : -value * 2 - 1);
+
+const writeFloat64 = (w: ByteWriter, value: number) => {
+  reserve(w, 8);
+  w.view.setFloat64(w.length, value, true);
+  w.length += 8;
+};
+
+const writeBytes = (w: ByteWriter, bytes: Uint8Array) => {
+  writeUvarint(w, bytes.length);
+  reserve(w, bytes.length);
+  w.bytes.set(bytes, w.length);
+  w.length += bytes.length;
+};
+
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
+const writeString = (w: ByteWriter, value: string) => writeBytes(w, textEncoder.encode(value));
+
+const finishWriter = (w: ByteWriter): Uint8Array => w.bytes.slice(0, w.length);
+
+const createReader = (bytes: Uint8Array): ByteReader =>
+  ({ bytes, view: new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength), offset: 0 });
+
+const readByte = (r: ByteReader): number => r.bytes[r.offset++];
+
+const readUvarint = (r: ByteReader): number => {
+  let value = 0;
+  let scale = 1;
+  let byte: number;
+  do {
+    byte = r.bytes[r.offset++];
+    value += (byte & 0x7f) * scale;
+    scale *= 0x80;
+  } while (byte & 0x80);
+  return value;
+};
+
+const readSvarint = (r: ByteReader): number => {
+  const value = readUvarint(r);
+  return value % 2 === 0 ? value / 2 : -(value + 1) / 2;
+};
+
+const readFloat64 = (r: ByteReader): number => {
+  const value = r.view.getFloat64(r.offset, true);
+  r.offset += 8;
+  return value;
+};
+
+const readBytes = (r: ByteReader): Uint8Array => {
+  const length = readUvarint(r);
+  // A view: packed values decoded from one buffer keep sharing it
+  const bytes = r.bytes.subarray(r.offset, r.offset + length);
+  r.offset += length;
+  return bytes;
+};
+
+const readString = (r: ByteReader): string => textDecoder.decode(readBytes(r));
+
+// ---------------------------------------------------------------------------
+// Packed values: tagged binary for the schema-less parts
+// ---------------------------------------------------------------------------
+
+const TAG_NULL = 0;
+const TAG_FALSE = 1;
+const TAG_TRUE = 2;
+const TAG_INT = 3;
+const TAG_FLOAT = 4;
+const TAG_STRING = 5;
+const TAG_ARRAY = 6;
+const TAG_OBJECT = 7;
+const TAG_UNDEFINED = 8;
+
+const writeValue = (w: ByteWriter, pool: InternPool, value: unknown) => {
+  if (value === null) writeByte(w, TAG_NULL);
+  else if (value === undefined) writeByte(w, TAG_UNDEFINED);
+  else if (typeof value === 'boolean') writeByte(w, value ? TAG_TRUE : TAG_FALSE);
+  else if (typeof value === 'number') {
+    if (Number.isSafeInteger(value) && !Object.is(value, -0)) {
+      writeByte(w, TAG_INT);
+      writeSvarint(w, value);
+    } else {
+      writeByte(w, TAG_FLOAT);
+      writeFloat64(w, value);
+    }
+  } else if (typeof value === 'string') {
+    writeByte(w, TAG_STRING);
+    writeUvarint(w, intern(pool, value));
+  } else if (Array.isArray(value)) {
+    writeByte(w, TAG_ARRAY);
+    writeUvarint(w, value.length);
+    value.forEach(item => writeValue(w, pool, item));
+  } else {
+    // Like JSON: undefined fields are dropped
+    const record = value as Record<string, unknown>;
+    const keys = Object.keys(record).filter(k => record[k] !== undefined && typeof record[k] !== 'function');
+    writeByte(w, TAG_OBJECT);
+    writeUvarint(w, internShape(pool, keys));
+    keys.forEach(k => writeValue(w, pool, record[k]));
+  }
+};
+
+const readValue = (r: ByteReader, pool: InternPool): unknown => {
+  const tag = readByte(r);
+  switch (tag) {
+    case TAG_NULL: return null;
+    case TAG_UNDEFINED: return undefined;
+    case TAG_FALSE: return false;
+    case TAG_TRUE: return true;
+    case TAG_INT: return readSvarint(r);
+    case TAG_FLOAT: return readFloat64(r);
+    case TAG_STRING: return pool.strings[readUvarint(r)];
+    case TAG_ARRAY: {
+      const length = readUvarint(r);
+      const items = new Array(length);
+      for (let i = 0; i < length; i++) items[i] = readValue(r, pool);
+      return items;
+    }
+    case TAG_OBJECT: {
+      const shape = pool.shapes[readUvarint(r)];
+      const record: Record<string, unknown> = {};
+      shape.forEach(k => { record[pool.strings[k]] = readValue(r, pool); });
+      return record;
+    }
+    default:
+      throw new Error(`Corrupt snapshot value (tag ${tag})`);
+  }
+};
+
+const packValue = (pool: InternPool, value: unknown): Uint8Array => {
+  const w = createWriter();
+  writeValue(w, pool, value);
+  return finishWriter(w);
+};
+
+const unpackValue = (pool: InternPool, bytes: Uint8Array): unknown => readValue(createReader(bytes), pool);
+
+// Keys of a packed object, without unpacking its values
+const packedKeys = (pool: InternPool, bytes: Uint8Array): string[] => {
+  const r = createReader(bytes);
+  if (readByte(r) !== TAG_OBJECT) return [];
+  return pool.shapes[readUvarint(r)].map(k => pool.strings[k]);
+};
+
+// Fields of a record not stored in columns, in key order (for packing and reuse checks)
+const extrasOf = (record: object, columns: Set<string>): [string[], unknown[]] => {
+  const keys = Object.keys(record).filter(k => !columns.has(k) && (record as Record<string, unknown>)[k] !== undefined);
+  return [keys, keys.map(k => (record as Record<string, unknown>)[k])];
+};
+
+const sameSource = (a: unknown[] | undefined, b: unknown[]): boolean =>
+  !!a && a.length === b.length && a.every((v, i) => v === b[i]);
+
+// Packed extras, reusing the previous bytes when every source value is the same object
+const packExtras = (
+  pool: InternPool,
+  records: object[],
+  columns: Set<string>,
+  previousBytes?: Uint8Array[],
+  previousSources?: unknown[][],
+  previousIds?: (i: number) => string | undefined
+): { bytes: Uint8Array[]; sources: unknown[][] } => {
+  const bytes: Uint8Array[] = [];
+  const sources: unknown[][] = [];
+  records.forEach((record, i) => {
+    const [keys, values] = extrasOf(record, columns);
+    const source = [...keys, ...values];
+    const reusable = previousBytes && previousSources && previousIds &&
+      previousIds(i) === (record as { id?: string }).id && sameSource(previousSources[i], source);
+    bytes.push(reusable ? previousBytes![i] : packValue(pool, Object.fromEntries(keys.map((k, j) => [k, values[j]]))));
+    sources.push(source);
+  });
+  return { bytes, sources };
+};
+
+// ---------------------------------------------------------------------------
+// Field tables
+// ---------------------------------------------------------------------------
+
+const fieldKind = (value: unknown): number =>
+  (typeof value === 'string' ? FIELD_STRING : typeof value === 'boolean' ? FIELD_BOOLEAN : FIELD_NUMBER);
+
+const buildFieldTable = (pool: InternPool, records: (object | undefined)[], fixedKeys?: string[]): FieldTable => {
+  const keys = fixedKeys ? [...fixedKeys] : [];
+  const kinds: number[] = [];
+  if (!fixedKeys) {
+    const seen = new Set<string>();
+    records.forEach(record => {
+      if (!record) return;
+      Object.keys(record).forEach(k => { if (!seen.has(k)) { seen.add(k); keys.push(k); } });
+    });
+  }
+  keys.forEach(k => {
+    intern(pool, k);
+    const sample = records.find(r => r && (r as Record<string, unknown>)[k] !== undefined) as Record<string, unknown> | undefined;
+    kinds.push(sample ? fieldKind(sample[k]) : FIELD_NUMBER);
+  });
+
+  const width = keys.length;
+  const present = new Uint8Array(records.length);
+  const defined = new Uint8Array(records.length * width);
+  const values = new Float64Array(records.length * width);
+  records.forEach((record, row) => {
+    if (!record) return;
+    present[row] = 1;
+    const fields = record as Record<string, unknown>;
+    for (let k = 0; k < width; k++) {
+      const value = fields[keys[k]];
+      if (value === undefined || value === null) continue;
+      defined[row * width + k] = 1;
+      values[row * width + k] = kinds[k] === FIELD_STRING ? intern(pool, String(value)) : Number(value);
+    }
+  });
+  return { rows: records.length, keys, kinds: Uint8Array.from(kinds), present, defined, values };
+};
+
+const readFieldRow = (pool: InternPool, table: FieldTable, row: number): Record<string, unknown> | undefined => {
+  if (!table.present[row]) return undefined;
+  const width = table.keys.length;
+  const record: Record<string, unknown> = {};
+  for (let k = 0; k < width; k++) {
+    const cell = row * width + k;
+    if (!table.defined[cell]) continue;
+    const value = table.values[cell];
+    record[table.keys[k]] = table.kinds[k] === FIELD_STRING ? pool.strings[value] : table.kinds[k] === FIELD_BOOLEAN ? value !== 0 : value;
+  }
+  return record;
+};
+
+const sameKeys = (a: FieldTable, b: FieldTable): boolean =>
+  a.keys.length === b.keys.length && a.keys.every((k, i) => k === b.keys[i] && a.kinds[i] === b.kinds[i]);
+
+const sameTable = (a: FieldTable, b: FieldTable): boolean => {
+  if (a.rows !== b.rows || !sameKeys(a, b)) return false;
+  for (let i = 0; i < a.present.length; i++) if (a.present[i] !== b.present[i]) return false;
+  for (let i = 0; i < a.values.length; i++) {
+    if (a.defined[i] !== b.defined[i] || (a.defined[i] && !Object.is(a.values[i], b.values[i]))) return false;
+  }
+  return true;
+};
+
+const EMPTY_TABLE: FieldTable = {
+  rows: 0, keys: [], kinds: new Uint8Array(0), present: new Uint8Array(0), defined: new Uint8Array(0), values: new Float64Array(0)
+};
+
+const diffTable = (base: FieldTable, next: FieldTable): TableDelta => {
+  const rebased = !sameKeys(base, next);
+  const width = next.keys.length;
+  const kept = rebased ? 0 : Math.min(base.rows, next.rows) * width;
+  const cells: number[] = [];
+  for (let i = 0; i < next.values.length; i++) {
+    const changed = i < kept
+      ? next.defined[i] !== base.defined[i] || (next.defined[i] === 1 && !Object.is(next.values[i], base.values[i]))
+      : next.defined[i] !== 1 || !Object.is(next.values[i], 0);
+    if (changed) cells.push(i);
+  }
+  return {
+    rows: next.rows,
+    keys: next.keys,
+    kinds: next.kinds,
+    rebased,
+    present: next.present,
+    cells: Uint32Array.from(cells),
+    defined: Uint8Array.from(cells, i => next.defined[i]),
+    values: Float64Array.from(cells, i => next.values[i])
+  };
+};
+
+const applyTableDelta = (base: FieldTable, delta: TableDelta): FieldTable => {
+  const width = delta.keys.length;
+  const size = delta.rows * width;
+  const defined = new Uint8Array(size).fill(1);
+  const values = new Float64Array(size);
+  if (!delta.rebased) {
+    const kept = Math.min(base.rows, delta.rows) * width;
+    defined.set(base.defined.subarray(0, kept));
+    values.set(base.values.subarray(0, kept));
+  }
+  delta.cells.forEach((cell, i) => {
+    defined[cell] = delta.defined[i];
+    values[cell] = delta.values[i];
+  });
+  return { rows: delta.rows, keys: delta.keys, kinds: delta.kinds, present: delta.present, defined, values };
+};
+
+const diffPacked = (base: Uint8Array[], next: Uint8Array[]): PackedDelta => {
+  const indices: number[] = [];
+  next.forEach((bytes, i) => { if (bytes !== base[i]) indices.push(i); });
+  return { count: next.length, indices: Uint32Array.from(indices), values: indices.map(i => next[i]) };
+};
+
+const applyPacked = (base: Uint8Array[], delta: PackedDelta): Uint8Array[] => {
+  const next = base.slice(0, delta.count);
+  next.length = delta.count;
+  delta.indices.forEach((index, i) => { next[index] = delta.values[i]; });
+  return next;
+};
+
+// ---------------------------------------------------------------------------
+// Snapshots
+// ---------------------------------------------------------------------------
+
+/**
+ * Snapshot of a season. With `previous` (the last checkpoint of the same league or branch) the
+ * static section, string pool and every unchanged packed value are shared with it.
+ */
+export const createLeagueSnapshot = (season: SeasonState, previous?: LeagueSnapshot): LeagueSnapshot => {
+  const pool = previous?.pool ?? createPool();
+  const teams = season.teams;
+  const players = teams.flatMap(t => t.roster);
+
+  const rosterStart = new Int32Array(teams.length + 1);
+  teams.forEach((t, i) => { rosterStart[i + 1] = rosterStart[i] + t.roster.length; });
+
+  const prevStatic = previous?.static;
+  const teamExtras = packExtras(pool, teams, TEAM_COLUMNS, prevStatic?.teamExtras, prevStatic?.sources?.slice(0, teams.length),
+    i => (prevStatic ? pool.strings[prevStatic.teams.values[i * prevStatic.teams.keys.length]] : undefined));
+  const playerExtras = packExtras(pool, players, PLAYER_COLUMNS, prevStatic?.playerExtras, prevStatic?.sources?.slice(prevStatic.teams.rows),
+    i => (prevStatic && i < prevStatic.players.rows ? pool.strings[prevStatic.players.values[i * prevStatic.players.keys.length]] : undefined));
+  let staticSection: StaticSection = {
+    teams: buildFieldTable(pool, teams, TEAM_STATIC_KEYS),
+    teamExtras: teamExtras.bytes,
+    rosterStart,
+    players: buildFieldTable(pool, players, PLAYER_STATIC_KEYS),
+    attributes: buildFieldTable(pool, players.map(p => p.attributes)),
+    playerExtras: playerExtras.bytes,
+    sources: [...teamExtras.sources, ...playerExtras.sources]
+  };
+  if (prevStatic && isSameStatic(prevStatic, staticSection)) staticSection = prevStatic;
+
+  const prevState = previous?.state;
+  const schedule = season.schedule;
+  const gameDetails = packExtras(pool, schedule, GAME_COLUMNS, prevState?.gameDetails, prevState?.gameSources,
+    i => (prevState && i < prevState.tables.games.rows ? pool.strings[prevState.tables.games.values[i * GAME_KEYS.length]] : undefined));
+  const tables = {
+    teams: buildFieldTable(pool, teams, TEAM_STATE_KEYS),
+    players: buildFieldTable(pool, players, PLAYER_STATE_KEYS),
+    games: buildFieldTable(pool, schedule, GAME_KEYS)
+  } as Record<StateTable, FieldTable>;
+  PLAYER_RECORDS.forEach(([table, key]) => { tables[table] = buildFieldTable(pool, players.map(p => p[key] as object | undefined)); });
+
+  return {
+    format: 'league-snapshot',
+    version: SNAPSHOT_VERSION,
+    pool,
+    stringCount: pool.strings.length,
+    shapeCount: pool.shapes.length,
+    static: staticSection,
+    state: {
+      date: new Date(season.date).toISOString(),
+      phase: season.phase,
+      isPlaying: season.isPlaying,
+      postseason: packValue(pool, season.postseason),
+      tables,
+      gameDetails: gameDetails.bytes,
+      gameSources: gameDetails.sources
+    }
+  };
+};
+
+const isSameStatic = (a: StaticSection, b: StaticSection): boolean =>
+  a.rosterStart.length === b.rosterStart.length && a.rosterStart.every((v, i) => v === b.rosterStart[i]) &&
+  STATIC_TABLES.every(t => sameTable(a[t], b[t])) &&
+  a.teamExtras.every((bytes, i) => bytes === b.teamExtras[i]) &&
+  a.playerExtras.length === b.playerExtras.length && a.playerExtras.every((bytes, i) => bytes === b.playerExtras[i]);
+
+/**
+ * The season as fresh objects (safe to simulate on: nothing is shared with other restores).
+ * Played games' logs, box scores and replays are unpacked on first access.
+ */
+export const restoreLeagueSnapshot = (snapshot: LeagueSnapshot): SeasonState => {
+  const { pool, state } = snapshot;
+  const st = snapshot.static;
+  const tables = state.tables;
+
+  const players: Player[] = [];
+  for (let row = 0; row < st.players.rows; row++) {
+    const player = {
+      ...(unpackValue(pool, st.playerExtras[row]) as object),
+      ...readFieldRow(pool, st.players, row),
+      ...readFieldRow(pool, tables.players, row),
+      attributes: readFieldRow(pool, st.attributes, row)
+    } as Record<string, unknown>;
+    PLAYER_RECORDS.forEach(([table, key]) => {
+      const record = readFieldRow(pool, tables[table], row);
+      if (record) player[key] = record;
+    });
+    players.push(player as unknown as Player);
+  }
+
+  const teams: Team[] = [];
+  for (let row = 0; row < st.teams.rows; row++) {
+    teams.push({
+      ...(unpackValue(pool, st.teamExtras[row]) as object),
+      ...readFieldRow(pool, st.teams, row),
+      ...readFieldRow(pool, tables.teams, row),
+      roster: players.slice(st.rosterStart[row], st.rosterStart[row + 1])
+    } as unknown as Team);
+  }
+
+  const schedule: GameResult[] = [];
+  for (let row = 0; row < tables.games.rows; row++) {
+    const game = readFieldRow(pool, tables.games, row) as Record<string, unknown>;
+    const bytes = state.gameDetails[row];
+    let details: Record<string, unknown> | undefined;
+    packedKeys(pool, bytes).forEach(key => {
+      Object.defineProperty(game, key, {
+        enumerable: true,
+        configurable: true,
+        get: () => {
+          details ??= unpackValue(pool, bytes) as Record<string, unknown>;
+          return details[key];
+        },
+        set: (value: unknown) => { Object.defineProperty(game, key, { value, enumerable: true, configurable: true, writable: true }); }
+      });
+    });
+    schedule.push(game as unknown as GameResult);
+  }
+
+  return {
+    teams,
+    schedule,
+    date: new Date(state.date),
+    phase: state.phase,
+    isPlaying: state.isPlaying,
+    postseason: unpackValue(pool, state.postseason) as SeasonState['postseason']
+  };
+};
+
+/** Cells, pool entries and packed values that changed between two snapshots of a league. */
+export const diffLeagueSnapshots = (base: LeagueSnapshot | undefined, next: LeagueSnapshot): LeagueSnapshotDelta => {
+  if (base && base.pool !== next.pool) throw new Error('Snapshots from different leagues (string pools differ)');
+  const baseStrings = base?.stringCount ?? 0;
+  const baseShapes = base?.shapeCount ?? 0;
+  const st = next.static;
+  const baseStatic = base?.static;
+
+  const stateTables: Partial<Record<StateTable, TableDelta>> = {};
+  STATE_TABLES.forEach(t => {
+    const from = base?.state.tables[t] ?? EMPTY_TABLE;
+    if (from !== next.state.tables[t] && !sameTable(from, next.state.tables[t])) stateTables[t] = diffTable(from, next.state.tables[t]);
+  });
+
+  return {
+    format: 'league-snapshot-delta',
+    version: SNAPSHOT_VERSION,
+    baseStringCount: baseStrings,
+    baseShapeCount: baseShapes,
+    strings: next.pool.strings.slice(baseStrings, next.stringCount),
+    shapes: next.pool.shapes.slice(baseShapes, next.shapeCount),
+    static: baseStatic === st ? undefined : {
+      tables: Object.fromEntries(STATIC_TABLES.map(t => [t, diffTable(baseStatic?.[t] ?? EMPTY_TABLE, st[t])])) as Record<StaticTable, TableDelta>,
+      rosterStart: st.rosterStart,
+      teamExtras: diffPacked(baseStatic?.teamExtras ?? [], st.teamExtras),
+      playerExtras: diffPacked(baseStatic?.playerExtras ?? [], st.playerExtras)
+    },
+    state: {
+      date: next.state.date,
+      phase: next.state.phase,
+      isPlaying: next.state.isPlaying,
+      postseason: next.state.postseason,
+      tables: stateTables,
+      gameDetails: diffPacked(base?.state.gameDetails ?? [], next.state.gameDetails)
+    }
+  };
+};
+
+/** The snapshot a delta leads to from its base (undefined: the delta is a full snapshot). */
+export const applyLeagueSnapshotDelta = (base: LeagueSnapshot | undefined, delta: LeagueSnapshotDelta): LeagueSnapshot => {
+  // Deltas decoded from bytes carry their own pool entries; a shared pool may already have them
+  const pool = base?.pool ?? createPool();
+  if (delta.baseStringCount !== (base?.stringCount ?? 0) || delta.baseShapeCount !== (base?.shapeCount ?? 0)) {
+    throw new Error('Delta does not follow this snapshot');
+  }
+  const stringCount = delta.baseStringCount + delta.strings.length;
+  const shapeCount = delta.baseShapeCount + delta.shapes.length;
+  delta.strings.forEach((s, i) => {
+    const index = delta.baseStringCount + i;
+    if (index >= pool.strings.length) intern(pool, s);
+    else if (pool.strings[index] !== s) throw new Error('Delta does not follow this snapshot (string pools diverged)');
+  });
+  delta.shapes.forEach((shape, i) => {
+    if (delta.baseShapeCount + i >= pool.shapes.length) internShape(pool, shape.map(k => pool.strings[k]));
+  });
+
+  let staticSection = base?.static;
+  if (delta.static) {
+    const from = base?.static;
+    staticSection = {
+      teams: applyTableDelta(from?.teams ?? EMPTY_TABLE, delta.static.tables.teams),
+      players: applyTableDelta(from?.players ?? EMPTY_TABLE, delta.static.tables.players),
+      attributes: applyTableDelta(from?.attributes ?? EMPTY_TABLE, delta.static.tables.attributes),
+      rosterStart: delta.static.rosterStart,
+      teamExtras: applyPacked(from?.teamExtras ?? [], delta.static.teamExtras),
+      playerExtras: applyPacked(from?.playerExtras ?? [], delta.static.playerExtras)
+    };
+  }
+  if (!staticSection) throw new Error('Delta has no static section and no base snapshot');
+
+  const tables = {} as Record<StateTable, FieldTable>;
+  STATE_TABLES.forEach(t => {
+    const from = base?.state.tables[t] ?? EMPTY_TABLE;
+    const change = delta.state.tables[t];
+    tables[t] = change ? applyTableDelta(from, change) : from;
+  });
+
+  return {
+    format: 'league-snapshot',
+    version: SNAPSHOT_VERSION,
+    pool,
+    stringCount,
+    shapeCount,
+    static: staticSection,
+    state: {
+      date: delta.state.date,
+      phase: delta.state.phase,
+      isPlaying: delta.state.isPlaying,
+      postseason: delta.state.postseason,
+      tables,
+      gameDetails: applyPacked(base?.state.gameDetails ?? [], delta.state.gameDetails)
+    }
+  };
+};
+
+// ---------------------------------------------------------------------------
+// Binary encoding
+// ---------------------------------------------------------------------------
+
+const MAGIC = [0x47, 0x53, 0x4c, 0x53];   // 'GSLS'
+
+const writeTableDelta = (w: ByteWriter, pool: InternPool, delta: TableDelta) => {
+  // Table keys are interned when the table is built, so they are never new here
+  writeUvarint(w, delta.rows);
+  writeUvarint(w, delta.keys.length);
+  delta.keys.forEach((k, i) => {
+    writeUvarint(w, pool.stringIndex.get(k)!);
+    writeByte(w, delta.kinds[i]);
+  });
+  writeByte(w, delta.rebased ? 1 : 0);
+  writeBytes(w, delta.present);
+  // Cells as gaps, with the value's encoding folded in: 0 = absent, 1 = integer, 2 = float
+  writeUvarint(w, delta.cells.length);
+  let previous = -1;
+  delta.cells.forEach((cell, i) => {
+    const value = delta.values[i];
+    const mode = delta.defined[i] === 0 ? 0 : Number.isSafeInteger(value) && !Object.is(value, -0) ? 1 : 2;
+    writeUvarint(w, (cell - previous - 1) * 3 + mode);
+    if (mode === 1) writeSvarint(w, value);
+    else if (mode === 2) writeFloat64(w, value);
+    previous = cell;
+  });
+};
+
+const readTableDelta = (r: ByteReader, strings: string[]): TableDelta => {
+  const rows = readUvarint(r);
+  const width = readUvarint(r);
+  const keys: string[] = [];
+  const kinds = new Uint8Array(width);
+  for (let k = 0; k < width; k++) {
+    keys.push(strings[readUvarint(r)]);
+    kinds[k] = readByte(r);
+  }
+  const rebased = readByte(r) === 1;
+  const present = readBytes(r);
+  const count = readUvarint(r);
+  const cells = new Uint32Array(count);
+  const defined = new Uint8Array(count);
+  const values = new Float64Array(count);
+  let previous = -1;
+  for (let i = 0; i < count; i++) {
+    const code = readUvarint(r);
+    const mode = code % 3;
+    cells[i] = previous + 1 + (code - mode) / 3;
+    previous = cells[i];
+    defined[i] = mode === 0 ? 0 : 1;
+    values[i] = mode === 1 ? readSvarint(r) : mode === 2 ? readFloat64(r) : 0;
+  }
+  return { rows, keys, kinds, rebased, present, cells, defined, values };
+};
+
+const writePackedDelta = (w: ByteWriter, delta: PackedDelta) => {
+  writeUvarint(w, delta.count);
+  writeUvarint(w, delta.indices.length);
+  delta.indices.forEach((index, i) => {
+    writeUvarint(w, index);
+    writeBytes(w, delta.values[i]);
+  });
+};
+
+const readPackedDelta = (r: ByteReader): PackedDelta => {
+  const count = readUvarint(r);
+  const changed = readUvarint(r);
+  const indices = new Uint32Array(changed);
+  const values: Uint8Array[] = [];
+  for (let i = 0; i < changed; i++) {
+    indices[i] = readUvarint(r);
+    values.push(readBytes(r));
+  }
+  return { count, indices, values };
+};
+
+/** Delta as bytes; `pool` is the pool of the snapshots it was taken between. */
+export const encodeLeagueSnapshotDelta = (delta: LeagueSnapshotDelta, pool: InternPool): Uint8Array => {
+  const w = createWriter(1 << 16);
+  MAGIC.forEach(b => writeByte(w, b));
+  writeUvarint(w, SNAPSHOT_VERSION);
+  writeUvarint(w, delta.baseStringCount);
+  writeUvarint(w, delta.strings.length);
+  delta.strings.forEach(s => writeString(w, s));
+  writeUvarint(w, delta.baseShapeCount);
+  writeUvarint(w, delta.shapes.length);
+  delta.shapes.forEach(shape => {
+    writeUvarint(w, shape.length);
+    shape.forEach(k => writeUvarint(w, k));
+  });
+
+  writeByte(w, delta.static ? 1 : 0);
+  if (delta.static) {
+    STATIC_TABLES.forEach(t => writeTableDelta(w, pool, delta.static!.tables[t]));
+    writeUvarint(w, delta.static.rosterStart.length);
+    delta.static.rosterStart.forEach(v => writeUvarint(w, v));
+    writePackedDelta(w, delta.static.teamExtras);
+    writePackedDelta(w, delta.static.playerExtras);
+  }
+
+  writeString(w, delta.state.date);
+  writeString(w, delta.state.phase);
+  writeByte(w, delta.state.isPlaying ? 1 : 0);
+  writeBytes(w, delta.state.postseason);
+  STATE_TABLES.forEach(t => {
+    const change = delta.state.tables[t];
+    writeByte(w, change ? 1 : 0);
+    if (change) writeTableDelta(w, pool, change);
+  });
+  writePackedDelta(w, delta.state.gameDetails);
+  return finishWriter(w);
+};
+
+/** Bytes back into a delta; `pool` is the base snapshot's pool (omit for a full snapshot). */
+export const decodeLeagueSnapshotDelta = (bytes: Uint8Array, pool?: InternPool): LeagueSnapshotDelta => {
+  const r = createReader(bytes);
+  if (MAGIC.some(b => readByte(r) !== b)) throw new Error('Not a league snapshot');
+  const version = readUvarint(r);
+  if (version !== SNAPSHOT_VERSION) throw new Error(`Unsupported league snapshot version ${version}`);
+
+  const baseStrings = readUvarint(r);
+  const strings: string[] = [];
+  for (let i = readUvarint(r); i > 0; i--) strings.push(readString(r));
+  const baseShapes = readUvarint(r);
+  const shapes: number[][] = [];
+  for (let i = readUvarint(r); i > 0; i--) {
+    const shape: number[] = [];
+    for (let k = readUvarint(r); k > 0; k--) shape.push(readUvarint(r));
+    shapes.push(shape);
+  }
+  if (baseStrings > (pool?.strings.length ?? 0) || baseShapes > (pool?.shapes.length ?? 0)) {
+    throw new Error('Delta needs a base snapshot it was not given');
+  }
+  const allStrings = [...(pool?.strings.slice(0, baseStrings) ?? []), ...strings];
+
+  let staticSection: LeagueSnapshotDelta['static'];
+  if (readByte(r) === 1) {
+    const tables = Object.fromEntries(STATIC_TABLES.map(t => [t, readTableDelta(r, allStrings)])) as Record<StaticTable, TableDelta>;
+    const rosterStart = new Int32Array(readUvarint(r));
+    for (let i = 0; i < rosterStart.length; i++) rosterStart[i] = readUvarint(r);
+    staticSection = { tables, rosterStart, teamExtras: readPackedDelta(r), playerExtras: readPackedDelta(r) };
+  }
+
+  const date = readString(r);
+  const phase = readString(r) as SeasonState['phase'];
+  const isPlaying = readByte(r) === 1;
+  const postseason = readBytes(r);
+  const tables: Partial<Record<StateTable, TableDelta>> = {};
+  STATE_TABLES.forEach(t => { if (readByte(r) === 1) tables[t] = readTableDelta(r, allStrings); });
+
+  return {
+    format: 'league-snapshot-delta',
+    version,
+    baseStringCount: baseStrings,
+    baseShapeCount: baseShapes,
+    strings,
+    shapes,
+    static: staticSection,
+    state: { date, phase, isPlaying, postseason, tables, gameDetails: readPackedDelta(r) }
+  };
+};
+
+/** A whole snapshot as bytes (its delta against an empty league). */
+export const encodeLeagueSnapshot = (snapshot: LeagueSnapshot): Uint8Array =>
+  encodeLeagueSnapshotDelta(diffLeagueSnapshots(undefined, snapshot), snapshot.pool);
+
+export const decodeLeagueSnapshot = (bytes: Uint8Array): LeagueSnapshot =>
+  applyLeagueSnapshotDelta(undefined, decodeLeagueSnapshotDelta(bytes));
@@ -0,0 +1,613 @@
+import { Team, Player, Position, LineupPlan, StarterArchetype } from "../types";
+import { SIM_PARAMS } from "./simParams";
+import { getHistoricalPerformance, getStarterArchetype, getBestLineup } from "./simulator";
+
+/**
+ * Batting-order optimizer.
+ *
+ * Every hitter gets per-plate-appearance event probabilities against a representative
+ * power or finesse starter, from the same pitch and ball-in-play constants the game
+ * engine uses (an exact Markov chain over the ball-strike counts, as in calibration.ts).
+ * Runs are then evaluated with a base-out Markov chain:
+ *
+ * - Selection: one position-eligible hitter per position plus a DH, chosen by
+ *   branch-and-bound on run value per plate appearance (additive, so the bound is
+ *   exact). The best few selections go on to the ordering search.
+ * - Ordering: depth-first search over the 9! orders, in game order. Each node carries the
+ *   game state distribution after its prefix, so every partial lineup is evaluated once
+ *   for its whole subtree. Later trips through the order are valued with the nine's
+ *   average hitter; the bound on a partial lineup is the best any remaining hitter could
+ *   do in each open slot, memoized per set of placed hitters.
+ * - The orders that survive are rescored with the full nine-inning chain (every trip
+ *   through the actual order), and the best one is polished on it by pairwise swaps.
+ *
+ * A lineup takes tens of milliseconds, so lineups are planned once per series instead of
+ * being rebuilt heuristically every game (see planSeriesLineups).
+ */
+
+export interface StarterProfile {
+  stuff: number;
+  control: number;
+}
+
+export interface OptimizedLineup {
+  archetype: StarterArchetype;
+  order: Player[];
+  runsPerGame: number;          // full nine-inning chain
+  heuristicRuns: number;        // getBestLineup's lineup under the same model
+  nodes: number;                // ordering search nodes expanded
+}
+
+export interface TeamLineups {
+  power: OptimizedLineup;
+  finesse: OptimizedLineup;
+}
+
+// Stand-ins when a staff has no starter of an archetype
+export const DEFAULT_STARTER_PROFILES: Record<StarterArchetype, StarterProfile> = {
+  power: { stuff: 62, control: 50 },
+  finesse: { stuff: 50, control: 60 }
+};
+
+const FIELD_POSITIONS = [Position.C, Position.TB, Position.SB, Position.TB_3, Position.SS, Position.LF, Position.CF, Position.RF];
+const TOP_SELECTIONS = 2;       // selections passed to the ordering search
+const TOP_ORDERS = 4;           // orders rescored with the full chain
+// Runs per game a partial order's bound must clear the incumbents by to be expanded. The
+// first-trip value is only a guide to the full chain, and the polish step covers the rest.
+const SEARCH_TOLERANCE = 0.02;
+const INNINGS = 9;
+
+// Plate appearance events
+const K = 0, OUT = 1, BB = 2, SINGLE = 3, DOUBLE = 4, TRIPLE = 5, HR = 6;
+const EVENTS = 7;
+
+// Base-out states: outs * 8 + base mask (1 = first, 2 = second, 4 = third); END = third out
+const STATES = 24;
+const END = -1;
+// Out-in-play runner rates at league-average speed and contact (resolveBallInPlay)
+const GIDP_RATE = 0.45 * 0.10;
+const SAC_FLY_RATE = 0.55 * 0.35;
+
+const clamp = (val: number, min: number, max: number) => Math.max(min, Math.min(max, val));
+const runnersOn = (bases: number) => (bases & 1) + ((bases >> 1) & 1) + ((bases >> 2) & 1);
+
+// Transitions as a flat outcome list; state s owns [STATE_START[s], STATE_START[s + 1])
+const buildTransitions = () => {
+  const start = new Int32Array(STATES + 1);
+  const toState = (outs: number, bases: number) => (outs >= 3 ? END : outs * 8 + bases);
+  const outcomes: [number, number, number, number][] = [];   // event, prob, next, runs
+  for (let s = 0; s < STATES; s++) {
+    const outs = s >> 3;
+    const bases = s & 7;
+    const set = (event: number, list: [number, number, number][]) => {
+      list.forEach(([prob, next, runs]) => outcomes.push([event, prob, next, runs]));
+    };
+    start[s] = outcomes.length;
+
+    set(K, [[1, toState(outs + 1, bases), 0]]);
+
+    if (outs < 2 && bases === 1) {
+      set(OUT, [[1 - GIDP_RATE, toState(outs + 1, bases), 0], [GIDP_RATE, toState(outs + 2, 0), 0]]);
+    } else if (outs < 2 && (bases & 4)) {
+      set(OUT, [[1 - SAC_FLY_RATE, toState(outs + 1, bases), 0], [SAC_FLY_RATE, toState(outs + 1, bases & 3), 1]]);
+    } else {
+      set(OUT, [[1, toState(outs + 1, bases), 0]]);
+    }
+
+    // Walks force runners; hits move everyone up (runners on second score on a single)
+    const forced = !(bases & 1) ? bases | 1 : !(bases & 2) ? bases | 2 : 7;
+    set(BB, [[1, toState(outs, forced), bases === 7 ? 1 : 0]]);
+    set(SINGLE, [[1, toState(outs, 1 | (bases & 1 ? 2 : 0)), ((bases >> 1) & 1) + ((bases >> 2) & 1)]]);
+    set(DOUBLE, [[1, toState(outs, 2 | (bases & 1 ? 4 : 0)), ((bases >> 1) & 1) + ((bases >> 2) & 1)]]);
+    set(TRIPLE, [[1, toState(outs, 4), runnersOn(bases)]]);
+    set(HR, [[1, toState(outs, 0), runnersOn(bases) + 1]]);
+  }
+  start[STATES] = outcomes.length;
+  return {
+    start,
+    event: Int8Array.from(outcomes, o => o[0]),
+    prob: Float64Array.from(outcomes, o => o[1]),
+    next: Int8Array.from(outcomes, o => o[2]),
+    runs: Int8Array.from(outcomes, o => o[3])
+  };
+};
+const TRANSITIONS = buildTransitions();
+const STATE_START = TRANSITIONS.start;
+const OUTCOME_EVENT = TRANSITIONS.event;
+const OUTCOME_PROB = TRANSITIONS.prob;
+const OUTCOME_NEXT = TRANSITIONS.next;
+const OUTCOME_RUNS = TRANSITIONS.runs;
+
+/** Per-PA event probabilities (K, out in play, BB/HBP, 1B, 2B, 3B, HR) against a fresh starter. */
+export const plateAppearanceEvents = (batter: Player, starter: StarterProfile): Float64Array => {
+  const pitch = SIM_PARAMS.pitch;
+  const bip = SIM_PARAMS.ballInPlay;
+  const hist = getHistoricalPerformance(batter);
+  const contact = batter.attributes.contact || 50;
+  const power = batter.attributes.power || 50;
+  const eye = batter.attributes.eye || 50;
+  const speed = batter.attributes.speed || 50;
+
+  // Per-pitch outcomes, mirroring simulatePitch
+  const effectiveEye = pitch.eyeCenter + (eye - pitch.eyeCenter) * pitch.eyeCompression;
+  const chase = clamp(pitch.chaseBase - effectiveEye * pitch.chaseEye, 0, 1);
+  const zone = clamp(pitch.zoneBase + starter.control * pitch.zoneControl, 0, 1);
+  const contactProb = clamp(pitch.contactBase + (contact - starter.stuff) * pitch.contactSpread, pitch.contactMin, pitch.contactMax);
+  const live = (1 - pitch.hbp) * (1 - pitch.wildPitch);
+  const swingContact = live * zone * pitch.zoneSwing * contactProb;
+  const pHbp = pitch.hbp;
+  const pBall = (1 - pitch.hbp) * pitch.wildPitch + live * (1 - zone) * (1 - chase);
+  const pFoul = swingContact * pitch.foul;
+  const pInPlay = swingContact * (1 - pitch.foul);
+  const pStrike = 1 - pHbp - pBall - pFoul - pInPlay;
+
+  // Count chain; a two-strike foul repeats the count
+  const reach = new Float64Array(12);
+  reach[0] = 1;
+  let strikeout = 0, walk = 0, inPlay = 0;
+  for (let balls = 0; balls < 4; balls++) {
+    for (let strikes = 0; strikes < 3; strikes++) {
+      const r = reach[balls * 3 + strikes];
+      if (r === 0) continue;
+      const visits = strikes === 2 ? r / (1 - pFoul) : r;
+      inPlay += visits * pInPlay;
+      walk += visits * pHbp;
+      if (balls === 3) walk += visits * pBall;
+      else reach[(balls + 1) * 3 + strikes] += visits * pBall;
+      if (strikes === 2) strikeout += visits * pStrike;
+      else reach[balls * 3 + strikes + 1] += visits * (pStrike + pFoul);
+    }
+  }
+
+  // Ball in play, mirroring resolveBallInPlay in a neutral park
+  const powerAdjust = power >= 70 ? 0.012 : power >= 60 ? 0.007 : power >= 50 ? 0.003 : power < 35 ? -0.005 : 0;
+  const contactFactor = Math.min(hist.contactFactor, 1.20);
+  const historyAdjust = contactFactor > 1.15 ? 0.006 : contactFactor > 1.08 ? 0.003 : contactFactor > 1.03 ? 0.001 : 0;
+  const hit = clamp(bip.hitBase + (contact - starter.stuff) * bip.hitSpread + powerAdjust + historyAdjust, bip.hitMin, bip.hitMax);
+  const homeRun = clamp((bip.hrBase + (power - starter.stuff) * bip.hrSpread) * clamp(hist.powerFactor, 0.70, 1.50), bip.hrMin, bip.hrMax);
+  const gap = clamp(bip.gapBase + power * bip.gapPower + speed * bip.gapSpeed, 0, 1);
+  const triple = 0.04 + speed * 0.004;
+
+  const events = new Float64Array(EVENTS);
+  const hits = inPlay * hit;
+  events[K] = strikeout;
+  events[BB] = walk;
+  events[OUT] = inPlay - hits;
+  events[HR] = hits * homeRun;
+  events[TRIPLE] = hits * (1 - homeRun) * gap * triple;
+  events[DOUBLE] = hits * (1 - homeRun) * gap * (1 - triple);
+  events[SINGLE] = hits * (1 - homeRun) * (1 - gap);
+  // Normalize away the chain's truncation error
+  const total = events.reduce((sum, p) => sum + p, 0);
+  for (let e = 0; e < EVENTS; e++) events[e] /= total;
+  return events;
+};
+
+/** Expected runs from each base-out state to the end of the inning, with one hitter batting throughout. */
+const inningValues = (events: Float64Array): Float64Array => {
+  const values = new Float64Array(STATES);
+  const next = new Float64Array(STATES);
+  for (let iter = 0; iter < 200; iter++) {
+    let change = 0;
+    for (let s = 0; s < STATES; s++) {
+      let v = 0;
+      for (let k = STATE_START[s]; k < STATE_START[s + 1]; k++) {
+        const to = OUTCOME_NEXT[k];
+        v += events[OUTCOME_EVENT[k]] * OUTCOME_PROB[k] * (OUTCOME_RUNS[k] + (to === END ? 0 : values[to]));
+      }
+      next[s] = v;
+      change = Math.max(change, Math.abs(v - values[s]));
+    }
+    values.set(next);
+    if (change < 1e-10) break;
+  }
+  return values;
+};
+
+/**
+ * Run value of each event (RE24 averaged over how often each base-out state comes up),
+ * so a hitter's value per plate appearance is additive across a selection.
+ */
+const eventRunValues = (events: Float64Array): Float64Array => {
+  const values = inningValues(events);
+  // Expected visits to each state in an inning from the empty-bases, no-out start
+  const visits = new Float64Array(STATES);
+  let dist = new Float64Array(STATES);
+  dist[0] = 1;
+  for (let pa = 0; pa < 40; pa++) {
+    const nextDist = new Float64Array(STATES);
+    for (let s = 0; s < STATES; s++) {
+      const p = dist[s];
+      if (p === 0) continue;
+      visits[s] += p;
+      for (let k = STATE_START[s]; k < STATE_START[s + 1]; k++) {
+        const to = OUTCOME_NEXT[k];
+        if (to !== END) nextDist[to] += p * events[OUTCOME_EVENT[k]] * OUTCOME_PROB[k];
+      }
+    }
+    dist = nextDist;
+  }
+  const total = visits.reduce((sum, v) => sum + v, 0);
+  const runValues = new Float64Array(EVENTS);
+  for (let e = 0; e < EVENTS; e++) {
+    let rv = 0;
+    for (let s = 0; s < STATES; s++) {
+      let after = 0;
+      for (let k = STATE_START[s]; k < STATE_START[s + 1]; k++) {
+        if (OUTCOME_EVENT[k] !== e) continue;
+        const to = OUTCOME_NEXT[k];
+        after += OUTCOME_PROB[k] * (OUTCOME_RUNS[k] + (to === END ? 0 : values[to]));
+      }
+      rv += visits[s] * (after - values[s]);
+    }
+    runValues[e] = rv / total;
+  }
+  return runValues;
+};
+
+const averageEvents = (rows: Float64Array[]): Float64Array => {
+  const mean = new Float64Array(EVENTS);
+  rows.forEach(row => row.forEach((p, e) => { mean[e] += p / rows.length; }));
+  return mean;
+};
+
+// Scratch buffers for evaluateBattingOrder (lineups have at most nine slots)
+const MAX_SLOTS = 9;
+const slotRuns = new Float64Array(MAX_SLOTS);
+const slotNext = new Float64Array(MAX_SLOTS * MAX_SLOTS);   // [leadoff * MAX_SLOTS + next leadoff]
+const inningDist = [new Float64Array(STATES), new Float64Array(STATES)];
+const leadoffDist = [new Float64Array(MAX_SLOTS), new Float64Array(MAX_SLOTS)];
+
+/** Expected runs per game for a batting order (rows of event probabilities), every trip through the order. */
+export const evaluateBattingOrder = (order: Float64Array[]): number => {
+  const n = order.length;
+  slotNext.fill(0);
+  // Per leadoff slot: expected inning runs and where the next inning starts
+  for (let leadoff = 0; leadoff < n; leadoff++) {
+    let [dist, next] = inningDist;
+    dist.fill(0);
+    dist[0] = 1;
+    let runs = 0;
+    for (let pa = 0; pa < 40; pa++) {
+      const slot = (leadoff + pa) % n;
+      const events = order[slot];
+      const ends = leadoff * MAX_SLOTS + (slot + 1) % n;
+      next.fill(0);
+      let alive = 0;
+      for (let s = 0; s < STATES; s++) {
+        const p = dist[s];
+        if (p === 0) continue;
+        for (let k = STATE_START[s]; k < STATE_START[s + 1]; k++) {
+          const mass = p * events[OUTCOME_EVENT[k]] * OUTCOME_PROB[k];
+          runs += mass * OUTCOME_RUNS[k];
+          const to = OUTCOME_NEXT[k];
+          if (to === END) slotNext[ends] += mass;
+          else { next[to] += mass; alive += mass; }
+        }
+      }
+      [dist, next] = [next, dist];
+      if (alive < 1e-7) break;
+    }
+    slotRuns[leadoff] = runs;
+  }
+
+  let [leadoff, next] = leadoffDist;
+  leadoff.fill(0);
+  leadoff[0] = 1;
+  let total = 0;
+  for (let inning = 0; inning < INNINGS; inning++) {
+    next.fill(0);
+    for (let s = 0; s < n; s++) {
+      if (leadoff[s] === 0) continue;
+      total += leadoff[s] * slotRuns[s];
+      for (let t = 0; t < n; t++) next[t] += leadoff[s] * slotNext[s * MAX_SLOTS + t];
+    }
+    [leadoff, next] = [next, leadoff];
+  }
+  return total;
+};
+
+// Game states for the ordering search: inning * STATES + base-out state
+const GAME_STATES = INNINGS * STATES;
+
+/**
+ * Advance a game state distribution by one plate appearance. Returns the expected runs scored.
+ * `reach` bounds the states with mass (after pa plate appearances, the inning is at most pa / 3).
+ */
+const stepGame = (dist: Float64Array, events: Float64Array, out: Float64Array, reach: number): number => {
+  out.fill(0);
+  let runs = 0;
+  for (let g = 0; g < reach; g++) {
+    const p = dist[g];
+    if (p === 0) continue;
+    const inning = (g / STATES) | 0;
+    const s = g - inning * STATES;
+    for (let k = STATE_START[s]; k < STATE_START[s + 1]; k++) {
+      const mass = p * events[OUTCOME_EVENT[k]] * OUTCOME_PROB[k];
+      runs += mass * OUTCOME_RUNS[k];
+      const to = OUTCOME_NEXT[k];
+      if (to !== END) out[inning * STATES + to] += mass;
+      else if (inning + 1 < INNINGS) out[(inning + 1) * STATES] += mass;
+    }
+  }
+  return runs;
+};
+
+/** Value of one plate appearance by a hitter from each game state below `reach`, given the values after it. */
+const backupGame = (events: Float64Array, after: Float64Array, out: Float64Array, reach: number) => {
+  for (let g = 0; g < reach; g++) {
+    const inning = (g / STATES) | 0;
+    const s = g - inning * STATES;
+    let v = 0;
+    for (let k = STATE_START[s]; k < STATE_START[s + 1]; k++) {
+      const to = OUTCOME_NEXT[k];
+      const future = to !== END ? after[inning * STATES + to] : inning + 1 < INNINGS ? after[(inning + 1) * STATES] : 0;
+      v += events[OUTCOME_EVENT[k]] * OUTCOME_PROB[k] * (OUTCOME_RUNS[k] + future);
+    }
+    out[g] = v;
+  }
+};
+
+interface OrderCandidate {
+  order: number[];
+  value: number;
+}
+
+/**
+ * Branch-and-bound over the orders of nine hitters. Returns the best orders by
+ * first-trip value (exact first trip, later trips with the average hitter).
+ */
+const searchOrders = (rows: Float64Array[], keep: number): { candidates: OrderCandidate[]; nodes: number } => {
+  const n = rows.length;
+  const full = (1 << n) - 1;
+
+  // Rest of the game after the first trip: innings are independent with the average hitter
+  const average = inningValues(averageEvents(rows));
+  const terminal = new Float64Array(GAME_STATES);
+  for (let g = 0; g < GAME_STATES; g++) {
+    const inning = (g / STATES) | 0;
+    terminal[g] = average[g - inning * STATES] + (INNINGS - 1 - inning) * average[0];
+  }
+
+  // States that can have mass after a number of plate appearances
+  const reachAfter = (plateAppearances: number) => Math.min(GAME_STATES, (((plateAppearances / 3) | 0) + 1) * STATES);
+
+  // Bound per set of placed hitters: every open slot takes the best remaining hitter for
+  // the state it comes up in (repeats allowed), then the terminal value
+  const bounds = new Map<number, Float64Array>([[full, terminal]]);
+  const scratch = new Float64Array(GAME_STATES);
+  const boundFor = (mask: number): Float64Array => {
+    const cached = bounds.get(mask);
+    if (cached) return cached;
+    let placed = 0;
+    for (let b = 0; b < n; b++) if (mask & (1 << b)) placed++;
+    const reach = reachAfter(placed);
+    const bound = new Float64Array(GAME_STATES).fill(-Infinity);
+    for (let b = 0; b < n; b++) {
+      if (mask & (1 << b)) continue;
+      backupGame(rows[b], boundFor(mask | (1 << b)), scratch, reach);
+      for (let g = 0; g < reach; g++) if (scratch[g] > bound[g]) bound[g] = scratch[g];
+    }
+    bounds.set(mask, bound);
+    return bound;
+  };
+  const dot = (dist: Float64Array, values: Float64Array, reach: number) => {
+    let sum = 0;
+    for (let g = 0; g < reach; g++) if (dist[g] !== 0) sum += dist[g] * values[g];
+    return sum;
+  };
+
+  const best: OrderCandidate[] = [];
+  const threshold = () => (best.length < keep ? -Infinity : best[best.length - 1].value);
+  const consider = (order: number[], value: number) => {
+    if (value <= threshold()) return;
+    best.push({ order: [...order], value });
+    best.sort((a, b) => b.value - a.value);
+    if (best.length > keep) best.pop();
+  };
+
+  // Distribution buffers per depth and child: the memoized partial-lineup states
+  const dists = Array.from({ length: n + 1 }, () => Array.from({ length: n }, () => new Float64Array(GAME_STATES)));
+  const root = new Float64Array(GAME_STATES);
+  root[0] = 1;
+  const order: number[] = [];
+  const childRuns = new Float64Array(n * n);
+  const childBound = new Float64Array(n * n);
+  let nodes = 0;
+
+  const visit = (depth: number, mask: number, dist: Float64Array, runs: number) => {
+    nodes++;
+    const reach = reachAfter(depth);
+    if (depth === n) {
+      consider(order, runs + dot(dist, terminal, reach));
+      return;
+    }
+    // Expand children best-bound first so good orders are found early
+    const children: number[] = [];
+    for (let b = 0; b < n; b++) {
+      if (mask & (1 << b)) continue;
+      const childDist = dists[depth + 1][b];
+      const r = runs + stepGame(dist, rows[b], childDist, reach);
+      childRuns[depth * n + b] = r;
+      childBound[depth * n + b] = r + dot(childDist, boundFor(mask | (1 << b)), reachAfter(depth + 1));
+      children.push(b);
+    }
+    children.sort((a, b) => childBound[depth * n + b] - childBound[depth * n + a]);
+    for (const b of children) {
+      if (childBound[depth * n + b] <= threshold() + SEARCH_TOLERANCE) break;
+      order.push(b);
+      visit(depth + 1, mask | (1 << b), dists[depth + 1][b], childRuns[depth * n + b]);
+      order.pop();
+    }
+  };
+
+  visit(0, 0, root, 0);
+  return { candidates: best, nodes };
+};
+
+/**
+ * Hill-climb an order on the full chain, swapping two hitters at a time until no swap
+ * scores more runs. Evaluations are memoized by order.
+ */
+const polishOrder = (rows: Float64Array[], start: number[]): OrderCandidate => {
+  const cache = new Map<string, number>();
+  const evaluate = (order: number[]) => {
+    const key = order.join(',');
+    let runs = cache.get(key);
+    if (runs === undefined) {
+      runs = evaluateBattingOrder(order.map(i => rows[i]));
+      cache.set(key, runs);
+    }
+    return runs;
+  };
+
+  let current = { order: start, value: evaluate(start) };
+  let improved = true;
+  while (improved) {
+    improved = false;
+    const n = current.order.length;
+    for (let i = 0; i < n; i++) {
+      for (let j = i + 1; j < n; j++) {
+        const order = [...current.order];
+        [order[i], order[j]] = [order[j], order[i]];
+        const value = evaluate(order);
+        if (value > current.value + 1e-12) {
+          current = { order, value };
+          improved = true;
+        }
+      }
+    }
+  }
+  return current;
+};
+
+interface Selection {
+  hitters: Player[];
+  value: number;
+}
+
+/**
+ * Position-eligible selections by run value per PA: a catcher, the infield, the outfield
+ * and a DH, each hitter at their listed position (any hitter at DH, or at a position
+ * nobody on the roster plays).
+ */
+const searchSelections = (hitters: Player[], value: Map<string, number>, keep: number): Selection[] => {
+  const slots = [...FIELD_POSITIONS, Position.DH].map(pos => {
+    const listed = pos === Position.DH ? [] : hitters.filter(p => p.position === pos);
+    const eligible = listed.length > 0 ? listed : hitters;
+    return [...eligible].sort((a, b) => value.get(b.id)! - value.get(a.id)!);
+  });
+  // Most constrained slots first
+  slots.sort((a, b) => a.length - b.length);
+  // Optimistic value of the open slots: each one's best hitter, ignoring conflicts
+  const remaining = slots.map((_, i) => slots.slice(i).reduce((sum, c) => sum + value.get(c[0].id)!, 0));
+
+  const best: Selection[] = [];
+  const picked: Player[] = [];
+  const used = new Set<string>();
+  const visit = (depth: number, total: number) => {
+    if (depth === slots.length) {
+      // The same nine can come from different slot assignments
+      const key = picked.map(p => p.id).sort().join();
+      if (best.some(sel => sel.hitters.map(p => p.id).sort().join() === key)) return;
+      best.push({ hitters: [...picked], value: total });
+      best.sort((a, b) => b.value - a.value);
+      if (best.length > keep) best.pop();
+      return;
+    }
+    for (const p of slots[depth]) {
+      if (used.has(p.id)) continue;
+      const v = total + value.get(p.id)!;
+      // Slots are sorted by value, so no later candidate can do better either
+      if (best.length === keep && v + (remaining[depth + 1] || 0) <= best[best.length - 1].value) break;
+      picked.push(p);
+      used.add(p.id);
+      visit(depth + 1, v);
+      used.delete(p.id);
+      picked.pop();
+    }
+  };
+  visit(0, 0);
+  return best;
+};
+
+/** Run-optimal lineup for a team against one starter profile. */
+export const optimizeLineup = (team: Team, starter: StarterProfile, archetype: StarterArchetype): OptimizedLineup => {
+  const hitters = team.roster.filter(p => !p.injury.isInjured && (p.position !== Position.P || p.isTwoWay));
+  const events = new Map(hitters.map(p => [p.id, plateAppearanceEvents(p, starter)]));
+  const runValues = eventRunValues(averageEvents([...events.values()]));
+  const value = new Map(hitters.map(p => [p.id, events.get(p.id)!.reduce((sum, pe, e) => sum + pe * runValues[e], 0)]));
+
+  let selections = hitters.length > 9 ? searchSelections(hitters, value, TOP_SELECTIONS) : [];
+  if (selections.length === 0) {
+    selections = [{ hitters: [...hitters].sort((a, b) => value.get(b.id)! - value.get(a.id)!).slice(0, 9), value: 0 }];
+  }
+  // Each selection's searched orders are rescored on the full chain; the best start is polished
+  let best = { selection: selections[0], order: selections[0].hitters.map((_, i) => i), value: -Infinity };
+  let nodes = 0;
+  selections.forEach(selection => {
+    const rows = selection.hitters.map(p => events.get(p.id)!);
+    const search = searchOrders(rows, TOP_ORDERS);
+    nodes += search.nodes;
+    search.candidates.forEach(candidate => {
+      const value = evaluateBattingOrder(candidate.order.map(i => rows[i]));
+      if (value > best.value) best = { selection, order: candidate.order, value };
+    });
+  });
+  const rows = best.selection.hitters.map(p => events.get(p.id)!);
+  const polished = polishOrder(rows, best.order);
+
+  const heuristic = getBestLineup(team);
+  return {
+    archetype,
+    order: polished.order.map(i => best.selection.hitters[i]),
+    runsPerGame: polished.value,
+    heuristicRuns: evaluateBattingOrder(heuristic.map(p => events.get(p.id)!)),
+    nodes
+  };
+};
+
+/** Average stuff and control of a staff's starters of each archetype (defaults where a staff has none). */
+export const getStarterProfiles = (teams: Team[]): Record<StarterArchetype, StarterProfile> => {
+  const starters = teams.flatMap(t => t.roster.filter(p => p.position === Position.P && p.rotationSlot >= 1 && p.rotationSlot <= 5));
+  const profile = (archetype: StarterArchetype): StarterProfile => {
+    const group = starters.filter(p => getStarterArchetype(p) === archetype);
+    if (group.length === 0) return DEFAULT_STARTER_PROFILES[archetype];
+    return {
+      stuff: group.reduce((sum, p) => sum + (p.attributes.stuff || 50), 0) / group.length,
+      control: group.reduce((sum, p) => sum + (p.attributes.control || 50), 0) / group.length
+    };
+  };
+  return { power: profile('power'), finesse: profile('finesse') };
+};
+
+/** Lineups against league-average power and finesse starters for every team. */
+export const optimizeLeagueLineups = (teams: Team[]): Map<string, TeamLineups> => {
+  const profiles = getStarterProfiles(teams);
+  return new Map(teams.map(team => [team.id, {
+    power: optimizeLineup(team, profiles.power, 'power'),
+    finesse: optimizeLineup(team, profiles.finesse, 'finesse')
+  }]));
+};
+
+/** Whether a plan still holds for this series: same opponent and all of its hitters healthy. */
+export const isLineupPlanCurrent = (plan: LineupPlan | undefined, team: Team, opponent: Team): plan is LineupPlan => {
+  if (!plan || plan.teamId !== team.id || plan.opponentId !== opponent.id) return false;
+  const healthy = (id: string) => team.roster.some(p => p.id === id && !p.injury.isInjured);
+  return plan.vsPower.every(healthy) && plan.vsFinesse.every(healthy);
+};
+
+/**
+ * Lineups for a series, against the opposing rotation. The previous plan is reused while
+ * it is current (isLineupPlanCurrent).
+ */
+export const planSeriesLineups = (team: Team, opponent: Team, previous?: LineupPlan): LineupPlan => {
+  if (isLineupPlanCurrent(previous, team, opponent)) return previous;
+  const profiles = getStarterProfiles([opponent]);
+  return {
+    teamId: team.id,
+    opponentId: opponent.id,
+    vsPower: optimizeLineup(team, profiles.power, 'power').order.map(p => p.id),
+    vsFinesse: optimizeLineup(team, profiles.finesse, 'finesse').order.map(p => p.id)
+  };
+};
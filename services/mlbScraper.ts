@@ -1,70 +1,17 @@
 
 import { Player, Position, StaffMember, PlayerRatings, PlayerHistoryEntry, StatsCounters, DefensiveStats, PitchRepertoireEntry, SavantBatterStats, SavantPitchingStats } from "../types";
 
-// Import real pitch arsenal data fetched from Baseball Savant via pybaseball
-import pitchArsenalData from './pitchArsenals.json';
-
-// Import real batter savant data fetched from Baseball Savant via pybaseball
-import batterSavantData from './batterSavant.json';
-
-// Import real pitcher savant data fetched from Baseball Savant via pybaseball
-import pitcherSavantData from './pitcherSavant.json';
+// Real Baseball Savant data (batter/pitcher stats and pitch arsenals) fetched via pybaseball,
+// normalized into services/savantRegistry.json by scripts/savantRegistry.py
+import { getBatterSavant, getPitcherSavant, getPitcherArsenal } from './savantRegistry';
+import { getSnapshotResponse } from './rosterSnapshot';
+import { buildNearestArsenal } from './arsenalIndex';
 
 const BASE_URL = "https://statsapi.mlb.com/api/v1";
 
-// Type the imported arsenal data (new structure with names and history)
-interface PitcherArsenalData {
-    name: string;
-    mlbId: number;
-    currentArsenal: PitchRepertoireEntry[];
-    arsenalHistory: Record<string, PitchRepertoireEntry[]>;  // year -> arsenal
-}
-
-interface PitchArsenalCache {
-    lastUpdated: string;
-    source: string;
-    years: number[];
-    pitcherCount: number;
-    pitchers: Record<string, PitcherArsenalData>;
-}
-
-const realArsenals: PitchArsenalCache = pitchArsenalData as PitchArsenalCache;
-
-// Type the imported batter savant data
-interface BatterSavantEntry {
-    name: string;
-    mlbId: number;
-    currentStats: SavantBatterStats | null;
-    statsHistory: Record<string, SavantBatterStats>;
-}
-
-interface BatterSavantCache {
-    lastUpdated: string;
-    source: string;
-    years: number[];
-    batterCount: number;
-    batters: Record<string, BatterSavantEntry>;
-}
-
-const realBatterSavant: BatterSavantCache = batterSavantData as unknown as BatterSavantCache;
-
-// Type the imported pitcher savant data
-interface PitcherSavantEntry {
-    name: string;
-    mlbId: number;
-    currentStats: SavantPitchingStats | null;
-    statsHistory: Record<string, SavantPitchingStats>;
-}
-
-interface PitcherSavantCache {
-    lastUpdated: string;
-    source: string;
-    years: number[];
-    pitcherCount: number;
-    pitchers: Record<string, PitcherSavantEntry>;
-}
-
-const realPitcherSavant: PitcherSavantCache = pitcherSavantData as unknown as PitcherSavantCache;
+// Answer from the prebuilt roster snapshot when it has the path, otherwise hit the live API
+const apiFetch = async (path: string): Promise<Response> =>
+    (await getSnapshotResponse(path)) || fetch(`${BASE_URL}${path}`);
 
 const mapPosition = (posData: any): Position => {
     if (
@@ -165,7 +112,7 @@ const calculateWOBA = (bb: number, hbp: number, h: number, d: number, t: number,
 
 export const fetchCoachingStaff = async (teamMlbId: number): Promise<StaffMember[]> => {
     try {
-        const res = await fetch(`${BASE_URL}/teams/${teamMlbId}/coaches`);
+        const res = await apiFetch(`/teams/${teamMlbId}/coaches`);
         if (!res.ok) return [];
         const data = await res.json();
         const coaches = data.roster || [];
@@ -198,8 +145,8 @@ const fetchPitchArsenal = async (personId: number): Promise<PitchRepertoireEntry
         // 1. Primary: pitchArsenal stats endpoint
         // 2. Fallback: statSplits with pitch type breakdown
         const [arsenalRes, splitsRes] = await Promise.all([
-            fetch(`${BASE_URL}/people/${personId}/stats?stats=pitchArsenal&group=pitching`),
-            fetch(`${BASE_URL}/people/${personId}/stats?stats=statSplits&sitCodes=pitch&group=pitching&season=2025`)
+            apiFetch(`/people/${personId}/stats?stats=pitchArsenal&group=pitching`),
+            apiFetch(`/people/${personId}/stats?stats=statSplits&sitCodes=pitch&group=pitching&season=2025`)
         ]);
         
         let arsenal: PitchRepertoireEntry[] = [];
@@ -254,55 +201,34 @@ const fetchPitchArsenal = async (personId: number): Promise<PitchRepertoireEntry
     }
 };
 
-const buildFallbackArsenal = (velocityRating: number, stuff: number, role: 'starter' | 'reliever'): PitchRepertoireEntry[] => {
-    // Build a REALISTIC pitch mix - most pitchers have 3-5 pitches, NOT 7-9
-    // MLB average: Starters ~4 pitches, Relievers ~2-3 pitches
-    const isPower = velocityRating >= 70 || stuff >= 60;
-    
-    // Randomly select a realistic number of pitches based on role
-    // Starters: 3-5 pitches, Relievers: 2-3 pitches
-    const numPitches = role === 'starter' 
-        ? Math.floor(Math.random() * 3) + 3  // 3-5 pitches
-        : Math.floor(Math.random() * 2) + 2; // 2-3 pitches
-    
-    // Primary pitch selection (every pitcher has a fastball)
-    const primaryFastball = Math.random() < 0.65 
-        ? { type: 'Four-Seam Fastball', speed: 95, usage: role === 'reliever' ? 55 : 45 }
-        : { type: 'Sinker', speed: 93, usage: role === 'reliever' ? 50 : 40 };
-    
-    // Available secondary pitch pool
-    const secondaryPool: PitchRepertoireEntry[] = [
-        { type: 'Slider', speed: 88, usage: 25 },
-        { type: 'Changeup', speed: 86, usage: 18 },
-        { type: 'Curveball', speed: 82, usage: 15 },
-        { type: 'Cutter', speed: 92, usage: 20 },
-        { type: 'Sweeper', speed: 84, usage: 18 },
-        { type: 'Splitter', speed: 85, usage: 12 }
-    ];
-    
-    // Shuffle and pick random secondaries
-    const shuffled = secondaryPool.sort(() => Math.random() - 0.5);
-    const selectedSecondaries = shuffled.slice(0, numPitches - 1);
-    
-    // Build final arsenal
-    const arsenal: PitchRepertoireEntry[] = [primaryFastball, ...selectedSecondaries];
-    
-    // Normalize usage to 100%
-    const total = arsenal.reduce((sum, p) => sum + p.usage, 0);
-    const normalized = arsenal.map(p => ({ ...p, usage: Math.round((p.usage / total) * 100) }));
-    
-    // Ensure total is exactly 100%
-    const adjustedTotal = normalized.reduce((sum, p) => sum + p.usage, 0);
-    if (adjustedTotal !== 100) {
-        normalized[0].usage += (100 - adjustedTotal);
-    }
-    
-    return normalized.sort((a, b) => b.usage - a.usage);
+// Map rating -> fastball velocity; relievers often sit a tick higher
+const ratingFastballVelo = (velocityRating: number, role: 'starter' | 'reliever'): number =>
+    Math.min(103, Math.max(88, 87 + (velocityRating * 0.16) + (role === 'reliever' ? 1.5 : 0)));
+
+const buildFallbackArsenal = (
+    velocityRating: number,
+    stuff: number,
+    control: number,
+    role: 'starter' | 'reliever',
+    savant?: SavantPitchingStats | null
+): PitchRepertoireEntry[] => {
+    // Blend the arsenals of the most similar real pitchers (scripts/buildArsenalIndex.py).
+    // Savant numbers when the pitcher has them, otherwise the ratings mapped back to rates:
+    // stuff and control come from K/9 (5-12) and BB/9 (1-4), at ~38.5 batters per 9 innings.
+    const k9 = 5 + ((stuff - 20) / 79) * 7;
+    const bb9 = 4 - ((control - 20) / 79) * 3;
+    return buildNearestArsenal({
+        fastballVelo: savant?.fastball_velo || ratingFastballVelo(velocityRating, role),
+        whiffPct: savant?.whiff_pct || undefined,
+        gbPct: savant?.gb_pct || undefined,
+        kPct: savant?.k_pct || (k9 / 38.5) * 100,
+        bbPct: savant?.bb_pct || (bb9 / 38.5) * 100,
+        role
+    });
 };
 
 const rebaseArsenalSpeeds = (arsenal: PitchRepertoireEntry[], velocityRating: number, role: 'starter' | 'reliever'): PitchRepertoireEntry[] => {
-    // Map rating -> fastball velocity; relievers often sit a tick higher
-    const baseFastball = Math.min(103, Math.max(88, 87 + (velocityRating * 0.16) + (role === 'reliever' ? 1.5 : 0)));
+    const baseFastball = ratingFastballVelo(velocityRating, role);
     const offset = (type: string) => {
         const t = type.toLowerCase();
         if (t.includes('four-seam') || t.includes('fastball')) return 0;
@@ -366,12 +292,12 @@ export const fetchRealRoster = async (teamMlbId: number): Promise<Player[]> => {
     try {
         // OPTIMIZED: Single hydrated API call replaces N+1 per-player requests
         // This fetches roster + person details + all hitting/pitching/fielding stats in ONE call
-        const hydrateUrl = `${BASE_URL}/teams/${teamMlbId}/roster?rosterType=fullRoster&hydrate=person(stats(type=[yearByYear,career],group=[hitting,pitching,fielding],gameType=R))`;
-        const activeRosterUrl = `${BASE_URL}/teams/${teamMlbId}/roster?rosterType=active`;
+        const hydratePath = `/teams/${teamMlbId}/roster?rosterType=fullRoster&hydrate=person(stats(type=[yearByYear,career],group=[hitting,pitching,fielding],gameType=R))`;
+        const activeRosterPath = `/teams/${teamMlbId}/roster?rosterType=active`;
         
         const [hydrateRes, activeRes] = await Promise.all([
-            fetch(hydrateUrl),
-            fetch(activeRosterUrl)
+            apiFetch(hydratePath),
+            apiFetch(activeRosterPath)
         ]);
         
         if (!hydrateRes.ok && !activeRes.ok) throw new Error("Failed to fetch roster");
@@ -413,7 +339,7 @@ export const fetchRealRoster = async (teamMlbId: number): Promise<Player[]> => {
                 // Only fetch pitch arsenal if NOT in static Baseball Savant data AND is a pitcher
                 const isPitcher = p.position?.type === 'Pitcher' || 
                     ['P', 'SP', 'RP', 'CL', 'RHP', 'LHP'].includes(p.position?.abbreviation || '');
-                const hasStaticArsenal = realArsenals.pitchers[String(personId)]?.currentArsenal?.length > 0;
+                const hasStaticArsenal = (getPitcherArsenal(personId)?.currentArsenal?.length || 0) > 0;
                 
                 let arsenalRaw: PitchRepertoireEntry[] = [];
                 if (isPitcher && !hasStaticArsenal) {
@@ -442,7 +368,7 @@ export const fetchRealRoster = async (teamMlbId: number): Promise<Player[]> => {
                 let arsenalHistory: Record<string, PitchRepertoireEntry[]> = {};
                 
                 // Priority 1: Check real Baseball Savant data (most accurate, includes historical data)
-                const realPitcherData = realArsenals.pitchers[String(personId)];
+                const realPitcherData = getPitcherArsenal(personId);
                 if (realPitcherData && realPitcherData.currentArsenal && realPitcherData.currentArsenal.length > 0) {
                     arsenal = realPitcherData.currentArsenal;
                     arsenalHistory = realPitcherData.arsenalHistory || {};
@@ -453,11 +379,10 @@ export const fetchRealRoster = async (teamMlbId: number): Promise<Player[]> => {
                     arsenal = arsenalRaw;
                     console.log(`[${personId}] Using MLB API arsenal: ${arsenal.length} pitches`);
                 }
-                // Priority 3: Build fallback arsenal (rare - only for new/minor league pitchers)
+                // Priority 3: Nearest-neighbor fallback (rare - only for new/minor league pitchers),
+                // built once ratings and role are known
                 else {
-                    const role = (p.position?.abbreviation === 'SP') ? 'starter' : 'reliever';
-                    arsenal = buildFallbackArsenal(50, 50, role);
-                    console.log(`[${personId}] Using fallback arsenal: ${arsenal.length} pitches`);
+                    console.log(`[${personId}] No arsenal data, using nearest real pitchers`);
                 }
 
                 const historyMap = new Map<string, PlayerHistoryEntry>();
@@ -716,7 +641,7 @@ export const fetchRealRoster = async (teamMlbId: number): Promise<Player[]> => {
                         
                         // Enhance pitcher ratings with Savant data if available
                         // Use WEIGHTED BLEND across years (not just current) for injury resilience
-                        const pitcherSavantEntry = realPitcherSavant.pitchers[String(personId)];
+                        const pitcherSavantEntry = getPitcherSavant(personId);
                         let pitcherSavant: SavantPitchingStats | null = null;
                         
                         if (pitcherSavantEntry) {
@@ -833,7 +758,7 @@ export const fetchRealRoster = async (teamMlbId: number): Promise<Player[]> => {
                     const hStats = history.find(h => (h.year === '2025' || h.year === '2024') && h.stats.avg !== undefined)?.stats;
 
                     // Try to get real Baseball Savant batter data
-                    const realBatterData = realBatterSavant.batters[String(personId)];
+                    const realBatterData = getBatterSavant(personId);
                     let savantCurrent: SavantBatterStats | null = null;
                     let savantHistory: Record<string, SavantBatterStats> = {};
                     
@@ -973,32 +898,30 @@ export const fetchRealRoster = async (teamMlbId: number): Promise<Player[]> => {
 
                 const meta = { isStarter, rating: overall, saves: (s25?.saves || 0), recentStarts, recentIp };
 
-                // Rebase pitch speeds ONLY for fallback/synthetic arsenals
-                // Real Baseball Savant data should remain untouched
+                // Rebase pitch speeds ONLY for MLB API arsenals
+                // Real Baseball Savant data and nearest-neighbor fallbacks should remain untouched
                 const finalRole: 'starter' | 'reliever' = isStarter ? 'starter' : 'reliever';
                 
                 // If we have real Baseball Savant data, use it as-is
                 const hasRealData = realPitcherData && realPitcherData.currentArsenal && realPitcherData.currentArsenal.length > 0;
                 
                 if (!hasRealData && arsenal.length === 0) {
-                    // Only use fallback if no real data exists
-                    arsenal = buildFallbackArsenal(attributes.velocity, attributes.stuff, finalRole);
-                }
-                
-                // Only rebase synthetic/fallback arsenals, not real data
-                if (!hasRealData) {
+                    // Only use fallback if no real data exists; its speeds already match the velocity
+                    arsenal = buildFallbackArsenal(attributes.velocity, attributes.stuff, attributes.control, finalRole, getPitcherSavant(personId)?.currentStats);
+                } else if (!hasRealData) {
+                    // Rebase MLB API arsenals, not real Savant data
                     arsenal = rebaseArsenalSpeeds(arsenal, attributes.velocity, finalRole);
                 }
                 
                 const avgVelo = arsenal.reduce((sum, p) => sum + (p.speed * (p.usage || 0)), 0) / (arsenal.reduce((sum, p) => sum + (p.usage || 0), 1));
 
                 // Prepare Savant batter data for the player object
-                const realBatterEntry = realBatterSavant.batters[String(personId)];
+                const realBatterEntry = getBatterSavant(personId);
                 const playerSavantBatting = realBatterEntry?.currentStats || undefined;
                 const playerSavantBattingHistory = realBatterEntry?.statsHistory || undefined;
 
                 // Prepare Savant pitcher data for the player object
-                const realPitcherEntry = realPitcherSavant.pitchers[String(personId)];
+                const realPitcherEntry = getPitcherSavant(personId);
                 const playerSavantPitching = realPitcherEntry?.currentStats || undefined;
                 const playerSavantPitchingHistory = realPitcherEntry?.statsHistory || undefined;
 
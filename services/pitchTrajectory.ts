@@ -0,0 +1,238 @@
+import { ReplayEvent, ReplayPitchEvent, ReplayVector3 } from "../types";
+
+// Pitch trajectories for replays.
+//
+// A pitch is fully described by its type, release point and plate point: the ball path between
+// them (late-breaking quadratic movement) is a pure function of those. The simulator only
+// samples the two points per pitch and stores them (the compact form); paths are synthesized in
+// batches, as flat arrays, when a replay is opened (withBallPaths) or for bulk generation
+// (generatePitchBatch). scripts/replayCodec.py regenerates the same paths when decoding archives.
+
+export const PITCH_PATH_POINTS = 10;
+const PATH_STRIDE = (PITCH_PATH_POINTS + 1) * 3;
+
+// Strike zone is roughly x: [-0.83, 0.83] (17 inches / 2 scaled), y: [1.5, 3.5]
+const ZONE_LEFT = -0.83;
+const ZONE_RIGHT = 0.83;
+const ZONE_BOT = 1.5;
+const ZONE_TOP = 3.5;
+const ZONE_MID_X = 0;
+const ZONE_MID_Y = 2.5;
+
+export interface PitchBreak {
+  x: number;     // lateral break
+  drop: number;  // vertical drop
+}
+
+export interface PitchLocation {
+  releasePoint: ReplayVector3;
+  platePoint: ReplayVector3;
+}
+
+export interface PitchParams {
+  pitchType: string;
+  speed: number;
+  result?: string;
+  control?: number;
+}
+
+export interface PitchBatch {
+  count: number;
+  release: Float64Array;  // [pitch * 3 + axis]
+  plate: Float64Array;    // [pitch * 3 + axis]
+  paths: Float64Array;    // [pitch * (PITCH_PATH_POINTS + 1) * 3 + point * 3 + axis]
+}
+
+// Pitch types repeat constantly, so the name matching runs once per distinct type
+const breakCache = new Map<string, PitchBreak>();
+
+export const getPitchBreak = (pitchType: string): PitchBreak => {
+  let cached = breakCache.get(pitchType);
+  if (!cached) {
+    const type = pitchType.toLowerCase();
+    cached = {
+      x: type.includes('slider') ? -0.35 : type.includes('curve') ? -0.30 : type.includes('cutter') ? -0.20 : type.includes('change') ? 0.12 : type.includes('sinker') ? 0.10 : -0.08,
+      drop: type.includes('curve') ? -0.9 : type.includes('slider') ? -0.5 : type.includes('change') ? -0.5 : type.includes('sinker') ? -0.4 : -0.25
+    };
+    breakCache.set(pitchType, cached);
+  }
+  return cached;
+};
+
+/**
+ * Release and plate points for one pitch: the target depends on the result (balls outside the
+ * zone, called strikes on the edges, better control paints more corners), plus the pitch's
+ * movement. Uses `random` in the same order as the original per-pitch path builder.
+ */
+export const samplePitchLocation = (
+  pitchType: string,
+  speed: number,
+  pitchResult?: string,
+  pitcherControl?: number,
+  random: () => number = Math.random
+): PitchLocation => {
+  const speedNorm = Math.max(0, Math.min(1, (speed - 70) / 35));
+  const control = pitcherControl ?? 50;
+  const controlNorm = control / 100; // 0 = wild, 1 = elite command
+  const { x: baseBreakX, drop: baseDrop } = getPitchBreak(pitchType);
+
+  let targetX: number;
+  let targetY: number;
+
+  // Gaussian-ish random using Box-Muller
+  const gaussRand = () => {
+    const u1 = random();
+    const u2 = random();
+    return Math.sqrt(-2 * Math.log(u1 || 0.001)) * Math.cos(2 * Math.PI * u2);
+  };
+
+  if (pitchResult === 'Ball' || pitchResult === 'WP') {
+    // Ball: Target outside the zone (corners, edges, off-plate)
+    const side = random();
+    if (side < 0.3) {
+      // Low ball
+      targetX = ZONE_MID_X + gaussRand() * 0.5;
+      targetY = ZONE_BOT - 0.3 - random() * 0.8;
+    } else if (side < 0.55) {
+      // High ball
+      targetX = ZONE_MID_X + gaussRand() * 0.4;
+      targetY = ZONE_TOP + 0.2 + random() * 0.6;
+    } else if (side < 0.75) {
+      // Inside/outside off plate
+      targetX = (random() < 0.5 ? -1 : 1) * (ZONE_RIGHT + 0.2 + random() * 0.7);
+      targetY = ZONE_MID_Y + gaussRand() * 0.6;
+    } else {
+      // Just off a corner
+      const cornerX = random() < 0.5 ? ZONE_LEFT - 0.15 : ZONE_RIGHT + 0.15;
+      const cornerY = random() < 0.5 ? ZONE_BOT - 0.15 : ZONE_TOP + 0.15;
+      targetX = cornerX + gaussRand() * 0.15;
+      targetY = cornerY + gaussRand() * 0.15;
+    }
+  } else if (pitchResult === 'StrikeSwinging' || pitchResult === 'InPlay') {
+    // Swinging strike / In play: Can be anywhere in or near the zone
+    // Better control → paint corners more; worse → more center
+    const cornerBias = 0.3 + controlNorm * 0.5; // 0.3 - 0.8
+    if (random() < cornerBias) {
+      // Aim for corner/edge
+      const edgeX = random() < 0.5 ? ZONE_LEFT + 0.15 : ZONE_RIGHT - 0.15;
+      const edgeY = random() < 0.5 ? ZONE_BOT + 0.3 : ZONE_TOP - 0.3;
+      targetX = edgeX + gaussRand() * (0.3 - controlNorm * 0.15);
+      targetY = edgeY + gaussRand() * (0.3 - controlNorm * 0.15);
+    } else {
+      // More centrally located
+      targetX = ZONE_MID_X + gaussRand() * 0.45;
+      targetY = ZONE_MID_Y + gaussRand() * 0.5;
+    }
+  } else if (pitchResult === 'StrikeLooking') {
+    // Called strike: Must be in the zone - pitchers paint edges
+    const edgeBias = 0.2 + controlNorm * 0.6;
+    if (random() < edgeBias) {
+      // Edge/corner
+      targetX = (random() < 0.5 ? ZONE_LEFT + 0.2 : ZONE_RIGHT - 0.2) + gaussRand() * 0.2;
+      targetY = (random() < 0.5 ? ZONE_BOT + 0.25 : ZONE_TOP - 0.25) + gaussRand() * 0.2;
+    } else {
+      targetX = ZONE_MID_X + gaussRand() * 0.35;
+      targetY = ZONE_MID_Y + gaussRand() * 0.4;
+    }
+    // Keep strictly in zone
+    targetX = Math.max(ZONE_LEFT, Math.min(ZONE_RIGHT, targetX));
+    targetY = Math.max(ZONE_BOT, Math.min(ZONE_TOP, targetY));
+  } else if (pitchResult === 'Foul') {
+    // Foul: typically contact zone - anywhere in or near zone
+    targetX = ZONE_MID_X + gaussRand() * 0.55;
+    targetY = ZONE_MID_Y + gaussRand() * 0.55;
+  } else {
+    // Default / HBP: wide inside
+    targetX = (random() < 0.5 ? -1.2 : 1.2) + gaussRand() * 0.2;
+    targetY = ZONE_MID_Y + gaussRand() * 0.4;
+  }
+
+  // Apply pitch movement on top of target
+  targetX += baseBreakX * (1 - speedNorm * 0.25) * 0.3;
+  targetY += baseDrop * 0.15;
+
+  const releasePoint = { x: 0.5 + gaussRand() * 0.08, y: 1.9 + gaussRand() * 0.05, z: 54 };
+  const platePoint = { x: targetX, y: targetY, z: 1.4 };
+  return { releasePoint, platePoint };
+};
+
+// Path shape per point: t, and the late break share t^2
+const PATH_T = Float64Array.from({ length: PITCH_PATH_POINTS + 1 }, (_, i) => i / PITCH_PATH_POINTS);
+const PATH_BREAK = PATH_T.map(t => t * t);
+
+/**
+ * Ball paths for a batch of pitches, from their types and release/plate points (flat
+ * [pitch * 3 + axis] arrays), into one flat array of PITCH_PATH_POINTS + 1 points per pitch.
+ */
+export const buildPitchPaths = (pitchTypes: ArrayLike<string>, release: Float64Array, plate: Float64Array): Float64Array => {
+  const count = pitchTypes.length;
+  const paths = new Float64Array(count * PATH_STRIDE);
+  for (let p = 0; p < count; p++) {
+    const { x: breakX, drop } = getPitchBreak(pitchTypes[p]);
+    const rx = release[p * 3];
+    const ry = release[p * 3 + 1];
+    const rz = release[p * 3 + 2];
+    const dx = plate[p * 3] - rx;
+    const dy = plate[p * 3 + 1] - ry;
+    const dz = plate[p * 3 + 2] - rz;
+    let out = p * PATH_STRIDE;
+    for (let i = 0; i <= PITCH_PATH_POINTS; i++) {
+      // Break that develops late (quadratic curves)
+      const t = PATH_T[i];
+      const progress = PATH_BREAK[i];
+      const lateral = breakX * progress * 0.3;
+      const vertical = drop * progress * 0.15;
+      paths[out++] = rx + (dx - lateral) * t + lateral * progress;
+      paths[out++] = ry + (dy - vertical) * t + vertical * progress;
+      paths[out++] = rz + dz * t;
+    }
+  }
+  return paths;
+};
+
+/** Locations and paths for a batch of pitches in one pass (types, speeds, results, control). */
+export const generatePitchBatch = (pitches: PitchParams[], random: () => number = Math.random): PitchBatch => {
+  const count = pitches.length;
+  const release = new Float64Array(count * 3);
+  const plate = new Float64Array(count * 3);
+  pitches.forEach((pitch, p) => {
+    const { releasePoint, platePoint } = samplePitchLocation(pitch.pitchType, pitch.speed, pitch.result, pitch.control, random);
+    release[p * 3] = releasePoint.x;
+    release[p * 3 + 1] = releasePoint.y;
+    release[p * 3 + 2] = releasePoint.z;
+    plate[p * 3] = platePoint.x;
+    plate[p * 3 + 1] = platePoint.y;
+    plate[p * 3 + 2] = platePoint.z;
+  });
+  return { count, release, plate, paths: buildPitchPaths(pitches.map(p => p.pitchType), release, plate) };
+};
+
+/** One pitch's path from a flat batch, as replay points. */
+export const getBatchPath = (paths: Float64Array, pitch: number): ReplayVector3[] => {
+  const points: ReplayVector3[] = [];
+  for (let i = pitch * PATH_STRIDE; i < (pitch + 1) * PATH_STRIDE; i += 3) {
+    points.push({ x: paths[i], y: paths[i + 1], z: paths[i + 2] });
+  }
+  return points;
+};
+
+/**
+ * Replay events with every pitch's ball path: stored paths are kept, missing ones (the compact
+ * form the simulator writes) are synthesized together in one batch.
+ */
+export const withBallPaths = <T extends ReplayEvent>(events: T[]): T[] => {
+  const missing = events.filter((e): e is T & ReplayPitchEvent => e.kind === 'pitch' && !(e.ballPath && e.ballPath.length > 0));
+  if (missing.length === 0) return events;
+  const release = new Float64Array(missing.length * 3);
+  const plate = new Float64Array(missing.length * 3);
+  missing.forEach((p, i) => {
+    release.set([p.releasePoint.x, p.releasePoint.y, p.releasePoint.z], i * 3);
+    plate.set([p.platePoint.x, p.platePoint.y, p.platePoint.z], i * 3);
+  });
+  const paths = buildPitchPaths(missing.map(p => p.pitchType), release, plate);
+  const filled = new Map<T, ReplayVector3[]>(missing.map((p, i) => [p, getBatchPath(paths, i)]));
+  return events.map(e => {
+    const ballPath = filled.get(e);
+    return ballPath ? { ...e, ballPath } : e;
+  });
+};
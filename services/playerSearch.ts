@@ -0,0 +1,185 @@
+// Fuzzy player-name search: accent folding, prefix matching on any part of the name,
+// first-name nicknames and trigram typo tolerance.
+// Same rules as scripts/playerSearch.py (which indexes the Savant registry) - keep them in sync.
+
+export interface PlayerSearchMatch<T> {
+    id: T;
+    name: string;
+    score: number;
+}
+
+export interface PlayerSearchIndex<T> {
+    search: (query: string, limit?: number) => PlayerSearchMatch<T>[];
+}
+
+// Minimum trigram (Dice) similarity for a fuzzy match
+const MIN_SIMILARITY = 0.35;
+
+const NICKNAME_GROUPS: string[][] = [
+    ['michael', 'mike', 'mikey'],
+    ['matthew', 'matt'],
+    ['alexander', 'alex', 'alejandro'],
+    ['nicholas', 'nick', 'nico'],
+    ['christopher', 'chris'],
+    ['joshua', 'josh'],
+    ['jacob', 'jake'],
+    ['zachary', 'zach', 'zack'],
+    ['william', 'will', 'bill', 'billy', 'willie'],
+    ['robert', 'rob', 'bob', 'bobby', 'robbie'],
+    ['daniel', 'dan', 'danny'],
+    ['anthony', 'tony'],
+    ['joseph', 'joe', 'joey'],
+    ['jonathan', 'jon', 'jonny'],
+    ['benjamin', 'ben'],
+    ['samuel', 'sam', 'sammy'],
+    ['thomas', 'tom', 'tommy'],
+    ['andrew', 'andy', 'drew'],
+    ['peter', 'pete'],
+    ['cameron', 'cam'],
+    ['nathaniel', 'nathan', 'nate'],
+    ['edward', 'ed', 'eddie'],
+    ['james', 'jim', 'jimmy', 'jamie'],
+    ['gregory', 'greg'],
+    ['jeffrey', 'jeff'],
+    ['kenneth', 'ken', 'kenny'],
+    ['steven', 'stephen', 'steve'],
+    ['frederick', 'fred', 'freddie', 'freddy'],
+    ['manuel', 'manny'],
+    ['javier', 'javy'],
+    ['vladimir', 'vlad', 'vladdy'],
+    ['richard', 'rich', 'rick', 'ricky'],
+    ['timothy', 'tim', 'timmy'],
+    ['charles', 'charlie', 'chuck'],
+    ['theodore', 'ted', 'teddy', 'theo'],
+    ['mitchell', 'mitch'],
+    ['francisco', 'frankie', 'frank', 'pancho'],
+    ['enrique', 'kike'],
+    ['jose', 'pepe'],
+    ['jackson', 'jack'],
+    ['maxwell', 'max'],
+];
+
+const NICKNAMES = new Map<string, string[]>();
+NICKNAME_GROUPS.forEach(group => {
+    group.forEach(name => {
+        const others = group.filter(n => n !== name);
+        NICKNAMES.set(name, [...(NICKNAMES.get(name) || []), ...others]);
+    });
+});
+
+// "José Ramírez" -> "jose ramirez", "J. T. Realmuto" -> "jt realmuto"
+export const foldName = (name: string): string => {
+    const stripped = (name || '')
+        .normalize('NFKD')
+        .replace(/[\u0300-\u036f]/g, '')
+        .toLowerCase()
+        .replace(/[.'`]/g, '');
+    const tokens = stripped.replace(/[^a-z0-9 ]/g, ' ').split(/\s+/).filter(Boolean);
+    // Run initials together
+    const merged: string[] = [];
+    let inInitials = false;
+    for (const token of tokens) {
+        const isInitial = token.length === 1 && /[a-z]/.test(token);
+        if (isInitial && inInitials) merged[merged.length - 1] += token;
+        else merged.push(token);
+        inInitials = isInitial;
+    }
+    return merged.join(' ');
+};
+
+const trigrams = (text: string): Set<string> => {
+    const padded = `  ${text} `;
+    const result = new Set<string>();
+    for (let i = 0; i < padded.length - 2; i++) result.add(padded.slice(i, i + 3));
+    return result;
+};
+
+const lowerBound = (keys: string[], target: string): number => {
+    let lo = 0;
+    let hi = keys.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (keys[mid] < target) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+};
+
+export const createPlayerSearch = <T>(entries: { id: T; name: string }[]): PlayerSearchIndex<T> => {
+    const folded = entries.map(e => foldName(e.name));
+    const trigramCounts = folded.map(f => trigrams(f).size);
+
+    // Sorted prefix table over the full name and every trailing part of it
+    const keyPairs: [string, number][] = [];
+    const postings = new Map<string, number[]>();
+    folded.forEach((name, idx) => {
+        const tokens = name.split(' ');
+        for (let i = 0; i < tokens.length; i++) keyPairs.push([tokens.slice(i).join(' '), idx]);
+        trigrams(name).forEach(tri => {
+            const list = postings.get(tri);
+            if (list) list.push(idx);
+            else postings.set(tri, [idx]);
+        });
+    });
+    keyPairs.sort((a, b) => (a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : a[1] - b[1]));
+    const keyText = keyPairs.map(k => k[0]);
+    const keyPlayer = keyPairs.map(k => k[1]);
+
+    const prefixMatches = (prefix: string): number[] => {
+        const matches: number[] = [];
+        for (let pos = lowerBound(keyText, prefix); pos < keyText.length && keyText[pos].startsWith(prefix); pos++) {
+            matches.push(keyPlayer[pos]);
+        }
+        return matches;
+    };
+
+    const search = (query: string, limit = 10): PlayerSearchMatch<T>[] => {
+        const q = foldName(query);
+        if (!q) return [];
+        const scores = new Map<number, number>();
+        const offer = (idx: number, score: number) => {
+            if (score > (scores.get(idx) || 0)) scores.set(idx, score);
+        };
+
+        const tokens = q.split(' ');
+        const variants = [q, ...(NICKNAMES.get(tokens[0]) || []).slice().sort().map(alt => [alt, ...tokens.slice(1)].join(' '))];
+        variants.forEach((variant, rank) => {
+            // Nickname expansions rank just below the literal query
+            const penalty = rank === 0 ? 0 : 0.05;
+            prefixMatches(variant).forEach(idx => {
+                const full = folded[idx];
+                if (full === variant) offer(idx, 3.0 - penalty);
+                else if (full.startsWith(variant)) offer(idx, 2.5 - penalty);
+                else offer(idx, 2.0 - penalty);
+            });
+            // Multi-word queries: every query token must prefix some name token ("sho oht")
+            const variantTokens = variant.split(' ');
+            if (variantTokens.length > 1) {
+                new Set(prefixMatches(variantTokens[variantTokens.length - 1])).forEach(idx => {
+                    const nameTokens = folded[idx].split(' ');
+                    if (variantTokens.every(qt => nameTokens.some(nt => nt.startsWith(qt)))) offer(idx, 1.8 - penalty);
+                });
+            }
+        });
+
+        // Typo tolerance: trigram Dice similarity when prefix matching comes up short
+        if (scores.size < limit) {
+            const queryTris = trigrams(q);
+            const shared = new Map<number, number>();
+            queryTris.forEach(tri => {
+                (postings.get(tri) || []).forEach(idx => shared.set(idx, (shared.get(idx) || 0) + 1));
+            });
+            shared.forEach((count, idx) => {
+                const similarity = (2 * count) / (queryTris.size + trigramCounts[idx]);
+                if (similarity >= MIN_SIMILARITY) offer(idx, similarity);
+            });
+        }
+
+        return [...scores.entries()]
+            .sort((a, b) => b[1] - a[1] || (folded[a[0]] < folded[b[0]] ? -1 : folded[a[0]] > folded[b[0]] ? 1 : 0))
+            .slice(0, limit)
+            .map(([idx, score]) => ({ id: entries[idx].id, name: entries[idx].name, score: Math.round(score * 1000) / 1000 }));
+    };
+
+    return { search };
+};
@@ -0,0 +1,26 @@
+import { keyedUniform } from "./fastSim";
+
+// Offseason rating progression shared by progressionSystem (services/simulator.ts) and dynasty
+// projections (services/dynasty.ts). With the same seed, a replayed offseason matches universe 0
+// of a projection.
+
+export const RATING_MIN = 40;
+export const RATING_MAX = 99;
+export const ATTRIBUTE_MIN = 20;
+export const ATTRIBUTE_MAX = 99;
+
+export const DEFAULT_PROGRESSION_SEED = 20260325;
+
+/**
+ * Rating change for a player who just turned `age`, from a uniform draw. Peak 26-29: younger
+ * players gain 0-2, peak players move -1..+1, older players lose 0-3 (one more past 33).
+ */
+export const getProgressionChange = (age: number, u: number): number => {
+  if (age < 26) return Math.round(u * 2);
+  if (age > 29) return -Math.round(u * 3) - (age > 33 ? 1 : 0);
+  return Math.round(u * 2) - 1;
+};
+
+/** Draw for one player's progression in one year of one universe. */
+export const progressionUniform = (seed: number, year: number, universe: number, player: number): number =>
+  keyedUniform((seed ^ Math.imul(year, 0x9e3779b1)) >>> 0, universe, player);
@@ -0,0 +1,42 @@
+// Pre-fetched MLB Stats API responses, built by scripts/buildRosterSnapshot.py into
+// public/rosterSnapshot.json. Responses are keyed by the API path mlbScraper requests, so a
+// snapshot hit is parsed exactly like a live response. Without a snapshot (or for a path it
+// doesn't have) the scraper falls back to the live API.
+
+const SNAPSHOT_URL = 'rosterSnapshot.json';   // served from public/, relative to the app base
+const SNAPSHOT_VERSION = 1;
+
+interface RosterSnapshot {
+    format: 'roster-snapshot';
+    version: number;
+    builtAt: string;
+    season: number;
+    teams: number[];
+    responses: Record<string, unknown>;   // API path -> JSON body (null = 404)
+}
+
+let snapshotPromise: Promise<RosterSnapshot | null> | null = null;
+
+export const loadRosterSnapshot = (): Promise<RosterSnapshot | null> => {
+    if (!snapshotPromise) {
+        snapshotPromise = fetch(SNAPSHOT_URL)
+            .then(res => (res.ok ? res.json() : null))
+            .then((data: RosterSnapshot | null) => {
+                if (data?.format !== 'roster-snapshot' || data.version !== SNAPSHOT_VERSION) return null;
+                console.log(`[Roster Snapshot] Loaded ${Object.keys(data.responses).length} responses (built ${data.builtAt})`);
+                return data;
+            })
+            // Missing file (dev server falls back to index.html) or not in a browser
+            .catch(() => null);
+    }
+    return snapshotPromise;
+};
+
+// Snapshot response for an API path, or undefined when it has to be fetched live
+export const getSnapshotResponse = async (path: string): Promise<Response | undefined> => {
+    const snapshot = await loadRosterSnapshot();
+    if (!snapshot || !(path in snapshot.responses)) return undefined;
+    const body = snapshot.responses[path];
+    if (body === null) return new Response(null, { status: 404 });
+    return new Response(JSON.stringify(body), { headers: { 'Content-Type': 'application/json' } });
+};
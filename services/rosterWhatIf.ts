@@ -0,0 +1,447 @@
+import { Team, GameResult, Player } from "../types";
+import {
+  LINEUP_SLOTS,
+  MAX_OVERALL,
+  MIN_OVERALL,
+  OFFENSE_WEIGHT,
+  PITCHING_WEIGHT,
+  ROTATION_SLOTS,
+  STRENGTH_SD,
+  TeamStrength,
+  expectedWinProbability,
+  getBattingValue,
+  getPitchingValue,
+  getPlayerWeight,
+  inverseNormalCdf,
+  isStrengthHitter,
+  isStrengthPitcher,
+  keyedUniform,
+} from "./fastSim";
+
+// Roster what-if engine: score trades, signings and releases without rebuilding teams or
+// rerunning season sims for each candidate.
+//
+// Team strength (getTeamStrength) is the mean of the top 9 hitters' batting and the top 5
+// pitchers' pitching. Each team keeps both groups sorted by selection score with prefix sums of
+// their values, so the strength after removing one player and/or adding another is a couple of
+// lookups and a binary search over a dozen entries: constant time, no roster filtering or
+// history weighting per candidate.
+//
+// Projected wins and playoff odds come from a fixed ensemble of simulated seasons (the same
+// strength-draw and per-game model as runFastSim, with common random numbers). For a team, the
+// whole ensemble is replayed once over a grid of the team's own overall strength, only
+// re-deciding that team's games, which gives a response curve of mean wins and playoff odds.
+// Every candidate move for the team is then an interpolation on the curve, so after a few tens
+// of milliseconds per team, thousands of moves are scored per millisecond-scale batch. Each move
+// is evaluated with the rest of the league as it stands (the two sides of a trade are two moves).
+
+export interface RosterMove {
+  teamId: string;
+  add?: Player;        // signing, or the player coming back in a trade
+  removeId?: string;   // release, or the player going out
+}
+
+export interface MoveEvaluation {
+  move: RosterMove;
+  strength: TeamStrength;
+  overallDelta: number;
+  projectedWins: number;
+  winsDelta: number;
+  playoffPct: number;
+  playoffDelta: number;   // percentage points
+}
+
+export interface RosterWhatIfOptions {
+  simulations?: number;
+  seed?: number;
+}
+
+// One side of a team's strength: players sorted by selection score (descending, roster order
+// on ties, like the stable sort in getTeamStrength)
+interface RankedGroup {
+  ids: string[];
+  keys: Float64Array;
+  values: Float64Array;
+  prefix: Float64Array;   // prefix[i] = sum of values[0..i)
+  rank: Map<string, number>;
+  slots: number;
+}
+
+interface ResponseCurve {
+  origin: number;          // overall at grid point 0
+  meanWins: Float64Array;  // [grid point] banked + simulated wins
+  playoff: Float64Array;   // [grid point] P(playoffs)
+}
+
+export interface RosterWhatIf {
+  teams: Team[];
+  teamIndex: Map<string, number>;
+  hitters: RankedGroup[];          // [team]
+  pitchers: RankedGroup[];
+  strengths: TeamStrength[];       // [team] current, including applied moves
+  baseWins: Int16Array;            // [team] wins already banked
+  home: Int16Array;                // [game] team index, unplayed regular-season games
+  away: Int16Array;
+  teamGameStart: Int32Array;       // [team] offset into teamGames (CSR)
+  teamGames: Int32Array;           // game columns involving each team
+  division: Int8Array;             // [team] league * 3 + division
+  simulations: number;
+  z: Float64Array;                 // [sim * teams + team] standard normal strength draw
+  uniforms: Float32Array;          // [sim * games + game] outcome draw
+  outcomes: Uint8Array;            // [sim * games + game] 1 = home win, at current strengths
+  wins: Int16Array;                // [sim * teams + team] final wins, at current strengths
+  curves: (ResponseCurve | undefined)[];
+}
+
+const DEFAULT_SIMULATIONS = 400;
+const DEFAULT_SEED = 20260325;
+
+// Response curve grid: +/-8 overall around the team's current strength, in quarter points.
+// One player moves overall by at most ~5; moves beyond the grid are clamped to its edge.
+const GRID_STEP = 0.25;
+const GRID_RADIUS = 8;
+const GRID_POINTS = Math.round((2 * GRID_RADIUS) / GRID_STEP) + 1;
+
+const WILD_CARDS = 3;
+const DIVISIONS = ['East', 'Central', 'West'] as const;
+
+const clamp = (val: number, min: number, max: number) => Math.max(min, Math.min(max, val));
+
+const buildGroup = (players: Player[], key: (p: Player) => number, value: (p: Player) => number, slots: number): RankedGroup => {
+  const ranked = players.map(p => ({ id: p.id, key: key(p), value: value(p) })).sort((a, b) => b.key - a.key);
+  const prefix = new Float64Array(ranked.length + 1);
+  ranked.forEach((r, i) => { prefix[i + 1] = prefix[i] + r.value; });
+  return {
+    ids: ranked.map(r => r.id),
+    keys: Float64Array.from(ranked, r => r.key),
+    values: Float64Array.from(ranked, r => r.value),
+    prefix,
+    rank: new Map(ranked.map((r, i) => [r.id, i])),
+    slots
+  };
+};
+
+const hitterKey = (p: Player) => p.rating * getPlayerWeight(p);
+const pitcherKey = (p: Player) => p.rating;
+
+// Players in the group scoring >= key (a newcomer ranks after existing ties)
+const countAtLeast = (keys: Float64Array, key: number): number => {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (keys[mid] >= key) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+// Mean value of the top `slots` players after removing rank `removed` (-1: none) and adding a
+// player with (key, value) (NaN key: none). Mirrors mean() over an empty selection (0).
+const groupMeanAfter = (group: RankedGroup, removed: number, key: number, value: number): number => {
+  const { prefix, values, slots } = group;
+  const adding = !Number.isNaN(key);
+  const remaining = values.length - (removed >= 0 ? 1 : 0);
+  const taken = Math.min(slots, remaining + (adding ? 1 : 0));
+  if (taken === 0) return 0;
+
+  // Sum of the top m of the group without the removed player
+  const topSum = (m: number) => (removed < 0 || removed >= m ? prefix[m] : prefix[m + 1] - values[removed]);
+
+  if (adding) {
+    let position = countAtLeast(group.keys, key);
+    if (removed >= 0 && removed < position) position--;
+    if (position < taken) return (topSum(taken - 1) + value) / taken;
+  }
+  return topSum(taken) / taken;
+};
+
+const strengthOf = (offense: number, pitching: number): TeamStrength =>
+  ({ offense, pitching, overall: (offense * OFFENSE_WEIGHT) + (pitching * PITCHING_WEIGHT) });
+
+const insertIntoGroup = (group: RankedGroup, id: string, key: number, value: number) => {
+  const at = countAtLeast(group.keys, key);
+  const keys = new Float64Array(group.keys.length + 1);
+  const values = new Float64Array(keys.length);
+  keys.set(group.keys.subarray(0, at));
+  keys[at] = key;
+  keys.set(group.keys.subarray(at), at + 1);
+  values.set(group.values.subarray(0, at));
+  values[at] = value;
+  values.set(group.values.subarray(at), at + 1);
+  group.ids.splice(at, 0, id);
+  group.keys = keys;
+  group.values = values;
+  reindexGroup(group, at);
+};
+
+const removeFromGroup = (group: RankedGroup, id: string) => {
+  const at = group.rank.get(id);
+  if (at === undefined) return;
+  const keys = new Float64Array(group.keys.length - 1);
+  const values = new Float64Array(keys.length);
+  keys.set(group.keys.subarray(0, at));
+  keys.set(group.keys.subarray(at + 1), at);
+  values.set(group.values.subarray(0, at));
+  values.set(group.values.subarray(at + 1), at);
+  group.ids.splice(at, 1);
+  group.rank.delete(id);
+  group.keys = keys;
+  group.values = values;
+  reindexGroup(group, at);
+};
+
+// Prefix sums and ranks from position `from` on
+const reindexGroup = (group: RankedGroup, from: number) => {
+  const prefix = new Float64Array(group.values.length + 1);
+  prefix.set(group.prefix.subarray(0, from + 1));
+  for (let i = from; i < group.values.length; i++) {
+    prefix[i + 1] = prefix[i] + group.values[i];
+    group.rank.set(group.ids[i], i);
+  }
+  group.prefix = prefix;
+};
+
+export const createRosterWhatIf = (
+  teams: Team[],
+  schedule: GameResult[],
+  options: RosterWhatIfOptions = {}
+): RosterWhatIf => {
+  const teamIndex = new Map(teams.map((t, i) => [t.id, i]));
+  const hitters = teams.map(t => buildGroup(t.roster.filter(isStrengthHitter), hitterKey, getBattingValue, LINEUP_SLOTS));
+  const pitchers = teams.map(t => buildGroup(t.roster.filter(isStrengthPitcher), pitcherKey, getPitchingValue, ROTATION_SLOTS));
+  const strengths = teams.map((_, i) => strengthOf(groupMeanAfter(hitters[i], -1, NaN, 0), groupMeanAfter(pitchers[i], -1, NaN, 0)));
+
+  const games = schedule.filter(g => !g.played && !g.isPostseason && teamIndex.has(g.homeTeamId) && teamIndex.has(g.awayTeamId));
+  const home = Int16Array.from(games, g => teamIndex.get(g.homeTeamId)!);
+  const away = Int16Array.from(games, g => teamIndex.get(g.awayTeamId)!);
+
+  const teamGameStart = new Int32Array(teams.length + 1);
+  games.forEach((_, g) => { teamGameStart[home[g] + 1]++; teamGameStart[away[g] + 1]++; });
+  for (let t = 0; t < teams.length; t++) teamGameStart[t + 1] += teamGameStart[t];
+  const teamGames = new Int32Array(teamGameStart[teams.length]);
+  const fill = teamGameStart.slice(0, teams.length);
+  games.forEach((_, g) => { teamGames[fill[home[g]]++] = g; teamGames[fill[away[g]]++] = g; });
+
+  const simulations = Math.max(1, options.simulations ?? DEFAULT_SIMULATIONS);
+  const seed = options.seed ?? DEFAULT_SEED;
+  const z = new Float64Array(simulations * teams.length);
+  const uniforms = new Float32Array(simulations * games.length);
+  for (let s = 0; s < simulations; s++) {
+    for (let t = 0; t < teams.length; t++) z[s * teams.length + t] = inverseNormalCdf(keyedUniform(seed, s, t));
+    for (let g = 0; g < games.length; g++) uniforms[s * games.length + g] = keyedUniform(seed, s, teams.length + g);
+  }
+
+  const engine: RosterWhatIf = {
+    teams,
+    teamIndex,
+    hitters,
+    pitchers,
+    strengths,
+    baseWins: Int16Array.from(teams, t => t.wins),
+    home,
+    away,
+    teamGameStart,
+    teamGames,
+    division: Int8Array.from(teams, t => (t.league === 'AL' ? 0 : 3) + Math.max(0, DIVISIONS.indexOf(t.division as typeof DIVISIONS[number]))),
+    simulations,
+    z,
+    uniforms,
+    outcomes: new Uint8Array(simulations * games.length),
+    wins: new Int16Array(simulations * teams.length),
+    curves: teams.map(() => undefined)
+  };
+  simulateEnsemble(engine);
+  return engine;
+};
+
+const simulatedOverall = (engine: RosterWhatIf, s: number, t: number, overall: number) =>
+  clamp(overall + engine.z[s * engine.teams.length + t] * STRENGTH_SD, MIN_OVERALL, MAX_OVERALL);
+
+// Every season of the ensemble at the current strengths
+const simulateEnsemble = (engine: RosterWhatIf) => {
+  const { teams, home, away, uniforms, outcomes, wins, simulations } = engine;
+  const teamCount = teams.length;
+  const gameCount = home.length;
+  const overall = new Float64Array(teamCount);
+  for (let s = 0; s < simulations; s++) {
+    for (let t = 0; t < teamCount; t++) {
+      overall[t] = simulatedOverall(engine, s, t, engine.strengths[t].overall);
+      wins[s * teamCount + t] = engine.baseWins[t];
+    }
+    for (let g = 0; g < gameCount; g++) {
+      const homeWin = uniforms[s * gameCount + g] < expectedWinProbability(overall[home[g]], overall[away[g]]);
+      outcomes[s * gameCount + g] = homeWin ? 1 : 0;
+      wins[s * teamCount + (homeWin ? home[g] : away[g])]++;
+    }
+  }
+  engine.curves.fill(undefined);
+};
+
+// Division winner or one of the top non-winners in the league (ties: earlier team, as in
+// getPlayoffField's stable sorts)
+const makesPlayoffs = (engine: RosterWhatIf, wins: Int16Array, t: number): boolean => {
+  const { division } = engine;
+  const teamCount = wins.length;
+  const beats = (a: number, b: number) => wins[a] > wins[b] || (wins[a] === wins[b] && a < b);
+  const first = division[t] - (division[t] % 3);
+  const leaders = [-1, -1, -1];
+  for (let o = 0; o < teamCount; o++) {
+    const d = division[o] - first;
+    if (d < 0 || d > 2) continue;
+    if (leaders[d] < 0 || beats(o, leaders[d])) leaders[d] = o;
+  }
+  if (leaders[division[t] - first] === t) return true;
+  let ahead = 0;
+  for (let o = 0; o < teamCount; o++) {
+    const d = division[o] - first;
+    if (d < 0 || d > 2 || o === t || leaders[d] === o) continue;
+    if (beats(o, t) && ++ahead >= WILD_CARDS) return false;
+  }
+  return true;
+};
+
+// Replay the ensemble over a grid of team t's overall, re-deciding only t's games. With the
+// draws fixed, each game is won from some grid point on (the win probability is monotone in
+// t's strength), so a season costs a binary search per game plus one standings check per
+// grid point, updated by the games that flip there.
+const buildCurve = (engine: RosterWhatIf, t: number): ResponseCurve => {
+  const { teams, home, away, uniforms, outcomes, simulations, teamGameStart, teamGames } = engine;
+  const teamCount = teams.length;
+  const gameCount = home.length;
+  const origin = engine.strengths[t].overall - GRID_RADIUS;
+  const gridOverall = new Float64Array(GRID_POINTS);
+  const meanWins = new Float64Array(GRID_POINTS);
+  const playoff = new Float64Array(GRID_POINTS);
+  const wins = new Int16Array(teamCount);
+  const opponentOverall = new Float64Array(teamCount);
+  // Games of t bucketed by the first grid point t wins them at (GRID_POINTS: never)
+  const flipCount = new Int32Array(GRID_POINTS + 2);
+  const flipOpponents = new Int16Array(teamGameStart[t + 1] - teamGameStart[t]);
+  const flipFill = new Int32Array(GRID_POINTS + 1);
+  const firstWin = new Int16Array(flipOpponents.length);
+
+  for (let s = 0; s < simulations; s++) {
+    for (let o = 0; o < teamCount; o++) opponentOverall[o] = simulatedOverall(engine, s, o, engine.strengths[o].overall);
+    for (let j = 0; j < GRID_POINTS; j++) gridOverall[j] = simulatedOverall(engine, s, t, origin + j * GRID_STEP);
+
+    // Standings with every game of t lost (grid point -1)
+    wins.set(engine.wins.subarray(s * teamCount, (s + 1) * teamCount));
+    flipCount.fill(0);
+    for (let i = teamGameStart[t], k = 0; i < teamGameStart[t + 1]; i++, k++) {
+      const g = teamGames[i];
+      const atHome = home[g] === t;
+      const opponent = atHome ? away[g] : home[g];
+      if ((outcomes[s * gameCount + g] === 1) === atHome) {
+        wins[t]--;
+        wins[opponent]++;
+      }
+      const u = uniforms[s * gameCount + g];
+      const wonAt = (j: number) => (atHome
+        ? u < expectedWinProbability(gridOverall[j], opponentOverall[opponent])
+        : u >= expectedWinProbability(opponentOverall[opponent], gridOverall[j]));
+      let lo = 0;
+      let hi = GRID_POINTS;
+      while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (wonAt(mid)) hi = mid;
+        else lo = mid + 1;
+      }
+      firstWin[k] = lo;
+      flipCount[lo + 1]++;
+    }
+    for (let j = 0; j <= GRID_POINTS; j++) flipCount[j + 1] += flipCount[j];
+    flipFill.set(flipCount.subarray(0, GRID_POINTS + 1));
+    for (let i = teamGameStart[t], k = 0; i < teamGameStart[t + 1]; i++, k++) {
+      const g = teamGames[i];
+      flipOpponents[flipFill[firstWin[k]]++] = home[g] === t ? away[g] : home[g];
+    }
+
+    for (let j = 0; j < GRID_POINTS; j++) {
+      for (let f = flipCount[j]; f < flipCount[j + 1]; f++) {
+        wins[t]++;
+        wins[flipOpponents[f]]--;
+      }
+      meanWins[j] += wins[t];
+      if (makesPlayoffs(engine, wins, t)) playoff[j]++;
+    }
+  }
+  for (let j = 0; j < GRID_POINTS; j++) {
+    meanWins[j] /= simulations;
+    playoff[j] /= simulations;
+  }
+  return { origin, meanWins, playoff };
+};
+
+const curveAt = (values: Float64Array, curve: ResponseCurve, overall: number): number => {
+  const x = clamp((overall - curve.origin) / GRID_STEP, 0, GRID_POINTS - 1);
+  const j = Math.min(GRID_POINTS - 2, Math.floor(x));
+  return values[j] + (values[j + 1] - values[j]) * (x - j);
+};
+
+const getCurve = (engine: RosterWhatIf, t: number): ResponseCurve => {
+  if (!engine.curves[t]) engine.curves[t] = buildCurve(engine, t);
+  return engine.curves[t]!;
+};
+
+/** Team strength after a move, without touching the team (constant time). */
+export const teamStrengthAfter = (engine: RosterWhatIf, move: RosterMove): TeamStrength => {
+  const t = engine.teamIndex.get(move.teamId);
+  if (t === undefined) throw new Error(`Unknown team ${move.teamId}`);
+  const side = (group: RankedGroup, belongs: boolean, key: (p: Player) => number, value: (p: Player) => number) => {
+    const removed = move.removeId !== undefined ? group.rank.get(move.removeId) ?? -1 : -1;
+    const add = move.add && belongs ? move.add : undefined;
+    return groupMeanAfter(group, removed, add ? key(add) : NaN, add ? value(add) : 0);
+  };
+  const add = move.add;
+  return strengthOf(
+    side(engine.hitters[t], !!add && isStrengthHitter(add), hitterKey, getBattingValue),
+    side(engine.pitchers[t], !!add && isStrengthPitcher(add), pitcherKey, getPitchingValue)
+  );
+};
+
+/**
+ * Projected wins and playoff odds for a batch of moves, each against the league as it stands.
+ * The first move for a team builds its response curve; every other move is an interpolation.
+ */
+export const evaluateRosterMoves = (engine: RosterWhatIf, moves: RosterMove[]): MoveEvaluation[] =>
+  moves.map(move => {
+    const t = engine.teamIndex.get(move.teamId)!;
+    const strength = teamStrengthAfter(engine, move);
+    const curve = getCurve(engine, t);
+    const current = engine.strengths[t].overall;
+    const baseWins = curveAt(curve.meanWins, curve, current);
+    const basePlayoff = curveAt(curve.playoff, curve, current);
+    const projectedWins = curveAt(curve.meanWins, curve, strength.overall);
+    const playoffPct = curveAt(curve.playoff, curve, strength.overall) * 100;
+    return {
+      move,
+      strength,
+      overallDelta: strength.overall - current,
+      projectedWins,
+      winsDelta: projectedWins - baseWins,
+      playoffPct,
+      playoffDelta: playoffPct - basePlayoff * 100
+    };
+  });
+
+/**
+ * Make moves permanent in the engine (the Team objects are not modified). Rankings are updated
+ * in place; the ensemble is re-decided once for the batch and the response curves rebuilt lazily.
+ */
+export const applyRosterMoves = (engine: RosterWhatIf, moves: RosterMove[]) => {
+  moves.forEach(move => {
+    const t = engine.teamIndex.get(move.teamId);
+    if (t === undefined) throw new Error(`Unknown team ${move.teamId}`);
+    if (move.removeId !== undefined) {
+      removeFromGroup(engine.hitters[t], move.removeId);
+      removeFromGroup(engine.pitchers[t], move.removeId);
+    }
+    if (move.add) {
+      if (isStrengthHitter(move.add)) insertIntoGroup(engine.hitters[t], move.add.id, hitterKey(move.add), getBattingValue(move.add));
+      if (isStrengthPitcher(move.add)) insertIntoGroup(engine.pitchers[t], move.add.id, pitcherKey(move.add), getPitchingValue(move.add));
+    }
+    engine.strengths[t] = strengthOf(groupMeanAfter(engine.hitters[t], -1, NaN, 0), groupMeanAfter(engine.pitchers[t], -1, NaN, 0));
+  });
+  if (moves.length > 0) simulateEnsemble(engine);
+};
@@ -0,0 +1,99 @@
+import { getRegistryPlayer } from "./savantRegistry";
+
+// Savant leaderboards and percentile ranks precomputed by scripts/buildLeaderboards.py
+// from the registry. Leaders are stored best-first and percentiles are aligned with the
+// qualified player list, so every lookup here is a read - nothing is sorted client-side.
+import leaderboardData from './savantLeaderboards.json';
+
+export type LeaderboardTable = 'batting' | 'pitching';
+
+interface YearBoards {
+    players: number[];  // qualified mlbIds, ascending
+    stats: Record<string, { leaders: [number, number][]; pct: number[] }>;
+}
+
+interface SavantLeaderboards {
+    format: string;
+    version: number;
+    lastUpdated: string;
+    leaderboardSize: number;
+    tables: Partial<Record<LeaderboardTable, {
+        qualifier: { field: string; min: number };
+        higherIsBetter: Record<string, boolean>;
+        years: Record<string, YearBoards>;
+    }>>;
+}
+
+export interface SavantLeader {
+    rank: number;
+    mlbId: number;
+    name: string;
+    value: number;
+}
+
+const leaderboards = leaderboardData as unknown as SavantLeaderboards;
+
+// "table:year" -> mlbId -> position in the qualified player list, built on first lookup
+const positionIndex = new Map<string, Map<number, number>>();
+
+const getYearBoards = (table: LeaderboardTable, year: number | string): YearBoards | undefined =>
+    leaderboards.tables[table]?.years[String(year)];
+
+const getPosition = (table: LeaderboardTable, year: number | string, mlbId: number): number | undefined => {
+    const boards = getYearBoards(table, year);
+    if (!boards) return undefined;
+    const key = `${table}:${year}`;
+    let positions = positionIndex.get(key);
+    if (!positions) {
+        positions = new Map(boards.players.map((id, pos) => [id, pos]));
+        positionIndex.set(key, positions);
+    }
+    return positions.get(mlbId);
+};
+
+// Top `n` qualified players for a stat, best first (at most leaderboardSize)
+export const getSavantLeaders = (table: LeaderboardTable, year: number | string, stat: string, n = 10): SavantLeader[] => {
+    const board = getYearBoards(table, year)?.stats[stat];
+    if (!board) return [];
+    return board.leaders.slice(0, n).map(([mlbId, value], i) => ({
+        rank: i + 1,
+        mlbId,
+        name: getRegistryPlayer(mlbId)?.name || `Unknown (${mlbId})`,
+        value,
+    }));
+};
+
+// 0-100 percentile among qualified players; undefined if unqualified or the stat is missing
+export const getSavantPercentile = (mlbId: number, table: LeaderboardTable, year: number | string, stat: string): number | undefined => {
+    const pos = getPosition(table, year, mlbId);
+    const pct = pos === undefined ? undefined : getYearBoards(table, year)?.stats[stat]?.pct[pos];
+    return pct === undefined || pct < 0 ? undefined : pct;
+};
+
+// Every available percentile for a player-season, e.g. for a row of percentile bars
+export const getSavantPercentiles = (mlbId: number, table: LeaderboardTable, year: number | string): Record<string, number> => {
+    const pos = getPosition(table, year, mlbId);
+    const result: Record<string, number> = {};
+    if (pos === undefined) return result;
+    Object.entries(getYearBoards(table, year)!.stats).forEach(([stat, board]) => {
+        if (board.pct[pos] >= 0) result[stat] = board.pct[pos];
+    });
+    return result;
+};
+
+export const isHigherBetter = (table: LeaderboardTable, stat: string): boolean =>
+    leaderboards.tables[table]?.higherIsBetter[stat] ?? true;
+
+// Seasons with boards for a table, newest first
+export const getSavantLeaderboardYears = (table: LeaderboardTable): string[] =>
+    Object.keys(leaderboards.tables[table]?.years ?? {}).sort((a, b) => Number(b) - Number(a));
+
+// Stats ranked for a table, in the order the builder lists them
+export const getSavantLeaderboardStats = (table: LeaderboardTable): string[] =>
+    Object.keys(leaderboards.tables[table]?.higherIsBetter ?? {});
+
+// MLB person id of a rostered player (real rosters use "mlb_<personId>" ids)
+export const getPlayerMlbId = (playerId: string): number | undefined => {
+    const match = /^mlb_(\d+)$/.exec(playerId);
+    return match ? Number(match[1]) : undefined;
+};
@@ -0,0 +1,151 @@
+import { PitchRepertoireEntry, SavantBatterStats, SavantPitchingStats } from "../types";
+
+// Normalized Baseball Savant data built by scripts/savantRegistry.py from the
+// three ingest artifacts (batterSavant.json, pitcherSavant.json, pitchArsenals.json).
+// Each player is stored once and each stat line once; "current" is a pointer into the history.
+import registryData from './savantRegistry.json';
+
+type TableName = 'batting' | 'pitching' | 'arsenal';
+
+interface RegistryTable {
+    fields: string[];
+    years: Record<string, any[][]>;       // year -> [playerIndex, ...values]
+    current: [number, number, number][];  // [playerIndex, year, rowIndex]
+    pitchTypes?: string[];                // arsenal only: pitch type dictionary
+}
+
+interface SavantRegistry {
+    format: string;
+    version: number;
+    lastUpdated: string;
+    years: number[];
+    sources: Partial<Record<TableName, { lastUpdated: string; source: string; years: number[] }>>;
+    players: { fields: string[]; rows: [number, string, string[], number[]][] };
+    tables: Partial<Record<TableName, RegistryTable>>;
+}
+
+// Per-source entry shapes (same layout as the original artifacts)
+export interface PitcherArsenalEntry {
+    name: string;
+    mlbId: number;
+    currentArsenal: PitchRepertoireEntry[];
+    arsenalHistory: Record<string, PitchRepertoireEntry[]>;  // year -> arsenal
+}
+
+export interface BatterSavantEntry {
+    name: string;
+    mlbId: number;
+    currentStats: SavantBatterStats | null;
+    statsHistory: Record<string, SavantBatterStats>;
+}
+
+export interface PitcherSavantEntry {
+    name: string;
+    mlbId: number;
+    currentStats: SavantPitchingStats | null;
+    statsHistory: Record<string, SavantPitchingStats>;
+}
+
+const registry = registryData as unknown as SavantRegistry;
+
+// mlbId -> player index, built on first lookup
+let playerIndex: Map<number, number> | null = null;
+// table -> player index -> { year -> row }, built on first lookup into that table
+const rowIndex: Partial<Record<TableName, Map<number, Record<string, any[]>>>> = {};
+// table -> player index -> current year (from the table's current pointers)
+const currentIndex: Partial<Record<TableName, Map<number, number>>> = {};
+// Decoded entries, so repeated lookups return the same object
+const entryCache: Partial<Record<TableName, Map<number, any>>> = {};
+
+const getPlayerIndex = (mlbId: number): number | undefined => {
+    if (!playerIndex) {
+        playerIndex = new Map();
+        registry.players.rows.forEach((row, idx) => playerIndex!.set(row[0], idx));
+    }
+    return playerIndex.get(mlbId);
+};
+
+const getRows = (table: TableName): Map<number, Record<string, any[]>> => {
+    let rows = rowIndex[table];
+    if (!rows) {
+        rows = new Map();
+        const data = registry.tables[table];
+        if (data) {
+            for (const [year, yearRows] of Object.entries(data.years)) {
+                for (const row of yearRows) {
+                    let byYear = rows.get(row[0]);
+                    if (!byYear) {
+                        byYear = {};
+                        rows.set(row[0], byYear);
+                    }
+                    byYear[year] = row;
+                }
+            }
+            currentIndex[table] = new Map(data.current.map(([idx, year]) => [idx, year]));
+        }
+        rowIndex[table] = rows;
+    }
+    return rows;
+};
+
+const decodeLine = (data: RegistryTable, row: any[]): any => {
+    if (data.pitchTypes) {
+        const types = data.pitchTypes;
+        return (row[1] as [number, number, number][]).map(([t, speed, usage]) => ({ type: types[t], speed, usage }));
+    }
+    const line: Record<string, number> = {};
+    data.fields.forEach((field, i) => { line[field] = row[i + 1]; });
+    return line;
+};
+
+const lookupEntry = (table: TableName, mlbId: number, currentKey: string, historyKey: string): any | undefined => {
+    const data = registry.tables[table];
+    if (!data) return undefined;
+
+    let cache = entryCache[table];
+    if (!cache) {
+        cache = new Map();
+        entryCache[table] = cache;
+    }
+    if (cache.has(mlbId)) return cache.get(mlbId);
+
+    const idx = getPlayerIndex(mlbId);
+    const byYear = idx === undefined ? undefined : getRows(table).get(idx);
+    if (idx === undefined || !byYear) {
+        cache.set(mlbId, undefined);
+        return undefined;
+    }
+
+    const history: Record<string, any> = {};
+    Object.keys(byYear)
+        .sort((a, b) => parseInt(b) - parseInt(a))
+        .forEach(year => { history[year] = decodeLine(data, byYear[year]); });
+
+    // "current" is a pointer: resolve it to the matching history line rather than storing a copy
+    const currentYear = currentIndex[table]?.get(idx);
+    const [mlbIdValue, name] = registry.players.rows[idx];
+    const entry = {
+        name,
+        mlbId: mlbIdValue,
+        [currentKey]: currentYear !== undefined ? history[String(currentYear)] : null,
+        [historyKey]: history,
+    };
+    cache.set(mlbId, entry);
+    return entry;
+};
+
+export const getBatterSavant = (mlbId: number): BatterSavantEntry | undefined =>
+    lookupEntry('batting', mlbId, 'currentStats', 'statsHistory');
+
+export const getPitcherSavant = (mlbId: number): PitcherSavantEntry | undefined =>
+    lookupEntry('pitching', mlbId, 'currentStats', 'statsHistory');
+
+export const getPitcherArsenal = (mlbId: number): PitcherArsenalEntry | undefined =>
+    lookupEntry('arsenal', mlbId, 'currentArsenal', 'arsenalHistory');
+
+export const getRegistryPlayer = (mlbId: number): { mlbId: number; name: string; roles: string[]; years: number[] } | undefined => {
+    const idx = getPlayerIndex(mlbId);
+    if (idx === undefined) return undefined;
+    const [id, name, roles, years] = registry.players.rows[idx];
+    return { mlbId: id, name, roles, years };
+};
@@ -0,0 +1,93 @@
+// Exact postseason odds: series win probabilities by dynamic programming over
+// (wins, losses) states, propagated through the bracket as probability distributions
+// instead of sampled game by game.
+
+// P(home team wins a single game)
+export type GameProbability = (homeId: string, awayId: string) => number;
+
+// True when the higher seed hosts game i (MLB formats)
+export const SERIES_HOME_PATTERNS: Record<number, boolean[]> = {
+  3: [true, true, true],                               // Wild Card: all at the higher seed
+  5: [true, true, false, false, true],                 // Division Series: 2-2-1
+  7: [true, true, false, false, false, true, true],    // LCS / World Series: 2-3-2
+};
+
+const homePattern = (bestOf: number): boolean[] =>
+  SERIES_HOME_PATTERNS[bestOf] || Array.from({ length: bestOf }, (_, i) => i % 2 === 0);
+
+// P(higher seed wins a best-of-N series), given its per-game win probability at home and on the road
+export const seriesWinProbability = (pHome: number, pAway: number, bestOf: number): number => {
+  const needed = Math.floor(bestOf / 2) + 1;
+  const pattern = homePattern(bestOf);
+  // win[b] for one row a of the (a, b) state table: P(higher seed wins the series from a-b).
+  // Rows are filled backwards from the clinching row a = needed; win[needed] (lost) stays 0.
+  const win = new Float64Array(needed + 1);
+  win.fill(1, 0, needed);
+  for (let a = needed - 1; a >= 0; a--) {
+    for (let b = needed - 1; b >= 0; b--) {
+      const p = pattern[a + b] ? pHome : pAway;
+      win[b] = p * win[b] + (1 - p) * win[b + 1];
+    }
+  }
+  return win[0];
+};
+
+// Winner distribution of a round where each side is a distribution over teams.
+// `hasHomeField(a, b)` is true when a hosts the series.
+export const playSeriesRound = (
+  sideA: Record<string, number>,
+  sideB: Record<string, number>,
+  bestOf: number,
+  gameProbability: GameProbability,
+  hasHomeField: (a: string, b: string) => boolean
+): Record<string, number> => {
+  const winners: Record<string, number> = {};
+  for (const [a, pa] of Object.entries(sideA)) {
+    for (const [b, pb] of Object.entries(sideB)) {
+      const meet = pa * pb;
+      if (meet === 0) continue;
+      const [high, low] = hasHomeField(a, b) ? [a, b] : [b, a];
+      const pHigh = seriesWinProbability(gameProbability(high, low), 1 - gameProbability(low, high), bestOf);
+      winners[high] = (winners[high] || 0) + meet * pHigh;
+      winners[low] = (winners[low] || 0) + meet * (1 - pHigh);
+    }
+  }
+  return winners;
+};
+
+export interface LeagueBracketOdds {
+  divisionSeries: Record<string, number>;       // P(reach the Division Series)
+  championshipSeries: Record<string, number>;   // P(reach the LCS)
+  pennant: Record<string, number>;              // P(win the league)
+}
+
+// Six-team bracket for one league; seeds[0] is the top seed.
+// 1 and 2 get byes; 3 hosts 6 and 4 hosts 5 in the Wild Card round; 1 meets the 4/5 winner.
+export const leagueBracketOdds = (seeds: string[], gameProbability: GameProbability): LeagueBracketOdds | null => {
+  if (seeds.length < 6) return null;
+  const seedRank: Record<string, number> = {};
+  seeds.forEach((id, i) => { seedRank[id] = i; });
+  const higherSeed = (a: string, b: string) => seedRank[a] < seedRank[b];
+  const only = (id: string) => ({ [id]: 1 });
+
+  const wc1 = playSeriesRound(only(seeds[2]), only(seeds[5]), 3, gameProbability, higherSeed);
+  const wc2 = playSeriesRound(only(seeds[3]), only(seeds[4]), 3, gameProbability, higherSeed);
+  const ds1 = playSeriesRound(only(seeds[0]), wc2, 5, gameProbability, higherSeed);
+  const ds2 = playSeriesRound(only(seeds[1]), wc1, 5, gameProbability, higherSeed);
+  const pennant = playSeriesRound(ds1, ds2, 7, gameProbability, higherSeed);
+
+  return {
+    divisionSeries: { [seeds[0]]: 1, [seeds[1]]: 1, ...wc1, ...wc2 },
+    championshipSeries: { ...ds1, ...ds2 },
+    pennant,
+  };
+};
+
+// World Series winner distribution; home field goes to the better regular-season record
+export const worldSeriesOdds = (
+  alPennant: Record<string, number>,
+  nlPennant: Record<string, number>,
+  gameProbability: GameProbability,
+  wins: Record<string, number>
+): Record<string, number> =>
+  playSeriesRound(alPennant, nlPennant, 7, gameProbability, (al, nl) => wins[al] >= wins[nl]);
@@ -0,0 +1,83 @@
+// Tunable constants for the game engine (simulator.ts) and the season engine (fastSim.ts).
+// They live in simParams.json so scripts/calibrateSim.ts can refit them against the benchmark
+// targets and write a new revision without touching code.
+import paramsData from './simParams.json';
+
+export interface PitchParams {
+    hbp: number;              // per-pitch hit-by-pitch chance
+    wildPitch: number;        // per-pitch wild pitch chance (counts as a ball)
+    zoneBase: number;         // in-zone probability = zoneBase + control * zoneControl
+    zoneControl: number;
+    eyeCenter: number;        // eye is compressed toward eyeCenter by eyeCompression
+    eyeCompression: number;
+    chaseBase: number;        // chase probability = chaseBase - compressedEye * chaseEye
+    chaseEye: number;
+    zoneSwing: number;        // swing probability on an in-zone pitch
+    contactBase: number;      // contact probability = contactBase + (contact - stuff) * contactSpread
+    contactSpread: number;
+    contactMin: number;
+    contactMax: number;
+    foul: number;             // share of contact that is fouled off
+}
+
+export interface BallInPlayParams {
+    hitBase: number;          // hit probability = hitBase + (contact - stuff) * hitSpread (+ adjustments)
+    hitSpread: number;
+    hitMin: number;
+    hitMax: number;
+    hrBase: number;           // share of hits that leave the park = hrBase + (power - stuff) * hrSpread
+    hrSpread: number;
+    hrMin: number;
+    hrMax: number;
+    gapBase: number;          // share of the remaining hits that go for extra bases
+    gapPower: number;
+    gapSpeed: number;
+}
+
+export interface SeasonParams {
+    logisticScale: number;    // home win chance = 1 / (1 + 10^(-diff / logisticScale)) before adjustments
+    homeAdvantage: number;
+    regression: number;       // pull toward .500
+    gameVariance: number;     // half-width of the per-game uniform noise
+    minWinProb: number;
+    maxWinProb: number;
+    strengthSd: number;       // season-long variance on team overall strength
+}
+
+export interface SimParamsFit {
+    league: string;
+    targets: Record<string, number>;
+    achieved: Record<string, number>;
+    elapsedMs: number;
+}
+
+export interface SimParams {
+    format: 'sim-params';
+    version: number;          // file layout version
+    revision: number;         // bumped by every calibration run that writes the file
+    fittedAt: string | null;
+    source: string;
+    pitch: PitchParams;
+    ballInPlay: BallInPlayParams;
+    season: SeasonParams;
+    fit: SimParamsFit | null;
+}
+
+export const SIM_PARAMS_VERSION = 1;
+
+export const SIM_PARAMS = paramsData as SimParams;
+
+if (SIM_PARAMS.version !== SIM_PARAMS_VERSION) {
+    console.warn(`[Sim Params] simParams.json is version ${SIM_PARAMS.version}, expected ${SIM_PARAMS_VERSION}`);
+}
+
+/**
+ * Overwrite the live constants in place. The engines read SIM_PARAMS on every call,
+ * so the calibrator can try candidate values against the real game engine.
+ * (season.strengthSd is the exception: fastSim exports it as STRENGTH_SD at load.)
+ */
+export const setSimParams = (params: { pitch?: Partial<PitchParams>; ballInPlay?: Partial<BallInPlayParams>; season?: Partial<SeasonParams> }) => {
+    if (params.pitch) Object.assign(SIM_PARAMS.pitch, params.pitch);
+    if (params.ballInPlay) Object.assign(SIM_PARAMS.ballInPlay, params.ballInPlay);
+    if (params.season) Object.assign(SIM_PARAMS.season, params.season);
+};
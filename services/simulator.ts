@@ -1,10 +1,13 @@
 
-import { Team, GameResult, GameEvent, Player, Position, PlayerHistoryEntry, PitchDetails, StatsCounters, BoxScore, BoxScorePlayer, LineScore, GameReplayData, ReplayEvent, ReplayVector3 } from "../types";
+import { Team, GameResult, GameEvent, Player, Position, PlayerHistoryEntry, PitchDetails, StatsCounters, BoxScore, BoxScorePlayer, LineScore, GameReplayData, ReplayEvent, ReplayVector3, LineupPlan, StarterArchetype } from "../types";
+import { SIM_PARAMS } from "./simParams";
+import { samplePitchLocation, withBallPaths } from "./pitchTrajectory";
+import { ATTRIBUTE_MAX, ATTRIBUTE_MIN, DEFAULT_PROGRESSION_SEED, RATING_MAX, RATING_MIN, getProgressionChange, progressionUniform } from "./progression";
 
 // --- Historical Bias Logic ---
 // This weights recent seasons heavily to project player performance
 // Fixes issues with players like Cal Raleigh underperforming their historical stats
-const getHistoricalPerformance = (player: Player) => {
+export const getHistoricalPerformance = (player: Player) => {
     if (!player.history || player.history.length === 0) return { powerFactor: 1.0, contactFactor: 1.0, pitchingFactor: 1.0 };
 
     // Weight the most recent seasons heavily, older seasons lightly
@@ -474,27 +477,28 @@ const getEffectiveAttr = (base: number, fatigue: number): number => {
 const simulatePitch = (pitcher: Player, batter: Player, currentPitches: number): PitchResult => {
     const fatiguePenalty = getFatiguePenalty(pitcher, currentPitches);
     const hist = getHistoricalPerformance(pitcher);
+    const params = SIM_PARAMS.pitch;
     
     const effectiveControl = getEffectiveAttr(pitcher.attributes.control || 50, fatiguePenalty);
     const rawEye = getEffectiveAttr(batter.attributes.eye || 50, 0);
     // Savant-driven eye ranges from ~9 (free-swingers) to ~72 (patient hitters).
     // Compress toward league mean (42) to prevent extreme walk/K divergence.
     // eye=9 → 22, eye=39 → 40, eye=72 → 60 (keeps ordering, tames extremes)
-    const effectiveEye = 42 + (rawEye - 42) * 0.60;
+    const effectiveEye = params.eyeCenter + (rawEye - params.eyeCenter) * params.eyeCompression;
     
     // Rare events
-    if (Math.random() < 0.005) return 'HBP'; 
-    if (Math.random() < 0.004) return 'WP';
+    if (Math.random() < params.hbp) return 'HBP'; 
+    if (Math.random() < params.wildPitch) return 'WP';
 
     // Strike Zone Probability — higher = more strikes in zone, fewer walks
     // MLB average ~63-65% of pitches are in-zone or swung-at
     // Raised slightly to reduce walk rate and lower WHIP across the board
-    const strikeZoneProb = 0.48 + (effectiveControl * 0.0012);
+    const strikeZoneProb = params.zoneBase + (effectiveControl * params.zoneControl);
     
     if (Math.random() > strikeZoneProb) {
         // Outside Zone — chase probability based on compressed eye
-        // Raised from 0.28 to 0.30 to further reduce walk rate
-        const chaseProb = 0.30 - (effectiveEye * 0.003);
+        // Base rate and slope come from simParams.json (refit by scripts/calibrateSim.ts)
+        const chaseProb = params.chaseBase - (effectiveEye * params.chaseEye);
         if (Math.random() < chaseProb) {
              return 'StrikeSwinging';
         }
@@ -502,7 +506,7 @@ const simulatePitch = (pitcher: Player, batter: Player, currentPitches: number):
     }
 
     // Inside Zone
-    const swingProb = 0.78; 
+    const swingProb = params.zoneSwing; 
     if (Math.random() > swingProb) {
         return 'StrikeLooking';
     }
@@ -514,8 +518,8 @@ const simulatePitch = (pitcher: Player, batter: Player, currentPitches: number):
     const effectiveContact = getEffectiveAttr(batter.attributes.contact || 50, 0);
     
     // Contact% — MLB average ~76-78%, lowered base to produce more Ks with savant spread
-    let contactProb = 0.78 + ((effectiveContact - effectiveStuff) * 0.0018);
-    contactProb = Math.max(0.55, Math.min(0.92, contactProb));
+    let contactProb = params.contactBase + ((effectiveContact - effectiveStuff) * params.contactSpread);
+    contactProb = Math.max(params.contactMin, Math.min(params.contactMax, contactProb));
 
     if (Math.random() > contactProb) {
         return 'StrikeSwinging';
@@ -523,7 +527,7 @@ const simulatePitch = (pitcher: Player, batter: Player, currentPitches: number):
 
     // Foul vs InPlay — raised foul rate for longer ABs and fewer balls in play
     // More fouls = higher pitch counts, slightly fewer hit opportunities per PA
-    if (Math.random() < 0.28) return 'Foul';
+    if (Math.random() < params.foul) return 'Foul';
     return 'InPlay';
 };
 
@@ -577,6 +581,7 @@ const resolveBallInPlay = (pitcher: Player, batter: Player, defenseTeam: Team, r
     
     const batterHist = getHistoricalPerformance(batter);
     const pitcherHist = getHistoricalPerformance(pitcher);
+    const params = SIM_PARAMS.ballInPlay;
 
     const effectivePower = getEffectiveAttr(batter.attributes.power || 50, 0);
     const effectiveContact = getEffectiveAttr(batter.attributes.contact || 50, 0);
@@ -602,7 +607,7 @@ const resolveBallInPlay = (pitcher: Player, batter: Player, defenseTeam: Team, r
     // HIT PROBABILITY TUNING — calibrated for savant-driven attributes
     // Target: .243-.250 league AVG, .310-.320 OBP, 4.00-4.20 league ERA
     // BABIP target ~.290-.300
-    let hitProb = 0.285 + ((effectiveContact - effectiveStuff) * 0.0015) + (fatiguePenalty * 0.007);
+    let hitProb = params.hitBase + ((effectiveContact - effectiveStuff) * params.hitSpread) + (fatiguePenalty * 0.007);
     
     // Power/Exit Velocity Boost: hard-hit balls are harder to field → higher BABIP
     // This ensures power hitters like Cal Raleigh (.231 xBA but 91+ EV) maintain realistic BA
@@ -632,7 +637,7 @@ const resolveBallInPlay = (pitcher: Player, batter: Player, defenseTeam: Team, r
     const runAdj = park.run / 100;
     const babipAdj = park.babip / 100;
     hitProb *= (0.7 * runAdj + 0.3 * babipAdj);
-    hitProb = Math.min(0.370, Math.max(0.175, hitProb));
+    hitProb = Math.min(params.hitMax, Math.max(params.hitMin, hitProb));
 
     // OUT
     if (Math.random() > hitProb) {
@@ -684,19 +689,19 @@ const resolveBallInPlay = (pitcher: Player, batter: Player, defenseTeam: Team, r
     //   Elite power (power ~90, pf ~1.40): ~25-32% of hits are HR (~40-50 HR season)
     //   Good power  (power ~70, pf ~1.22): ~16-20% of hits are HR (~25-35 HR season)
     //   League avg  (power ~50, pf ~1.00): ~10-13% of hits are HR (~12-18 HR season)
-    let hrProb = 0.10 + ((effectivePower - effectiveStuff) * 0.0016);
+    let hrProb = params.hrBase + ((effectivePower - effectiveStuff) * params.hrSpread);
     // No exponent — powerFactor already calibrated, exponent caused runaway compounding
     // Cap powerFactor at 1.50 to prevent young-breakout edge cases from hitting 70+ HR
     hrProb *= Math.min(1.50, Math.max(0.70, batterHist.powerFactor));
     hrProb *= (park.hr / 100);
-    hrProb = Math.max(0.03, Math.min(0.28, hrProb));
+    hrProb = Math.max(params.hrMin, Math.min(params.hrMax, hrProb));
 
     if (Math.random() < hrProb) {
         return { result: 'HR', type: 'Home Run', desc: 'crushes a home run!', outs: 0, runs: 1, rbi: 1, ev: 105, la: 28, hitLocation: generateHitLocation('HR', 'hr', pullBias) };
     }
 
     // XBH rates — doubles ~5-6% of PA for good hitters, savant power is precise
-    let gapProb = 0.13 + (effectivePower * 0.0015) + (effectiveSpeed * 0.0008);
+    let gapProb = params.gapBase + (effectivePower * params.gapPower) + (effectiveSpeed * params.gapSpeed);
     gapProb *= (0.8 + (park.babip / 100) * 0.2);
     if (Math.random() < gapProb) {
         if (Math.random() < 0.04 + (effectiveSpeed * 0.004)) {
@@ -708,7 +713,7 @@ const resolveBallInPlay = (pitcher: Player, batter: Player, defenseTeam: Team, r
     return { result: '1B', type: 'Single', desc: 'singles', outs: 0, runs: 0, rbi: 0, ev: 90, la: 10, hitLocation: generateHitLocation('1B', Math.random() < 0.6 ? 'ground' : 'line', pullBias) };
 };
 
-const getBestLineup = (team: Team): Player[] => {
+export const getBestLineup = (team: Team): Player[] => {
     const candidates = team.roster.filter(p => !p.injury.isInjured && (p.position !== Position.P || p.isTwoWay));
     
     // Calculate a "starter score" based on historical games played AND rating
@@ -782,6 +787,19 @@ const getBestLineup = (team: Team): Player[] => {
     return lineup.slice(0, 9);
 };
 
+export const getStarterArchetype = (pitcher: Player): StarterArchetype =>
+    (pitcher.attributes.stuff || 50) >= (pitcher.attributes.control || 50) ? 'power' : 'finesse';
+
+// Precomputed series lineup for today's opposing starter, or the heuristic lineup if the plan
+// is missing or one of its hitters is no longer available
+const getPlannedLineup = (team: Team, opposingStarter: Player, plan?: LineupPlan): Player[] => {
+    if (!plan || plan.teamId !== team.id) return getBestLineup(team);
+    const ids = getStarterArchetype(opposingStarter) === 'power' ? plan.vsPower : plan.vsFinesse;
+    const lineup = ids.map(id => team.roster.find(p => p.id === id));
+    if (lineup.length !== 9 || lineup.some(p => !p || p.injury.isInjured)) return getBestLineup(team);
+    return lineup as Player[];
+};
+
 const getReliever = (team: Team, usedIds: Set<string>, role: 'Closer' | 'Setup' | 'Long' | 'Any', inning: number = 9, scoreDiff: number = 0): Player | null => {
     // Filter available relievers: not injured, is pitcher, not yet used this game, rested, and is a reliever (slot >= 9)
     // CRITICAL: Also check they haven't exceeded their season workload limits
@@ -959,9 +977,13 @@ const generatePitchMeta = (pitcher: Player, result: string): { type: string, spe
 export interface SimulateGameOptions {
     seed?: number;
     captureReplay?: boolean;
+    lineups?: { home?: LineupPlan; away?: LineupPlan };
+    // Replays store each pitch's release and plate points; ball paths are synthesized when the
+    // replay is viewed (services/pitchTrajectory.ts). Set to store them too, built in one batch.
+    ballPaths?: boolean;
 }
 
-const createSeededRandom = (seed: number): (() => number) => {
+export const createSeededRandom = (seed: number): (() => number) => {
     let state = (seed >>> 0) || 1;
     return () => {
         state += 0x6D2B79F5;
@@ -971,122 +993,6 @@ const createSeededRandom = (seed: number): (() => number) => {
     };
 };
 
-const buildPitchPath = (pitchType: string, speed: number, pitchResult?: string, pitcherControl?: number): { releasePoint: ReplayVector3; platePoint: ReplayVector3; ballPath: ReplayVector3[] } => {
-    const speedNorm = Math.max(0, Math.min(1, (speed - 70) / 35));
-    const control = pitcherControl ?? 50;
-    const controlNorm = control / 100; // 0 = wild, 1 = elite command
-    
-    // Base pitch movement characteristics
-    const type = pitchType.toLowerCase();
-    let baseBreakX = type.includes('slider') ? -0.35 : type.includes('curve') ? -0.30 : type.includes('cutter') ? -0.20 : type.includes('change') ? 0.12 : type.includes('sinker') ? 0.10 : -0.08;
-    let baseDrop = type.includes('curve') ? -0.9 : type.includes('slider') ? -0.5 : type.includes('change') ? -0.5 : type.includes('sinker') ? -0.4 : -0.25;
-    
-    // Determine target location based on pitch result
-    // Strike zone is roughly x: [-0.83, 0.83] (17 inches / 2 scaled), y: [1.5, 3.5]
-    const ZONE_LEFT = -0.83;
-    const ZONE_RIGHT = 0.83;
-    const ZONE_BOT = 1.5;
-    const ZONE_TOP = 3.5;
-    const ZONE_MID_X = 0;
-    const ZONE_MID_Y = 2.5;
-    
-    let targetX: number;
-    let targetY: number;
-    
-    // Gaussian-ish random using Box-Muller (approximate with Math.random)
-    const gaussRand = () => {
-        const u1 = Math.random();
-        const u2 = Math.random();
-        return Math.sqrt(-2 * Math.log(u1 || 0.001)) * Math.cos(2 * Math.PI * u2);
-    };
-    
-    if (pitchResult === 'Ball' || pitchResult === 'WP') {
-        // Ball: Target outside the zone (corners, edges, off-plate)
-        const side = Math.random();
-        if (side < 0.3) {
-            // Low ball
-            targetX = ZONE_MID_X + gaussRand() * 0.5;
-            targetY = ZONE_BOT - 0.3 - Math.random() * 0.8;
-        } else if (side < 0.55) {
-            // High ball
-            targetX = ZONE_MID_X + gaussRand() * 0.4;
-            targetY = ZONE_TOP + 0.2 + Math.random() * 0.6;
-        } else if (side < 0.75) {
-            // Inside/outside off plate
-            targetX = (Math.random() < 0.5 ? -1 : 1) * (ZONE_RIGHT + 0.2 + Math.random() * 0.7);
-            targetY = ZONE_MID_Y + gaussRand() * 0.6;
-        } else {
-            // Just off a corner
-            const cornerX = Math.random() < 0.5 ? ZONE_LEFT - 0.15 : ZONE_RIGHT + 0.15;
-            const cornerY = Math.random() < 0.5 ? ZONE_BOT - 0.15 : ZONE_TOP + 0.15;
-            targetX = cornerX + gaussRand() * 0.15;
-            targetY = cornerY + gaussRand() * 0.15;
-        }
-    } else if (pitchResult === 'StrikeSwinging' || pitchResult === 'InPlay') {
-        // Swinging strike / In play: Can be anywhere in or near the zone
-        // Better control → paint corners more; worse → more center
-        const cornerBias = 0.3 + controlNorm * 0.5; // 0.3 - 0.8
-        if (Math.random() < cornerBias) {
-            // Aim for corner/edge
-            const edgeX = Math.random() < 0.5 ? ZONE_LEFT + 0.15 : ZONE_RIGHT - 0.15;
-            const edgeY = Math.random() < 0.5 ? ZONE_BOT + 0.3 : ZONE_TOP - 0.3;
-            targetX = edgeX + gaussRand() * (0.3 - controlNorm * 0.15);
-            targetY = edgeY + gaussRand() * (0.3 - controlNorm * 0.15);
-        } else {
-            // More centrally located
-            targetX = ZONE_MID_X + gaussRand() * 0.45;
-            targetY = ZONE_MID_Y + gaussRand() * 0.5;
-        }
-    } else if (pitchResult === 'StrikeLooking') {
-        // Called strike: Must be in the zone - pitchers paint edges
-        const edgeBias = 0.2 + controlNorm * 0.6;
-        if (Math.random() < edgeBias) {
-            // Edge/corner
-            targetX = (Math.random() < 0.5 ? ZONE_LEFT + 0.2 : ZONE_RIGHT - 0.2) + gaussRand() * 0.2;
-            targetY = (Math.random() < 0.5 ? ZONE_BOT + 0.25 : ZONE_TOP - 0.25) + gaussRand() * 0.2;
-        } else {
-            targetX = ZONE_MID_X + gaussRand() * 0.35;
-            targetY = ZONE_MID_Y + gaussRand() * 0.4;
-        }
-        // Keep strictly in zone
-        targetX = Math.max(ZONE_LEFT, Math.min(ZONE_RIGHT, targetX));
-        targetY = Math.max(ZONE_BOT, Math.min(ZONE_TOP, targetY));
-    } else if (pitchResult === 'Foul') {
-        // Foul: typically contact zone - anywhere in or near zone
-        targetX = ZONE_MID_X + gaussRand() * 0.55;
-        targetY = ZONE_MID_Y + gaussRand() * 0.55;
-    } else {
-        // Default / HBP: wide inside
-        targetX = (Math.random() < 0.5 ? -1.2 : 1.2) + gaussRand() * 0.2;
-        targetY = ZONE_MID_Y + gaussRand() * 0.4;
-    }
-    
-    // Apply pitch movement on top of target
-    targetX += baseBreakX * (1 - speedNorm * 0.25) * 0.3;
-    targetY += baseDrop * 0.15;
-    
-    const releasePoint = { x: 0.5 + gaussRand() * 0.08, y: 1.9 + gaussRand() * 0.05, z: 54 };
-    const platePoint = { x: targetX, y: targetY, z: 1.4 };
-    
-    // Build curved path with realistic movement
-    const ballPath: ReplayVector3[] = [];
-    const points = 10;
-    for (let i = 0; i <= points; i++) {
-        const t = i / points;
-        // Add break that develops late (quadratic curves)
-        const breakProgress = t * t; // More break as pitch approaches plate
-        const lateralBreak = baseBreakX * breakProgress * 0.3;
-        const vertBreak = baseDrop * breakProgress * 0.15;
-        
-        ballPath.push({
-            x: releasePoint.x + (platePoint.x - releasePoint.x - lateralBreak) * t + lateralBreak * breakProgress,
-            y: releasePoint.y + (platePoint.y - releasePoint.y - vertBreak) * t + vertBreak * breakProgress,
-            z: releasePoint.z + (platePoint.z - releasePoint.z) * t
-        });
-    }
-    return { releasePoint, platePoint, ballPath };
-};
-
 export const simulateGame = (home: Team, away: Team, date: Date, isPostseason = false, options: SimulateGameOptions = {}): GameResult => {
     const gameSeed = options.seed ?? ((Date.now() ^ (home.mlbId << 7) ^ (away.mlbId << 15)) >>> 0);
     const seededRandom = createSeededRandom(gameSeed);
@@ -1200,7 +1106,10 @@ export const simulateGame = (home: Team, away: Team, date: Date, isPostseason =
 
   log.push({ description: `Starters: ${awayPitcher.name} (Away) vs ${homePitcher.name} (Home)`, type: 'info', inning: 0, isTop: true });
 
-    const lineups = { home: getBestLineup(home), away: getBestLineup(away) };
+    const lineups = {
+        home: getPlannedLineup(home, awayStarter, options.lineups?.home),
+        away: getPlannedLineup(away, homeStarter, options.lineups?.away)
+    };
     const benches = {
         home: home.roster.filter(p => !p.injury.isInjured && (p.position !== Position.P || p.isTwoWay) && !lineups.home.some(lp => lp.id === p.id)).sort((a, b) => b.rating - a.rating),
         away: away.roster.filter(p => !p.injury.isInjured && (p.position !== Position.P || p.isTwoWay) && !lineups.away.some(lp => lp.id === p.id)).sort((a, b) => b.rating - a.rating)
@@ -1516,7 +1425,7 @@ export const simulateGame = (home: Team, away: Team, date: Date, isPostseason =
                   });
 
                   if (replayEnabled) {
-                      const trajectory = buildPitchPath(meta.type, meta.speed, pitch, homePitcher.attributes.control);
+                      const location = samplePitchLocation(meta.type, meta.speed, pitch, homePitcher.attributes.control);
                       const pitchReplayEvent: any = {
                           kind: 'pitch',
                           inning: currentInning,
@@ -1529,9 +1438,8 @@ export const simulateGame = (home: Team, away: Team, date: Date, isPostseason =
                           result: pitchDesc,
                           pitchType: meta.type,
                           speed: meta.speed,
-                          releasePoint: trajectory.releasePoint,
-                          platePoint: trajectory.platePoint,
-                          ballPath: trajectory.ballPath,
+                          releasePoint: location.releasePoint,
+                          platePoint: location.platePoint,
                           runners: serializeRunners(bases)
                       };
                       // Attach hit location for balls in play
@@ -1906,7 +1814,7 @@ export const simulateGame = (home: Team, away: Team, date: Date, isPostseason =
                   });
 
                   if (replayEnabled) {
-                      const trajectory = buildPitchPath(meta.type, meta.speed, pitch, awayPitcher.attributes.control);
+                      const location = samplePitchLocation(meta.type, meta.speed, pitch, awayPitcher.attributes.control);
                       const pitchReplayEvent: any = {
                           kind: 'pitch',
                           inning: currentInning,
@@ -1919,9 +1827,8 @@ export const simulateGame = (home: Team, away: Team, date: Date, isPostseason =
                           result: pitchDesc,
                           pitchType: meta.type,
                           speed: meta.speed,
-                          releasePoint: trajectory.releasePoint,
-                          platePoint: trajectory.platePoint,
-                          ballPath: trajectory.ballPath,
+                          releasePoint: location.releasePoint,
+                          platePoint: location.platePoint,
                           runners: serializeRunners(bases)
                       };
                       if (pitch === 'InPlay' && abResult?.hitLocation) {
@@ -2281,7 +2188,7 @@ export const simulateGame = (home: Team, away: Team, date: Date, isPostseason =
             ? {
                     schemaVersion: 'v1',
                     seed: gameSeed,
-                    events: replayEvents
+                    events: options.ballPaths ? withBallPaths(replayEvents) : replayEvents
                 }
             : undefined;
 
@@ -2384,7 +2291,20 @@ export const generateSchedule = (teams: Team[], startDate: Date): GameResult[] =
     return schedule;
 };
 
-export const progressionSystem = (teams: Team[]) => {
+const EMPTY_STATS_COUNTERS: StatsCounters = {
+    ab:0, h:0, d:0, t:0, hr:0, gsh:0, bb:0, ibb:0, hbp:0, so:0, rbi:0, sb:0, cs:0, gidp:0, sf:0, sac:0, r:0, lob:0, xbh:0, tb:0, roe:0, wo:0, pa:0,
+    totalExitVelo: 0, battedBallEvents: 0, hardHits: 0, barrels: 0, swings: 0, whiffs: 0, groundouts:0, flyouts:0,
+    outsPitched:0, er:0, p_r:0, p_h:0, p_bb:0, p_ibb:0, p_hbp: 0, p_hr: 0, p_so:0, wp:0, bk:0, pk:0, bf:0, 
+    wins:0, losses:0, saves:0, holds:0, blownSaves: 0, pitchesThrown: 0, strikes: 0, qs:0, cg:0, sho:0, gf:0, svo:0, ir:0, irs:0, rw:0,
+    gs: 0, gp: 0, g: 0,
+    po: 0, a: 0, e: 0, dp: 0, tp:0, pb:0, ofa:0, chances: 0, inn: 0
+};
+
+// Offseason for the season `year` just finished. Rating changes are seeded (the same draws as
+// universe 0 of a dynasty projection with the same seed, services/progression.ts), so a replayed
+// offseason matches.
+export const progressionSystem = (teams: Team[], year: number, seed: number = DEFAULT_PROGRESSION_SEED) => {
+    let index = 0;
     teams.forEach(t => {
         t.wins = 0;
         t.losses = 0;
@@ -2397,41 +2317,26 @@ export const progressionSystem = (teams: Team[]) => {
              
              // 2. Progression/Regression (no POT system)
              // Simple model: Peak 26-29.
-             let change = 0;
-             if (p.age < 26) {
-                 change = Math.round(Math.random() * 2);
-             } else if (p.age > 29) {
-                 change = -Math.round(Math.random() * 3);
-                 if (p.age > 33) change -= 1;
-             } else {
-                 change = Math.round(Math.random() * 2) - 1;
-             }
+             const change = getProgressionChange(p.age, progressionUniform(seed, year, 0, index++));
              
-             p.rating = Math.max(40, Math.min(99, p.rating + change));
+             p.rating = Math.max(RATING_MIN, Math.min(RATING_MAX, p.rating + change));
              p.potential = p.rating;
              
              // Adjust attributes slightly to match
              if (change !== 0) {
                  const keys = Object.keys(p.attributes) as (keyof typeof p.attributes)[];
                  keys.forEach(k => {
-                     p.attributes[k] = Math.max(20, Math.min(99, p.attributes[k] + change));
+                     p.attributes[k] = Math.max(ATTRIBUTE_MIN, Math.min(ATTRIBUTE_MAX, p.attributes[k] + change));
                  });
              }
              
              // 3. Reset Stats
              p.seasonStats = { games: 0, hr: 0, avg: 0, wins: 0, losses: 0, era: 0 };
-             p.statsCounters = {
-                ab:0, h:0, d:0, t:0, hr:0, gsh:0, bb:0, ibb:0, hbp:0, so:0, rbi:0, sb:0, cs:0, gidp:0, sf:0, sac:0, r:0, lob:0, xbh:0, tb:0, roe:0, wo:0, pa:0,
-                totalExitVelo: 0, battedBallEvents: 0, hardHits: 0, barrels: 0, swings: 0, whiffs: 0, groundouts:0, flyouts:0,
-                outsPitched:0, er:0, p_r:0, p_h:0, p_bb:0, p_ibb:0, p_hbp: 0, p_hr: 0, p_so:0, wp:0, bk:0, pk:0, bf:0, 
-                wins:0, losses:0, saves:0, holds:0, blownSaves: 0, pitchesThrown: 0, strikes: 0, qs:0, cg:0, sho:0, gf:0, svo:0, ir:0, irs:0, rw:0,
-                gs: 0, gp: 0, g: 0,
-                po: 0, a: 0, e: 0, dp: 0, tp:0, pb:0, ofa:0, chances: 0, inn: 0
-             };
+             p.statsCounters = { ...EMPTY_STATS_COUNTERS };
              p.batting = undefined;
              p.pitching = undefined;
              p.history.push({
-                 year: (new Date().getFullYear()).toString(), 
+                 year: year.toString(), 
                  team: t.name,
                  stats: { games: 0 } 
              });
@@ -0,0 +1,114 @@
+// Exact win-total distributions. For fixed team strengths each team's remaining win total is
+// a Poisson-binomial over its games, so it is built by convolving per-game (per-opponent)
+// distributions instead of sampling seasons. The season-long strength variance is integrated
+// out with Gauss-Hermite quadrature: over the team's own strength, and over each opponent's
+// strength for the block of games against that opponent (opponent draws are independent,
+// so the per-opponent blocks stay independent given the team's own draw).
+
+export interface StrengthModel {
+  base: Record<string, number>;   // teamId -> mean overall strength
+  sd: number;                     // season-long standard deviation of overall strength
+  min: number;                    // clamp applied after the draw
+  max: number;
+  gameProbability: (homeOverall: number, awayOverall: number) => number;  // P(home team wins)
+}
+
+export interface WinDistribution {
+  mean: number;
+  sd: number;
+  dist: Record<number, number>;   // total wins -> probability
+}
+
+// 7-point Gauss-Hermite rule, rescaled to the standard normal
+const GAUSS_HERMITE_7: { z: number; weight: number }[] = [
+  [-2.6519613568352334, 0.0009717812450995192],
+  [-1.6735516287674714, 0.05451558281912703],
+  [-0.8162878828589647, 0.4256072526101278],
+  [0, 0.8102646175568073],
+  [0.8162878828589647, 0.4256072526101278],
+  [1.6735516287674714, 0.05451558281912703],
+  [2.6519613568352334, 0.0009717812450995192],
+].map(([t, w]) => ({ z: t * Math.SQRT2, weight: w / Math.sqrt(Math.PI) }));
+
+// Drop probability mass this small from the tails of the final distribution
+const MIN_PROBABILITY = 1e-9;
+
+const convolve = (a: Float64Array, b: Float64Array): Float64Array => {
+  const out = new Float64Array(a.length + b.length - 1);
+  for (let i = 0; i < a.length; i++) {
+    if (a[i] === 0) continue;
+    for (let j = 0; j < b.length; j++) out[i + j] += a[i] * b[j];
+  }
+  return out;
+};
+
+// Wins in n independent games with the same win probability
+const binomial = (n: number, p: number): Float64Array => {
+  const pmf = new Float64Array(n + 1);
+  pmf[0] = 1;
+  for (let k = 0; k < n; k++) {
+    // Add one game: pmf_{k+1}[w] = p * pmf_k[w-1] + (1-p) * pmf_k[w]
+    for (let w = k + 1; w > 0; w--) pmf[w] = pmf[w] * (1 - p) + pmf[w - 1] * p;
+    pmf[0] *= 1 - p;
+  }
+  return pmf;
+};
+
+export const computeWinDistributions = (
+  games: { homeTeamId: string; awayTeamId: string }[],
+  baseWins: Record<string, number>,
+  model: StrengthModel
+): Record<string, WinDistribution> => {
+  const strengthAt = (teamId: string, z: number) =>
+    Math.max(model.min, Math.min(model.max, model.base[teamId] + model.sd * z));
+
+  // teamId -> opponentId -> [home games, away games]
+  const matchups: Record<string, Record<string, [number, number]>> = {};
+  Object.keys(model.base).forEach(id => { matchups[id] = {}; });
+  for (const game of games) {
+    const { homeTeamId: home, awayTeamId: away } = game;
+    if (model.base[home] === undefined || model.base[away] === undefined) continue;
+    (matchups[home][away] ||= [0, 0])[0]++;
+    (matchups[away][home] ||= [0, 0])[1]++;
+  }
+
+  const results: Record<string, WinDistribution> = {};
+  for (const [teamId, opponents] of Object.entries(matchups)) {
+    const totalGames = Object.values(opponents).reduce((sum, [h, a]) => sum + h + a, 0);
+    const remaining = new Float64Array(totalGames + 1);
+
+    for (const own of GAUSS_HERMITE_7) {
+      const ownStrength = strengthAt(teamId, own.z);
+      let dist: Float64Array = new Float64Array([1]);
+      for (const [oppId, [homeGames, awayGames]] of Object.entries(opponents)) {
+        // Wins against this opponent, mixed over the opponent's strength draw
+        const block = new Float64Array(homeGames + awayGames + 1);
+        for (const opp of GAUSS_HERMITE_7) {
+          const oppStrength = strengthAt(oppId, opp.z);
+          const pHome = model.gameProbability(ownStrength, oppStrength);
+          const pAway = 1 - model.gameProbability(oppStrength, ownStrength);
+          const wins = convolve(binomial(homeGames, pHome), binomial(awayGames, pAway));
+          for (let w = 0; w < wins.length; w++) block[w] += opp.weight * wins[w];
+        }
+        dist = convolve(dist, block);
+      }
+      for (let w = 0; w < dist.length; w++) remaining[w] += own.weight * dist[w];
+    }
+
+    const offset = baseWins[teamId] || 0;
+    const dist: Record<number, number> = {};
+    let mean = 0;
+    let meanSquare = 0;
+    remaining.forEach((p, w) => {
+      mean += p * w;
+      meanSquare += p * w * w;
+      if (p >= MIN_PROBABILITY) dist[offset + w] = p;
+    });
+    results[teamId] = {
+      mean: offset + mean,
+      sd: Math.sqrt(Math.max(0, meanSquare - mean * mean)),
+      dist,
+    };
+  }
+  return results;
+};
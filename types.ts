@@ -377,6 +377,17 @@ export interface Team {
   dataSources?: string[];
 }
 
+// Opposing starters are split by their dominant tool: stuff (power) or control (finesse)
+export type StarterArchetype = 'power' | 'finesse';
+
+// Batting orders (player ids) precomputed for a series by services/lineupOptimizer.ts
+export interface LineupPlan {
+  teamId: string;
+  opponentId?: string;
+  vsPower: string[];
+  vsFinesse: string[];
+}
+
 export interface PitchDetails {
   number: number;
   result: string;
@@ -448,7 +459,8 @@ export interface ReplayPitchEvent {
   speed: number;
   releasePoint: ReplayVector3;
   platePoint: ReplayVector3;
-  ballPath: ReplayVector3[];
+  /** Omitted by the simulator: synthesized from the type and the two points (services/pitchTrajectory.ts) */
+  ballPath?: ReplayVector3[];
   runners: ReplayRunnerState[];
   /** Where the ball landed on the field (if in play) */
   hitLocation?: { x: number; y: number; type: 'ground' | 'fly' | 'line' | 'hr' };